@@ -0,0 +1,4504 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading;
+using System.Threading.Tasks;
+namespace Reynolds.Mappings.Benchmarks
+{
+	public static class Benchmarks
+	{
+		const int Size = 4096;
+		const int Mask = Size - 1;
+		static readonly int[] k1 = Harness.Keys(Size, 1, 0);
+		static readonly int[] m1 = Harness.Keys(Size, 1, Size);
+		static readonly int[] k2 = Harness.Keys(Size, 2, 0);
+		static readonly int[] m2 = Harness.Keys(Size, 2, Size);
+		static readonly int[] k3 = Harness.Keys(Size, 3, 0);
+		static readonly int[] m3 = Harness.Keys(Size, 3, Size);
+		static readonly int[] k4 = Harness.Keys(Size, 4, 0);
+		static readonly int[] m4 = Harness.Keys(Size, 4, Size);
+		static readonly int[] k5 = Harness.Keys(Size, 5, 0);
+		static readonly int[] m5 = Harness.Keys(Size, 5, Size);
+		static readonly int[] k6 = Harness.Keys(Size, 6, 0);
+		static readonly int[] m6 = Harness.Keys(Size, 6, Size);
+		static readonly int[] k7 = Harness.Keys(Size, 7, 0);
+		static readonly int[] m7 = Harness.Keys(Size, 7, Size);
+		static readonly int[] k8 = Harness.Keys(Size, 8, 0);
+		static readonly int[] m8 = Harness.Keys(Size, 8, Size);
+		static void Mapping1(Harness harness)
+		{
+			var mapping = new Mapping<int, int>(key1 => key1);
+			harness.Run("Mapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView1(Harness harness)
+		{
+			var function = new Mapping<int, int>(key1 => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where(key1 => key1 >= 0);
+			var added = new Mapping<int, int>(key1 => function[key1] + 1);
+			var doubled = new Mapping<int, int>(key1 => added[key1] * 2);
+			var nested = new Mapping<int, int>(key1 => key1 >= 0 ? doubled[key1] : -1);
+			harness.Run("MappingView/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/1/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping1(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i]] = i;
+			}
+			harness.Run("DictionaryMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/1/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/1/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping1(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/1/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/1/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping1(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i]] = i;
+			}
+			harness.Run("ColumnarMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/1/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/1/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping1(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i]] = i;
+			}
+			harness.Run("SortedMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/1/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/1/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping1(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i]] = i;
+			}
+			harness.Run("ShardedMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/1/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/1/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/1/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping1(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int>(path);
+			harness.Run("SnapshotMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/1/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/1/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping1(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int>(key1 => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i]];
+			}
+			harness.Run("LazyMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/1/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int>(key1 => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping1(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int>(key1 => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i]];
+			}
+			harness.Run("BoundedLazyMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/1/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int>(key1 => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping1(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int>(key1 => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i]];
+			}
+			harness.Run("ExpiringLazyMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/1/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int>(key1 => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping1(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int>(key1 => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/1/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int>(key1 => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping1(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int>((key1, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/1/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int>((key1, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping1(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, object>(key1 => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i]];
+			}
+			harness.Run("WeakLazyMapping/1/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/1/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/1/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, object>(key1 => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, object>(key1 => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/1/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/1/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, object>(key1 => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping2(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int>((key1, key2) => key1);
+			harness.Run("Mapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView2(Harness harness)
+		{
+			var function = new Mapping<int, int, int>((key1, key2) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2) => key1 >= 0);
+			var added = new Mapping<int, int, int>((key1, key2) => function[key1, key2] + 1);
+			var doubled = new Mapping<int, int, int>((key1, key2) => added[key1, key2] * 2);
+			var nested = new Mapping<int, int, int>((key1, key2) => key1 >= 0 ? doubled[key1, key2] : -1);
+			harness.Run("MappingView/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/2/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping2(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i]] = i;
+			}
+			harness.Run("DictionaryMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/2/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/2/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping2(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/2/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/2/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping2(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i]] = i;
+			}
+			harness.Run("ColumnarMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/2/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/2/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping2(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i]] = i;
+			}
+			harness.Run("SortedMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/2/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/2/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping2(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i]] = i;
+			}
+			harness.Run("ShardedMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/2/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/2/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/2/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping2(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int>(path);
+			harness.Run("SnapshotMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/2/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/2/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping2(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int>((key1, key2) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i]];
+			}
+			harness.Run("LazyMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/2/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int>((key1, key2) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping2(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int>((key1, key2) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i]];
+			}
+			harness.Run("BoundedLazyMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/2/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int>((key1, key2) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping2(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int>((key1, key2) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i]];
+			}
+			harness.Run("ExpiringLazyMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/2/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int>((key1, key2) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping2(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int>((key1, key2) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/2/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int>((key1, key2) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping2(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int>((key1, key2, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/2/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int>((key1, key2, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping2(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, object>((key1, key2) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i]];
+			}
+			harness.Run("WeakLazyMapping/2/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/2/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/2/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, object>((key1, key2) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, object>((key1, key2) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/2/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/2/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, object>((key1, key2) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping3(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int, int>((key1, key2, key3) => key1);
+			harness.Run("Mapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView3(Harness harness)
+		{
+			var function = new Mapping<int, int, int, int>((key1, key2, key3) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2, key3) => key1 >= 0);
+			var added = new Mapping<int, int, int, int>((key1, key2, key3) => function[key1, key2, key3] + 1);
+			var doubled = new Mapping<int, int, int, int>((key1, key2, key3) => added[key1, key2, key3] * 2);
+			var nested = new Mapping<int, int, int, int>((key1, key2, key3) => key1 >= 0 ? doubled[key1, key2, key3] : -1);
+			harness.Run("MappingView/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/3/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping3(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i]] = i;
+			}
+			harness.Run("DictionaryMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/3/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/3/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping3(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/3/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/3/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping3(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i]] = i;
+			}
+			harness.Run("ColumnarMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/3/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/3/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping3(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i]] = i;
+			}
+			harness.Run("SortedMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/3/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/3/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping3(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i]] = i;
+			}
+			harness.Run("ShardedMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/3/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/3/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/3/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping3(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int, int>(path);
+			harness.Run("SnapshotMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/3/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/3/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping3(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int, int>((key1, key2, key3) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i]];
+			}
+			harness.Run("LazyMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/3/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int, int>((key1, key2, key3) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping3(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int, int>((key1, key2, key3) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i]];
+			}
+			harness.Run("BoundedLazyMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/3/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int, int>((key1, key2, key3) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping3(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int, int>((key1, key2, key3) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i]];
+			}
+			harness.Run("ExpiringLazyMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/3/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int, int>((key1, key2, key3) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping3(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int, int>((key1, key2, key3) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/3/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int, int>((key1, key2, key3) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping3(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int, int>((key1, key2, key3, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/3/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int, int>((key1, key2, key3, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping3(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, int, object>((key1, key2, key3) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i]];
+			}
+			harness.Run("WeakLazyMapping/3/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/3/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/3/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, int, object>((key1, key2, key3) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, int, object>((key1, key2, key3) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i], k3[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/3/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask], k3[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/3/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, int, object>((key1, key2, key3) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping4(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int, int, int>((key1, key2, key3, key4) => key1);
+			harness.Run("Mapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView4(Harness harness)
+		{
+			var function = new Mapping<int, int, int, int, int>((key1, key2, key3, key4) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2, key3, key4) => key1 >= 0);
+			var added = new Mapping<int, int, int, int, int>((key1, key2, key3, key4) => function[key1, key2, key3, key4] + 1);
+			var doubled = new Mapping<int, int, int, int, int>((key1, key2, key3, key4) => added[key1, key2, key3, key4] * 2);
+			var nested = new Mapping<int, int, int, int, int>((key1, key2, key3, key4) => key1 >= 0 ? doubled[key1, key2, key3, key4] : -1);
+			harness.Run("MappingView/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/4/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping4(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i]] = i;
+			}
+			harness.Run("DictionaryMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/4/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/4/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping4(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/4/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/4/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping4(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i]] = i;
+			}
+			harness.Run("ColumnarMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/4/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/4/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping4(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i]] = i;
+			}
+			harness.Run("SortedMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/4/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/4/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping4(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i]] = i;
+			}
+			harness.Run("ShardedMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/4/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/4/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/4/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping4(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int, int, int>(path);
+			harness.Run("SnapshotMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/4/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/4/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping4(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i]];
+			}
+			harness.Run("LazyMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/4/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping4(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i]];
+			}
+			harness.Run("BoundedLazyMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/4/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping4(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i]];
+			}
+			harness.Run("ExpiringLazyMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/4/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping4(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/4/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int, int, int>((key1, key2, key3, key4) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping4(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int, int, int>((key1, key2, key3, key4, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/4/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int, int, int>((key1, key2, key3, key4, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping4(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, int, int, object>((key1, key2, key3, key4) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i]];
+			}
+			harness.Run("WeakLazyMapping/4/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/4/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/4/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, int, int, object>((key1, key2, key3, key4) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i, i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, int, int, object>((key1, key2, key3, key4) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i], k3[i], k4[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/4/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/4/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, int, int, object>((key1, key2, key3, key4) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i, i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping5(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1);
+			harness.Run("Mapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView5(Harness harness)
+		{
+			var function = new Mapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2, key3, key4, key5) => key1 >= 0);
+			var added = new Mapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => function[key1, key2, key3, key4, key5] + 1);
+			var doubled = new Mapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => added[key1, key2, key3, key4, key5] * 2);
+			var nested = new Mapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1 >= 0 ? doubled[key1, key2, key3, key4, key5] : -1);
+			harness.Run("MappingView/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/5/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping5(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i]] = i;
+			}
+			harness.Run("DictionaryMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/5/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/5/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping5(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/5/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/5/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping5(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i]] = i;
+			}
+			harness.Run("ColumnarMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/5/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/5/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping5(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i]] = i;
+			}
+			harness.Run("SortedMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/5/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/5/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping5(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i]] = i;
+			}
+			harness.Run("ShardedMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/5/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/5/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/5/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping5(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int, int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int, int, int, int>(path);
+			harness.Run("SnapshotMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/5/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/5/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping5(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i]];
+			}
+			harness.Run("LazyMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/5/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping5(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i]];
+			}
+			harness.Run("BoundedLazyMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/5/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping5(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i]];
+			}
+			harness.Run("ExpiringLazyMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/5/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping5(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/5/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping5(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/5/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int, int, int, int>((key1, key2, key3, key4, key5, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping5(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, int, int, int, object>((key1, key2, key3, key4, key5) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i]];
+			}
+			harness.Run("WeakLazyMapping/5/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/5/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/5/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, int, int, int, object>((key1, key2, key3, key4, key5) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i, i, i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, int, int, int, object>((key1, key2, key3, key4, key5) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i], k3[i], k4[i], k5[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/5/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/5/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, int, int, int, object>((key1, key2, key3, key4, key5) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i, i, i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping6(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1);
+			harness.Run("Mapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView6(Harness harness)
+		{
+			var function = new Mapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2, key3, key4, key5, key6) => key1 >= 0);
+			var added = new Mapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => function[key1, key2, key3, key4, key5, key6] + 1);
+			var doubled = new Mapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => added[key1, key2, key3, key4, key5, key6] * 2);
+			var nested = new Mapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1 >= 0 ? doubled[key1, key2, key3, key4, key5, key6] : -1);
+			harness.Run("MappingView/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/6/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping6(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] = i;
+			}
+			harness.Run("DictionaryMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/6/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/6/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping6(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/6/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/6/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping6(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] = i;
+			}
+			harness.Run("ColumnarMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/6/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/6/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping6(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] = i;
+			}
+			harness.Run("SortedMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/6/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/6/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping6(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] = i;
+			}
+			harness.Run("ShardedMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/6/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/6/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/6/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping6(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int, int, int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int, int, int, int, int>(path);
+			harness.Run("SnapshotMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/6/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/6/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping6(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]];
+			}
+			harness.Run("LazyMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/6/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping6(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]];
+			}
+			harness.Run("BoundedLazyMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/6/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping6(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]];
+			}
+			harness.Run("ExpiringLazyMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/6/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping6(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/6/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping6(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/6/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping6(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]];
+			}
+			harness.Run("WeakLazyMapping/6/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/6/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/6/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i, i, i, i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/6/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/6/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i, i, i, i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping7(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1);
+			harness.Run("Mapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView7(Harness harness)
+		{
+			var function = new Mapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2, key3, key4, key5, key6, key7) => key1 >= 0);
+			var added = new Mapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => function[key1, key2, key3, key4, key5, key6, key7] + 1);
+			var doubled = new Mapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => added[key1, key2, key3, key4, key5, key6, key7] * 2);
+			var nested = new Mapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1 >= 0 ? doubled[key1, key2, key3, key4, key5, key6, key7] : -1);
+			harness.Run("MappingView/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/7/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping7(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] = i;
+			}
+			harness.Run("DictionaryMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/7/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/7/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping7(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/7/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/7/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping7(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] = i;
+			}
+			harness.Run("ColumnarMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/7/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/7/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping7(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] = i;
+			}
+			harness.Run("SortedMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/7/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/7/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping7(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] = i;
+			}
+			harness.Run("ShardedMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/7/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/7/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/7/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping7(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int, int, int, int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int, int, int, int, int, int>(path);
+			harness.Run("SnapshotMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/7/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/7/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping7(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]];
+			}
+			harness.Run("LazyMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/7/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping7(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]];
+			}
+			harness.Run("BoundedLazyMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/7/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping7(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]];
+			}
+			harness.Run("ExpiringLazyMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/7/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping7(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/7/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping7(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/7/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping7(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]];
+			}
+			harness.Run("WeakLazyMapping/7/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/7/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/7/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i, i, i, i, i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/7/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/7/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i, i, i, i, i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		static void Mapping8(Harness harness)
+		{
+			var mapping = new Mapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1);
+			harness.Run("Mapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void MappingView8(Harness harness)
+		{
+			var function = new Mapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1);
+			var mapping = function.Select(v => v + 1).Select(v => v * 2).Where((key1, key2, key3, key4, key5, key6, key7, key8) => key1 >= 0);
+			var added = new Mapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => function[key1, key2, key3, key4, key5, key6, key7, key8] + 1);
+			var doubled = new Mapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => added[key1, key2, key3, key4, key5, key6, key7, key8] * 2);
+			var nested = new Mapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1 >= 0 ? doubled[key1, key2, key3, key4, key5, key6, key7, key8] : -1);
+			harness.Run("MappingView/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("MappingView/8/NestedGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += nested[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+		}
+		static void DictionaryMapping8(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] = i;
+			}
+			harness.Run("DictionaryMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/8/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask], m8[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("DictionaryMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("DictionaryMapping/8/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void FrozenMapping8(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] = i;
+			}
+			var frozen = mapping.Freeze();
+			harness.Run("FrozenMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/8/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (frozen.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask], m8[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("FrozenMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += frozen[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("FrozenMapping/8/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in frozen)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ColumnarMapping8(Harness harness)
+		{
+			var mapping = new ColumnarMapping<int, int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] = i;
+			}
+			harness.Run("ColumnarMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/8/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask], m8[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("ColumnarMapping/8/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SortedMapping8(Harness harness)
+		{
+			var mapping = new SortedMapping<int, int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] = i;
+			}
+			harness.Run("SortedMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/8/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask], m8[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.Run("SortedMapping/8/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void ShardedMapping8(Harness harness)
+		{
+			var mapping = new ShardedMapping<int, int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] = i;
+			}
+			harness.Run("ShardedMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/8/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask], m8[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ShardedMapping/8/ConcurrentWriters", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]] = i);
+				}
+				return sum;
+			});
+			harness.Run("ShardedMapping/8/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in mapping)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+		}
+		static void SnapshotMapping8(Harness harness)
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int, int>();
+			for(int i = 0; i < Size; i++)
+			{
+				mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] = i;
+			}
+			var path = Path.GetTempFileName();
+			SnapshotMapping<int, int, int, int, int, int, int, int, int>.Write(path, mapping);
+			var snapshot = new SnapshotMapping<int, int, int, int, int, int, int, int, int>(path);
+			harness.Run("SnapshotMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/8/GetMiss", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (snapshot.Contains(m1[i & Mask], m2[i & Mask], m3[i & Mask], m4[i & Mask], m5[i & Mask], m6[i & Mask], m7[i & Mask], m8[i & Mask]) ? 1 : 0);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("SnapshotMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += snapshot[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("SnapshotMapping/8/Enumerate", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i += Size)
+				{
+					foreach(var entry in snapshot)
+					{
+						sum += entry.Value;
+					}
+				}
+				return sum;
+			});
+			snapshot.Dispose();
+			File.Delete(path);
+		}
+		static void LazyMapping8(Harness harness)
+		{
+			var mapping = new LazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]];
+			}
+			harness.Run("LazyMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("LazyMapping/8/Instantiate", iterations =>
+			{
+				var fresh = new LazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void BoundedLazyMapping8(Harness harness)
+		{
+			var mapping = new BoundedLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1, Size);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]];
+			}
+			harness.Run("BoundedLazyMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("BoundedLazyMapping/8/Instantiate", iterations =>
+			{
+				var fresh = new BoundedLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1, Size / 4);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ExpiringLazyMapping8(Harness harness)
+		{
+			var mapping = new ExpiringLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1, TimeSpan.FromMinutes(10));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]];
+			}
+			harness.Run("ExpiringLazyMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ExpiringLazyMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ExpiringLazyMapping/8/Instantiate", iterations =>
+			{
+				var fresh = new ExpiringLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1, TimeSpan.FromMinutes(10));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void ConcurrentLazyMapping8(Harness harness)
+		{
+			var mapping = new ConcurrentLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1);
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]];
+			}
+			harness.Run("ConcurrentLazyMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.RunConcurrent("ConcurrentLazyMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]];
+				}
+				return sum;
+			});
+			harness.Run("ConcurrentLazyMapping/8/Instantiate", iterations =>
+			{
+				var fresh = new ConcurrentLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8) => key1);
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i, i];
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void AsyncLazyMapping8(Harness harness)
+		{
+			var mapping = new AsyncLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8, cancellationToken) => Harness.Completed(key1));
+			var alive = new int[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]].Result;
+			}
+			harness.Run("AsyncLazyMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]].Result;
+				}
+				return sum;
+			});
+			harness.Run("AsyncLazyMapping/8/Instantiate", iterations =>
+			{
+				var fresh = new AsyncLazyMapping<int, int, int, int, int, int, int, int, int>((key1, key2, key3, key4, key5, key6, key7, key8, cancellationToken) => Harness.Completed(key1));
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += fresh[i, i, i, i, i, i, i, i].Result;
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+		}
+		static void WeakLazyMapping8(Harness harness)
+		{
+			var mapping = new WeakLazyMapping<int, int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7, key8) => new object());
+			var alive = new object[Size];
+			for(int i = 0; i < Size; i++)
+			{
+				alive[i] = mapping[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]];
+			}
+			harness.Run("WeakLazyMapping/8/GetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.RunConcurrent("WeakLazyMapping/8/ConcurrentReaders", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (mapping[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Run("WeakLazyMapping/8/Instantiate", iterations =>
+			{
+				var fresh = new WeakLazyMapping<int, int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7, key8) => new object());
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (fresh[i, i, i, i, i, i, i, i] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			GC.KeepAlive(alive);
+			var tiered = new WeakLazyMapping<int, int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7, key8) => new object(), null, 2 * Size);
+			for(int i = 0; i < Size; i++)
+			{
+				Harness.Sink += (tiered[k1[i], k2[i], k3[i], k4[i], k5[i], k6[i], k7[i], k8[i]] == null ? 0 : 1);
+			}
+			harness.Run("WeakLazyMapping/8/TieredGetHit", iterations =>
+			{
+				long sum = 0;
+				for(int i = 0; i < iterations; i++)
+				{
+					sum += (tiered[k1[i & Mask], k2[i & Mask], k3[i & Mask], k4[i & Mask], k5[i & Mask], k6[i & Mask], k7[i & Mask], k8[i & Mask]] == null ? 0 : 1);
+				}
+				return sum;
+			});
+			harness.Measure("WeakLazyMapping/8/Cleanup", () =>
+			{
+				var dropped = new WeakLazyMapping<int, int, int, int, int, int, int, int, object>((key1, key2, key3, key4, key5, key6, key7, key8) => new object());
+				dropped.Statistics = new MappingStatistics();
+				for(int i = 0; i < Size; i++)
+				{
+					Harness.Sink += (dropped[i, i, i, i, i, i, i, i] == null ? 0 : 1);
+				}
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				return dropped.Statistics;
+			});
+		}
+		public static void RunAll(Harness harness)
+		{
+			Mapping1(harness);
+			MappingView1(harness);
+			DictionaryMapping1(harness);
+			FrozenMapping1(harness);
+			ColumnarMapping1(harness);
+			SortedMapping1(harness);
+			ShardedMapping1(harness);
+			SnapshotMapping1(harness);
+			LazyMapping1(harness);
+			BoundedLazyMapping1(harness);
+			ExpiringLazyMapping1(harness);
+			ConcurrentLazyMapping1(harness);
+			AsyncLazyMapping1(harness);
+			WeakLazyMapping1(harness);
+			Mapping2(harness);
+			MappingView2(harness);
+			DictionaryMapping2(harness);
+			FrozenMapping2(harness);
+			ColumnarMapping2(harness);
+			SortedMapping2(harness);
+			ShardedMapping2(harness);
+			SnapshotMapping2(harness);
+			LazyMapping2(harness);
+			BoundedLazyMapping2(harness);
+			ExpiringLazyMapping2(harness);
+			ConcurrentLazyMapping2(harness);
+			AsyncLazyMapping2(harness);
+			WeakLazyMapping2(harness);
+			Mapping3(harness);
+			MappingView3(harness);
+			DictionaryMapping3(harness);
+			FrozenMapping3(harness);
+			ColumnarMapping3(harness);
+			SortedMapping3(harness);
+			ShardedMapping3(harness);
+			SnapshotMapping3(harness);
+			LazyMapping3(harness);
+			BoundedLazyMapping3(harness);
+			ExpiringLazyMapping3(harness);
+			ConcurrentLazyMapping3(harness);
+			AsyncLazyMapping3(harness);
+			WeakLazyMapping3(harness);
+			Mapping4(harness);
+			MappingView4(harness);
+			DictionaryMapping4(harness);
+			FrozenMapping4(harness);
+			ColumnarMapping4(harness);
+			SortedMapping4(harness);
+			ShardedMapping4(harness);
+			SnapshotMapping4(harness);
+			LazyMapping4(harness);
+			BoundedLazyMapping4(harness);
+			ExpiringLazyMapping4(harness);
+			ConcurrentLazyMapping4(harness);
+			AsyncLazyMapping4(harness);
+			WeakLazyMapping4(harness);
+			Mapping5(harness);
+			MappingView5(harness);
+			DictionaryMapping5(harness);
+			FrozenMapping5(harness);
+			ColumnarMapping5(harness);
+			SortedMapping5(harness);
+			ShardedMapping5(harness);
+			SnapshotMapping5(harness);
+			LazyMapping5(harness);
+			BoundedLazyMapping5(harness);
+			ExpiringLazyMapping5(harness);
+			ConcurrentLazyMapping5(harness);
+			AsyncLazyMapping5(harness);
+			WeakLazyMapping5(harness);
+			Mapping6(harness);
+			MappingView6(harness);
+			DictionaryMapping6(harness);
+			FrozenMapping6(harness);
+			ColumnarMapping6(harness);
+			SortedMapping6(harness);
+			ShardedMapping6(harness);
+			SnapshotMapping6(harness);
+			LazyMapping6(harness);
+			BoundedLazyMapping6(harness);
+			ExpiringLazyMapping6(harness);
+			ConcurrentLazyMapping6(harness);
+			AsyncLazyMapping6(harness);
+			WeakLazyMapping6(harness);
+			Mapping7(harness);
+			MappingView7(harness);
+			DictionaryMapping7(harness);
+			FrozenMapping7(harness);
+			ColumnarMapping7(harness);
+			SortedMapping7(harness);
+			ShardedMapping7(harness);
+			SnapshotMapping7(harness);
+			LazyMapping7(harness);
+			BoundedLazyMapping7(harness);
+			ExpiringLazyMapping7(harness);
+			ConcurrentLazyMapping7(harness);
+			AsyncLazyMapping7(harness);
+			WeakLazyMapping7(harness);
+			Mapping8(harness);
+			MappingView8(harness);
+			DictionaryMapping8(harness);
+			FrozenMapping8(harness);
+			ColumnarMapping8(harness);
+			SortedMapping8(harness);
+			ShardedMapping8(harness);
+			SnapshotMapping8(harness);
+			LazyMapping8(harness);
+			BoundedLazyMapping8(harness);
+			ExpiringLazyMapping8(harness);
+			ConcurrentLazyMapping8(harness);
+			AsyncLazyMapping8(harness);
+			WeakLazyMapping8(harness);
+		}
+	}
+}
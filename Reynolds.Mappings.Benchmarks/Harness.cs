@@ -0,0 +1,157 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Reynolds.Mappings.Benchmarks
+{
+	// Runs a benchmark body with doubling iteration counts until one run takes MinimumTime, and reports
+	// the time, the bytes allocated (by all threads) and the collections per generation of that run.
+	public class Harness
+	{
+		// benchmark results are added here so that the JIT cannot drop the work
+		public static long Sink;
+
+		readonly string filter;
+
+		static TimeSpan minimumTime = TimeSpan.FromMilliseconds(500);
+		public static TimeSpan MinimumTime
+		{
+			get
+			{
+				return minimumTime;
+			}
+			set
+			{
+				minimumTime = value;
+			}
+		}
+
+		// runs only the benchmarks whose name contains filter, or all when it is null
+		public Harness(string filter)
+		{
+			this.filter = filter;
+			AppDomain.MonitoringIsEnabled = true;
+			Console.WriteLine("{0,-48} {1,14} {2,12} {3,6} {4,6} {5,6}", "benchmark", "ns/op", "B/op", "gen0", "gen1", "gen2");
+		}
+
+		public static int[] Keys(int count, int component, int offset)
+		{
+			var keys = new int[count];
+			for(int i = 0; i < count; i++)
+				keys[i] = (i + offset) * (2 * component + 1);
+			return keys;
+		}
+
+		public static Task<T> Completed<T>(T value)
+		{
+			var source = new TaskCompletionSource<T>();
+			source.SetResult(value);
+			return source.Task;
+		}
+
+		bool Selected(string name)
+		{
+			return filter == null || name.IndexOf(filter, StringComparison.OrdinalIgnoreCase) >= 0;
+		}
+
+		public void Run(string name, Func<int, long> body)
+		{
+			Measure(name, 1, body);
+		}
+
+		// the body runs on every processor at once; the time reported is wall-clock time per operation overall
+		public void RunConcurrent(string name, Func<int, long> body)
+		{
+			Measure(name, Environment.ProcessorCount, body);
+		}
+
+		// body fills a weak mapping and drops its values; reports the cleanup time per entry removed, once the
+		// cleanup thread has removed every dropped entry or its passes have stopped for half a second
+		public void Measure(string name, Func<MappingStatistics> body)
+		{
+			if(!Selected(name))
+				return;
+			var statistics = body();
+			var waited = Stopwatch.StartNew();
+			var idle = Stopwatch.StartNew();
+			long cleanups = 0;
+			while(statistics.Removals < statistics.Misses && waited.Elapsed < TimeSpan.FromSeconds(10))
+			{
+				Thread.Sleep(10);
+				long current = statistics.Cleanups;
+				if(current != cleanups)
+				{
+					cleanups = current;
+					idle.Restart();
+				}
+				else if(cleanups > 0 && idle.Elapsed >= TimeSpan.FromMilliseconds(500))
+					break;
+			}
+			long removed = statistics.Removals;
+			if(removed == 0)
+				Console.WriteLine("{0,-48} {1,14} {2,12} {3,6} {4,6} {5,6}", name, "-", "-", "-", "-", "-");
+			else
+				Console.WriteLine("{0,-48} {1,14:F1} {2,12} {3,6} {4,6} {5,6}", name, statistics.CleanupTime.TotalMilliseconds * 1e6 / removed, "-", "-", "-", "-");
+		}
+
+		void Measure(string name, int threads, Func<int, long> body)
+		{
+			if(!Selected(name))
+				return;
+			Execute(body, threads, 1024);
+			for(int iterations = 1024; ; iterations *= 2)
+			{
+				GC.Collect();
+				GC.WaitForPendingFinalizers();
+				GC.Collect();
+				var collections = new int[3];
+				for(int g = 0; g < collections.Length; g++)
+					collections[g] = GC.CollectionCount(g);
+				long allocated = AppDomain.CurrentDomain.MonitoringTotalAllocatedMemorySize;
+				var elapsed = Execute(body, threads, iterations);
+				for(int g = 0; g < collections.Length; g++)
+					collections[g] = GC.CollectionCount(g) - collections[g];
+				allocated = AppDomain.CurrentDomain.MonitoringTotalAllocatedMemorySize - allocated;
+				if(elapsed >= minimumTime || iterations >= 1 << 28)
+				{
+					double operations = (double) iterations * threads;
+					Console.WriteLine("{0,-48} {1,14:F1} {2,12:F1} {3,6} {4,6} {5,6}", name, elapsed.TotalMilliseconds * 1e6 / operations, allocated / operations, collections[0], collections[1], collections[2]);
+					return;
+				}
+			}
+		}
+
+		static TimeSpan Execute(Func<int, long> body, int threads, int iterations)
+		{
+			if(threads == 1)
+			{
+				var stopwatch = Stopwatch.StartNew();
+				Sink += body(iterations);
+				return stopwatch.Elapsed;
+			}
+			var ready = new CountdownEvent(threads);
+			var start = new ManualResetEvent(false);
+			var workers = new Thread[threads];
+			for(int t = 0; t < threads; t++)
+			{
+				workers[t] = new Thread(() =>
+				{
+					ready.Signal();
+					start.WaitOne();
+					Interlocked.Add(ref Sink, body(iterations));
+				});
+				workers[t].Start();
+			}
+			ready.Wait();
+			var elapsed = Stopwatch.StartNew();
+			start.Set();
+			foreach(var worker in workers)
+				worker.Join();
+			return elapsed.Elapsed;
+		}
+	}
+}
@@ -0,0 +1,17 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+
+namespace Reynolds.Mappings.Benchmarks
+{
+	// Usage: Reynolds.Mappings.Benchmarks [filter], e.g. "WeakLazyMapping/3" or "Enumerate".
+	// Benchmarks.cs is generated by Mapping.py along with Mapping.cs.
+	class Program
+	{
+		static void Main(string[] args)
+		{
+			Benchmarks.RunAll(new Harness(args.Length > 0 ? args[0] : null));
+		}
+	}
+}
@@ -0,0 +1,947 @@
+# Generated by Mapping.py. Needs pytest-benchmark:
+#   pytest --benchmark-only bench_mappings.py
+# Each group times the generated mappings and functools.lru_cache on the same keys.
+
+import functools
+
+from reynolds_mappings import *
+
+SIZE = 4096
+ROUNDS = 20
+
+K1 = [i * 3 for i in range(SIZE)]
+K2 = [i * 5 for i in range(SIZE)]
+K3 = [i * 7 for i in range(SIZE)]
+K4 = [i * 9 for i in range(SIZE)]
+K5 = [i * 11 for i in range(SIZE)]
+K6 = [i * 13 for i in range(SIZE)]
+K7 = [i * 15 for i in range(SIZE)]
+K8 = [i * 17 for i in range(SIZE)]
+KEYS1 = K1
+KEYS2 = list(zip(K1, K2))
+KEYS3 = list(zip(K1, K2, K3))
+KEYS4 = list(zip(K1, K2, K3, K4))
+KEYS5 = list(zip(K1, K2, K3, K4, K5))
+KEYS6 = list(zip(K1, K2, K3, K4, K5, K6))
+KEYS7 = list(zip(K1, K2, K3, K4, K5, K6, K7))
+KEYS8 = list(zip(K1, K2, K3, K4, K5, K6, K7, K8))
+
+
+class Value:
+	"""A weakly referenceable value for WeakLazyMapping."""
+	__slots__ = ("value", "__weakref__")
+
+	def __init__(self, value):
+		self.value = value
+
+
+def call1(function, keys):
+	for key in keys:
+		function(key)
+
+
+def subscript1(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call2(function, keys):
+	for key1, key2 in keys:
+		function(key1, key2)
+
+
+def subscript2(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call3(function, keys):
+	for key1, key2, key3 in keys:
+		function(key1, key2, key3)
+
+
+def subscript3(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call4(function, keys):
+	for key1, key2, key3, key4 in keys:
+		function(key1, key2, key3, key4)
+
+
+def subscript4(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call5(function, keys):
+	for key1, key2, key3, key4, key5 in keys:
+		function(key1, key2, key3, key4, key5)
+
+
+def subscript5(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call6(function, keys):
+	for key1, key2, key3, key4, key5, key6 in keys:
+		function(key1, key2, key3, key4, key5, key6)
+
+
+def subscript6(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call7(function, keys):
+	for key1, key2, key3, key4, key5, key6, key7 in keys:
+		function(key1, key2, key3, key4, key5, key6, key7)
+
+
+def subscript7(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def call8(function, keys):
+	for key1, key2, key3, key4, key5, key6, key7, key8 in keys:
+		function(key1, key2, key3, key4, key5, key6, key7, key8)
+
+
+def subscript8(mapping, keys):
+	for key in keys:
+		mapping[key]
+
+
+def test_lru_cache_1_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key: key)
+	call1(mapping, KEYS1)
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_lru_cache_1_instantiate(benchmark):
+	benchmark.group = "1/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key: key), KEYS1), {})
+	benchmark.pedantic(call1, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_1_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = Mapping1(lambda key: key)
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_mapping_1_subscript_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = Mapping1(lambda key: key)
+	benchmark(subscript1, mapping, KEYS1)
+
+
+def test_dictionary_mapping_1_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = DictionaryMapping1((key, key) for key in KEYS1)
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_dictionary_mapping_1_subscript_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = DictionaryMapping1((key, key) for key in KEYS1)
+	benchmark(subscript1, mapping, KEYS1)
+
+
+def test_lazy_mapping_1_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = LazyMapping1(lambda key: key)
+	alive = [mapping(key) for key in KEYS1]
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_lazy_mapping_1_subscript_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = LazyMapping1(lambda key: key)
+	alive = [mapping(key) for key in KEYS1]
+	benchmark(subscript1, mapping, KEYS1)
+
+
+def test_lazy_mapping_1_instantiate(benchmark):
+	benchmark.group = "1/Instantiate"
+	setup = lambda: ((LazyMapping1(lambda key: key), KEYS1), {})
+	benchmark.pedantic(call1, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_1_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = ConcurrentLazyMapping1(lambda key: key)
+	alive = [mapping(key) for key in KEYS1]
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_concurrent_lazy_mapping_1_subscript_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = ConcurrentLazyMapping1(lambda key: key)
+	alive = [mapping(key) for key in KEYS1]
+	benchmark(subscript1, mapping, KEYS1)
+
+
+def test_concurrent_lazy_mapping_1_instantiate(benchmark):
+	benchmark.group = "1/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping1(lambda key: key), KEYS1), {})
+	benchmark.pedantic(call1, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_1_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = WeakLazyMapping1(lambda key: Value(key))
+	alive = [mapping(key) for key in KEYS1]
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_weak_lazy_mapping_1_subscript_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = WeakLazyMapping1(lambda key: Value(key))
+	alive = [mapping(key) for key in KEYS1]
+	benchmark(subscript1, mapping, KEYS1)
+
+
+def test_weak_lazy_mapping_1_instantiate(benchmark):
+	benchmark.group = "1/Instantiate"
+	setup = lambda: ((WeakLazyMapping1(lambda key: Value(key)), KEYS1), {})
+	benchmark.pedantic(call1, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_1_tiered_get_hit(benchmark):
+	benchmark.group = "1/GetHit"
+	mapping = WeakLazyMapping1(lambda key: Value(key), None, SIZE)
+	call1(mapping, KEYS1)
+	benchmark(call1, mapping, KEYS1)
+
+
+def test_lru_cache_2_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2: key1)
+	call2(mapping, KEYS2)
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_lru_cache_2_instantiate(benchmark):
+	benchmark.group = "2/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2: key1), KEYS2), {})
+	benchmark.pedantic(call2, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_2_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = Mapping2(lambda key1, key2: key1)
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_mapping_2_subscript_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = Mapping2(lambda key1, key2: key1)
+	benchmark(subscript2, mapping, KEYS2)
+
+
+def test_dictionary_mapping_2_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = DictionaryMapping2((keys, keys[0]) for keys in KEYS2)
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_dictionary_mapping_2_subscript_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = DictionaryMapping2((keys, keys[0]) for keys in KEYS2)
+	benchmark(subscript2, mapping, KEYS2)
+
+
+def test_lazy_mapping_2_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = LazyMapping2(lambda key1, key2: key1)
+	alive = [mapping(key1, key2) for key1, key2 in KEYS2]
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_lazy_mapping_2_subscript_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = LazyMapping2(lambda key1, key2: key1)
+	alive = [mapping(key1, key2) for key1, key2 in KEYS2]
+	benchmark(subscript2, mapping, KEYS2)
+
+
+def test_lazy_mapping_2_instantiate(benchmark):
+	benchmark.group = "2/Instantiate"
+	setup = lambda: ((LazyMapping2(lambda key1, key2: key1), KEYS2), {})
+	benchmark.pedantic(call2, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_2_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = ConcurrentLazyMapping2(lambda key1, key2: key1)
+	alive = [mapping(key1, key2) for key1, key2 in KEYS2]
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_concurrent_lazy_mapping_2_subscript_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = ConcurrentLazyMapping2(lambda key1, key2: key1)
+	alive = [mapping(key1, key2) for key1, key2 in KEYS2]
+	benchmark(subscript2, mapping, KEYS2)
+
+
+def test_concurrent_lazy_mapping_2_instantiate(benchmark):
+	benchmark.group = "2/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping2(lambda key1, key2: key1), KEYS2), {})
+	benchmark.pedantic(call2, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_2_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = WeakLazyMapping2(lambda key1, key2: Value(key1))
+	alive = [mapping(key1, key2) for key1, key2 in KEYS2]
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_weak_lazy_mapping_2_subscript_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = WeakLazyMapping2(lambda key1, key2: Value(key1))
+	alive = [mapping(key1, key2) for key1, key2 in KEYS2]
+	benchmark(subscript2, mapping, KEYS2)
+
+
+def test_weak_lazy_mapping_2_instantiate(benchmark):
+	benchmark.group = "2/Instantiate"
+	setup = lambda: ((WeakLazyMapping2(lambda key1, key2: Value(key1)), KEYS2), {})
+	benchmark.pedantic(call2, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_2_tiered_get_hit(benchmark):
+	benchmark.group = "2/GetHit"
+	mapping = WeakLazyMapping2(lambda key1, key2: Value(key1), None, SIZE)
+	call2(mapping, KEYS2)
+	benchmark(call2, mapping, KEYS2)
+
+
+def test_lru_cache_3_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2, key3: key1)
+	call3(mapping, KEYS3)
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_lru_cache_3_instantiate(benchmark):
+	benchmark.group = "3/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2, key3: key1), KEYS3), {})
+	benchmark.pedantic(call3, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_3_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = Mapping3(lambda key1, key2, key3: key1)
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_mapping_3_subscript_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = Mapping3(lambda key1, key2, key3: key1)
+	benchmark(subscript3, mapping, KEYS3)
+
+
+def test_dictionary_mapping_3_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = DictionaryMapping3((keys, keys[0]) for keys in KEYS3)
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_dictionary_mapping_3_subscript_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = DictionaryMapping3((keys, keys[0]) for keys in KEYS3)
+	benchmark(subscript3, mapping, KEYS3)
+
+
+def test_lazy_mapping_3_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = LazyMapping3(lambda key1, key2, key3: key1)
+	alive = [mapping(key1, key2, key3) for key1, key2, key3 in KEYS3]
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_lazy_mapping_3_subscript_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = LazyMapping3(lambda key1, key2, key3: key1)
+	alive = [mapping(key1, key2, key3) for key1, key2, key3 in KEYS3]
+	benchmark(subscript3, mapping, KEYS3)
+
+
+def test_lazy_mapping_3_instantiate(benchmark):
+	benchmark.group = "3/Instantiate"
+	setup = lambda: ((LazyMapping3(lambda key1, key2, key3: key1), KEYS3), {})
+	benchmark.pedantic(call3, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_3_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = ConcurrentLazyMapping3(lambda key1, key2, key3: key1)
+	alive = [mapping(key1, key2, key3) for key1, key2, key3 in KEYS3]
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_concurrent_lazy_mapping_3_subscript_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = ConcurrentLazyMapping3(lambda key1, key2, key3: key1)
+	alive = [mapping(key1, key2, key3) for key1, key2, key3 in KEYS3]
+	benchmark(subscript3, mapping, KEYS3)
+
+
+def test_concurrent_lazy_mapping_3_instantiate(benchmark):
+	benchmark.group = "3/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping3(lambda key1, key2, key3: key1), KEYS3), {})
+	benchmark.pedantic(call3, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_3_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = WeakLazyMapping3(lambda key1, key2, key3: Value(key1))
+	alive = [mapping(key1, key2, key3) for key1, key2, key3 in KEYS3]
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_weak_lazy_mapping_3_subscript_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = WeakLazyMapping3(lambda key1, key2, key3: Value(key1))
+	alive = [mapping(key1, key2, key3) for key1, key2, key3 in KEYS3]
+	benchmark(subscript3, mapping, KEYS3)
+
+
+def test_weak_lazy_mapping_3_instantiate(benchmark):
+	benchmark.group = "3/Instantiate"
+	setup = lambda: ((WeakLazyMapping3(lambda key1, key2, key3: Value(key1)), KEYS3), {})
+	benchmark.pedantic(call3, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_3_tiered_get_hit(benchmark):
+	benchmark.group = "3/GetHit"
+	mapping = WeakLazyMapping3(lambda key1, key2, key3: Value(key1), None, SIZE)
+	call3(mapping, KEYS3)
+	benchmark(call3, mapping, KEYS3)
+
+
+def test_lru_cache_4_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4: key1)
+	call4(mapping, KEYS4)
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_lru_cache_4_instantiate(benchmark):
+	benchmark.group = "4/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4: key1), KEYS4), {})
+	benchmark.pedantic(call4, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_4_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = Mapping4(lambda key1, key2, key3, key4: key1)
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_mapping_4_subscript_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = Mapping4(lambda key1, key2, key3, key4: key1)
+	benchmark(subscript4, mapping, KEYS4)
+
+
+def test_dictionary_mapping_4_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = DictionaryMapping4((keys, keys[0]) for keys in KEYS4)
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_dictionary_mapping_4_subscript_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = DictionaryMapping4((keys, keys[0]) for keys in KEYS4)
+	benchmark(subscript4, mapping, KEYS4)
+
+
+def test_lazy_mapping_4_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = LazyMapping4(lambda key1, key2, key3, key4: key1)
+	alive = [mapping(key1, key2, key3, key4) for key1, key2, key3, key4 in KEYS4]
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_lazy_mapping_4_subscript_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = LazyMapping4(lambda key1, key2, key3, key4: key1)
+	alive = [mapping(key1, key2, key3, key4) for key1, key2, key3, key4 in KEYS4]
+	benchmark(subscript4, mapping, KEYS4)
+
+
+def test_lazy_mapping_4_instantiate(benchmark):
+	benchmark.group = "4/Instantiate"
+	setup = lambda: ((LazyMapping4(lambda key1, key2, key3, key4: key1), KEYS4), {})
+	benchmark.pedantic(call4, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_4_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = ConcurrentLazyMapping4(lambda key1, key2, key3, key4: key1)
+	alive = [mapping(key1, key2, key3, key4) for key1, key2, key3, key4 in KEYS4]
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_concurrent_lazy_mapping_4_subscript_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = ConcurrentLazyMapping4(lambda key1, key2, key3, key4: key1)
+	alive = [mapping(key1, key2, key3, key4) for key1, key2, key3, key4 in KEYS4]
+	benchmark(subscript4, mapping, KEYS4)
+
+
+def test_concurrent_lazy_mapping_4_instantiate(benchmark):
+	benchmark.group = "4/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping4(lambda key1, key2, key3, key4: key1), KEYS4), {})
+	benchmark.pedantic(call4, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_4_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = WeakLazyMapping4(lambda key1, key2, key3, key4: Value(key1))
+	alive = [mapping(key1, key2, key3, key4) for key1, key2, key3, key4 in KEYS4]
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_weak_lazy_mapping_4_subscript_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = WeakLazyMapping4(lambda key1, key2, key3, key4: Value(key1))
+	alive = [mapping(key1, key2, key3, key4) for key1, key2, key3, key4 in KEYS4]
+	benchmark(subscript4, mapping, KEYS4)
+
+
+def test_weak_lazy_mapping_4_instantiate(benchmark):
+	benchmark.group = "4/Instantiate"
+	setup = lambda: ((WeakLazyMapping4(lambda key1, key2, key3, key4: Value(key1)), KEYS4), {})
+	benchmark.pedantic(call4, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_4_tiered_get_hit(benchmark):
+	benchmark.group = "4/GetHit"
+	mapping = WeakLazyMapping4(lambda key1, key2, key3, key4: Value(key1), None, SIZE)
+	call4(mapping, KEYS4)
+	benchmark(call4, mapping, KEYS4)
+
+
+def test_lru_cache_5_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5: key1)
+	call5(mapping, KEYS5)
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_lru_cache_5_instantiate(benchmark):
+	benchmark.group = "5/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5: key1), KEYS5), {})
+	benchmark.pedantic(call5, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_5_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = Mapping5(lambda key1, key2, key3, key4, key5: key1)
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_mapping_5_subscript_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = Mapping5(lambda key1, key2, key3, key4, key5: key1)
+	benchmark(subscript5, mapping, KEYS5)
+
+
+def test_dictionary_mapping_5_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = DictionaryMapping5((keys, keys[0]) for keys in KEYS5)
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_dictionary_mapping_5_subscript_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = DictionaryMapping5((keys, keys[0]) for keys in KEYS5)
+	benchmark(subscript5, mapping, KEYS5)
+
+
+def test_lazy_mapping_5_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = LazyMapping5(lambda key1, key2, key3, key4, key5: key1)
+	alive = [mapping(key1, key2, key3, key4, key5) for key1, key2, key3, key4, key5 in KEYS5]
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_lazy_mapping_5_subscript_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = LazyMapping5(lambda key1, key2, key3, key4, key5: key1)
+	alive = [mapping(key1, key2, key3, key4, key5) for key1, key2, key3, key4, key5 in KEYS5]
+	benchmark(subscript5, mapping, KEYS5)
+
+
+def test_lazy_mapping_5_instantiate(benchmark):
+	benchmark.group = "5/Instantiate"
+	setup = lambda: ((LazyMapping5(lambda key1, key2, key3, key4, key5: key1), KEYS5), {})
+	benchmark.pedantic(call5, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_5_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = ConcurrentLazyMapping5(lambda key1, key2, key3, key4, key5: key1)
+	alive = [mapping(key1, key2, key3, key4, key5) for key1, key2, key3, key4, key5 in KEYS5]
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_concurrent_lazy_mapping_5_subscript_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = ConcurrentLazyMapping5(lambda key1, key2, key3, key4, key5: key1)
+	alive = [mapping(key1, key2, key3, key4, key5) for key1, key2, key3, key4, key5 in KEYS5]
+	benchmark(subscript5, mapping, KEYS5)
+
+
+def test_concurrent_lazy_mapping_5_instantiate(benchmark):
+	benchmark.group = "5/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping5(lambda key1, key2, key3, key4, key5: key1), KEYS5), {})
+	benchmark.pedantic(call5, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_5_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = WeakLazyMapping5(lambda key1, key2, key3, key4, key5: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5) for key1, key2, key3, key4, key5 in KEYS5]
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_weak_lazy_mapping_5_subscript_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = WeakLazyMapping5(lambda key1, key2, key3, key4, key5: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5) for key1, key2, key3, key4, key5 in KEYS5]
+	benchmark(subscript5, mapping, KEYS5)
+
+
+def test_weak_lazy_mapping_5_instantiate(benchmark):
+	benchmark.group = "5/Instantiate"
+	setup = lambda: ((WeakLazyMapping5(lambda key1, key2, key3, key4, key5: Value(key1)), KEYS5), {})
+	benchmark.pedantic(call5, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_5_tiered_get_hit(benchmark):
+	benchmark.group = "5/GetHit"
+	mapping = WeakLazyMapping5(lambda key1, key2, key3, key4, key5: Value(key1), None, SIZE)
+	call5(mapping, KEYS5)
+	benchmark(call5, mapping, KEYS5)
+
+
+def test_lru_cache_6_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5, key6: key1)
+	call6(mapping, KEYS6)
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_lru_cache_6_instantiate(benchmark):
+	benchmark.group = "6/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5, key6: key1), KEYS6), {})
+	benchmark.pedantic(call6, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_6_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = Mapping6(lambda key1, key2, key3, key4, key5, key6: key1)
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_mapping_6_subscript_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = Mapping6(lambda key1, key2, key3, key4, key5, key6: key1)
+	benchmark(subscript6, mapping, KEYS6)
+
+
+def test_dictionary_mapping_6_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = DictionaryMapping6((keys, keys[0]) for keys in KEYS6)
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_dictionary_mapping_6_subscript_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = DictionaryMapping6((keys, keys[0]) for keys in KEYS6)
+	benchmark(subscript6, mapping, KEYS6)
+
+
+def test_lazy_mapping_6_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = LazyMapping6(lambda key1, key2, key3, key4, key5, key6: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6) for key1, key2, key3, key4, key5, key6 in KEYS6]
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_lazy_mapping_6_subscript_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = LazyMapping6(lambda key1, key2, key3, key4, key5, key6: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6) for key1, key2, key3, key4, key5, key6 in KEYS6]
+	benchmark(subscript6, mapping, KEYS6)
+
+
+def test_lazy_mapping_6_instantiate(benchmark):
+	benchmark.group = "6/Instantiate"
+	setup = lambda: ((LazyMapping6(lambda key1, key2, key3, key4, key5, key6: key1), KEYS6), {})
+	benchmark.pedantic(call6, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_6_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = ConcurrentLazyMapping6(lambda key1, key2, key3, key4, key5, key6: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6) for key1, key2, key3, key4, key5, key6 in KEYS6]
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_concurrent_lazy_mapping_6_subscript_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = ConcurrentLazyMapping6(lambda key1, key2, key3, key4, key5, key6: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6) for key1, key2, key3, key4, key5, key6 in KEYS6]
+	benchmark(subscript6, mapping, KEYS6)
+
+
+def test_concurrent_lazy_mapping_6_instantiate(benchmark):
+	benchmark.group = "6/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping6(lambda key1, key2, key3, key4, key5, key6: key1), KEYS6), {})
+	benchmark.pedantic(call6, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_6_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = WeakLazyMapping6(lambda key1, key2, key3, key4, key5, key6: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5, key6) for key1, key2, key3, key4, key5, key6 in KEYS6]
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_weak_lazy_mapping_6_subscript_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = WeakLazyMapping6(lambda key1, key2, key3, key4, key5, key6: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5, key6) for key1, key2, key3, key4, key5, key6 in KEYS6]
+	benchmark(subscript6, mapping, KEYS6)
+
+
+def test_weak_lazy_mapping_6_instantiate(benchmark):
+	benchmark.group = "6/Instantiate"
+	setup = lambda: ((WeakLazyMapping6(lambda key1, key2, key3, key4, key5, key6: Value(key1)), KEYS6), {})
+	benchmark.pedantic(call6, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_6_tiered_get_hit(benchmark):
+	benchmark.group = "6/GetHit"
+	mapping = WeakLazyMapping6(lambda key1, key2, key3, key4, key5, key6: Value(key1), None, SIZE)
+	call6(mapping, KEYS6)
+	benchmark(call6, mapping, KEYS6)
+
+
+def test_lru_cache_7_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	call7(mapping, KEYS7)
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_lru_cache_7_instantiate(benchmark):
+	benchmark.group = "7/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5, key6, key7: key1), KEYS7), {})
+	benchmark.pedantic(call7, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_7_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = Mapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_mapping_7_subscript_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = Mapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	benchmark(subscript7, mapping, KEYS7)
+
+
+def test_dictionary_mapping_7_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = DictionaryMapping7((keys, keys[0]) for keys in KEYS7)
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_dictionary_mapping_7_subscript_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = DictionaryMapping7((keys, keys[0]) for keys in KEYS7)
+	benchmark(subscript7, mapping, KEYS7)
+
+
+def test_lazy_mapping_7_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = LazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7) for key1, key2, key3, key4, key5, key6, key7 in KEYS7]
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_lazy_mapping_7_subscript_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = LazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7) for key1, key2, key3, key4, key5, key6, key7 in KEYS7]
+	benchmark(subscript7, mapping, KEYS7)
+
+
+def test_lazy_mapping_7_instantiate(benchmark):
+	benchmark.group = "7/Instantiate"
+	setup = lambda: ((LazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1), KEYS7), {})
+	benchmark.pedantic(call7, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_7_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = ConcurrentLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7) for key1, key2, key3, key4, key5, key6, key7 in KEYS7]
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_concurrent_lazy_mapping_7_subscript_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = ConcurrentLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7) for key1, key2, key3, key4, key5, key6, key7 in KEYS7]
+	benchmark(subscript7, mapping, KEYS7)
+
+
+def test_concurrent_lazy_mapping_7_instantiate(benchmark):
+	benchmark.group = "7/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: key1), KEYS7), {})
+	benchmark.pedantic(call7, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_7_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = WeakLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7) for key1, key2, key3, key4, key5, key6, key7 in KEYS7]
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_weak_lazy_mapping_7_subscript_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = WeakLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7) for key1, key2, key3, key4, key5, key6, key7 in KEYS7]
+	benchmark(subscript7, mapping, KEYS7)
+
+
+def test_weak_lazy_mapping_7_instantiate(benchmark):
+	benchmark.group = "7/Instantiate"
+	setup = lambda: ((WeakLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: Value(key1)), KEYS7), {})
+	benchmark.pedantic(call7, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_7_tiered_get_hit(benchmark):
+	benchmark.group = "7/GetHit"
+	mapping = WeakLazyMapping7(lambda key1, key2, key3, key4, key5, key6, key7: Value(key1), None, SIZE)
+	call7(mapping, KEYS7)
+	benchmark(call7, mapping, KEYS7)
+
+
+def test_lru_cache_8_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	call8(mapping, KEYS8)
+	benchmark(call8, mapping, KEYS8)
+
+
+def test_lru_cache_8_instantiate(benchmark):
+	benchmark.group = "8/Instantiate"
+	setup = lambda: ((functools.lru_cache(maxsize = None)(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1), KEYS8), {})
+	benchmark.pedantic(call8, setup = setup, rounds = ROUNDS)
+
+
+def test_mapping_8_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = Mapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	benchmark(call8, mapping, KEYS8)
+
+
+def test_mapping_8_subscript_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = Mapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	benchmark(subscript8, mapping, KEYS8)
+
+
+def test_dictionary_mapping_8_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = DictionaryMapping8((keys, keys[0]) for keys in KEYS8)
+	benchmark(call8, mapping, KEYS8)
+
+
+def test_dictionary_mapping_8_subscript_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = DictionaryMapping8((keys, keys[0]) for keys in KEYS8)
+	benchmark(subscript8, mapping, KEYS8)
+
+
+def test_lazy_mapping_8_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = LazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7, key8) for key1, key2, key3, key4, key5, key6, key7, key8 in KEYS8]
+	benchmark(call8, mapping, KEYS8)
+
+
+def test_lazy_mapping_8_subscript_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = LazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7, key8) for key1, key2, key3, key4, key5, key6, key7, key8 in KEYS8]
+	benchmark(subscript8, mapping, KEYS8)
+
+
+def test_lazy_mapping_8_instantiate(benchmark):
+	benchmark.group = "8/Instantiate"
+	setup = lambda: ((LazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1), KEYS8), {})
+	benchmark.pedantic(call8, setup = setup, rounds = ROUNDS)
+
+
+def test_concurrent_lazy_mapping_8_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = ConcurrentLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7, key8) for key1, key2, key3, key4, key5, key6, key7, key8 in KEYS8]
+	benchmark(call8, mapping, KEYS8)
+
+
+def test_concurrent_lazy_mapping_8_subscript_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = ConcurrentLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1)
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7, key8) for key1, key2, key3, key4, key5, key6, key7, key8 in KEYS8]
+	benchmark(subscript8, mapping, KEYS8)
+
+
+def test_concurrent_lazy_mapping_8_instantiate(benchmark):
+	benchmark.group = "8/Instantiate"
+	setup = lambda: ((ConcurrentLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: key1), KEYS8), {})
+	benchmark.pedantic(call8, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_8_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = WeakLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7, key8) for key1, key2, key3, key4, key5, key6, key7, key8 in KEYS8]
+	benchmark(call8, mapping, KEYS8)
+
+
+def test_weak_lazy_mapping_8_subscript_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = WeakLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: Value(key1))
+	alive = [mapping(key1, key2, key3, key4, key5, key6, key7, key8) for key1, key2, key3, key4, key5, key6, key7, key8 in KEYS8]
+	benchmark(subscript8, mapping, KEYS8)
+
+
+def test_weak_lazy_mapping_8_instantiate(benchmark):
+	benchmark.group = "8/Instantiate"
+	setup = lambda: ((WeakLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: Value(key1)), KEYS8), {})
+	benchmark.pedantic(call8, setup = setup, rounds = ROUNDS)
+
+
+def test_weak_lazy_mapping_8_tiered_get_hit(benchmark):
+	benchmark.group = "8/GetHit"
+	mapping = WeakLazyMapping8(lambda key1, key2, key3, key4, key5, key6, key7, key8: Value(key1), None, SIZE)
+	call8(mapping, KEYS8)
+	benchmark(call8, mapping, KEYS8)
@@ -0,0 +1,2171 @@
+# Generated by Mapping.py from the same templates as the C# classes.
+
+import threading
+import weakref
+from collections import OrderedDict
+
+__all__ = ["Mapping1", "DictionaryMapping1", "LazyMapping1", "ConcurrentLazyMapping1", "WeakLazyMapping1", "Mapping2", "DictionaryMapping2", "LazyMapping2", "ConcurrentLazyMapping2", "WeakLazyMapping2", "Mapping3", "DictionaryMapping3", "LazyMapping3", "ConcurrentLazyMapping3", "WeakLazyMapping3", "Mapping4", "DictionaryMapping4", "LazyMapping4", "ConcurrentLazyMapping4", "WeakLazyMapping4", "Mapping5", "DictionaryMapping5", "LazyMapping5", "ConcurrentLazyMapping5", "WeakLazyMapping5", "Mapping6", "DictionaryMapping6", "LazyMapping6", "ConcurrentLazyMapping6", "WeakLazyMapping6", "Mapping7", "DictionaryMapping7", "LazyMapping7", "ConcurrentLazyMapping7", "WeakLazyMapping7", "Mapping8", "DictionaryMapping8", "LazyMapping8", "ConcurrentLazyMapping8", "WeakLazyMapping8"]
+
+
+class _Flight:
+	"""An instantiation in progress, which the threads missing the same key wait for."""
+	__slots__ = ("done", "value", "error", "owner")
+
+	def __init__(self):
+		self.done = threading.Lock()
+		self.done.acquire()
+		self.value = None
+		self.error = None
+		self.owner = threading.get_ident()
+
+	def wait(self):
+		if self.owner == threading.get_ident():
+			raise RuntimeError("The instantiator looked up the key it is instantiating")
+		self.done.acquire()
+		self.done.release()
+		if self.error is not None:
+			raise self.error
+		return self.value
+
+
+class Mapping1:
+	"""getter(key) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, key):
+		return self._getter(key)
+
+	__call__ = __getitem__
+
+	def __contains__(self, key):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping1:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, key):
+		return self._entries[key]
+
+	__call__ = __getitem__
+
+	def __setitem__(self, key, value):
+		self._entries[key] = value
+
+	def __delitem__(self, key):
+		del self._entries[key]
+
+	def __contains__(self, key):
+		return key in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, key, default = None):
+		return self._entries.get(key, default)
+
+
+class _Instances1(dict):
+	"""The values of a LazyMapping1, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, key):
+		value = self[key] = self.instantiator(key)
+		return value
+
+
+class LazyMapping1:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances1()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, key):
+		return self._values[key]
+
+	__call__ = __getitem__
+
+	def __contains__(self, key):
+		if self._contains is None:
+			return True
+		return self._contains(key)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for key, value in entries:
+			self._values.setdefault(key, value)
+
+	def get_existing(self, key, default = None):
+		return self._values.get(key, default)
+
+
+class ConcurrentLazyMapping1:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, key):
+		try:
+			return self._values[key]
+		except KeyError:
+			pass
+		return self._miss(key)
+
+	__call__ = __getitem__
+
+	def __contains__(self, key):
+		if self._contains is None:
+			return True
+		return self._contains(key)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, key):
+		with self._lock:
+			try:
+				return self._values[key]
+			except KeyError:
+				pass
+			flight = self._flights.get(key)
+			leader = flight is None
+			if leader:
+				flight = self._flights[key] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key)
+			self._values[key] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[key]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for key, value in entries:
+			self._values.setdefault(key, value)
+
+	def get_existing(self, key, default = None):
+		return self._values.get(key, default)
+
+
+class WeakLazyMapping1:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, key):
+		value = self._values.get(key)
+		if value is None:
+			return self._miss(key)
+		if self._strong_capacity:
+			self._retain(key, value)
+		return value
+
+	__call__ = __getitem__
+
+	def __contains__(self, key):
+		if self._contains is None:
+			return True
+		return self._contains(key)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, key):
+		with self._locks[hash(key) & 15]:
+			value = self._values.get(key)
+			if value is None:
+				value = self._instantiator(key)
+				self._values[key] = value
+		if self._strong_capacity:
+			self._retain(key, value)
+		return value
+
+	def _retain(self, key, value):
+		try:
+			self._strong.move_to_end(key)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[key] = value
+			strong.move_to_end(key)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, key, default = None):
+		return self._values.get(key, default)
+
+
+class Mapping2:
+	"""getter(key1, key2) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2 = keys
+		return self._getter(key1, key2)
+
+	def __call__(self, key1, key2):
+		return self._getter(key1, key2)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping2:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2):
+		keys = key1, key2
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances2(dict):
+	"""The values of a LazyMapping2, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2 = keys
+		value = self[keys] = self.instantiator(key1, key2)
+		return value
+
+
+class LazyMapping2:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances2()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2):
+		keys = key1, key2
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2 = keys
+		return self._contains(key1, key2)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping2:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2 = keys
+		return self._miss(keys, key1, key2)
+
+	def __call__(self, key1, key2):
+		keys = key1, key2
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2 = keys
+		return self._contains(key1, key2)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping2:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2 = keys
+			return self._miss(keys, key1, key2)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2):
+		keys = key1, key2
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2 = keys
+		return self._contains(key1, key2)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class Mapping3:
+	"""getter(key1, key2, key3) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2, key3 = keys
+		return self._getter(key1, key2, key3)
+
+	def __call__(self, key1, key2, key3):
+		return self._getter(key1, key2, key3)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping3:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2, key3):
+		keys = key1, key2, key3
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances3(dict):
+	"""The values of a LazyMapping3, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2, key3 = keys
+		value = self[keys] = self.instantiator(key1, key2, key3)
+		return value
+
+
+class LazyMapping3:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances3()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2, key3):
+		keys = key1, key2, key3
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3 = keys
+		return self._contains(key1, key2, key3)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping3:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2, key3 = keys
+		return self._miss(keys, key1, key2, key3)
+
+	def __call__(self, key1, key2, key3):
+		keys = key1, key2, key3
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2, key3)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3 = keys
+		return self._contains(key1, key2, key3)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2, key3)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping3:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2, key3 = keys
+			return self._miss(keys, key1, key2, key3)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2, key3):
+		keys = key1, key2, key3
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2, key3)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3 = keys
+		return self._contains(key1, key2, key3)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2, key3)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class Mapping4:
+	"""getter(key1, key2, key3, key4) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2, key3, key4 = keys
+		return self._getter(key1, key2, key3, key4)
+
+	def __call__(self, key1, key2, key3, key4):
+		return self._getter(key1, key2, key3, key4)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping4:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2, key3, key4):
+		keys = key1, key2, key3, key4
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances4(dict):
+	"""The values of a LazyMapping4, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2, key3, key4 = keys
+		value = self[keys] = self.instantiator(key1, key2, key3, key4)
+		return value
+
+
+class LazyMapping4:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances4()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2, key3, key4):
+		keys = key1, key2, key3, key4
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4 = keys
+		return self._contains(key1, key2, key3, key4)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping4:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2, key3, key4 = keys
+		return self._miss(keys, key1, key2, key3, key4)
+
+	def __call__(self, key1, key2, key3, key4):
+		keys = key1, key2, key3, key4
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2, key3, key4)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4 = keys
+		return self._contains(key1, key2, key3, key4)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2, key3, key4)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping4:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2, key3, key4 = keys
+			return self._miss(keys, key1, key2, key3, key4)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2, key3, key4):
+		keys = key1, key2, key3, key4
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2, key3, key4)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4 = keys
+		return self._contains(key1, key2, key3, key4)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2, key3, key4)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class Mapping5:
+	"""getter(key1, key2, key3, key4, key5) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2, key3, key4, key5 = keys
+		return self._getter(key1, key2, key3, key4, key5)
+
+	def __call__(self, key1, key2, key3, key4, key5):
+		return self._getter(key1, key2, key3, key4, key5)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping5:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5):
+		keys = key1, key2, key3, key4, key5
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances5(dict):
+	"""The values of a LazyMapping5, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2, key3, key4, key5 = keys
+		value = self[keys] = self.instantiator(key1, key2, key3, key4, key5)
+		return value
+
+
+class LazyMapping5:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances5()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5):
+		keys = key1, key2, key3, key4, key5
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5 = keys
+		return self._contains(key1, key2, key3, key4, key5)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping5:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2, key3, key4, key5 = keys
+		return self._miss(keys, key1, key2, key3, key4, key5)
+
+	def __call__(self, key1, key2, key3, key4, key5):
+		keys = key1, key2, key3, key4, key5
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2, key3, key4, key5)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5 = keys
+		return self._contains(key1, key2, key3, key4, key5)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2, key3, key4, key5)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping5:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2, key3, key4, key5 = keys
+			return self._miss(keys, key1, key2, key3, key4, key5)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2, key3, key4, key5):
+		keys = key1, key2, key3, key4, key5
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2, key3, key4, key5)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5 = keys
+		return self._contains(key1, key2, key3, key4, key5)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2, key3, key4, key5)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class Mapping6:
+	"""getter(key1, key2, key3, key4, key5, key6) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2, key3, key4, key5, key6 = keys
+		return self._getter(key1, key2, key3, key4, key5, key6)
+
+	def __call__(self, key1, key2, key3, key4, key5, key6):
+		return self._getter(key1, key2, key3, key4, key5, key6)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping6:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5, key6):
+		keys = key1, key2, key3, key4, key5, key6
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances6(dict):
+	"""The values of a LazyMapping6, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2, key3, key4, key5, key6 = keys
+		value = self[keys] = self.instantiator(key1, key2, key3, key4, key5, key6)
+		return value
+
+
+class LazyMapping6:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances6()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5, key6):
+		keys = key1, key2, key3, key4, key5, key6
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping6:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2, key3, key4, key5, key6 = keys
+		return self._miss(keys, key1, key2, key3, key4, key5, key6)
+
+	def __call__(self, key1, key2, key3, key4, key5, key6):
+		keys = key1, key2, key3, key4, key5, key6
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2, key3, key4, key5, key6)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5, key6):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2, key3, key4, key5, key6)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping6:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2, key3, key4, key5, key6 = keys
+			return self._miss(keys, key1, key2, key3, key4, key5, key6)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2, key3, key4, key5, key6):
+		keys = key1, key2, key3, key4, key5, key6
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2, key3, key4, key5, key6)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5, key6):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2, key3, key4, key5, key6)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class Mapping7:
+	"""getter(key1, key2, key3, key4, key5, key6, key7) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2, key3, key4, key5, key6, key7 = keys
+		return self._getter(key1, key2, key3, key4, key5, key6, key7)
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7):
+		return self._getter(key1, key2, key3, key4, key5, key6, key7)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping7:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7):
+		keys = key1, key2, key3, key4, key5, key6, key7
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances7(dict):
+	"""The values of a LazyMapping7, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2, key3, key4, key5, key6, key7 = keys
+		value = self[keys] = self.instantiator(key1, key2, key3, key4, key5, key6, key7)
+		return value
+
+
+class LazyMapping7:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances7()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7):
+		keys = key1, key2, key3, key4, key5, key6, key7
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6, key7 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6, key7)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping7:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2, key3, key4, key5, key6, key7 = keys
+		return self._miss(keys, key1, key2, key3, key4, key5, key6, key7)
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7):
+		keys = key1, key2, key3, key4, key5, key6, key7
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2, key3, key4, key5, key6, key7)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6, key7 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6, key7)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5, key6, key7):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2, key3, key4, key5, key6, key7)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping7:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2, key3, key4, key5, key6, key7 = keys
+			return self._miss(keys, key1, key2, key3, key4, key5, key6, key7)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7):
+		keys = key1, key2, key3, key4, key5, key6, key7
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2, key3, key4, key5, key6, key7)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6, key7 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6, key7)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5, key6, key7):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2, key3, key4, key5, key6, key7)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class Mapping8:
+	"""getter(key1, key2, key3, key4, key5, key6, key7, key8) as a mapping over every key."""
+	__slots__ = ("_getter",)
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, getter):
+		self._getter = getter
+
+	def __getitem__(self, keys):
+		key1, key2, key3, key4, key5, key6, key7, key8 = keys
+		return self._getter(key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7, key8):
+		return self._getter(key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __contains__(self, keys):
+		return True
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+
+class DictionaryMapping8:
+	"""A finite mapping over the keys it was given."""
+	__slots__ = ("_entries",)
+	is_finite = True
+	is_numerable = True
+
+	def __init__(self, entries = ()):
+		self._entries = dict(entries)
+
+	def __getitem__(self, keys):
+		return self._entries[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7, key8):
+		keys = key1, key2, key3, key4, key5, key6, key7, key8
+		return self._entries[keys]
+
+	def __setitem__(self, keys, value):
+		self._entries[keys] = value
+
+	def __delitem__(self, keys):
+		del self._entries[keys]
+
+	def __contains__(self, keys):
+		return keys in self._entries
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def items(self):
+		return self._entries.items()
+
+	def get(self, keys, default = None):
+		return self._entries.get(keys, default)
+
+
+class _Instances8(dict):
+	"""The values of a LazyMapping8, instantiated on the first lookup of their key."""
+	__slots__ = ("instantiator",)
+
+	def __missing__(self, keys):
+		key1, key2, key3, key4, key5, key6, key7, key8 = keys
+		value = self[keys] = self.instantiator(key1, key2, key3, key4, key5, key6, key7, key8)
+		return value
+
+
+class LazyMapping8:
+	"""Instantiates the value of each key once, on its first lookup. Not thread-safe."""
+	__slots__ = ("_contains", "_values")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._contains = contains
+		self._values = _Instances8()
+		self._values.instantiator = instantiator
+
+	def __getitem__(self, keys):
+		return self._values[keys]
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7, key8):
+		keys = key1, key2, key3, key4, key5, key6, key7, key8
+		return self._values[keys]
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6, key7, key8 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class ConcurrentLazyMapping8:
+	"""A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None):
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = {}
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __getitem__(self, keys):
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		key1, key2, key3, key4, key5, key6, key7, key8 = keys
+		return self._miss(keys, key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7, key8):
+		keys = key1, key2, key3, key4, key5, key6, key7, key8
+		try:
+			return self._values[keys]
+		except KeyError:
+			pass
+		return self._miss(keys, key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6, key7, key8 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5, key6, key7, key8):
+		with self._lock:
+			try:
+				return self._values[keys]
+			except KeyError:
+				pass
+			flight = self._flights.get(keys)
+			leader = flight is None
+			if leader:
+				flight = self._flights[keys] = _Flight()
+		if not leader:
+			return flight.wait()
+		try:
+			value = flight.value = self._instantiator(key1, key2, key3, key4, key5, key6, key7, key8)
+			self._values[keys] = value
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._flights[keys]
+			flight.done.release()
+		return value
+
+	@property
+	def instantiated(self):
+		return dict(self._values)
+
+	def seed(self, entries):
+		for keys, value in entries:
+			self._values.setdefault(keys, value)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
+
+
+class WeakLazyMapping8:
+	"""A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable."""
+	__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")
+	is_finite = False
+	is_numerable = False
+
+	def __init__(self, instantiator, contains = None, strong_capacity = 0):
+		if strong_capacity < 0:
+			raise ValueError("strong_capacity must not be negative")
+		self._instantiator = instantiator
+		self._contains = contains
+		self._values = weakref.WeakValueDictionary()
+		self._locks = tuple(threading.RLock() for stripe in range(16))
+		self._strong = OrderedDict()
+		self._strong_capacity = strong_capacity
+		self._strong_lock = threading.Lock()
+
+	@property
+	def strong_capacity(self):
+		return self._strong_capacity
+
+	def __getitem__(self, keys):
+		value = self._values.get(keys)
+		if value is None:
+			key1, key2, key3, key4, key5, key6, key7, key8 = keys
+			return self._miss(keys, key1, key2, key3, key4, key5, key6, key7, key8)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __call__(self, key1, key2, key3, key4, key5, key6, key7, key8):
+		keys = key1, key2, key3, key4, key5, key6, key7, key8
+		value = self._values.get(keys)
+		if value is None:
+			return self._miss(keys, key1, key2, key3, key4, key5, key6, key7, key8)
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def __contains__(self, keys):
+		if self._contains is None:
+			return True
+		key1, key2, key3, key4, key5, key6, key7, key8 = keys
+		return self._contains(key1, key2, key3, key4, key5, key6, key7, key8)
+
+	def __len__(self):
+		raise TypeError("Domain is not finite")
+
+	def __iter__(self):
+		raise TypeError("Domain is non-numerable")
+
+	def _miss(self, keys, key1, key2, key3, key4, key5, key6, key7, key8):
+		with self._locks[hash(keys) & 15]:
+			value = self._values.get(keys)
+			if value is None:
+				value = self._instantiator(key1, key2, key3, key4, key5, key6, key7, key8)
+				self._values[keys] = value
+		if self._strong_capacity:
+			self._retain(keys, value)
+		return value
+
+	def _retain(self, keys, value):
+		try:
+			self._strong.move_to_end(keys)
+			return
+		except KeyError:
+			pass
+		with self._strong_lock:
+			strong = self._strong
+			strong[keys] = value
+			strong.move_to_end(keys)
+			if len(strong) > self._strong_capacity:
+				strong.popitem(last = False)
+
+	def get_existing(self, keys, default = None):
+		return self._values.get(keys, default)
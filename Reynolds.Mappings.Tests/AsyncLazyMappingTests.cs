@@ -0,0 +1,94 @@
+﻿using System;
+using System.Threading;
+using System.Threading.Tasks;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class AsyncLazyMappingTests
+	{
+		[Test]
+		public void ConcurrentCallersShareTheInFlightTask()
+		{
+			int calls = 0;
+			var source = new TaskCompletionSource<int>();
+			var mapping = new AsyncLazyMapping<int, int, int>((key1, key2, cancellationToken) => { calls++; return source.Task; });
+			var first = mapping[1, 2];
+			var second = mapping[1, 2];
+			Assert.AreSame(first, second);
+			Assert.AreEqual(1, calls);
+			int value;
+			Assert.IsFalse(mapping.TryGetExisting(1, 2, out value));
+			source.SetResult(3);
+			Assert.AreEqual(3, second.Result);
+			Assert.IsTrue(mapping.TryGetExisting(1, 2, out value));
+			Assert.AreEqual(3, value);
+		}
+
+		[Test]
+		public void FaultedTaskIsEvicted()
+		{
+			int calls = 0;
+			var mapping = new AsyncLazyMapping<int, int>((key, cancellationToken) =>
+			{
+				var source = new TaskCompletionSource<int>();
+				if(++calls == 1)
+					source.SetException(new InvalidOperationException());
+				else
+					source.SetResult(key);
+				return source.Task;
+			});
+			Assert.IsTrue(mapping[5].IsFaulted);
+			Assert.AreEqual(5, mapping[5].Result);
+			Assert.AreEqual(2, calls);
+		}
+
+		[Test]
+		public void ThrowingInstantiatorFaultsTheTask()
+		{
+			var mapping = new AsyncLazyMapping<int, int>((key, cancellationToken) => { throw new InvalidOperationException(); });
+			Assert.IsInstanceOf<InvalidOperationException>(mapping[0].Exception.InnerException);
+		}
+
+		[Test]
+		public void CallerCancellationLeavesTheSharedTaskRunning()
+		{
+			var source = new TaskCompletionSource<int>();
+			var mapping = new AsyncLazyMapping<int, int>((key, cancellationToken) => source.Task);
+			using(var cancellation = new CancellationTokenSource())
+			{
+				var waiting = mapping.GetAsync(0, cancellation.Token);
+				var shared = mapping[0];
+				cancellation.Cancel();
+				Assert.IsTrue(waiting.IsCanceled);
+				Assert.IsFalse(shared.IsCompleted);
+				source.SetResult(1);
+				Assert.AreEqual(1, shared.Result);
+			}
+		}
+
+		[Test]
+		public void CancelPendingCancelsInstantiationsAndStartsAfresh()
+		{
+			var tokens = new CancellationToken[2];
+			int calls = 0;
+			var mapping = new AsyncLazyMapping<int, int>((key, cancellationToken) =>
+			{
+				tokens[calls++] = cancellationToken;
+				var source = new TaskCompletionSource<int>();
+				cancellationToken.Register(() => source.TrySetCanceled());
+				return source.Task;
+			});
+			var pending = mapping[0];
+			mapping.CancelPending();
+			Assert.IsTrue(tokens[0].IsCancellationRequested);
+			Assert.IsTrue(pending.IsCanceled);
+			// the cancelled task was evicted, and the retry gets a token of the new source
+			Assert.AreNotEqual(pending, mapping[0]);
+			Assert.AreEqual(2, calls);
+			Assert.IsFalse(tokens[1].IsCancellationRequested);
+			Assert.IsTrue(tokens[1].CanBeCanceled);
+		}
+	}
+}
@@ -0,0 +1,119 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class ColumnarMappingTests
+	{
+		enum Color
+		{
+			Red,
+			Green,
+			Blue
+		}
+
+		[Test]
+		public void EnumKeysAreSupported()
+		{
+			var mapping = new ColumnarMapping<Color, int, string>();
+			mapping[Color.Red, 1] = "red";
+			mapping.Add(Color.Blue, 1, "blue");
+			Assert.AreEqual("red", mapping[Color.Red, 1]);
+			Assert.AreEqual("blue", mapping[Color.Blue, 1]);
+			Assert.IsFalse(mapping.Contains(Color.Green, 1));
+			Assert.Throws<ArgumentException>(() => mapping.Add(Color.Red, 1, "again"));
+		}
+
+		[Test]
+		public void RemovalKeepsEveryProbeSequenceIntact()
+		{
+			var random = new Random(1);
+			var mapping = new ColumnarMapping<int, int>();
+			var expected = new Dictionary<int, int>();
+			for(int round = 0; round < 20000; round++)
+			{
+				int key = random.Next(500);
+				if(random.Next(3) == 0)
+				{
+					Assert.AreEqual(expected.Remove(key), mapping.Remove(key));
+				}
+				else
+				{
+					mapping[key] = round;
+					expected[key] = round;
+				}
+			}
+			Assert.AreEqual(expected.Count, mapping.Count);
+			for(int key = 0; key < 500; key++)
+			{
+				int value;
+				Assert.AreEqual(expected.ContainsKey(key), mapping.TryGetValue(key, out value));
+				if(expected.ContainsKey(key))
+					Assert.AreEqual(expected[key], value);
+			}
+		}
+
+		[Test]
+		public void RemovalMovesTheLastEntryIntoTheGap()
+		{
+			var mapping = new ColumnarMapping<int, int, int>();
+			for(int key = 0; key < 10; key++)
+				mapping[key, -key] = key;
+			Assert.IsTrue(mapping.Remove(3, -3));
+			Assert.IsFalse(mapping.Remove(3, -3));
+			var keys = new List<int>();
+			foreach(var entry in mapping)
+			{
+				Assert.AreEqual(entry.Key1, -entry.Key2);
+				Assert.AreEqual(entry.Key1, entry.Value);
+				keys.Add(entry.Key1);
+			}
+			CollectionAssert.AreEqual(new[] { 0, 1, 2, 9, 4, 5, 6, 7, 8 }, keys);
+			Assert.AreEqual(9, mapping[9, -9]);
+		}
+
+		[Test]
+		public void ModificationInvalidatesEnumerators()
+		{
+			var mapping = new ColumnarMapping<int, int>();
+			mapping[1] = 1;
+			mapping[2] = 2;
+			var enumerator = mapping.GetEnumerator();
+			Assert.IsTrue(enumerator.MoveNext());
+			mapping[1] = 10;
+			Assert.Throws<InvalidOperationException>(() => enumerator.MoveNext());
+			var keys = ((IEnumerable<int>) mapping).GetEnumerator();
+			Assert.IsTrue(keys.MoveNext());
+			mapping.Remove(2);
+			Assert.Throws<InvalidOperationException>(() => keys.MoveNext());
+			var entries = ((IEnumerable<IKeyValueTuple<int, int>>) mapping).GetEnumerator();
+			mapping.Clear();
+			Assert.Throws<InvalidOperationException>(() => entries.MoveNext());
+		}
+
+		[Test]
+		public void FailedAddLeavesEnumeratorsValid()
+		{
+			var mapping = new ColumnarMapping<int, int, int>();
+			mapping[1, 1] = 1;
+			mapping[2, 2] = 2;
+			var enumerator = mapping.GetEnumerator();
+			Assert.IsTrue(enumerator.MoveNext());
+			Assert.Throws<ArgumentException>(() => mapping.Add(1, 1, 10));
+			Assert.IsTrue(enumerator.MoveNext());
+			Assert.AreEqual(1, mapping[1, 1]);
+		}
+
+		[Test]
+		public void DomainEnumeratesKeys()
+		{
+			var mapping = new ColumnarMapping<int, long, int>();
+			mapping[1, 2L] = 3;
+			mapping[4, 5L] = 6;
+			CollectionAssert.AreEquivalent(new[] { Tuple.Create(1, 2L), Tuple.Create(4, 5L) }, (IEnumerable<Tuple<int, long>>) mapping);
+		}
+	}
+}
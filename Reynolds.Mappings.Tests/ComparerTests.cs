@@ -0,0 +1,69 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class ComparerTests
+	{
+		[Test]
+		public void InlineHashMatchesHashCodes()
+		{
+			var comparer = new DictionaryMapping<int, int, int>(null, null).Comparer;
+			uint expected = HashCodes.Combine(HashCodes.Combine(HashCodes.Seed + 2u, 7), 11);
+			Assert.AreEqual(HashCodes.Finish(expected), comparer.GetHashCode(Tuple.Create(7, 11)));
+		}
+
+		[Test]
+		public void ClusteredKeysSpreadOverBuckets()
+		{
+			var comparer = new DictionaryMapping<int, int, int>(null, null).Comparer;
+			var hashes = new List<int>();
+			for(int key1 = 0; key1 < 100; key1++)
+				for(int key2 = 0; key2 < 100; key2++)
+					hashes.Add(comparer.GetHashCode(Tuple.Create(key1, key2)));
+			Assert.AreEqual(hashes.Count, hashes.Distinct().Count());
+			// the low bits alone pick the bucket in a power-of-two table; 10000 keys over 1024 buckets average under 10
+			var loads = hashes.GroupBy(hash => hash & 1023).Select(bucket => bucket.Count()).ToList();
+			Assert.AreEqual(1024, loads.Count);
+			Assert.Less(loads.Max(), 30);
+		}
+
+		[Test]
+		public void ArrayComparersCompareContents()
+		{
+			var comparer = Int32ArrayEqualityComparer.Instance;
+			Assert.IsTrue(comparer.Equals(new[] { 1, 2, 3 }, new[] { 1, 2, 3 }));
+			Assert.IsFalse(comparer.Equals(new[] { 1, 2, 3 }, new[] { 1, 2 }));
+			Assert.IsFalse(comparer.Equals(new[] { 1 }, null));
+			Assert.IsTrue(comparer.Equals(null, null));
+			Assert.AreEqual(comparer.GetHashCode(new[] { 1, 2, 3 }), comparer.GetHashCode(new[] { 1, 2, 3 }));
+			Assert.AreNotEqual(comparer.GetHashCode(new[] { 1, 2, 3 }), comparer.GetHashCode(new[] { 3, 2, 1 }));
+			Assert.AreNotEqual(comparer.GetHashCode(new int[0]), comparer.GetHashCode(new[] { 0 }));
+		}
+
+		[Test]
+		public void ArrayComparersOrderByLengthFirst()
+		{
+			var comparer = Int32ArrayEqualityComparer.Instance;
+			Assert.Less(comparer.Compare(new[] { 9 }, new[] { 1, 1 }), 0);
+			Assert.Less(comparer.Compare(new[] { 1, 2 }, new[] { 1, 3 }), 0);
+			Assert.AreEqual(0, comparer.Compare(new[] { 1, 2 }, new[] { 1, 2 }));
+			var strings = ReferenceTypeArrayEqualityComparer<string>.Instance;
+			Assert.IsTrue(strings.Equals(new[] { "a", null }, new[] { "a", null }));
+			Assert.AreEqual(strings.GetHashCode(new[] { "a", "b" }), strings.GetHashCode(new[] { "a", "b" }));
+			Assert.Greater(strings.Compare(new[] { "b" }, new[] { "a" }), 0);
+		}
+
+		[Test]
+		public void ArrayKeysWorkInMappings()
+		{
+			var mapping = new DictionaryMapping<int[], string>(Int32ArrayEqualityComparer.Instance);
+			mapping[new[] { 1, 2 }] = "a";
+			Assert.IsTrue(mapping.Contains(new[] { 1, 2 }));
+			Assert.AreEqual("a", mapping[new[] { 1, 2 }]);
+		}
+	}
+}
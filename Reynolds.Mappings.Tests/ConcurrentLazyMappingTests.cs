@@ -0,0 +1,58 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class ConcurrentLazyMappingTests
+	{
+		[Test]
+		public void ConcurrentMissesInstantiateOnce()
+		{
+			int calls = 0;
+			var release = new ManualResetEvent(false);
+			var mapping = new ConcurrentLazyMapping<int, int, string>((key1, key2) =>
+			{
+				Interlocked.Increment(ref calls);
+				release.WaitOne();
+				return key1 + ":" + key2;
+			});
+			var readers = Enumerable.Range(0, 8).Select(i => Task.Factory.StartNew(() => mapping[1, 2], TaskCreationOptions.LongRunning)).ToArray();
+			Thread.Sleep(100);
+			release.Set();
+			Task.WaitAll(readers);
+			Assert.AreEqual(1, calls);
+			Assert.IsTrue(readers.All(r => r.Result == "1:2"));
+		}
+
+		[Test]
+		public void FailedInstantiationIsRetried()
+		{
+			int calls = 0;
+			var mapping = new ConcurrentLazyMapping<int, int>(key =>
+			{
+				if(++calls == 1)
+					throw new InvalidOperationException();
+				return key * 2;
+			});
+			Assert.Throws<InvalidOperationException>(() => { var value = mapping[3]; });
+			Assert.AreEqual(6, mapping[3]);
+			Assert.AreEqual(2, calls);
+		}
+
+		[Test]
+		public void TryGetExistingSeesOnlyInstantiatedValues()
+		{
+			var mapping = new ConcurrentLazyMapping<int, int>(key => key + 1);
+			int value;
+			Assert.IsFalse(mapping.TryGetExisting(1, out value));
+			Assert.AreEqual(2, mapping[1]);
+			Assert.IsTrue(mapping.TryGetExisting(1, out value));
+			Assert.AreEqual(2, value);
+		}
+	}
+}
@@ -0,0 +1,42 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class DictionaryMappingTests
+	{
+		[Test]
+		public void DomainEnumeratesTupleKeys()
+		{
+			var mapping = new DictionaryMapping<int, string, double>();
+			mapping[1, "a"] = 1.5;
+			mapping[2, "b"] = 2.5;
+			CollectionAssert.AreEquivalent(new[] { Tuple.Create(1, "a"), Tuple.Create(2, "b") }, (IEnumerable<Tuple<int, string>>) mapping);
+			Assert.IsTrue(mapping.Contains(2, "b"));
+			Assert.IsFalse(mapping.Contains(2, "a"));
+		}
+
+		[Test]
+		public void EightKeysKeepTheLastInRest()
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, int, int, string>();
+			mapping[1, 2, 3, 4, 5, 6, 7, 8] = "x";
+			mapping[1, 2, 3, 4, 5, 6, 7, 9] = "y";
+			Assert.AreEqual("x", mapping[1, 2, 3, 4, 5, 6, 7, 8]);
+			Assert.AreEqual("y", mapping[1, 2, 3, 4, 5, 6, 7, 9]);
+			Assert.AreEqual(new[] { 8, 9 }, ((IEnumerable<IKeyValueTuple<int, int, int, int, int, int, int, int, string>>) mapping).Select(e => e.Key8).OrderBy(k => k).ToArray());
+		}
+
+		[Test]
+		public void ComparersApplyPerKey()
+		{
+			var mapping = new DictionaryMapping<string, string, int>(StringComparer.OrdinalIgnoreCase, null);
+			mapping["A", "b"] = 1;
+			Assert.IsTrue(mapping.Contains("a", "b"));
+			Assert.IsFalse(mapping.Contains("a", "B"));
+		}
+	}
+}
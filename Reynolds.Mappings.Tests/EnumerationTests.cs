@@ -0,0 +1,81 @@
+﻿using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class EnumerationTests
+	{
+		static DictionaryMapping<int, int, int> Sample()
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int key = 0; key < 10; key++)
+				mapping[key, -key] = key * key;
+			return mapping;
+		}
+
+		[Test]
+		public void StructEnumeratorVisitsEveryEntry()
+		{
+			var mapping = Sample();
+			var seen = new List<int>();
+			DictionaryMapping<int, int, int>.Enumerator enumerator = mapping.GetEnumerator();
+			while(enumerator.MoveNext())
+			{
+				Assert.AreEqual(enumerator.Current.Key1, -enumerator.Current.Key2);
+				Assert.AreEqual(enumerator.Current.Key1 * enumerator.Current.Key1, enumerator.Current.Value);
+				seen.Add(enumerator.Current.Key1);
+			}
+			CollectionAssert.AreEquivalent(Enumerable.Range(0, 10), seen);
+		}
+
+		[Test]
+		public void ResetStartsOver()
+		{
+			var mapping = Sample();
+			var enumerator = mapping.GetEnumerator();
+			int count = 0;
+			while(enumerator.MoveNext())
+				count++;
+			enumerator.Reset();
+			while(enumerator.MoveNext())
+				count++;
+			Assert.AreEqual(20, count);
+		}
+
+		[Test]
+		public void EntriesMatchTheInterfaceEnumeration()
+		{
+			var mapping = Sample();
+			Assert.AreEqual(10, mapping.Entries.Count);
+			var entries = new List<int>();
+			foreach(var entry in mapping.Entries)
+				entries.Add(entry.Value);
+			var tuples = ((IEnumerable<IKeyValueTuple<int, int, int>>) mapping).Select(e => e.Value).ToList();
+			CollectionAssert.AreEqual(tuples, entries);
+			CollectionAssert.AreEqual(tuples, ((IEnumerable<KeyValueTuple<int, int, int>>) mapping.Entries).Select(e => e.Value));
+		}
+
+		[Test]
+		public void NonGenericEnumerationYieldsKeys()
+		{
+			var keys = new List<object>();
+			foreach(var key in (IEnumerable) Sample())
+				keys.Add(key);
+			CollectionAssert.AreEquivalent(Enumerable.Range(0, 10).Select(key => Tuple.Create(key, -key)), keys);
+		}
+
+		[Test]
+		public void ModificationInvalidatesTheEnumerator()
+		{
+			var mapping = Sample();
+			var enumerator = mapping.GetEnumerator();
+			Assert.IsTrue(enumerator.MoveNext());
+			mapping[20, 20] = 0;
+			Assert.Throws<InvalidOperationException>(() => enumerator.MoveNext());
+		}
+	}
+}
@@ -0,0 +1,81 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class EvictionPolicyTests
+	{
+		static EvictionNode<int, int>[] Add(EvictionPolicy<int, int> policy, params int[] keys)
+		{
+			var nodes = keys.Select(key => new EvictionNode<int, int> { Key = key, Value = key }).ToArray();
+			foreach(var node in nodes)
+				policy.Added(node);
+			return nodes;
+		}
+
+		[Test]
+		public void LruEvictsLeastRecentlyUsed()
+		{
+			var policy = new LruEvictionPolicy<int, int>();
+			var nodes = Add(policy, 1, 2, 3);
+			policy.Accessed(nodes[0]);
+			Assert.AreEqual(2, policy.Evict().Key);
+			Assert.AreEqual(3, policy.Evict().Key);
+			Assert.AreEqual(1, policy.Evict().Key);
+		}
+
+		[Test]
+		public void ClockGivesReferencedEntriesASecondChance()
+		{
+			var policy = new ClockEvictionPolicy<int, int>();
+			var nodes = Add(policy, 1, 2, 3);
+			policy.Accessed(nodes[0]);
+			policy.Accessed(nodes[2]);
+			Assert.AreEqual(2, policy.Evict().Key);
+			// the hand goes on from 3, which is still referenced, and wraps around to 1, whose flag it cleared
+			Assert.AreEqual(1, policy.Evict().Key);
+			Assert.AreEqual(3, policy.Evict().Key);
+		}
+
+		[Test]
+		public void BoundedLazyMappingKeepsAtMostCapacity()
+		{
+			int calls = 0;
+			var mapping = new BoundedLazyMapping<int, int, int>((key1, key2) => { calls++; return key1 * key2; }, 2);
+			Assert.AreEqual(2, mapping[1, 2]);
+			Assert.AreEqual(6, mapping[2, 3]);
+			Assert.AreEqual(2, mapping[1, 2]);
+			Assert.AreEqual(12, mapping[3, 4]);
+			int value;
+			Assert.IsFalse(mapping.TryGetExisting(2, 3, out value));
+			Assert.IsTrue(mapping.TryGetExisting(1, 2, out value));
+			Assert.AreEqual(3, calls);
+		}
+
+		[Test]
+		public void BoundedLazyMappingAllowsReentrantInstantiation()
+		{
+			BoundedLazyMapping<int, int> mapping = null;
+			int calls = 0;
+			mapping = new BoundedLazyMapping<int, int>(key => ++calls == 1 ? mapping[key] + 1 : key, 2);
+			Assert.AreEqual(2, mapping[1]);
+			Assert.AreEqual(2, mapping[1]);
+			Assert.AreEqual(2, calls);
+			// the replaced entry is still tracked once by the policy
+			GC.KeepAlive(mapping[2]);
+			GC.KeepAlive(mapping[3]);
+			int value;
+			Assert.IsFalse(mapping.TryGetExisting(1, out value));
+			Assert.IsTrue(mapping.TryGetExisting(3, out value));
+		}
+
+		[Test]
+		public void BoundedLazyMappingRejectsZeroCapacity()
+		{
+			Assert.Throws<ArgumentOutOfRangeException>(() => new BoundedLazyMapping<int, int>(key => key, 0));
+		}
+	}
+}
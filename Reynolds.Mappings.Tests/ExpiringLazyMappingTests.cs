@@ -0,0 +1,86 @@
+﻿using System;
+using System.Diagnostics;
+using System.Threading;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class ExpiringLazyMappingTests
+	{
+		// exposes the live entry count, which only the sweeper shrinks for keys nobody reads again
+		class Counted : ExpiringLazyMapping<int, int>
+		{
+			public Counted(InstantiateDelegate instantiator, TimeSpan timeToLive) : base(instantiator, timeToLive)
+			{
+			}
+			public int Live
+			{
+				get
+				{
+					lock(_inner)
+						return _inner.Count;
+				}
+			}
+		}
+
+		static bool WaitFor(Func<bool> condition)
+		{
+			var waited = Stopwatch.StartNew();
+			while(!condition() && waited.Elapsed < TimeSpan.FromSeconds(10))
+				Thread.Sleep(10);
+			return condition();
+		}
+
+		[Test]
+		public void ValueIsCachedWithinTimeToLive()
+		{
+			int calls = 0;
+			var mapping = new ExpiringLazyMapping<int, int, int>((key1, key2) => { calls++; return key1 + key2; }, TimeSpan.FromMinutes(1));
+			Assert.AreEqual(3, mapping[1, 2]);
+			Assert.AreEqual(3, mapping[1, 2]);
+			Assert.AreEqual(1, calls);
+		}
+
+		[Test]
+		public void ExpiredValueIsInstantiatedAgain()
+		{
+			int calls = 0;
+			var mapping = new ExpiringLazyMapping<int, int>(key => ++calls, TimeSpan.FromMilliseconds(50));
+			Assert.AreEqual(1, mapping[0]);
+			Thread.Sleep(100);
+			int value;
+			Assert.IsFalse(mapping.TryGetExisting(0, out value));
+			Assert.AreEqual(2, mapping[0]);
+		}
+
+		[Test]
+		public void RefreshAheadReplacesValueInBackground()
+		{
+			int calls = 0;
+			var mapping = new ExpiringLazyMapping<int, int>(key => Interlocked.Increment(ref calls), TimeSpan.FromSeconds(5), null, TimeSpan.FromMilliseconds(4990));
+			Assert.AreEqual(1, mapping[0]);
+			Thread.Sleep(20);
+			// inside the refresh window the old value is still served while the new one is built
+			Assert.AreEqual(1, mapping[0]);
+			int value = 0;
+			Assert.IsTrue(WaitFor(() => mapping.TryGetExisting(0, out value) && value == 2));
+		}
+
+		[Test]
+		public void TimingWheelSweepsUntouchedEntries()
+		{
+			var mapping = new Counted(key => key, TimeSpan.FromMilliseconds(50));
+			for(int key = 0; key < 100; key++)
+				GC.KeepAlive(mapping[key]);
+			Assert.AreEqual(100, mapping.Live);
+			Assert.IsTrue(WaitFor(() => mapping.Live == 0));
+		}
+
+		[Test]
+		public void RejectsNonPositiveTimeToLive()
+		{
+			Assert.Throws<ArgumentOutOfRangeException>(() => new ExpiringLazyMapping<int, int>(key => key, TimeSpan.Zero));
+		}
+	}
+}
@@ -0,0 +1,86 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class FrozenMappingTests
+	{
+		[Test]
+		public void FreezeKeepsEveryEntry()
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int key1 = 0; key1 < 100; key1++)
+				for(int key2 = 0; key2 < 10; key2++)
+					mapping[key1, key2] = key1 * key2;
+			var frozen = mapping.Freeze();
+			Assert.AreEqual(1000, frozen.Count);
+			for(int key1 = 0; key1 < 100; key1++)
+				for(int key2 = 0; key2 < 10; key2++)
+					Assert.AreEqual(key1 * key2, frozen[key1, key2]);
+			int value;
+			Assert.IsFalse(frozen.TryGetValue(100, 0, out value));
+			Assert.IsFalse(frozen.Contains(0, 10));
+			Assert.Throws<KeyNotFoundException>(() => { var missing = frozen[-1, 0]; });
+		}
+
+		[Test]
+		public void FreezeKeepsTheComparers()
+		{
+			var mapping = new DictionaryMapping<string, string, int>(StringComparer.OrdinalIgnoreCase, null);
+			mapping["A", "b"] = 1;
+			var frozen = mapping.Freeze();
+			Assert.IsTrue(frozen.Contains("a", "b"));
+			Assert.IsFalse(frozen.Contains("a", "B"));
+		}
+
+		[Test]
+		public void FrozenMappingIsASnapshot()
+		{
+			var mapping = new DictionaryMapping<int, int>();
+			mapping[1] = 1;
+			var frozen = mapping.Freeze();
+			mapping[2] = 2;
+			Assert.AreEqual(1, frozen.Count);
+			Assert.IsFalse(frozen.Contains(2));
+		}
+
+		[Test]
+		public void CollidingHashesAreProbed()
+		{
+			var frozen = new FrozenMapping<int, string>(Enumerable.Range(0, 50).ToDictionary(key => key, key => key.ToString()), new ConstantHash());
+			for(int key = 0; key < 50; key++)
+				Assert.AreEqual(key.ToString(), frozen[key]);
+			Assert.IsFalse(frozen.Contains(50));
+		}
+
+		[Test]
+		public void DuplicateKeysAreRejected()
+		{
+			var entries = new[] { new KeyValuePair<int, int>(1, 1), new KeyValuePair<int, int>(1, 2) };
+			Assert.Throws<ArgumentException>(() => new FrozenMapping<int, int>(entries));
+		}
+
+		[Test]
+		public void EmptyMappingFindsNothing()
+		{
+			var frozen = new DictionaryMapping<int, int, int>().Freeze();
+			Assert.AreEqual(0, frozen.Count);
+			Assert.IsFalse(frozen.Contains(0, 0));
+		}
+
+		class ConstantHash : IEqualityComparer<int>
+		{
+			public bool Equals(int a, int b)
+			{
+				return a == b;
+			}
+			public int GetHashCode(int obj)
+			{
+				return 42;
+			}
+		}
+	}
+}
@@ -0,0 +1,40 @@
+﻿using System;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	// arities above --generic-above are thin wrappers over the single-key classes, keyed by the tuple of all keys
+	[TestFixture]
+	public class GenericArityTests
+	{
+		[Test]
+		public void KeysReachTheInstantiatorInOrder()
+		{
+			int calls = 0;
+			var mapping = new LazyMapping<int, int, int, int, int, int, string>((k1, k2, k3, k4, k5, k6) => { calls++; return string.Concat(k1, k2, k3, k4, k5, k6); });
+			Assert.AreEqual("123456", mapping[1, 2, 3, 4, 5, 6]);
+			Assert.AreEqual("123456", mapping[1, 2, 3, 4, 5, 6]);
+			Assert.AreEqual("123465", mapping[1, 2, 3, 4, 6, 5]);
+			Assert.AreEqual(2, calls);
+		}
+
+		[Test]
+		public void ComparersApplyPerKey()
+		{
+			var mapping = new LazyMapping<string, string, string, string, string, string, int>((k1, k2, k3, k4, k5, k6) => 0, null, null, null, null, null, null, StringComparer.OrdinalIgnoreCase);
+			Assert.AreEqual(0, mapping["a", "b", "c", "d", "e", "f"]);
+			int value;
+			Assert.IsTrue(mapping.TryGetExisting("a", "b", "c", "d", "e", "F", out value));
+			Assert.IsFalse(mapping.TryGetExisting("A", "b", "c", "d", "e", "f", out value));
+		}
+
+		[Test]
+		public void ContainsDelegateSeesAllKeys()
+		{
+			var mapping = new LazyMapping<int, int, int, int, int, int, int, int>((k1, k2, k3, k4, k5, k6, k7) => k7, (k1, k2, k3, k4, k5, k6, k7) => k7 > k1);
+			Assert.IsTrue(mapping.Contains(1, 0, 0, 0, 0, 0, 2));
+			Assert.IsFalse(mapping.Contains(2, 0, 0, 0, 0, 0, 1));
+			Assert.AreEqual(7, mapping[0, 0, 0, 0, 0, 0, 7]);
+		}
+	}
+}
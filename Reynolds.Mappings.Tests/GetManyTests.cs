@@ -0,0 +1,62 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class GetManyTests
+	{
+		static IList<Tuple<int, int>> Keys(params int[] keys1)
+		{
+			return keys1.Select(key1 => Tuple.Create(key1, 0)).ToList();
+		}
+
+		[Test]
+		public void MissesGoToTheBatchInstantiatorOnce()
+		{
+			var mapping = new LazyMapping<int, int, int>((key1, key2) => { Assert.Fail("single instantiator used"); return 0; });
+			var batches = new List<IList<Tuple<int, int>>>();
+			var values = mapping.GetMany(Keys(1, 2, 1, 3), keys => { batches.Add(keys); return keys.Select(key => key.Item1 * 10).ToArray(); });
+			CollectionAssert.AreEqual(new[] { 10, 20, 10, 30 }, values);
+			Assert.AreEqual(1, batches.Count);
+			// duplicates in the batch are instantiated once
+			CollectionAssert.AreEqual(Keys(1, 2, 3), batches[0]);
+		}
+
+		[Test]
+		public void HitsAreNotInstantiatedAgain()
+		{
+			int calls = 0;
+			var mapping = new LazyMapping<int, int, int>((key1, key2) => { calls++; return key1; });
+			Assert.AreEqual(1, mapping[1, 0]);
+			mapping.Statistics = new MappingStatistics();
+			CollectionAssert.AreEqual(new[] { 1, 2 }, mapping.GetMany(Keys(1, 2)));
+			Assert.AreEqual(2, calls);
+			Assert.AreEqual(1, mapping.Statistics.Hits);
+			Assert.AreEqual(1, mapping.Statistics.Misses);
+			Assert.AreEqual(2, mapping[2, 0]);
+			Assert.AreEqual(2, calls);
+		}
+
+		[Test]
+		public void BatchInstantiatorMustReturnOneValuePerKey()
+		{
+			var mapping = new LazyMapping<int, int, int>((key1, key2) => key1);
+			Assert.Throws<InvalidOperationException>(() => mapping.GetMany(Keys(1, 2), keys => new int[1]));
+		}
+
+		[Test]
+		public void WeakLazyMappingSharesValuesWithTheIndexer()
+		{
+			var mapping = new WeakLazyMapping<int, int, string>((key1, key2) => key1.ToString());
+			var first = mapping[1, 0];
+			var values = mapping.GetMany(Keys(1, 2, 3, 2), keys => keys.Select(key => "batch" + key.Item1).ToArray());
+			Assert.AreSame(first, values[0]);
+			CollectionAssert.AreEqual(new[] { "1", "batch2", "batch3", "batch2" }, values);
+			Assert.AreSame(values[1], mapping[2, 0]);
+			Assert.AreSame(values[1], values[3]);
+		}
+	}
+}
@@ -0,0 +1,113 @@
+﻿using System;
+using System.Diagnostics;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Tasks;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class MappingStatisticsTests
+	{
+		[Test]
+		public void StripesAddUpAcrossThreads()
+		{
+			var statistics = new MappingStatistics(4);
+			Parallel.For(0, 8, t =>
+			{
+				for(int i = 0; i < 10000; i++)
+					statistics.RecordHit();
+				statistics.RecordMisses(5);
+			});
+			Assert.AreEqual(80000, statistics.Hits);
+			Assert.AreEqual(40, statistics.Misses);
+			Assert.AreEqual(80000.0 / 80040, statistics.HitRatio, 1e-12);
+			statistics.Reset();
+			Assert.AreEqual(0, statistics.Hits);
+			Assert.AreEqual(0, statistics.HitRatio);
+		}
+
+		[Test]
+		public void InstantiationsFillTheHistogram()
+		{
+			var statistics = new MappingStatistics(1);
+			statistics.RecordInstantiation(Stopwatch.GetTimestamp());
+			statistics.RecordInstantiation(Stopwatch.GetTimestamp() - Stopwatch.Frequency);
+			Assert.AreEqual(2, statistics.Instantiations);
+			Assert.AreEqual(2, statistics.InstantiationHistogram.Sum());
+			Assert.AreEqual(MappingStatistics.HistogramBuckets, statistics.InstantiationHistogram.Length);
+			// a second is 2^20 microseconds, give or take
+			Assert.AreEqual(1, statistics.InstantiationHistogram.Skip(19).Take(3).Sum());
+			Assert.GreaterOrEqual(statistics.InstantiationTime, TimeSpan.FromSeconds(1));
+		}
+
+		[Test]
+		public void LazyMappingRecordsLookups()
+		{
+			var mapping = new LazyMapping<int, int, int>((key1, key2) => key1 + key2);
+			mapping.Statistics = new MappingStatistics();
+			GC.KeepAlive(mapping[1, 2]);
+			GC.KeepAlive(mapping[1, 2]);
+			GC.KeepAlive(mapping[2, 2]);
+			Assert.AreEqual(1, mapping.Statistics.Hits);
+			Assert.AreEqual(2, mapping.Statistics.Misses);
+			Assert.AreEqual(2, mapping.Statistics.Instantiations);
+		}
+
+		// leaves dead entries in place, so that a collection does not race the next lookup to remove them
+		class Uncleaned : WeakLazyMapping<int, object>
+		{
+			public Uncleaned() : base(key => new object())
+			{
+			}
+			protected override bool CleanupBatch()
+			{
+				return true;
+			}
+		}
+
+		[MethodImpl(MethodImplOptions.NoInlining)]
+		static void Touch(WeakLazyMapping<int, object> mapping, int key)
+		{
+			GC.KeepAlive(mapping[key]);
+		}
+
+		[Test]
+		public void WeakLazyMappingRecordsResurrections()
+		{
+			var mapping = new Uncleaned();
+			mapping.Statistics = new MappingStatistics();
+			Touch(mapping, 1);
+			GC.Collect();
+			GC.WaitForPendingFinalizers();
+			Touch(mapping, 1);
+			Assert.AreEqual(1, mapping.Statistics.Resurrections);
+			Assert.AreEqual(2, mapping.Statistics.Misses);
+		}
+
+		[Test]
+		public void CleanupsRecordTheEntriesTheyRemove()
+		{
+			var mapping = new WeakLazyMapping<int, object>(key => new object());
+			mapping.Statistics = new MappingStatistics();
+			for(int key = 0; key < 100; key++)
+				Touch(mapping, key);
+			GC.Collect();
+			GC.WaitForPendingFinalizers();
+			var waited = Stopwatch.StartNew();
+			while(mapping.Statistics.Removals < 100 && waited.Elapsed < TimeSpan.FromSeconds(10))
+				Thread.Sleep(10);
+			Assert.AreEqual(100, mapping.Statistics.Removals);
+		}
+
+		[Test]
+		public void StatisticsAreOffByDefault()
+		{
+			var mapping = new LazyMapping<int, int>(key => key);
+			Assert.IsNull(mapping.Statistics);
+			Assert.AreEqual(1, mapping[1]);
+		}
+	}
+}
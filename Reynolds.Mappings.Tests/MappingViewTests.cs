@@ -0,0 +1,106 @@
+﻿using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class MappingViewTests
+	{
+		static DictionaryMapping<int, int, int> Grid()
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int key1 = 0; key1 < 3; key1++)
+				for(int key2 = 0; key2 < 4; key2++)
+					mapping[key1, key2] = key1 * 10 + key2;
+			return mapping;
+		}
+
+		static List<object> Items(IEnumerable enumerable)
+		{
+			var items = new List<object>();
+			foreach(var item in enumerable)
+				items.Add(item);
+			return items;
+		}
+
+		[Test]
+		public void SelectAndWhereFuseIntoOneLookup()
+		{
+			var view = Grid().Where((key1, key2) => key2 % 2 == 0).Select(value => value * 2);
+			Assert.AreEqual(40, view[2, 0]);
+			Assert.AreEqual(44, view[2, 2]);
+			Assert.IsFalse(view.Contains(2, 1));
+			Assert.Throws<KeyNotFoundException>(() => { var missing = view[2, 1]; });
+			Assert.AreEqual(6, view.Count);
+			CollectionAssert.AreEquivalent(new[] { 0, 4, 20, 24, 40, 44 }, ((IEnumerable<IKeyValueTuple<int, int, int>>) view).Select(e => e.Value));
+		}
+
+		[Test]
+		public void ComposeRestrictsToTheNextDomain()
+		{
+			var names = new DictionaryMapping<int, string>();
+			names[1] = "one";
+			names[21] = "twenty-one";
+			var view = Grid().Compose(names);
+			Assert.AreEqual("twenty-one", view[2, 1]);
+			Assert.IsFalse(view.Contains(2, 2));
+			CollectionAssert.AreEquivalent(new[] { "one", "twenty-one" }, ((IEnumerable<IKeyValueTuple<int, int, string>>) view).Select(e => e.Value));
+		}
+
+		[Test]
+		public void CurriedFiniteMappingStaysFinite()
+		{
+			var curried = Grid().Curry(1);
+			Assert.IsTrue(curried.IsFinite);
+			Assert.IsTrue(curried.IsNumerable);
+			Assert.AreEqual(4, curried.Count);
+			Assert.AreEqual(13, curried[3]);
+			CollectionAssert.AreEquivalent(new[] { 0, 1, 2, 3 }, (IEnumerable<int>) curried);
+			CollectionAssert.AreEquivalent(new[] { 10, 11, 12, 13 }, ((IEnumerable<IKeyValueTuple<int, int>>) curried).Select(e => e.Value));
+		}
+
+		[Test]
+		public void CurryKeepsTheFilter()
+		{
+			var curried = new DictionaryMapping<int, int, int, int>();
+			curried[1, 2, 3] = 1;
+			curried[1, 2, 4] = 2;
+			curried[2, 2, 3] = 3;
+			var view = curried.Where((key1, key2, key3) => key3 == 3).Curry(1);
+			Assert.AreEqual(1, view.Count);
+			CollectionAssert.AreEqual(new[] { Tuple.Create(2, 3) }, (IEnumerable<Tuple<int, int>>) view);
+		}
+
+		[Test]
+		public void CurriedFunctionIsNotEnumerable()
+		{
+			var sums = new Mapping<int, int, int>((key1, key2) => key1 + key2);
+			var curried = sums.Curry(5);
+			Assert.AreEqual(7, curried[2]);
+			Assert.IsFalse(curried.IsFinite);
+			Assert.Throws<Exception>(() => { var count = curried.Count; });
+		}
+
+		[Test]
+		public void NonGenericEnumerationYieldsKeys()
+		{
+			var view = Grid().Where((key1, key2) => key1 == 0);
+			CollectionAssert.AreEquivalent(Enumerable.Range(0, 4).Select(key2 => Tuple.Create(0, key2)), Items(view));
+			CollectionAssert.AreEquivalent(new object[] { 0, 1, 2, 3 }, Items(Grid().Curry(0)));
+		}
+
+		[Test]
+		public void MemoizeCachesTheFusedLookup()
+		{
+			int calls = 0;
+			var counted = new Mapping<int, int>(key => { calls++; return key; });
+			var memo = counted.Select(value => value + 1).Memoize();
+			Assert.AreEqual(3, memo[2]);
+			Assert.AreEqual(3, memo[2]);
+			Assert.AreEqual(1, calls);
+		}
+	}
+}
@@ -0,0 +1,89 @@
+﻿using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class ShardedMappingTests
+	{
+		[Test]
+		public void ShardCountRoundsUpToAPowerOfTwo()
+		{
+			Assert.AreEqual(1, new ShardedMapping<int, int>(1).ShardCount);
+			Assert.AreEqual(8, new ShardedMapping<int, int>(5).ShardCount);
+			Assert.Throws<ArgumentOutOfRangeException>(() => new ShardedMapping<int, int>(0));
+		}
+
+		[Test]
+		public void BehavesAsADictionary()
+		{
+			var mapping = new ShardedMapping<int, string, double>(4);
+			mapping[1, "a"] = 1.5;
+			mapping.Add(2, "b", 2.5);
+			Assert.Throws<ArgumentException>(() => mapping.Add(2, "b", 3.5));
+			Assert.AreEqual(2, mapping.Count);
+			Assert.AreEqual(2.5, mapping[2, "b"]);
+			Assert.IsTrue(mapping.Contains(1, "a"));
+			Assert.IsTrue(mapping.Remove(1, "a"));
+			Assert.IsFalse(mapping.Remove(1, "a"));
+			double value;
+			Assert.IsFalse(mapping.TryGetValue(1, "a", out value));
+			Assert.Throws<KeyNotFoundException>(() => { var missing = mapping[1, "a"]; });
+			mapping.Clear();
+			Assert.AreEqual(0, mapping.Count);
+		}
+
+		[Test]
+		public void ComparersApplyPerKey()
+		{
+			var mapping = new ShardedMapping<string, string, int>(4, StringComparer.OrdinalIgnoreCase, null);
+			mapping["A", "b"] = 1;
+			Assert.IsTrue(mapping.Contains("a", "b"));
+			Assert.IsFalse(mapping.Contains("a", "B"));
+		}
+
+		[Test]
+		public void ConcurrentWritersLoseNothing()
+		{
+			var mapping = new ShardedMapping<int, int>(8);
+			Parallel.For(0, 8, t =>
+			{
+				for(int i = 0; i < 1000; i++)
+					mapping[t * 1000 + i] = i;
+			});
+			Assert.AreEqual(8000, mapping.Count);
+			Assert.AreEqual(999, mapping[7999]);
+		}
+
+		[Test]
+		public void EnumerationSeesEachShardAsItWas()
+		{
+			var mapping = new ShardedMapping<int, int>(1);
+			for(int i = 0; i < 10; i++)
+				mapping[i] = i;
+			int seen = 0;
+			foreach(var entry in mapping)
+			{
+				// writes go to a fresh copy, so they neither show up here nor break the enumeration
+				mapping[100 + entry.Key] = entry.Value;
+				seen++;
+			}
+			Assert.AreEqual(10, seen);
+			Assert.AreEqual(20, mapping.Count);
+		}
+
+		[Test]
+		public void EnumeratesKeysNonGenerically()
+		{
+			var mapping = new ShardedMapping<int, string, double>(4);
+			mapping[1, "a"] = 1.5;
+			mapping[2, "b"] = 2.5;
+			CollectionAssert.AreEquivalent(new[] { Tuple.Create(1, "a"), Tuple.Create(2, "b") }, (IEnumerable) mapping);
+			CollectionAssert.AreEquivalent(new[] { 1.5, 2.5 }, ((IEnumerable<IKeyValueTuple<int, string, double>>) mapping).Select(e => e.Value));
+		}
+	}
+}
@@ -0,0 +1,152 @@
+﻿using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using System.Threading.Tasks;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class SliceTests
+	{
+		[Test]
+		public void SliceFollowsLaterWrites()
+		{
+			var mapping = new DictionaryMapping<int, int, int, string>();
+			mapping[1, 2, 3] = "a";
+			var slice = mapping.Slice(1);
+			mapping[1, 4, 5] = "b";
+			mapping.Add(2, 2, 3, "c");
+			Assert.AreEqual(2, slice.Count);
+			Assert.AreEqual("b", slice[4, 5]);
+			Assert.IsTrue(mapping.Remove(1, 2, 3));
+			Assert.IsFalse(slice.Contains(2, 3));
+			Assert.AreEqual(1, slice.Count);
+		}
+
+		[Test]
+		public void SliceOfAnAbsentKeyFillsLater()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			var slice = mapping.Slice(7);
+			Assert.AreEqual(0, slice.Count);
+			mapping[7, 1] = "a";
+			Assert.AreEqual("a", slice[1]);
+		}
+
+		[Test]
+		public void EmptiedSliceStaysAttached()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			mapping[1, 1] = "a";
+			var slice = mapping.Slice(1);
+			mapping.Remove(1, 1);
+			Assert.AreEqual(0, slice.Count);
+			mapping[1, 2] = "b";
+			Assert.AreEqual("b", slice[2]);
+			Assert.AreEqual(1, mapping.Slice(1).Count);
+		}
+
+		static int IndexedKeys<TKey1, TKey2, TValue>(DictionaryMapping<TKey1, TKey2, TValue> mapping)
+		{
+			var index = (IDictionary) typeof(DictionaryMapping<TKey1, TKey2, TValue>).GetField("_prefixIndex", BindingFlags.Instance | BindingFlags.NonPublic).GetValue(mapping);
+			return index.Count;
+		}
+
+		[Test]
+		public void IndexHoldsOnlyKeysWithEntries()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			mapping[1, 1] = "a";
+			for(int key1 = 0; key1 < 100; key1++)
+				Assert.AreEqual(key1 == 1 ? 1 : 0, mapping.Slice(key1).Count);
+			Assert.AreEqual(1, IndexedKeys(mapping));
+			for(int key1 = 2; key1 < 100; key1++)
+			{
+				mapping[key1, 1] = "b";
+				mapping.Remove(key1, 1);
+			}
+			Assert.AreEqual(1, IndexedKeys(mapping));
+			mapping.Clear();
+			Assert.AreEqual(0, IndexedKeys(mapping));
+		}
+
+		[Test]
+		public void MappingIsStillADictionary()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			Dictionary<Tuple<int, int>, string> dictionary = mapping;
+			mapping[1, 2] = "a";
+			Assert.AreEqual("a", dictionary[Tuple.Create(1, 2)]);
+			Assert.AreEqual(1, mapping.Slice(1).Count);
+		}
+
+		[Test]
+		public void ClearEmptiesSlicesInPlace()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			mapping[1, 1] = "a";
+			var slice = mapping.Slice(1);
+			mapping.Clear();
+			Assert.AreEqual(0, slice.Count);
+			mapping[1, 3] = "c";
+			Assert.AreEqual("c", slice[3]);
+		}
+
+		[Test]
+		public void SliceCannotBeWrittenThrough()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			mapping[1, 1] = "a";
+			var slice = mapping.Slice(1);
+			Assert.IsFalse(slice is DictionaryMapping<int, string>);
+			Assert.IsFalse(slice is IDictionary<int, string>);
+			CollectionAssert.AreEqual(new[] { 1 }, (IEnumerable<int>) slice);
+			Assert.AreEqual("a", ((IEnumerable<IKeyValueTuple<int, string>>) slice).Single().Value);
+		}
+
+		[Test]
+		public void WritesThroughTheInterfacesReachTheIndex()
+		{
+			var mapping = new DictionaryMapping<int, int, string>();
+			var slice = mapping.Slice(1);
+			var dictionary = (IDictionary<Tuple<int, int>, string>) mapping;
+			dictionary[Tuple.Create(1, 1)] = "a";
+			dictionary.Add(Tuple.Create(1, 2), "b");
+			((ICollection<KeyValuePair<Tuple<int, int>, string>>) mapping).Add(new KeyValuePair<Tuple<int, int>, string>(Tuple.Create(1, 3), "c"));
+			Assert.AreEqual(3, slice.Count);
+			Assert.IsFalse(((ICollection<KeyValuePair<Tuple<int, int>, string>>) mapping).Remove(new KeyValuePair<Tuple<int, int>, string>(Tuple.Create(1, 3), "other")));
+			Assert.IsTrue(((ICollection<KeyValuePair<Tuple<int, int>, string>>) mapping).Remove(new KeyValuePair<Tuple<int, int>, string>(Tuple.Create(1, 3), "c")));
+			Assert.IsTrue(dictionary.Remove(Tuple.Create(1, 2)));
+			CollectionAssert.AreEqual(new[] { 1 }, (IEnumerable<int>) slice);
+		}
+
+		[Test]
+		public void GenericAritiesIndexWritesThroughTheBase()
+		{
+			var mapping = new DictionaryMapping<int, int, int, int, int, int, string>();
+			var slice = mapping.Slice(1);
+			((IDictionary<Tuple<int, int, int, int, int, int>, string>) mapping).Add(Tuple.Create(1, 2, 3, 4, 5, 6), "a");
+			mapping[1, 0, 0, 0, 0, 0] = "b";
+			Assert.AreEqual(2, slice.Count);
+			Assert.AreEqual("a", slice[2, 3, 4, 5, 6]);
+			((DictionaryMapping<Tuple<int, int, int, int, int, int>, string>) mapping).Clear();
+			Assert.AreEqual(0, slice.Count);
+		}
+
+		[Test]
+		public void ConcurrentFirstSlicesAgree()
+		{
+			var mapping = new DictionaryMapping<int, int, int>();
+			for(int key1 = 0; key1 < 100; key1++)
+				for(int key2 = 0; key2 < 100; key2++)
+					mapping[key1, key2] = key1 + key2;
+			var counts = new int[8][];
+			Parallel.For(0, counts.Length, t => counts[t] = Enumerable.Range(0, 200).Select(key1 => mapping.Slice(key1).Count).ToArray());
+			foreach(var count in counts)
+				CollectionAssert.AreEqual(Enumerable.Range(0, 200).Select(key1 => key1 < 100 ? 100 : 0).ToArray(), count);
+		}
+	}
+}
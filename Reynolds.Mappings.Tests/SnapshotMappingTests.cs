@@ -0,0 +1,146 @@
+﻿using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class SnapshotMappingTests
+	{
+		struct Named
+		{
+			public string Name;
+		}
+
+		string _path;
+
+		[SetUp]
+		public void CreatePath()
+		{
+			_path = Path.Combine(Path.GetTempPath(), Guid.NewGuid() + ".snapshot");
+		}
+
+		[TearDown]
+		public void DeletePath()
+		{
+			File.Delete(_path);
+		}
+
+		static DictionaryMapping<int, long, double> Entries(int count)
+		{
+			var mapping = new DictionaryMapping<int, long, double>();
+			for(int i = 0; i < count; i++)
+				mapping[i, i * 10L] = i / 2.0;
+			return mapping;
+		}
+
+		[Test]
+		public void ReadsBackWhatWasWritten()
+		{
+			SnapshotMapping<int, long, double>.Write(_path, Entries(100));
+			using(var snapshot = new SnapshotMapping<int, long, double>(_path))
+			{
+				Assert.AreEqual(100, snapshot.Count);
+				Assert.AreEqual(21.5, snapshot[43, 430]);
+				Assert.IsTrue(snapshot.Contains(99, 990));
+				Assert.IsFalse(snapshot.Contains(99, 991));
+				double value;
+				Assert.IsFalse(snapshot.TryGetValue(100, 1000, out value));
+				Assert.Throws<KeyNotFoundException>(() => { var missing = snapshot[1, 1]; });
+				CollectionAssert.AreEquivalent(Enumerable.Range(0, 100).Select(i => i / 2.0), ((IEnumerable<IKeyValueTuple<int, long, double>>) snapshot).Select(e => e.Value));
+			}
+		}
+
+		[Test]
+		public void EnumeratesKeysNonGenerically()
+		{
+			SnapshotMapping<int, long, double>.Write(_path, Entries(3));
+			using(var snapshot = new SnapshotMapping<int, long, double>(_path))
+				CollectionAssert.AreEquivalent(new[] { Tuple.Create(0, 0L), Tuple.Create(1, 10L), Tuple.Create(2, 20L) }, (System.Collections.IEnumerable) snapshot);
+		}
+
+		[Test]
+		public void WritesAnEmptyMapping()
+		{
+			SnapshotMapping<int, long, double>.Write(_path, Entries(0));
+			using(var snapshot = new SnapshotMapping<int, long, double>(_path))
+			{
+				Assert.AreEqual(0, snapshot.Count);
+				Assert.IsFalse(snapshot.Contains(0, 0));
+			}
+		}
+
+		[Test]
+		public void ReplacingLeavesOpenReadersOnTheOldSnapshot()
+		{
+			SnapshotMapping<int, long, double>.Write(_path, Entries(2));
+			using(var old = new SnapshotMapping<int, long, double>(_path))
+			{
+				SnapshotMapping<int, long, double>.Write(_path, Entries(5));
+				Assert.IsFalse(File.Exists(_path + ".tmp"));
+				using(var replaced = new SnapshotMapping<int, long, double>(_path))
+				{
+					Assert.AreEqual(2, old.Count);
+					Assert.AreEqual(0.5, old[1, 10]);
+					Assert.AreEqual(5, replaced.Count);
+					Assert.AreEqual(2.0, replaced[4, 40]);
+				}
+			}
+		}
+
+		[Test]
+		public void DisposedReaderThrows()
+		{
+			SnapshotMapping<int, long, double>.Write(_path, Entries(2));
+			var snapshot = new SnapshotMapping<int, long, double>(_path);
+			snapshot.Dispose();
+			snapshot.Dispose();
+			Assert.Throws<ObjectDisposedException>(() => snapshot.Contains(1, 10));
+			double value;
+			Assert.Throws<ObjectDisposedException>(() => snapshot.TryGetValue(1, 10, out value));
+			Assert.Throws<ObjectDisposedException>(() => { var disposed = snapshot[1, 10]; });
+			Assert.Throws<ObjectDisposedException>(() => ((IEnumerable<IKeyValueTuple<int, long, double>>) snapshot).ToList());
+		}
+
+		[Test]
+		public void FailedWriteLeavesNoTemporaryFile()
+		{
+			// a directory in the way makes the final rename fail
+			Directory.CreateDirectory(_path);
+			try
+			{
+				Assert.Catch<IOException>(() => SnapshotMapping<int, long, double>.Write(_path, Entries(2)));
+				Assert.IsFalse(File.Exists(_path + ".tmp"));
+			}
+			finally
+			{
+				Directory.Delete(_path);
+			}
+		}
+
+		[Test]
+		public void RejectsSnapshotsOfOtherTypes()
+		{
+			SnapshotMapping<int, long, double>.Write(_path, Entries(2));
+			Assert.Throws<InvalidDataException>(() => new SnapshotMapping<int, long, long>(_path));
+		}
+
+		[Test]
+		public void RejectsFilesThatAreNotSnapshots()
+		{
+			File.WriteAllBytes(_path, new byte[64]);
+			Assert.Throws<InvalidDataException>(() => new SnapshotMapping<int, long, double>(_path));
+		}
+
+		[Test]
+		public void RejectsTypesWithReferences()
+		{
+			var e = Assert.Catch<TypeInitializationException>(() => SnapshotMapping<Named, int>.Write(_path, new DictionaryMapping<Named, int>()));
+			Assert.IsInstanceOf<NotSupportedException>(e.InnerException);
+			e = Assert.Catch<TypeInitializationException>(() => SnapshotMapping<int, bool>.Write(_path, new DictionaryMapping<int, bool>()));
+			Assert.IsInstanceOf<NotSupportedException>(e.InnerException);
+		}
+	}
+}
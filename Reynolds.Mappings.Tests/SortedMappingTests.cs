@@ -0,0 +1,111 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class SortedMappingTests
+	{
+		class Descending : IComparer<int>
+		{
+			public int Compare(int a, int b)
+			{
+				return b.CompareTo(a);
+			}
+		}
+
+		[Test]
+		public void SkipListMatchesSortedDictionary()
+		{
+			var random = new Random(1);
+			var list = new SkipList<int, int>();
+			var expected = new SortedDictionary<int, int>();
+			for(int round = 0; round < 20000; round++)
+			{
+				int key = random.Next(1000);
+				if(random.Next(3) == 0)
+				{
+					Assert.AreEqual(expected.Remove(key), list.Remove(key));
+				}
+				else
+				{
+					list.Set(key, round, false);
+					expected[key] = round;
+				}
+			}
+			Assert.AreEqual(expected.Count, list.Count);
+			CollectionAssert.AreEqual(expected, list);
+			list.Clear();
+			Assert.AreEqual(0, list.Count);
+			CollectionAssert.IsEmpty(list);
+		}
+
+		[Test]
+		public void SkipListAddRejectsDuplicates()
+		{
+			var list = new SkipList<int, int>();
+			list.Set(1, 1, true);
+			Assert.Throws<ArgumentException>(() => list.Set(1, 2, true));
+			list.Set(1, 2, false);
+			int value;
+			Assert.IsTrue(list.TryGetValue(1, out value));
+			Assert.AreEqual(2, value);
+		}
+
+		[Test]
+		public void FloorAndCeilingFindTheNearestKeys()
+		{
+			var mapping = new SortedMapping<int, int, string>();
+			mapping[1, 5] = "a";
+			mapping[2, 0] = "b";
+			mapping[2, 9] = "c";
+			KeyValueTuple<int, int, string> entry;
+			Assert.IsTrue(mapping.TryGetFloor(2, 5, out entry));
+			Assert.AreEqual("b", entry.Value);
+			Assert.IsTrue(mapping.TryGetCeiling(2, 5, out entry));
+			Assert.AreEqual("c", entry.Value);
+			Assert.IsTrue(mapping.TryGetFloor(2, 9, out entry));
+			Assert.AreEqual("c", entry.Value);
+			Assert.IsFalse(mapping.TryGetFloor(1, 4, out entry));
+			Assert.IsFalse(mapping.TryGetCeiling(2, 10, out entry));
+		}
+
+		[Test]
+		public void RangesAreHalfOpenAndOrdered()
+		{
+			var mapping = new SortedMapping<int, int, int>();
+			for(int key1 = 9; key1 >= 0; key1--)
+				for(int key2 = 0; key2 < 3; key2++)
+					mapping[key1, key2] = key1 * 10 + key2;
+			CollectionAssert.AreEqual(new[] { 21, 22, 30, 31, 32, 40 }, mapping.Range(Tuple.Create(2, 1), Tuple.Create(4, 1)).Select(e => e.Value));
+			CollectionAssert.AreEqual(new[] { 30, 31, 32, 40, 41, 42 }, mapping.RangeByKey1(3, 5).Select(e => e.Value));
+			CollectionAssert.IsEmpty(mapping.RangeByKey1(5, 5));
+		}
+
+		[Test]
+		public void ComparersApplyPerKey()
+		{
+			var mapping = new SortedMapping<int, string, int>(new Descending(), StringComparer.OrdinalIgnoreCase);
+			mapping[1, "b"] = 1;
+			mapping[2, "a"] = 2;
+			mapping[1, "A"] = 3;
+			Assert.IsTrue(mapping.Contains(1, "B"));
+			CollectionAssert.AreEqual(new[] { 2, 3, 1 }, ((IEnumerable<IKeyValueTuple<int, string, int>>) mapping).Select(e => e.Value));
+		}
+
+		[Test]
+		public void DomainEnumeratesKeysInOrder()
+		{
+			var mapping = new SortedMapping<int, int>();
+			mapping[3] = 0;
+			mapping[1] = 0;
+			mapping.Add(2, 0);
+			Assert.Throws<ArgumentException>(() => mapping.Add(2, 1));
+			CollectionAssert.AreEqual(new[] { 1, 2, 3 }, (IEnumerable<int>) mapping);
+			Assert.IsTrue(mapping.Remove(2));
+			Assert.Throws<KeyNotFoundException>(() => { var missing = mapping[2]; });
+		}
+	}
+}
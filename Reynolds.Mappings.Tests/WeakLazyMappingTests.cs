@@ -0,0 +1,157 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Tasks;
+using NUnit.Framework;
+
+namespace Reynolds.Mappings.Tests
+{
+	[TestFixture]
+	public class WeakLazyMappingTests
+	{
+		class Value
+		{
+			public readonly int Key;
+			public Value(int key)
+			{
+				Key = key;
+			}
+		}
+
+		// instantiates key without keeping the value, so that a collection can take it
+		[MethodImpl(MethodImplOptions.NoInlining)]
+		static void Touch(WeakLazyMapping<int, Value> mapping, int key)
+		{
+			GC.KeepAlive(mapping[key]);
+		}
+
+		static void Collect()
+		{
+			GC.Collect();
+			GC.WaitForPendingFinalizers();
+			GC.Collect();
+		}
+
+		[Test]
+		public void ValueIsSharedWhileAlive()
+		{
+			var mapping = new WeakLazyMapping<int, int, Value>((key1, key2) => new Value(key1 + key2));
+			var value = mapping[1, 2];
+			Assert.AreSame(value, mapping[1, 2]);
+			Assert.AreEqual(3, value.Key);
+		}
+
+		[Test]
+		public void ConcurrentReadersSeeOneValuePerKey()
+		{
+			var mapping = new WeakLazyMapping<int, Value>(key => new Value(key));
+			var seen = Enumerable.Range(0, 4).Select(t => Task.Factory.StartNew(() => Enumerable.Range(0, 1000).Select(key => mapping[key]).ToArray(), TaskCreationOptions.LongRunning)).ToArray();
+			Task.WaitAll(seen);
+			for(int key = 0; key < 1000; key++)
+				foreach(var values in seen)
+					Assert.AreSame(seen[0].Result[key], values.Result[key]);
+		}
+
+		[Test]
+		public void CollectedValueIsInstantiatedAgain()
+		{
+			int calls = 0;
+			var mapping = new WeakLazyMapping<int, Value>(key => { calls++; return new Value(key); });
+			Touch(mapping, 7);
+			Collect();
+			Value value;
+			Assert.IsFalse(mapping.TryGetExisting(7, out value));
+			Assert.AreEqual(7, mapping[7].Key);
+			Assert.AreEqual(2, calls);
+		}
+
+		[Test]
+		public void CollectionTriggersCleanupPass()
+		{
+			var mapping = new WeakLazyMapping<int, Value>(key => new Value(key));
+			mapping.Statistics = new MappingStatistics();
+			for(int key = 0; key < 100; key++)
+				Touch(mapping, key);
+			Collect();
+			var waited = Stopwatch.StartNew();
+			while(mapping.Statistics.Cleanups == 0 && waited.Elapsed < TimeSpan.FromSeconds(10))
+				Thread.Sleep(10);
+			Assert.Greater(mapping.Statistics.Cleanups, 0);
+		}
+
+		[Test]
+		public void StrongCapacityIsSplitAcrossStripes()
+		{
+			Assert.AreEqual(0, new WeakLazyMapping<int, Value>(key => new Value(key)).StrongCapacity);
+			// 20 rounds up to 2 per stripe
+			Assert.AreEqual(32, new WeakLazyMapping<int, Value>(key => new Value(key), null, 20).StrongCapacity);
+			Assert.Throws<ArgumentOutOfRangeException>(() => new WeakLazyMapping<int, Value>(key => new Value(key), null, -1));
+		}
+
+		[Test]
+		public void ComparersNeedNoStrongTier()
+		{
+			var mapping = new WeakLazyMapping<string, int, Value>((key1, key2) => new Value(key2), null, StringComparer.OrdinalIgnoreCase, null);
+			Assert.AreEqual(0, mapping.StrongCapacity);
+			Assert.AreSame(mapping["a", 1], mapping["A", 1]);
+		}
+
+		[Test]
+		public void StrongTierKeepsRecentValuesAlive()
+		{
+			int calls = 0;
+			var mapping = new WeakLazyMapping<int, Value>(key => { calls++; return new Value(key); }, null, 160);
+			for(int key = 0; key < 10; key++)
+				Touch(mapping, key);
+			Collect();
+			for(int key = 0; key < 10; key++)
+				Assert.AreEqual(key, mapping[key].Key);
+			Assert.AreEqual(10, calls);
+		}
+
+		[Test]
+		public void LeastRecentlyUsedIsDemotedAndPromotedBack()
+		{
+			// one strong slot per stripe; small int keys hash to stripe key & 15, so 0 and 16 compete for one slot
+			var mapping = new WeakLazyMapping<int, Value>(key => new Value(key), null, 16);
+			mapping.Statistics = new MappingStatistics();
+			var zero = mapping[0];
+			Touch(mapping, 16);
+			Assert.AreEqual(1, mapping.Statistics.Demotions);
+			Assert.AreSame(zero, mapping[0]);
+			Assert.AreEqual(1, mapping.Statistics.Promotions);
+			Assert.AreEqual(2, mapping.Statistics.Demotions);
+			Collect();
+			Value value;
+			Assert.IsFalse(mapping.TryGetExisting(16, out value));
+			Assert.IsTrue(mapping.TryGetExisting(0, out value));
+			GC.KeepAlive(zero);
+		}
+
+		[Test]
+		public void ValueFoundAfterInstantiatingIsPromoted()
+		{
+			Value inner = null;
+			bool nested = false;
+			WeakLazyMapping<int, Value> mapping = null;
+			mapping = new WeakLazyMapping<int, Value>(key =>
+			{
+				if(key == 0 && !nested)
+				{
+					// another caller gets in first, and its value is demoted before this one is done
+					nested = true;
+					inner = mapping[0];
+					Touch(mapping, 16);
+				}
+				return new Value(key);
+			}, null, 16);
+			mapping.Statistics = new MappingStatistics();
+			var value = mapping[0];
+			Assert.AreSame(inner, value);
+			Assert.AreEqual(1, mapping.Statistics.Promotions);
+		}
+	}
+}
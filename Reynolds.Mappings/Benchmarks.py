@@ -0,0 +1,165 @@
+﻿# Emits Benchmarks.cs for Reynolds.Mappings.Benchmarks: every selected class at every generated arity,
+# keyed by ints, timed by the hand-written Harness.cs there. Called from Mapping.py.
+
+from CodeGen import *
+
+SIZE = 4096 # distinct keys per benchmark, a power of two
+
+# value type and how a looked-up value is folded into the checksum, for classes that are not plain int mappings
+VALUES = {
+	"AsyncLazyMapping": ("int", "%s.Result"),
+	"WeakLazyMapping": ("object", "(%s == null ? 0 : 1)"),
+}
+INSTANTIATED = {
+	"AsyncLazyMapping": "Harness.Completed(%s)",
+	"WeakLazyMapping": "new object()",
+}
+CONSTRUCTOR_ARGS = {
+	"BoundedLazyMapping": ", Size",
+	"ExpiringLazyMapping": ", TimeSpan.FromMinutes(10)",
+}
+LAZY = ["LazyMapping", "BoundedLazyMapping", "ExpiringLazyMapping", "ConcurrentLazyMapping", "AsyncLazyMapping", "WeakLazyMapping"]
+CONCURRENT = ["DictionaryMapping", "FrozenMapping", "ShardedMapping", "SnapshotMapping", "ExpiringLazyMapping", "ConcurrentLazyMapping", "WeakLazyMapping"]
+
+def keys(n, prefix, index):
+	return ", ".join("%s%i[%s]" % (prefix, k+1, index) for k in range(n))
+
+def same_keys(n, key):
+	return ", ".join([key] * n)
+
+def parameters(n, extra = []):
+	names = ["key%i" % (k+1) for k in range(n)] + extra
+	return names[0] if len(names) == 1 else "(" + ", ".join(names) + ")"
+
+def type_name(name, n, value):
+	return "%s<%s, %s>" % (name, ", ".join(["int"] * n), value)
+
+def run(method, title, expression):
+	# a timed loop over the keys, folding every result into a checksum the JIT cannot drop
+	with block('harness.%s("%s", iterations =>' % (method, title), postfix = ");"):
+		stmt("long sum = 0")
+		with block("for(int i = 0; i < iterations; i++)"):
+			stmt("sum += %s" % expression)
+		stmt("return sum")
+
+def benchmark(name, n, statistics):
+	value, fold = VALUES.get(name, ("int", "%s"))
+	mapping = type_name(name, n, value)
+	title = "%s/%i/" % (name, n)
+	lookup = fold % ("mapping[%s]" % keys(n, "k", "i & Mask"))
+	with block("static void %s%i(Harness harness)" % (name, n)):
+		if name == "Mapping":
+			stmt("var mapping = new %s(%s => key1)" % (mapping, parameters(n)))
+			run("Run", title + "GetHit", lookup)
+			return
+		if name == "MappingView":
+			# the same three steps as one fused view and as Mappings wrapping one another
+			stmt("var function = new %s(%s => key1)" % (type_name("Mapping", n, value), parameters(n)))
+			stmt("var mapping = function.Select(v => v + 1).Select(v => v * 2).Where(%s => key1 >= 0)" % parameters(n))
+			stmt("var added = new %s(%s => function[%s] + 1)" % (type_name("Mapping", n, value), parameters(n), parameters(n).strip("()")))
+			stmt("var doubled = new %s(%s => added[%s] * 2)" % (type_name("Mapping", n, value), parameters(n), parameters(n).strip("()")))
+			stmt("var nested = new %s(%s => key1 >= 0 ? doubled[%s] : -1)" % (type_name("Mapping", n, value), parameters(n), parameters(n).strip("()")))
+			run("Run", title + "GetHit", lookup)
+			run("Run", title + "NestedGetHit", "nested[%s]" % keys(n, "k", "i & Mask"))
+			return
+		if name in LAZY:
+			instantiator = "%s => %s" % (parameters(n, ["cancellationToken"] if name == "AsyncLazyMapping" else []), INSTANTIATED.get(name, "%s").replace("%s", "key1"))
+			constructor = "new %s(%s%s)" % (mapping, instantiator, CONSTRUCTOR_ARGS.get(name, ""))
+			stmt("var mapping = %s" % constructor)
+			# the values are kept alive so that weak entries stay hits
+			stmt("var alive = new %s[Size]" % value)
+			with block("for(int i = 0; i < Size; i++)"):
+				stmt("alive[i] = mapping[%s]%s" % (keys(n, "k", "i"), ".Result" if name == "AsyncLazyMapping" else ""))
+			run("Run", title + "GetHit", lookup)
+			if name in CONCURRENT:
+				run("RunConcurrent", title + "ConcurrentReaders", lookup)
+			with block('harness.Run("%sInstantiate", iterations =>' % title, postfix = ");"):
+				if name == "BoundedLazyMapping":
+					# a quarter of the keys fit, so every lookup also evicts
+					stmt("var fresh = new %s(%s, Size / 4)" % (mapping, instantiator))
+				else:
+					stmt("var fresh = %s" % constructor)
+				stmt("long sum = 0")
+				with block("for(int i = 0; i < iterations; i++)"):
+					stmt("sum += %s" % (fold % ("fresh[%s]" % same_keys(n, "i"))))
+				stmt("return sum")
+			stmt("GC.KeepAlive(alive)")
+			if name == "WeakLazyMapping":
+				# nothing else holds the values, which the harness collects before each run; a strong tier
+				# with room for every key keeps them all (the stripes do not fill evenly, hence twice Size)
+				stmt("var tiered = new %s(%s, null, 2 * Size)" % (mapping, instantiator))
+				with block("for(int i = 0; i < Size; i++)"):
+					stmt("Harness.Sink += %s" % (fold % ("tiered[%s]" % keys(n, "k", "i"))))
+				run("Run", title + "TieredGetHit", fold % ("tiered[%s]" % keys(n, "k", "i & Mask")))
+			if name == "WeakLazyMapping" and statistics:
+				# the entries are dropped and collected, then the cleanup thread reports how long it took to purge them
+				with block('harness.Measure("%sCleanup", () =>' % title, postfix = ");"):
+					stmt("var dropped = %s" % constructor)
+					stmt("dropped.Statistics = new MappingStatistics()")
+					with block("for(int i = 0; i < Size; i++)"):
+						stmt("Harness.Sink += %s" % (fold % ("dropped[%s]" % same_keys(n, "i"))))
+					stmt("GC.Collect()")
+					stmt("GC.WaitForPendingFinalizers()")
+					stmt("return dropped.Statistics")
+			return
+		constructor = {
+			"FrozenMapping": "new DictionaryMapping<%s, int>()" % ", ".join(["int"] * n),
+			"SnapshotMapping": "new DictionaryMapping<%s, int>()" % ", ".join(["int"] * n),
+			"ColumnarMapping": "new %s()" % mapping,
+			"SortedMapping": "new %s()" % mapping,
+			"ShardedMapping": "new %s()" % mapping,
+			"DictionaryMapping": "new %s()" % mapping,
+		}[name]
+		stmt("var mapping = %s" % constructor)
+		with block("for(int i = 0; i < Size; i++)"):
+			stmt("mapping[%s] = i" % keys(n, "k", "i"))
+		# the mapping that is read: FrozenMapping and SnapshotMapping are made from a filled DictionaryMapping
+		reader = "mapping"
+		if name == "FrozenMapping":
+			stmt("var frozen = mapping.Freeze()")
+			reader = "frozen"
+		elif name == "SnapshotMapping":
+			stmt("var path = Path.GetTempFileName()")
+			stmt("%s.Write(path, mapping)" % mapping)
+			stmt("var snapshot = new %s(path)" % mapping)
+			reader = "snapshot"
+		lookup = "%s[%s]" % (reader, keys(n, "k", "i & Mask"))
+		run("Run", title + "GetHit", lookup)
+		run("Run", title + "GetMiss", "(%s.Contains(%s) ? 1 : 0)" % (reader, keys(n, "m", "i & Mask")))
+		if name in CONCURRENT:
+			run("RunConcurrent", title + "ConcurrentReaders", lookup)
+		if name == "ShardedMapping":
+			run("RunConcurrent", title + "ConcurrentWriters", "(mapping[%s] = i)" % keys(n, "k", "i & Mask"))
+		with block('harness.Run("%sEnumerate", iterations =>' % title, postfix = ");"):
+			stmt("long sum = 0")
+			with block("for(int i = 0; i < iterations; i += Size)"):
+				with block("foreach(var entry in %s)" % reader):
+					stmt("sum += entry.Value")
+			stmt("return sum")
+		if name == "SnapshotMapping":
+			stmt("snapshot.Dispose()")
+			stmt("File.Delete(path)")
+
+def emit_benchmarks(arities, selected, classes, statistics):
+	stmt("using System")
+	stmt("using System.Collections.Generic")
+	stmt("using System.IO")
+	stmt("using System.Threading")
+	stmt("using System.Threading.Tasks")
+	with block("namespace Reynolds.Mappings.Benchmarks"):
+		with block("public static class Benchmarks"):
+			stmt("const int Size = %i" % SIZE)
+			stmt("const int Mask = Size - 1")
+			# k holds the keys present in each mapping, m keys that are not
+			for k in range(max(arities)):
+				stmt("static readonly int[] k%i = Harness.Keys(Size, %i, 0)" % (k+1, k+1))
+				stmt("static readonly int[] m%i = Harness.Keys(Size, %i, Size)" % (k+1, k+1))
+			methods = []
+			for n in arities:
+				for name in classes:
+					if name in selected:
+						benchmark(name, n, statistics)
+						methods.append("%s%i" % (name, n))
+			with block("public static void RunAll(Harness harness)"):
+				for method in methods:
+					stmt("%s(harness)" % method)
@@ -1,98 +1,262 @@
 import re
+import os
+import hashlib
+import pickle
+import contextlib
 
 placeholder = re.compile('\\$([^\\$]+)\\$')
 
 INDENT = "\t"
-CURRENT_INDENT = 0
-SUBS = []
 
-class File:
-	def __init__(self):
+# INDENTS[i] is the prefix of a line at indentation level i
+INDENTS = [""]
+
+def indent_prefix(level):
+	while len(INDENTS) <= level:
+		INDENTS.append(INDENTS[-1] + INDENT)
+	return INDENTS[level]
+
+# a Writer with an output stream hands it its text once this many pieces have accumulated
+FLUSH_CHUNKS = 4096
+
+# template text -> (literals, names): the text split once at its placeholders, literals[i] preceding names[i]
+PLANS = {}
+
+def compile_template(text):
+	plan = PLANS.get(text)
+	if plan is None:
+		parts = placeholder.split(text)
+		plan = PLANS[text] = (parts[0::2], parts[1::2])
+	return plan
+
+# All the state of one piece of generated code: its output, the indentation, the substitutions in effect
+# and the block whose body has not been opened yet. A unit rendered through its own Writer does not
+# depend on any other, so units can be rendered in any order or in separate processes.
+# Lines are collected as pieces and joined once: by getvalue(), or, when the Writer was given a text
+# stream, by each flush to that stream.
+class Writer:
+	def __init__(self, out = None):
+		self.out = out
+		self.chunks = []
 		self.current_indent = 0
-		self.out = None
+		self.prefix = ""
+		# inner placeholders() blocks override outer ones
+		self.subs = {}
+		self.last = None
+		self.lines = 0
 		
 	def write(self, x):
-		self.out.write("\t" * self.current_indent + x + "\n")
+		self.lines += 1
+		chunks = self.chunks
+		chunks.append(self.prefix)
+		chunks.append(x)
+		chunks.append("\n")
+		if self.out is not None and len(chunks) >= FLUSH_CHUNKS:
+			self.flush()
+			
+	# an empty line, which does not count as a line of a block's body
+	def blank(self):
+		self.close_pending()
+		self.chunks.append("\n")
 		
+	def flush(self):
+		if self.out is not None and self.chunks:
+			self.out.write("".join(self.chunks))
+			del self.chunks[:]
+			
 	def indent(self):
 		self.current_indent += 1
+		self.prefix = indent_prefix(self.current_indent)
 		
 	def deindent(self):
 		self.current_indent -= 1
+		self.prefix = indent_prefix(self.current_indent)
+		
+	# the line that introduces a block, how its body is opened, and how it is closed; body_start is
+	# the line count returned by begin()
+	def header(self, text):
+		return text
+		
+	def begin(self):
+		self.write("{")
+		self.indent()
+		return self.lines
+		
+	def end(self, postfix, body_start):
+		self.deindent()
+		self.write("}" + postfix)
+		
+	def format(self, text):
+		literals, names = compile_template(text)
+		if not names:
+			return text
+		out = [literals[0]]
+		for name, literal in zip(names, literals[1:]):
+			s = self.subs.get(name)
+			if s is None:
+				raise Exception("Substitution '%s' not set." % name)
+			if "$" in s:
+				s = self.format(s)
+			out.append(s)
+			out.append(literal)
+		return "".join(out)
+		
+	def stmt(self, text, postfix = ";"):
+		self.write(self.format(text) + postfix)
+		
+	def block(self, text, postfix = ""):
+		return Snippet(self, self.header(self.format(text)), postfix)
+		
+	def placeholders(self, **subs):
+		return Subs(self, subs)
+		
+	def close_pending(self):
+		# a block that was never entered still gets its braces
+		if self.last is not None:
+			with self.last:
+				pass
+		
+	# the text written so far, for a Writer without an output stream
+	def getvalue(self):
+		self.close_pending()
+		return "".join(self.chunks)
+		
+	# while entered, the module-level stmt, block and placeholders write to this Writer
+	def __enter__(self):
+		WRITERS.append(self)
+		return self
 		
-f = File()
-write = f.write
-indent = f.indent
-deindent = f.deindent
+	def __exit__(self, a, b, c):
+		WRITERS.pop()
+		# after an error the output is incomplete anyway, and the stream may be what failed
+		if a is None:
+			self.close_pending()
+			self.flush()
 
+# Writes Python: a block is its header line and a colon, its body is only indented, and an empty body is a pass.
+class PythonWriter(Writer):
+	def header(self, text):
+		return text + ":"
+		
+	def begin(self):
+		self.indent()
+		return self.lines
+		
+	def end(self, postfix, body_start):
+		if self.lines == body_start:
+			self.write("pass")
+		self.deindent()
+		
+WRITERS = []
 
-def myformat(text):
-	global placeholder, SUBS
-	while True:
-		m = placeholder.search(text)
-		if m is None:
-			return text
-		s = None
-		for sub in SUBS:
-			if m.group(1) in sub:
-				s = sub[m.group(1)]
-				break
-		if s is None:
-			raise Exception("Substitution '%s' not set." % m.groups(1))
-		text = text[:m.start()] + s + text[m.end():]
+def current():
+	return WRITERS[-1]
 
 class Snippet:
-	last = None
-	def __init__(self, text, postfix):
-		if Snippet.last is not None:
-			with Snippet.last:
-				pass
-		write("".join(text))
-		Snippet.last = self
+	def __init__(self, writer, text, postfix):
+		writer.close_pending()
+		writer.write(text)
+		writer.last = self
+		self.writer = writer
 		self.postfix = postfix
 		
 	def __enter__(self):
-		write("{")
-		indent()
-		Snippet.last = None
+		self.body_start = self.writer.begin()
+		self.writer.last = None
 		
 	def __exit__(self, a, b, c):
-		if Snippet.last is not None:
-			with Snippet.last:
-				pass
-		deindent()
-		write("}" + self.postfix)
+		if a is not None:
+			return
+		self.writer.close_pending()
+		self.writer.end(self.postfix, self.body_start)
 		
 class Subs:
-	def __init__(self, subs):
+	def __init__(self, writer, subs):
+		self.writer = writer
 		self.subs = subs
 		
 	def __enter__(self):
-		global SUBS
-		SUBS = [self.subs] + SUBS
+		self.outer = self.writer.subs
+		self.writer.subs = dict(self.outer)
+		self.writer.subs.update(self.subs)
 		
 	def __exit__(self, a, b, c):
-		global SUBS
-		SUBS = SUBS[1:]
+		self.writer.subs = self.outer
 		
+def myformat(text):
+	return current().format(text)
+
 def stmt(text, postfix = ";"):
-	write(myformat(text) + postfix)
+	current().stmt(text, postfix)
 	
 def block(text, postfix=""):
-	return Snippet(myformat(text), postfix)
+	return current().block(text, postfix)
 
-def codegen_begin(fn):
-	global f
-	Snippet.last = None
-	f.out = open(fn ,"w")
+def placeholders(**subs):
+	return current().placeholders(**subs)
 	
-def codegen_end():
-	f.out.flush()
-	f.out = None
+def blank():
+	current().blank()
+
+# Runs emit() against a fresh Writer, or PythonWriter as writer_class. Returns the text it generated, or,
+# given a text stream, writes the text to that stream as it is generated.
+def render(emit, out = None, writer_class = Writer):
+	with writer_class(out) as writer:
+		emit()
+	if out is None:
+		return writer.getvalue()
 	
-def placeholders(**subs):
-	return Subs(subs)
+# Writes the output unless the file already holds the same text, so that its timestamp, and with it
+# MSBuild's incremental build, is left alone; returns whether the file was written.
+def write_if_changed(fn, text):
+	digest = hashlib.sha1(text.encode("utf-8")).digest()
+	try:
+		with open(fn, encoding = "utf-8") as existing:
+			if hashlib.sha1(existing.read().encode("utf-8")).digest() == digest:
+				return False
+	except (IOError, UnicodeDecodeError):
+		pass
+	with open(fn, "w", encoding = "utf-8") as out:
+		out.write(text)
+	return True
 
+# Generates into fn, which is only written if the text changed:
+#   with codegen("Foo.cs"):
+#       stmt(...)
+@contextlib.contextmanager
+def codegen(fn):
+	with Writer() as writer:
+		yield writer
+	write_if_changed(fn, writer.getvalue())
+
+# A digest of the generator's source files and of anything else its output depends on, such as its options.
+def fingerprint(sources, *extra):
+	digest = hashlib.sha1()
+	for fn in sources:
+		with open(fn, "rb") as source:
+			digest.update(source.read())
+	digest.update(repr(extra).encode("utf-8"))
+	return digest.hexdigest()
+
+# Rendered texts kept between runs, keyed by unit. The cache is dropped whenever the fingerprint it was
+# saved with no longer matches, i.e. when the generator or its options changed.
+def load_cache(fn, key):
+	try:
+		with open(fn, "rb") as cache:
+			saved, texts = pickle.load(cache)
+		if saved == key:
+			return texts
+	except (IOError, EOFError, ValueError, pickle.UnpicklingError):
+		pass
+	return {}
+
+def save_cache(fn, key, texts):
+	directory = os.path.dirname(fn)
+	if directory and not os.path.isdir(directory):
+		os.makedirs(directory)
+	with open(fn, "wb") as cache:
+		pickle.dump((key, texts), cache, pickle.HIGHEST_PROTOCOL)
+	
 def pascal_case(s):
 	return "".join([x[0].upper() + x[1:] for x in s.split()])
 	
@@ -104,4 +268,4 @@ def camel_case(s):
 		s = "@" + s;
 	return s
 				
-__all__ = [ "codegen_begin", "codegen_end", "placeholders", "stmt", "block", "camel_case", "pascal_case" ]
+__all__ = [ "Writer", "PythonWriter", "render", "codegen", "write_if_changed", "fingerprint", "load_cache", "save_cache", "placeholders", "stmt", "block", "blank", "camel_case", "pascal_case" ]
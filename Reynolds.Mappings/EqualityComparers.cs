@@ -5,6 +5,35 @@ using System.Text;
 
 namespace Reynolds.Mappings
 {
+	// The hash combiner the generated comparers write out inline: xxHash32 rounds over each element's
+	// hash, then an avalanche, so that clustered keys do not line up in the same buckets.
+	public static class HashCodes
+	{
+		public const uint Seed = 374761393u;
+
+		public static uint Combine(uint hash, int value)
+		{
+			unchecked
+			{
+				hash += (uint) value * 3266489917u;
+				return ((hash << 17) | (hash >> 15)) * 668265263u;
+			}
+		}
+
+		public static int Finish(uint hash)
+		{
+			unchecked
+			{
+				hash ^= hash >> 15;
+				hash *= 2246822519u;
+				hash ^= hash >> 13;
+				hash *= 3266489917u;
+				hash ^= hash >> 16;
+				return (int) hash;
+			}
+		}
+	}
+
 	public class ReferenceTypeArrayEqualityComparer<T> : IEqualityComparer<T[]>, IComparer<T[]> where T : class, IComparable<T>
 	{
 		protected ReferenceTypeArrayEqualityComparer()
@@ -12,28 +41,26 @@ namespace Reynolds.Mappings
 		}
 
 		public readonly static ReferenceTypeArrayEqualityComparer<T> Instance = new ReferenceTypeArrayEqualityComparer<T>();
+		static readonly EqualityComparer<T> elementComparer = EqualityComparer<T>.Default;
 
 		public bool Equals(T[] x, T[] y)
 		{
-			if(x.Length != y.Length)
+			if(x == y)
+				return true;
+			if(x == null || y == null || x.Length != y.Length)
 				return false;
 			for(int k = 0; k < x.Length; k++)
-				if(x[k] != y[k])
+				if(!elementComparer.Equals(x[k], y[k]))
 					return false;
 			return true;
 		}
 
 		public int GetHashCode(T[] array)
 		{
-			int result = array.Length;
+			uint result = HashCodes.Seed + (uint) array.Length;
 			for(int i = 0; i < array.Length; i++)
-			{
-				unchecked
-				{
-					result = result * 23 + array[i].GetHashCode();
-				}
-			}
-			return result;
+				result = HashCodes.Combine(result, elementComparer.GetHashCode(array[i]));
+			return HashCodes.Finish(result);
 		}
 
 		public int Compare(T[] x, T[] y)
@@ -57,28 +84,26 @@ namespace Reynolds.Mappings
 		}
 
 		public readonly static ValueTypeArrayEqualityComparer<T> Instance = new ValueTypeArrayEqualityComparer<T>();
+		static readonly EqualityComparer<T> elementComparer = EqualityComparer<T>.Default;
 
 		public bool Equals(T[] x, T[] y)
 		{
-			if(x.Length != y.Length)
+			if(x == y)
+				return true;
+			if(x == null || y == null || x.Length != y.Length)
 				return false;
 			for(int k = 0; k < x.Length; k++)
-				if(x[k].CompareTo(y[k]) != 0)
+				if(!elementComparer.Equals(x[k], y[k]))
 					return false;
 			return true;
 		}
 
 		public int GetHashCode(T[] array)
 		{
-			int result = array.Length;
+			uint result = HashCodes.Seed + (uint) array.Length;
 			for(int i = 0; i < array.Length; i++)
-			{
-				unchecked
-				{
-					result = result * 23 + array[i].GetHashCode();
-				}
-			}
-			return result;
+				result = HashCodes.Combine(result, elementComparer.GetHashCode(array[i]));
+			return HashCodes.Finish(result);
 		}
 
 		public int Compare(T[] x, T[] y)
@@ -0,0 +1,114 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+
+namespace Reynolds.Mappings
+{
+	public class EvictionNode<TKey, TValue>
+	{
+		public TKey Key;
+		public TValue Value;
+		public EvictionNode<TKey, TValue> Previous;
+		public EvictionNode<TKey, TValue> Next;
+		public bool Referenced;
+	}
+
+	// Decides which entry a bounded mapping drops when it is full. The nodes are owned by
+	// the mapping and linked into the policy's own structure, so a policy instance must not
+	// be shared between mappings.
+	public abstract class EvictionPolicy<TKey, TValue>
+	{
+		// newest node of a circular list; head.Previous is the oldest
+		protected EvictionNode<TKey, TValue> head;
+
+		public abstract void Added(EvictionNode<TKey, TValue> node);
+		public abstract void Accessed(EvictionNode<TKey, TValue> node);
+		public abstract EvictionNode<TKey, TValue> Evict();
+
+		protected void LinkAsNewest(EvictionNode<TKey, TValue> node)
+		{
+			if(head == null)
+			{
+				node.Next = node.Previous = node;
+			}
+			else
+			{
+				node.Next = head;
+				node.Previous = head.Previous;
+				head.Previous.Next = node;
+				head.Previous = node;
+			}
+			head = node;
+		}
+
+		protected void Unlink(EvictionNode<TKey, TValue> node)
+		{
+			if(node.Next == node)
+				head = null;
+			else
+			{
+				node.Previous.Next = node.Next;
+				node.Next.Previous = node.Previous;
+				if(head == node)
+					head = node.Next;
+			}
+			node.Next = node.Previous = null;
+		}
+	}
+
+	public class LruEvictionPolicy<TKey, TValue> : EvictionPolicy<TKey, TValue>
+	{
+		public override void Added(EvictionNode<TKey, TValue> node)
+		{
+			LinkAsNewest(node);
+		}
+
+		public override void Accessed(EvictionNode<TKey, TValue> node)
+		{
+			if(node != head)
+			{
+				Unlink(node);
+				LinkAsNewest(node);
+			}
+		}
+
+		public override EvictionNode<TKey, TValue> Evict()
+		{
+			var victim = head.Previous;
+			Unlink(victim);
+			return victim;
+		}
+	}
+
+	// CLOCK-style second chance (SIEVE): a hit only sets a flag, and the hand sweeps from the
+	// oldest entry towards the newest, so entries touched once by a scan go before ones that are reused.
+	public class ClockEvictionPolicy<TKey, TValue> : EvictionPolicy<TKey, TValue>
+	{
+		EvictionNode<TKey, TValue> hand;
+
+		public override void Added(EvictionNode<TKey, TValue> node)
+		{
+			node.Referenced = false;
+			LinkAsNewest(node);
+		}
+
+		public override void Accessed(EvictionNode<TKey, TValue> node)
+		{
+			node.Referenced = true;
+		}
+
+		public override EvictionNode<TKey, TValue> Evict()
+		{
+			var victim = hand ?? head.Previous;
+			while(victim.Referenced)
+			{
+				victim.Referenced = false;
+				victim = victim.Previous;
+			}
+			hand = victim == head ? null : victim.Previous;
+			Unlink(victim);
+			return victim;
+		}
+	}
+}
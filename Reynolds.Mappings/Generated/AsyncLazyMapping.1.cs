@@ -0,0 +1,193 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class AsyncLazyMapping<TKey, TValue> : IMapping<TKey, Task<TValue>>
+	{
+		public delegate Task<TValue> InstantiateDelegate(TKey key, CancellationToken cancellationToken);
+		public delegate bool ContainsDelegate(TKey key);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected ConcurrentDictionary<TKey, Task<TValue>> _inner;
+		protected CancellationTokenSource _cancellation = new CancellationTokenSource();
+		public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)
+		{
+			_inner = new ConcurrentDictionary<TKey, Task<TValue>>();
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey> comparer)
+		{
+			_inner = new ConcurrentDictionary<TKey, Task<TValue>>(comparer ?? EqualityComparer<TKey>.Default);
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public bool Contains(TKey key)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, Task<TValue>>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		void Forget(TKey innerKey, Task<TValue> task)
+		{
+			((ICollection<KeyValuePair<TKey, Task<TValue>>>) _inner).Remove(new KeyValuePair<TKey, Task<TValue>>(innerKey, task));
+		}
+		protected Task<TValue> AddTask(TKey innerKey, TKey key)
+		{
+			var source = new TaskCompletionSource<TValue>();
+			var task = _inner.GetOrAdd(innerKey, source.Task);
+			if(task != source.Task)
+			{
+				return task;
+			}
+			Task<TValue> instantiated;
+			var statistics = Statistics;
+			long started = statistics == null ? 0 : Stopwatch.GetTimestamp();
+			try
+			{
+				instantiated = _instantiator(key, PendingToken());
+				if(instantiated == null)
+				{
+					throw new InvalidOperationException("The instantiator returned no task");
+				}
+			}
+			catch(Exception e)
+			{
+				Forget(innerKey, source.Task);
+				source.SetException(e);
+				return source.Task;
+			}
+			instantiated.ContinueWith(t =>
+			{
+				if(statistics != null)
+				{
+					statistics.RecordInstantiation(started);
+				}
+				if(t.IsFaulted || t.IsCanceled)
+				{
+					Forget(innerKey, source.Task);
+				}
+				Tasks.Forward(t, source);
+			}, TaskContinuationOptions.ExecuteSynchronously);
+			return source.Task;
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		public Task<TValue> GetAsync(TKey key, CancellationToken cancellationToken)
+		{
+			Task<TValue> task;
+			TKey innerKey = key;
+			var statistics = Statistics;
+			if(!_inner.TryGetValue(innerKey, out task))
+			{
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				task = AddTask(innerKey, key);
+			}
+			else if(statistics != null)
+			{
+				statistics.RecordHit();
+			}
+			return Tasks.WithCancellation(task, cancellationToken);
+		}
+		public Task<TValue> this[TKey key]
+		{
+			get
+			{
+				return GetAsync(key, CancellationToken.None);
+			}
+		}
+		public bool TryGetExisting(TKey key, out TValue value)
+		{
+			Task<TValue> task;
+			if(_inner.TryGetValue(key, out task) && task.Status == TaskStatus.RanToCompletion)
+			{
+				value = task.Result;
+				return true;
+			}
+			value = default(TValue);
+			return false;
+		}
+		CancellationToken PendingToken()
+		{
+			try
+			{
+				return _cancellation.Token;
+			}
+			catch(ObjectDisposedException)
+			{
+				return new CancellationToken(true);
+			}
+		}
+		public void CancelPending()
+		{
+			var cancelled = Interlocked.Exchange(ref _cancellation, new CancellationTokenSource());
+			try
+			{
+				cancelled.Cancel();
+			}
+			finally
+			{
+				cancelled.Dispose();
+			}
+		}
+	}
+}
@@ -0,0 +1,193 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class AsyncLazyMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> : IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, Task<TValue>>
+	{
+		public delegate Task<TValue> InstantiateDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, CancellationToken cancellationToken);
+		public delegate bool ContainsDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected ConcurrentDictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Task<TValue>> _inner;
+		protected CancellationTokenSource _cancellation = new CancellationTokenSource();
+		public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)
+		{
+			_inner = new ConcurrentDictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Task<TValue>>();
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5)
+		{
+			_inner = new ConcurrentDictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Task<TValue>>(new DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>.EqualityComparer(comparer1, comparer2, comparer3, comparer4, comparer5));
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key1, key2, key3, key4, key5);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, Task<TValue>>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		void Forget(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey, Task<TValue> task)
+		{
+			((ICollection<KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Task<TValue>>>) _inner).Remove(new KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Task<TValue>>(innerKey, task));
+		}
+		protected Task<TValue> AddTask(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey, TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			var source = new TaskCompletionSource<TValue>();
+			var task = _inner.GetOrAdd(innerKey, source.Task);
+			if(task != source.Task)
+			{
+				return task;
+			}
+			Task<TValue> instantiated;
+			var statistics = Statistics;
+			long started = statistics == null ? 0 : Stopwatch.GetTimestamp();
+			try
+			{
+				instantiated = _instantiator(key1, key2, key3, key4, key5, PendingToken());
+				if(instantiated == null)
+				{
+					throw new InvalidOperationException("The instantiator returned no task");
+				}
+			}
+			catch(Exception e)
+			{
+				Forget(innerKey, source.Task);
+				source.SetException(e);
+				return source.Task;
+			}
+			instantiated.ContinueWith(t =>
+			{
+				if(statistics != null)
+				{
+					statistics.RecordInstantiation(started);
+				}
+				if(t.IsFaulted || t.IsCanceled)
+				{
+					Forget(innerKey, source.Task);
+				}
+				Tasks.Forward(t, source);
+			}, TaskContinuationOptions.ExecuteSynchronously);
+			return source.Task;
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		public Task<TValue> GetAsync(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, CancellationToken cancellationToken)
+		{
+			Task<TValue> task;
+			Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey = new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5);
+			var statistics = Statistics;
+			if(!_inner.TryGetValue(innerKey, out task))
+			{
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				task = AddTask(innerKey, key1, key2, key3, key4, key5);
+			}
+			else if(statistics != null)
+			{
+				statistics.RecordHit();
+			}
+			return Tasks.WithCancellation(task, cancellationToken);
+		}
+		public Task<TValue> this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5]
+		{
+			get
+			{
+				return GetAsync(key1, key2, key3, key4, key5, CancellationToken.None);
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out TValue value)
+		{
+			Task<TValue> task;
+			if(_inner.TryGetValue(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out task) && task.Status == TaskStatus.RanToCompletion)
+			{
+				value = task.Result;
+				return true;
+			}
+			value = default(TValue);
+			return false;
+		}
+		CancellationToken PendingToken()
+		{
+			try
+			{
+				return _cancellation.Token;
+			}
+			catch(ObjectDisposedException)
+			{
+				return new CancellationToken(true);
+			}
+		}
+		public void CancelPending()
+		{
+			var cancelled = Interlocked.Exchange(ref _cancellation, new CancellationTokenSource());
+			try
+			{
+				cancelled.Cancel();
+			}
+			finally
+			{
+				cancelled.Dispose();
+			}
+		}
+	}
+}
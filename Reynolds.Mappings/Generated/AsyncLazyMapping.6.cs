@@ -0,0 +1,47 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class AsyncLazyMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> : AsyncLazyMapping<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue>, IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, Task<TValue>>
+	{
+		public new delegate Task<TValue> InstantiateDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, CancellationToken cancellationToken);
+		public new delegate bool ContainsDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6);
+		public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null) : base((key, cancellationToken) => instantiator(key.Item1, key.Item2, key.Item3, key.Item4, key.Item5, key.Item6, cancellationToken), contains == null ? null : new AsyncLazyMapping<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue>.ContainsDelegate(key => contains(key.Item1, key.Item2, key.Item3, key.Item4, key.Item5, key.Item6)))
+		{
+		}
+		public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5, IEqualityComparer<TKey6> comparer6) : base((key, cancellationToken) => instantiator(key.Item1, key.Item2, key.Item3, key.Item4, key.Item5, key.Item6, cancellationToken), contains == null ? null : new AsyncLazyMapping<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue>.ContainsDelegate(key => contains(key.Item1, key.Item2, key.Item3, key.Item4, key.Item5, key.Item6)), new DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>.EqualityComparer(comparer1, comparer2, comparer3, comparer4, comparer5, comparer6))
+		{
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6)
+		{
+			return Contains(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6));
+		}
+		public new IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, Task<TValue>>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		public Task<TValue> this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6]
+		{
+			get
+			{
+				return this[new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6)];
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, out TValue value)
+		{
+			return TryGetExisting(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6), out value);
+		}
+		public Task<TValue> GetAsync(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, CancellationToken cancellationToken)
+		{
+			return GetAsync(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6), cancellationToken);
+		}
+	}
+}
@@ -0,0 +1,176 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class BoundedLazyMapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey key);
+		public delegate bool ContainsDelegate(TKey key);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected Dictionary<TKey, EvictionNode<TKey, TValue>> _inner;
+		protected EvictionPolicy<TKey, TValue> _policy;
+		protected int _capacity;
+		public BoundedLazyMapping(InstantiateDelegate instantiator, int capacity, ContainsDelegate contains = null, EvictionPolicy<TKey, TValue> policy = null)
+		{
+			if(capacity < 1)
+			{
+				throw new ArgumentOutOfRangeException("capacity");
+			}
+			_inner = new Dictionary<TKey, EvictionNode<TKey, TValue>>(capacity);
+			_policy = policy ?? new LruEvictionPolicy<TKey, TValue>();
+			_capacity = capacity;
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public BoundedLazyMapping(InstantiateDelegate instantiator, int capacity, ContainsDelegate contains, EvictionPolicy<TKey, TValue> policy, IEqualityComparer<TKey> comparer)
+		{
+			if(capacity < 1)
+			{
+				throw new ArgumentOutOfRangeException("capacity");
+			}
+			_inner = new Dictionary<TKey, EvictionNode<TKey, TValue>>(capacity, comparer);
+			_policy = policy ?? new LruEvictionPolicy<TKey, TValue>();
+			_capacity = capacity;
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public int Capacity
+		{
+			get
+			{
+				return _capacity;
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		protected TValue Instantiate(TKey key)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				EvictionNode<TKey, TValue> node;
+				TKey innerKey = key;
+				var statistics = Statistics;
+				if(_inner.TryGetValue(innerKey, out node))
+				{
+					if(statistics != null)
+					{
+						statistics.RecordHit();
+					}
+					_policy.Accessed(node);
+					return node.Value;
+				}
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				TValue value = Instantiate(key);
+				if(_inner.TryGetValue(innerKey, out node))
+				{
+					node.Value = value;
+					_policy.Accessed(node);
+					return value;
+				}
+				if(_inner.Count >= _capacity)
+				{
+					node = _policy.Evict();
+					_inner.Remove(node.Key);
+				}
+				else
+				{
+					node = new EvictionNode<TKey, TValue>();
+				}
+				node.Key = innerKey;
+				node.Value = value;
+				_inner.Add(innerKey, node);
+				_policy.Added(node);
+				return value;
+			}
+		}
+		public bool TryGetExisting(TKey key, out TValue value)
+		{
+			EvictionNode<TKey, TValue> node;
+			if(_inner.TryGetValue(key, out node))
+			{
+				value = node.Value;
+				return true;
+			}
+			value = default(TValue);
+			return false;
+		}
+	}
+}
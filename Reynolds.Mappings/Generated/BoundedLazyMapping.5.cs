@@ -0,0 +1,176 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class BoundedLazyMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> : IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		public delegate bool ContainsDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>> _inner;
+		protected EvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> _policy;
+		protected int _capacity;
+		public BoundedLazyMapping(InstantiateDelegate instantiator, int capacity, ContainsDelegate contains = null, EvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> policy = null)
+		{
+			if(capacity < 1)
+			{
+				throw new ArgumentOutOfRangeException("capacity");
+			}
+			_inner = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>>(capacity);
+			_policy = policy ?? new LruEvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>();
+			_capacity = capacity;
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public BoundedLazyMapping(InstantiateDelegate instantiator, int capacity, ContainsDelegate contains, EvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> policy, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5)
+		{
+			if(capacity < 1)
+			{
+				throw new ArgumentOutOfRangeException("capacity");
+			}
+			_inner = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>>(capacity, new DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>.EqualityComparer(comparer1, comparer2, comparer3, comparer4, comparer5));
+			_policy = policy ?? new LruEvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>();
+			_capacity = capacity;
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public int Capacity
+		{
+			get
+			{
+				return _capacity;
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key1, key2, key3, key4, key5);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		protected TValue Instantiate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key1, key2, key3, key4, key5);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key1, key2, key3, key4, key5);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5]
+		{
+			get
+			{
+				EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> node;
+				Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey = new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5);
+				var statistics = Statistics;
+				if(_inner.TryGetValue(innerKey, out node))
+				{
+					if(statistics != null)
+					{
+						statistics.RecordHit();
+					}
+					_policy.Accessed(node);
+					return node.Value;
+				}
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				TValue value = Instantiate(key1, key2, key3, key4, key5);
+				if(_inner.TryGetValue(innerKey, out node))
+				{
+					node.Value = value;
+					_policy.Accessed(node);
+					return value;
+				}
+				if(_inner.Count >= _capacity)
+				{
+					node = _policy.Evict();
+					_inner.Remove(node.Key);
+				}
+				else
+				{
+					node = new EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>();
+				}
+				node.Key = innerKey;
+				node.Value = value;
+				_inner.Add(innerKey, node);
+				_policy.Added(node);
+				return value;
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out TValue value)
+		{
+			EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> node;
+			if(_inner.TryGetValue(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out node))
+			{
+				value = node.Value;
+				return true;
+			}
+			value = default(TValue);
+			return false;
+		}
+	}
+}
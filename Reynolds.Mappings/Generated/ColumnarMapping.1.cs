@@ -0,0 +1,306 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ColumnarMapping<TKey, TValue> : IMapping<TKey, TValue> where TKey : struct
+	{
+		static readonly EqualityComparer<TKey> comparer = EqualityComparer<TKey>.Default;
+		protected TKey[] _keys;
+		protected TValue[] _values;
+		protected int[] _hashes;
+		protected int[] _buckets;
+		protected int _count;
+		protected int _shift;
+		protected int _version;
+		public ColumnarMapping() : this(4)
+		{
+		}
+		public ColumnarMapping(int capacity)
+		{
+			Resize(Math.Max(capacity, 4));
+		}
+		void Resize(int capacity)
+		{
+			Array.Resize(ref _keys, capacity);
+			Array.Resize(ref _values, capacity);
+			Array.Resize(ref _hashes, capacity);
+			int bits = 1;
+			while((1 << bits) < 2 * capacity)
+			{
+				bits++;
+			}
+			_shift = 32 - bits;
+			_buckets = new int[1 << bits];
+			for(int entry = 0; entry < _count; entry++)
+			{
+				int bucket = Bucket(_hashes[entry]);
+				while(_buckets[bucket] != 0)
+				{
+					bucket = (bucket + 1) & (_buckets.Length - 1);
+				}
+				_buckets[bucket] = entry + 1;
+			}
+		}
+		int Bucket(int hash)
+		{
+			return (int) (unchecked((uint) hash * 2654435769u) >> _shift);
+		}
+		static int Hash(TKey key)
+		{
+			return comparer.GetHashCode(key);
+		}
+		protected int FindBucket(int hash, TKey key)
+		{
+			int mask = _buckets.Length - 1;
+			for(int bucket = Bucket(hash); ; bucket = (bucket + 1) & mask)
+			{
+				int entry = _buckets[bucket] - 1;
+				if(entry < 0 || (_hashes[entry] == hash && comparer.Equals(_keys[entry], key)))
+				{
+					return bucket;
+				}
+			}
+		}
+		void RemoveBucket(int hole)
+		{
+			int mask = _buckets.Length - 1;
+			for(int bucket = (hole + 1) & mask; _buckets[bucket] != 0; bucket = (bucket + 1) & mask)
+			{
+				int home = Bucket(_hashes[_buckets[bucket] - 1]);
+				if(hole <= bucket ? (hole < home && home <= bucket) : (hole < home || home <= bucket))
+				{
+					continue;
+				}
+				_buckets[hole] = _buckets[bucket];
+				hole = bucket;
+			}
+			_buckets[hole] = 0;
+		}
+		void Insert(TKey key, TValue value, bool add)
+		{
+			int hash = Hash(key);
+			int bucket = FindBucket(hash, key);
+			int entry = _buckets[bucket] - 1;
+			if(entry >= 0)
+			{
+				if(add)
+				{
+					throw new ArgumentException("An entry with the same key already exists");
+				}
+				_values[entry] = value;
+				_version++;
+				return;
+			}
+			if(_count == _values.Length)
+			{
+				Resize(2 * _count);
+				bucket = FindBucket(hash, key);
+			}
+			_keys[_count] = key;
+			_values[_count] = value;
+			_hashes[_count] = hash;
+			_buckets[bucket] = ++_count;
+			_version++;
+		}
+		public bool ContainsKey(TKey key)
+		{
+			return _buckets[FindBucket(Hash(key), key)] != 0;
+		}
+		public bool Contains(TKey key)
+		{
+			return _buckets[FindBucket(Hash(key), key)] != 0;
+		}
+		public bool TryGetValue(TKey key, out TValue value)
+		{
+			int entry = _buckets[FindBucket(Hash(key), key)] - 1;
+			if(entry < 0)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = _values[entry];
+			return true;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				int entry = _buckets[FindBucket(Hash(key), key)] - 1;
+				if(entry < 0)
+				{
+					throw new KeyNotFoundException();
+				}
+				return _values[entry];
+			}
+			set
+			{
+				Insert(key, value, false);
+			}
+		}
+		public void Add(TKey key, TValue value)
+		{
+			Insert(key, value, true);
+		}
+		public bool Remove(TKey key)
+		{
+			int bucket = FindBucket(Hash(key), key);
+			int entry = _buckets[bucket] - 1;
+			if(entry < 0)
+			{
+				return false;
+			}
+			RemoveBucket(bucket);
+			_version++;
+			int last = --_count;
+			if(entry != last)
+			{
+				int moved = Bucket(_hashes[last]);
+				while(_buckets[moved] != last + 1)
+				{
+					moved = (moved + 1) & (_buckets.Length - 1);
+				}
+				_buckets[moved] = entry + 1;
+				_keys[entry] = _keys[last];
+				_values[entry] = _values[last];
+				_hashes[entry] = _hashes[last];
+			}
+			_values[last] = default(TValue);
+			return true;
+		}
+		public void Clear()
+		{
+			Array.Clear(_buckets, 0, _buckets.Length);
+			Array.Clear(_values, 0, _count);
+			_count = 0;
+			_version++;
+		}
+		public int Count
+		{
+			get
+			{
+				return _count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public struct Entry
+		{
+			readonly ColumnarMapping<TKey, TValue> _mapping;
+			readonly int _index;
+			internal Entry(ColumnarMapping<TKey, TValue> mapping, int index)
+			{
+				_mapping = mapping;
+				_index = index;
+			}
+			public TKey Key
+			{
+				get
+				{
+					return _mapping._keys[_index];
+				}
+			}
+			public TValue Value
+			{
+				get
+				{
+					return _mapping._values[_index];
+				}
+			}
+		}
+		void CheckVersion(int version)
+		{
+			if(version != _version)
+			{
+				throw new InvalidOperationException("Collection was modified; enumeration operation may not execute.");
+			}
+		}
+		public struct Enumerator
+		{
+			readonly ColumnarMapping<TKey, TValue> _mapping;
+			readonly int _version;
+			int _index;
+			internal Enumerator(ColumnarMapping<TKey, TValue> mapping)
+			{
+				_mapping = mapping;
+				_version = mapping._version;
+				_index = -1;
+			}
+			public Entry Current
+			{
+				get
+				{
+					return new Entry(_mapping, _index);
+				}
+			}
+			public bool MoveNext()
+			{
+				_mapping.CheckVersion(_version);
+				return ++_index < _mapping._count;
+			}
+		}
+		public Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> EnumerateTuples(int version)
+		{
+			for(int i = 0; ; i++)
+			{
+				CheckVersion(version);
+				if(i == _count)
+				{
+					yield break;
+				}
+				yield return new KeyValueTuple<TKey, TValue>(new KeyValuePair<TKey, TValue>(_keys[i], _values[i]));
+			}
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> IMapping<TKey, TValue>.GetEnumerator()
+		{
+			return EnumerateTuples(_version);
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> IEnumerable<IKeyValueTuple<TKey, TValue>>.GetEnumerator()
+		{
+			return EnumerateTuples(_version);
+		}
+		IEnumerator<TKey> EnumerateKeys(int version)
+		{
+			for(int i = 0; ; i++)
+			{
+				CheckVersion(version);
+				if(i == _count)
+				{
+					yield break;
+				}
+				yield return _keys[i];
+			}
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			return EnumerateKeys(_version);
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return EnumerateKeys(_version);
+		}
+	}
+}
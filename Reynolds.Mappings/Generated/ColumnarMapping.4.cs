@@ -0,0 +1,359 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ColumnarMapping<TKey1, TKey2, TKey3, TKey4, TValue> : IMapping<TKey1, TKey2, TKey3, TKey4, TValue> where TKey1 : struct where TKey2 : struct where TKey3 : struct where TKey4 : struct
+	{
+		static readonly EqualityComparer<TKey1> comparer1 = EqualityComparer<TKey1>.Default;
+		static readonly EqualityComparer<TKey2> comparer2 = EqualityComparer<TKey2>.Default;
+		static readonly EqualityComparer<TKey3> comparer3 = EqualityComparer<TKey3>.Default;
+		static readonly EqualityComparer<TKey4> comparer4 = EqualityComparer<TKey4>.Default;
+		protected TKey1[] _keys1;
+		protected TKey2[] _keys2;
+		protected TKey3[] _keys3;
+		protected TKey4[] _keys4;
+		protected TValue[] _values;
+		protected int[] _hashes;
+		protected int[] _buckets;
+		protected int _count;
+		protected int _shift;
+		protected int _version;
+		public ColumnarMapping() : this(4)
+		{
+		}
+		public ColumnarMapping(int capacity)
+		{
+			Resize(Math.Max(capacity, 4));
+		}
+		void Resize(int capacity)
+		{
+			Array.Resize(ref _keys1, capacity);
+			Array.Resize(ref _keys2, capacity);
+			Array.Resize(ref _keys3, capacity);
+			Array.Resize(ref _keys4, capacity);
+			Array.Resize(ref _values, capacity);
+			Array.Resize(ref _hashes, capacity);
+			int bits = 1;
+			while((1 << bits) < 2 * capacity)
+			{
+				bits++;
+			}
+			_shift = 32 - bits;
+			_buckets = new int[1 << bits];
+			for(int entry = 0; entry < _count; entry++)
+			{
+				int bucket = Bucket(_hashes[entry]);
+				while(_buckets[bucket] != 0)
+				{
+					bucket = (bucket + 1) & (_buckets.Length - 1);
+				}
+				_buckets[bucket] = entry + 1;
+			}
+		}
+		int Bucket(int hash)
+		{
+			return (int) (unchecked((uint) hash * 2654435769u) >> _shift);
+		}
+		static int Hash(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4)
+		{
+			uint result = 374761393u + 4u;
+			unchecked
+			{
+				result += (uint) comparer1.GetHashCode(key1) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result += (uint) comparer2.GetHashCode(key2) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result += (uint) comparer3.GetHashCode(key3) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result += (uint) comparer4.GetHashCode(key4) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		protected int FindBucket(int hash, TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4)
+		{
+			int mask = _buckets.Length - 1;
+			for(int bucket = Bucket(hash); ; bucket = (bucket + 1) & mask)
+			{
+				int entry = _buckets[bucket] - 1;
+				if(entry < 0 || (_hashes[entry] == hash && comparer1.Equals(_keys1[entry], key1) && comparer2.Equals(_keys2[entry], key2) && comparer3.Equals(_keys3[entry], key3) && comparer4.Equals(_keys4[entry], key4)))
+				{
+					return bucket;
+				}
+			}
+		}
+		void RemoveBucket(int hole)
+		{
+			int mask = _buckets.Length - 1;
+			for(int bucket = (hole + 1) & mask; _buckets[bucket] != 0; bucket = (bucket + 1) & mask)
+			{
+				int home = Bucket(_hashes[_buckets[bucket] - 1]);
+				if(hole <= bucket ? (hole < home && home <= bucket) : (hole < home || home <= bucket))
+				{
+					continue;
+				}
+				_buckets[hole] = _buckets[bucket];
+				hole = bucket;
+			}
+			_buckets[hole] = 0;
+		}
+		void Insert(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TValue value, bool add)
+		{
+			int hash = Hash(key1, key2, key3, key4);
+			int bucket = FindBucket(hash, key1, key2, key3, key4);
+			int entry = _buckets[bucket] - 1;
+			if(entry >= 0)
+			{
+				if(add)
+				{
+					throw new ArgumentException("An entry with the same key already exists");
+				}
+				_values[entry] = value;
+				_version++;
+				return;
+			}
+			if(_count == _values.Length)
+			{
+				Resize(2 * _count);
+				bucket = FindBucket(hash, key1, key2, key3, key4);
+			}
+			_keys1[_count] = key1;
+			_keys2[_count] = key2;
+			_keys3[_count] = key3;
+			_keys4[_count] = key4;
+			_values[_count] = value;
+			_hashes[_count] = hash;
+			_buckets[bucket] = ++_count;
+			_version++;
+		}
+		public bool ContainsKey(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4)
+		{
+			return _buckets[FindBucket(Hash(key1, key2, key3, key4), key1, key2, key3, key4)] != 0;
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4)
+		{
+			return _buckets[FindBucket(Hash(key1, key2, key3, key4), key1, key2, key3, key4)] != 0;
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, out TValue value)
+		{
+			int entry = _buckets[FindBucket(Hash(key1, key2, key3, key4), key1, key2, key3, key4)] - 1;
+			if(entry < 0)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = _values[entry];
+			return true;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4]
+		{
+			get
+			{
+				int entry = _buckets[FindBucket(Hash(key1, key2, key3, key4), key1, key2, key3, key4)] - 1;
+				if(entry < 0)
+				{
+					throw new KeyNotFoundException();
+				}
+				return _values[entry];
+			}
+			set
+			{
+				Insert(key1, key2, key3, key4, value, false);
+			}
+		}
+		public void Add(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TValue value)
+		{
+			Insert(key1, key2, key3, key4, value, true);
+		}
+		public bool Remove(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4)
+		{
+			int bucket = FindBucket(Hash(key1, key2, key3, key4), key1, key2, key3, key4);
+			int entry = _buckets[bucket] - 1;
+			if(entry < 0)
+			{
+				return false;
+			}
+			RemoveBucket(bucket);
+			_version++;
+			int last = --_count;
+			if(entry != last)
+			{
+				int moved = Bucket(_hashes[last]);
+				while(_buckets[moved] != last + 1)
+				{
+					moved = (moved + 1) & (_buckets.Length - 1);
+				}
+				_buckets[moved] = entry + 1;
+				_keys1[entry] = _keys1[last];
+				_keys2[entry] = _keys2[last];
+				_keys3[entry] = _keys3[last];
+				_keys4[entry] = _keys4[last];
+				_values[entry] = _values[last];
+				_hashes[entry] = _hashes[last];
+			}
+			_values[last] = default(TValue);
+			return true;
+		}
+		public void Clear()
+		{
+			Array.Clear(_buckets, 0, _buckets.Length);
+			Array.Clear(_values, 0, _count);
+			_count = 0;
+			_version++;
+		}
+		public int Count
+		{
+			get
+			{
+				return _count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public struct Entry
+		{
+			readonly ColumnarMapping<TKey1, TKey2, TKey3, TKey4, TValue> _mapping;
+			readonly int _index;
+			internal Entry(ColumnarMapping<TKey1, TKey2, TKey3, TKey4, TValue> mapping, int index)
+			{
+				_mapping = mapping;
+				_index = index;
+			}
+			public TKey1 Key1
+			{
+				get
+				{
+					return _mapping._keys1[_index];
+				}
+			}
+			public TKey2 Key2
+			{
+				get
+				{
+					return _mapping._keys2[_index];
+				}
+			}
+			public TKey3 Key3
+			{
+				get
+				{
+					return _mapping._keys3[_index];
+				}
+			}
+			public TKey4 Key4
+			{
+				get
+				{
+					return _mapping._keys4[_index];
+				}
+			}
+			public TValue Value
+			{
+				get
+				{
+					return _mapping._values[_index];
+				}
+			}
+		}
+		void CheckVersion(int version)
+		{
+			if(version != _version)
+			{
+				throw new InvalidOperationException("Collection was modified; enumeration operation may not execute.");
+			}
+		}
+		public struct Enumerator
+		{
+			readonly ColumnarMapping<TKey1, TKey2, TKey3, TKey4, TValue> _mapping;
+			readonly int _version;
+			int _index;
+			internal Enumerator(ColumnarMapping<TKey1, TKey2, TKey3, TKey4, TValue> mapping)
+			{
+				_mapping = mapping;
+				_version = mapping._version;
+				_index = -1;
+			}
+			public Entry Current
+			{
+				get
+				{
+					return new Entry(_mapping, _index);
+				}
+			}
+			public bool MoveNext()
+			{
+				_mapping.CheckVersion(_version);
+				return ++_index < _mapping._count;
+			}
+		}
+		public Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>> EnumerateTuples(int version)
+		{
+			for(int i = 0; ; i++)
+			{
+				CheckVersion(version);
+				if(i == _count)
+				{
+					yield break;
+				}
+				yield return new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>(new KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4>, TValue>(new Tuple<TKey1, TKey2, TKey3, TKey4>(_keys1[i], _keys2[i], _keys3[i], _keys4[i]), _values[i]));
+			}
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>> IMapping<TKey1, TKey2, TKey3, TKey4, TValue>.GetEnumerator()
+		{
+			return EnumerateTuples(_version);
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>> IEnumerable<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>>.GetEnumerator()
+		{
+			return EnumerateTuples(_version);
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4>> EnumerateKeys(int version)
+		{
+			for(int i = 0; ; i++)
+			{
+				CheckVersion(version);
+				if(i == _count)
+				{
+					yield break;
+				}
+				yield return new Tuple<TKey1, TKey2, TKey3, TKey4>(_keys1[i], _keys2[i], _keys3[i], _keys4[i]);
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4>>.GetEnumerator()
+		{
+			return EnumerateKeys(_version);
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return EnumerateKeys(_version);
+		}
+	}
+}
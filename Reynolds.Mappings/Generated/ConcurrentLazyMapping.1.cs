@@ -0,0 +1,146 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ConcurrentLazyMapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey key);
+		public delegate bool ContainsDelegate(TKey key);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected ConcurrentDictionary<TKey, Lazy<TValue>> _inner;
+		public ConcurrentLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)
+		{
+			_inner = new ConcurrentDictionary<TKey, Lazy<TValue>>();
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public ConcurrentLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey> comparer)
+		{
+			_inner = new ConcurrentDictionary<TKey, Lazy<TValue>>(comparer ?? EqualityComparer<TKey>.Default);
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public bool Contains(TKey key)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected Lazy<TValue> AddLazy(TKey innerKey, TKey key)
+		{
+			return _inner.GetOrAdd(innerKey, new Lazy<TValue>(() => Instantiate(key), LazyThreadSafetyMode.ExecutionAndPublication));
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		protected TValue Instantiate(TKey key)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				Lazy<TValue> lazy;
+				TKey innerKey = key;
+				var statistics = Statistics;
+				if(!_inner.TryGetValue(innerKey, out lazy))
+				{
+					if(statistics != null)
+					{
+						statistics.RecordMiss();
+					}
+					lazy = AddLazy(innerKey, key);
+				}
+				else if(statistics != null)
+				{
+					statistics.RecordHit();
+				}
+				try
+				{
+					return lazy.Value;
+				}
+				catch
+				{
+					((ICollection<KeyValuePair<TKey, Lazy<TValue>>>) _inner).Remove(new KeyValuePair<TKey, Lazy<TValue>>(innerKey, lazy));
+					throw;
+				}
+			}
+		}
+		public bool TryGetExisting(TKey key, out TValue value)
+		{
+			Lazy<TValue> lazy;
+			if(_inner.TryGetValue(key, out lazy) && lazy.IsValueCreated)
+			{
+				value = lazy.Value;
+				return true;
+			}
+			value = default(TValue);
+			return false;
+		}
+	}
+}
@@ -0,0 +1,146 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ConcurrentLazyMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> : IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		public delegate bool ContainsDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected ConcurrentDictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Lazy<TValue>> _inner;
+		public ConcurrentLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)
+		{
+			_inner = new ConcurrentDictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Lazy<TValue>>();
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public ConcurrentLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5)
+		{
+			_inner = new ConcurrentDictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Lazy<TValue>>(new DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>.EqualityComparer(comparer1, comparer2, comparer3, comparer4, comparer5));
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key1, key2, key3, key4, key5);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected Lazy<TValue> AddLazy(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey, TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			return _inner.GetOrAdd(innerKey, new Lazy<TValue>(() => Instantiate(key1, key2, key3, key4, key5), LazyThreadSafetyMode.ExecutionAndPublication));
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		protected TValue Instantiate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key1, key2, key3, key4, key5);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key1, key2, key3, key4, key5);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5]
+		{
+			get
+			{
+				Lazy<TValue> lazy;
+				Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey = new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5);
+				var statistics = Statistics;
+				if(!_inner.TryGetValue(innerKey, out lazy))
+				{
+					if(statistics != null)
+					{
+						statistics.RecordMiss();
+					}
+					lazy = AddLazy(innerKey, key1, key2, key3, key4, key5);
+				}
+				else if(statistics != null)
+				{
+					statistics.RecordHit();
+				}
+				try
+				{
+					return lazy.Value;
+				}
+				catch
+				{
+					((ICollection<KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Lazy<TValue>>>) _inner).Remove(new KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, Lazy<TValue>>(innerKey, lazy));
+					throw;
+				}
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out TValue value)
+		{
+			Lazy<TValue> lazy;
+			if(_inner.TryGetValue(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out lazy) && lazy.IsValueCreated)
+			{
+				value = lazy.Value;
+				return true;
+			}
+			value = default(TValue);
+			return false;
+		}
+	}
+}
@@ -0,0 +1,213 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class DictionaryMapping<TKey, TValue> : Dictionary<TKey, TValue>, IMapping<TKey, TValue>, IDictionary<TKey, TValue>, ICollection<KeyValuePair<TKey, TValue>>
+	{
+		public bool Contains(TKey key)
+		{
+			return this.ContainsKey(key);
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public DictionaryMapping() : base()
+		{
+		}
+		public DictionaryMapping(IEqualityComparer<TKey> comparer) : base (comparer)
+		{
+		}
+		public new virtual void Add(TKey key, TValue value)
+		{
+			base.Add(key, value);
+		}
+		public new virtual bool Remove(TKey key)
+		{
+			return base.Remove(key);
+		}
+		public new virtual TValue this[TKey key]
+		{
+			get
+			{
+				return base[key];
+			}
+			set
+			{
+				base[key] = value;
+			}
+		}
+		public new virtual void Clear()
+		{
+			base.Clear();
+		}
+		ICollection<TKey> IDictionary<TKey, TValue>.Keys
+		{
+			get
+			{
+				return Keys;
+			}
+		}
+		ICollection<TValue> IDictionary<TKey, TValue>.Values
+		{
+			get
+			{
+				return Values;
+			}
+		}
+		bool ICollection<KeyValuePair<TKey, TValue>>.IsReadOnly
+		{
+			get
+			{
+				return false;
+			}
+		}
+		void ICollection<KeyValuePair<TKey, TValue>>.Add(KeyValuePair<TKey, TValue> item)
+		{
+			Add(item.Key, item.Value);
+		}
+		bool ICollection<KeyValuePair<TKey, TValue>>.Contains(KeyValuePair<TKey, TValue> item)
+		{
+			TValue value;
+			return TryGetValue(item.Key, out value) && EqualityComparer<TValue>.Default.Equals(value, item.Value);
+		}
+		void ICollection<KeyValuePair<TKey, TValue>>.CopyTo(KeyValuePair<TKey, TValue>[] array, int arrayIndex)
+		{
+			if(array.Length - arrayIndex < Count)
+			{
+				throw new ArgumentException("The array is too small", "array");
+			}
+			foreach(var item in (Dictionary<TKey, TValue>) this)
+			{
+				array[arrayIndex++] = item;
+			}
+		}
+		bool ICollection<KeyValuePair<TKey, TValue>>.Remove(KeyValuePair<TKey, TValue> item)
+		{
+			return ((ICollection<KeyValuePair<TKey, TValue>>) this).Contains(item) && Remove(item.Key);
+		}
+		IEnumerator<KeyValuePair<TKey, TValue>> IEnumerable<KeyValuePair<TKey, TValue>>.GetEnumerator()
+		{
+			return base.GetEnumerator();
+		}
+		public new struct Enumerator : IEnumerator<KeyValueTuple<TKey, TValue>>, IEnumerator<IKeyValueTuple<TKey, TValue>>
+		{
+			readonly Dictionary<TKey, TValue> _dictionary;
+			Dictionary<TKey, TValue>.Enumerator _inner;
+			internal Enumerator(Dictionary<TKey, TValue> dictionary)
+			{
+				_dictionary = dictionary;
+				_inner = dictionary.GetEnumerator();
+			}
+			public KeyValueTuple<TKey, TValue> Current
+			{
+				get
+				{
+					return new KeyValueTuple<TKey, TValue>(_inner.Current);
+				}
+			}
+			IKeyValueTuple<TKey, TValue> IEnumerator<IKeyValueTuple<TKey, TValue>>.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			object IEnumerator.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			public bool MoveNext()
+			{
+				return _inner.MoveNext();
+			}
+			public void Reset()
+			{
+				_inner = _dictionary.GetEnumerator();
+			}
+			public void Dispose()
+			{
+				_inner.Dispose();
+			}
+		}
+		public struct EntryCollection : IEnumerable<KeyValueTuple<TKey, TValue>>
+		{
+			readonly Dictionary<TKey, TValue> _dictionary;
+			internal EntryCollection(Dictionary<TKey, TValue> dictionary)
+			{
+				_dictionary = dictionary;
+			}
+			public int Count
+			{
+				get
+				{
+					return _dictionary.Count;
+				}
+			}
+			public Enumerator GetEnumerator()
+			{
+				return new Enumerator(_dictionary);
+			}
+			IEnumerator<KeyValueTuple<TKey, TValue>> IEnumerable<KeyValueTuple<TKey, TValue>>.GetEnumerator()
+			{
+				return GetEnumerator();
+			}
+			IEnumerator IEnumerable.GetEnumerator()
+			{
+				return GetEnumerator();
+			}
+		}
+		public EntryCollection Entries
+		{
+			get
+			{
+				return new EntryCollection(this);
+			}
+		}
+		public new Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> IMapping<TKey, TValue>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> IEnumerable<IKeyValueTuple<TKey, TValue>>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			return this.Keys.GetEnumerator();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return this.Keys.GetEnumerator();
+		}
+		public FrozenMapping<TKey, TValue> Freeze()
+		{
+			return new FrozenMapping<TKey, TValue>(this, Comparer);
+		}
+	}
+}
@@ -0,0 +1,385 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class DictionaryMapping<TKey1, TKey2, TValue> : Dictionary<Tuple<TKey1, TKey2>, TValue>, IMapping<TKey1, TKey2, TValue>, IDictionary<Tuple<TKey1, TKey2>, TValue>, ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>
+	{
+		protected internal class EqualityComparer : IEqualityComparer<Tuple<TKey1, TKey2>>
+		{
+			internal readonly IEqualityComparer<TKey1> comparer1;
+			internal readonly IEqualityComparer<TKey2> comparer2;
+			public EqualityComparer(IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2)
+			{
+				this.comparer1 = (comparer1 == null ? EqualityComparer<TKey1>.Default : comparer1);
+				this.comparer2 = (comparer2 == null ? EqualityComparer<TKey2>.Default : comparer2);
+			}
+			public bool Equals(Tuple<TKey1, TKey2> a, Tuple<TKey1, TKey2> b)
+			{
+				return comparer1.Equals(a.Item1, b.Item1) && comparer2.Equals(a.Item2, b.Item2);
+			}
+			public int GetHashCode(Tuple<TKey1, TKey2> obj)
+			{
+				uint result = 374761393u + 2u;
+				unchecked
+				{
+					result += (uint) comparer1.GetHashCode(obj.Item1) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result += (uint) comparer2.GetHashCode(obj.Item2) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result ^= result >> 15;
+					result *= 2246822519u;
+					result ^= result >> 13;
+					result *= 3266489917u;
+					result ^= result >> 16;
+					return (int) result;
+				}
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2)
+		{
+			return this.ContainsKey(new Tuple<TKey1, TKey2>(key1, key2));
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public DictionaryMapping() : base()
+		{
+		}
+		public DictionaryMapping(IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2) : base (new EqualityComparer(comparer1, comparer2))
+		{
+		}
+		public new void Add(Tuple<TKey1, TKey2> key, TValue value)
+		{
+			base.Add(key, value);
+			if(_prefixIndex != null)
+			{
+				IndexSet(_prefixIndex, key, value);
+			}
+		}
+		public new bool Remove(Tuple<TKey1, TKey2> key)
+		{
+			if(!base.Remove(key))
+			{
+				return false;
+			}
+			if(_prefixIndex != null)
+			{
+				IndexRemove(key);
+			}
+			return true;
+		}
+		public new TValue this[Tuple<TKey1, TKey2> key]
+		{
+			get
+			{
+				return base[key];
+			}
+			set
+			{
+				base[key] = value;
+				if(_prefixIndex != null)
+				{
+					IndexSet(_prefixIndex, key, value);
+				}
+			}
+		}
+		public new void Clear()
+		{
+			base.Clear();
+			if(_prefixIndex != null)
+			{
+				_prefixIndex.Clear();
+			}
+		}
+		ICollection<Tuple<TKey1, TKey2>> IDictionary<Tuple<TKey1, TKey2>, TValue>.Keys
+		{
+			get
+			{
+				return Keys;
+			}
+		}
+		ICollection<TValue> IDictionary<Tuple<TKey1, TKey2>, TValue>.Values
+		{
+			get
+			{
+				return Values;
+			}
+		}
+		bool ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>.IsReadOnly
+		{
+			get
+			{
+				return false;
+			}
+		}
+		void ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>.Add(KeyValuePair<Tuple<TKey1, TKey2>, TValue> item)
+		{
+			Add(item.Key, item.Value);
+		}
+		bool ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>.Contains(KeyValuePair<Tuple<TKey1, TKey2>, TValue> item)
+		{
+			TValue value;
+			return TryGetValue(item.Key, out value) && EqualityComparer<TValue>.Default.Equals(value, item.Value);
+		}
+		void ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>.CopyTo(KeyValuePair<Tuple<TKey1, TKey2>, TValue>[] array, int arrayIndex)
+		{
+			if(array.Length - arrayIndex < Count)
+			{
+				throw new ArgumentException("The array is too small", "array");
+			}
+			foreach(var item in (Dictionary<Tuple<TKey1, TKey2>, TValue>) this)
+			{
+				array[arrayIndex++] = item;
+			}
+		}
+		bool ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>.Remove(KeyValuePair<Tuple<TKey1, TKey2>, TValue> item)
+		{
+			return ((ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>) this).Contains(item) && Remove(item.Key);
+		}
+		IEnumerator<KeyValuePair<Tuple<TKey1, TKey2>, TValue>> IEnumerable<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>.GetEnumerator()
+		{
+			return base.GetEnumerator();
+		}
+		public new struct Enumerator : IEnumerator<KeyValueTuple<TKey1, TKey2, TValue>>, IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>>
+		{
+			readonly Dictionary<Tuple<TKey1, TKey2>, TValue> _dictionary;
+			Dictionary<Tuple<TKey1, TKey2>, TValue>.Enumerator _inner;
+			internal Enumerator(Dictionary<Tuple<TKey1, TKey2>, TValue> dictionary)
+			{
+				_dictionary = dictionary;
+				_inner = dictionary.GetEnumerator();
+			}
+			public KeyValueTuple<TKey1, TKey2, TValue> Current
+			{
+				get
+				{
+					return new KeyValueTuple<TKey1, TKey2, TValue>(_inner.Current);
+				}
+			}
+			IKeyValueTuple<TKey1, TKey2, TValue> IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>>.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			object IEnumerator.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			public bool MoveNext()
+			{
+				return _inner.MoveNext();
+			}
+			public void Reset()
+			{
+				_inner = _dictionary.GetEnumerator();
+			}
+			public void Dispose()
+			{
+				_inner.Dispose();
+			}
+		}
+		public struct EntryCollection : IEnumerable<KeyValueTuple<TKey1, TKey2, TValue>>
+		{
+			readonly Dictionary<Tuple<TKey1, TKey2>, TValue> _dictionary;
+			internal EntryCollection(Dictionary<Tuple<TKey1, TKey2>, TValue> dictionary)
+			{
+				_dictionary = dictionary;
+			}
+			public int Count
+			{
+				get
+				{
+					return _dictionary.Count;
+				}
+			}
+			public Enumerator GetEnumerator()
+			{
+				return new Enumerator(_dictionary);
+			}
+			IEnumerator<KeyValueTuple<TKey1, TKey2, TValue>> IEnumerable<KeyValueTuple<TKey1, TKey2, TValue>>.GetEnumerator()
+			{
+				return GetEnumerator();
+			}
+			IEnumerator IEnumerable.GetEnumerator()
+			{
+				return GetEnumerator();
+			}
+		}
+		public EntryCollection Entries
+		{
+			get
+			{
+				return new EntryCollection(this);
+			}
+		}
+		public new Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> IMapping<TKey1, TKey2, TValue>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> IEnumerable<IKeyValueTuple<TKey1, TKey2, TValue>>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<Tuple<TKey1, TKey2>> IEnumerable<Tuple<TKey1, TKey2>>.GetEnumerator()
+		{
+			return this.Keys.GetEnumerator();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return this.Keys.GetEnumerator();
+		}
+		public FrozenMapping<TKey1, TKey2, TValue> Freeze()
+		{
+			return new FrozenMapping<TKey1, TKey2, TValue>(this, Comparer);
+		}
+		Dictionary<TKey1, DictionaryMapping<TKey2, TValue>> _prefixIndex;
+		void IndexSet(Dictionary<TKey1, DictionaryMapping<TKey2, TValue>> index, Tuple<TKey1, TKey2> key, TValue value)
+		{
+			DictionaryMapping<TKey2, TValue> slice;
+			if(!index.TryGetValue(key.Item1, out slice))
+			{
+				var comparer = Comparer as EqualityComparer;
+				slice = comparer == null ? new DictionaryMapping<TKey2, TValue>() : new DictionaryMapping<TKey2, TValue>(comparer.comparer2);
+				index.Add(key.Item1, slice);
+			}
+			slice[key.Item2] = value;
+		}
+		void IndexRemove(Tuple<TKey1, TKey2> key)
+		{
+			DictionaryMapping<TKey2, TValue> slice;
+			if(_prefixIndex.TryGetValue(key.Item1, out slice) && slice.Remove(key.Item2) && slice.Count == 0)
+			{
+				_prefixIndex.Remove(key.Item1);
+			}
+		}
+		public IMapping<TKey2, TValue> Slice(TKey1 key1)
+		{
+			if(_prefixIndex == null)
+			{
+				var comparer = Comparer as EqualityComparer;
+				var index = new Dictionary<TKey1, DictionaryMapping<TKey2, TValue>>(comparer == null ? null : comparer.comparer1);
+				foreach(var entry in (Dictionary<Tuple<TKey1, TKey2>, TValue>) this)
+				{
+					IndexSet(index, entry.Key, entry.Value);
+				}
+				Interlocked.CompareExchange(ref _prefixIndex, index, null);
+			}
+			return new SliceView(this, key1);
+		}
+		sealed class SliceView : IMapping<TKey2, TValue>
+		{
+			static readonly DictionaryMapping<TKey2, TValue> Empty = new DictionaryMapping<TKey2, TValue>();
+			readonly DictionaryMapping<TKey1, TKey2, TValue> _mapping;
+			readonly TKey1 _key1;
+			public SliceView(DictionaryMapping<TKey1, TKey2, TValue> mapping, TKey1 key1)
+			{
+				_mapping = mapping;
+				_key1 = key1;
+			}
+			DictionaryMapping<TKey2, TValue> Slice()
+			{
+				DictionaryMapping<TKey2, TValue> slice;
+				return _mapping._prefixIndex.TryGetValue(_key1, out slice) ? slice : Empty;
+			}
+			public bool Contains(TKey2 key2)
+			{
+				return Slice().Contains(key2);
+			}
+			public int Count
+			{
+				get
+				{
+					return Slice().Count;
+				}
+			}
+			public bool IsFinite
+			{
+				get
+				{
+					return true;
+				}
+			}
+			public bool IsNumerable
+			{
+				get
+				{
+					return true;
+				}
+			}
+			public TValue this[TKey2 key2]
+			{
+				get
+				{
+					return Slice()[key2];
+				}
+			}
+			public IEnumerator<IKeyValueTuple<TKey2, TValue>> GetEnumerator()
+			{
+				return ((IMapping<TKey2, TValue>) Slice()).GetEnumerator();
+			}
+			IEnumerator<TKey2> IEnumerable<TKey2>.GetEnumerator()
+			{
+				return ((IEnumerable<TKey2>) Slice()).GetEnumerator();
+			}
+			IEnumerator IEnumerable.GetEnumerator()
+			{
+				return ((IEnumerable) Slice()).GetEnumerator();
+			}
+		}
+		public bool ContainsKey(TKey1 key1, TKey2 key2)
+		{
+			return ContainsKey(new Tuple<TKey1, TKey2>(key1, key2));
+		}
+		public bool Remove(TKey1 key1, TKey2 key2)
+		{
+			return Remove(new Tuple<TKey1, TKey2>(key1, key2));
+		}
+		public void Add(TKey1 key1, TKey2 key2, TValue value)
+		{
+			Add(new Tuple<TKey1, TKey2>(key1, key2), value);
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, out TValue value)
+		{
+			return TryGetValue(new Tuple<TKey1, TKey2>(key1, key2), out value);
+		}
+		public TValue this[TKey1 key1, TKey2 key2]
+		{
+			get
+			{
+				return this[new Tuple<TKey1, TKey2>(key1, key2)];
+			}
+			set
+			{
+				this[new Tuple<TKey1, TKey2>(key1, key2)] = value;
+			}
+		}
+	}
+}
@@ -0,0 +1,330 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> : DictionaryMapping<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue>, IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>
+	{
+		protected internal class EqualityComparer : IEqualityComparer<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>>
+		{
+			internal readonly IEqualityComparer<TKey1> comparer1;
+			internal readonly IEqualityComparer<TKey2> comparer2;
+			internal readonly IEqualityComparer<TKey3> comparer3;
+			internal readonly IEqualityComparer<TKey4> comparer4;
+			internal readonly IEqualityComparer<TKey5> comparer5;
+			internal readonly IEqualityComparer<TKey6> comparer6;
+			public EqualityComparer(IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5, IEqualityComparer<TKey6> comparer6)
+			{
+				this.comparer1 = (comparer1 == null ? EqualityComparer<TKey1>.Default : comparer1);
+				this.comparer2 = (comparer2 == null ? EqualityComparer<TKey2>.Default : comparer2);
+				this.comparer3 = (comparer3 == null ? EqualityComparer<TKey3>.Default : comparer3);
+				this.comparer4 = (comparer4 == null ? EqualityComparer<TKey4>.Default : comparer4);
+				this.comparer5 = (comparer5 == null ? EqualityComparer<TKey5>.Default : comparer5);
+				this.comparer6 = (comparer6 == null ? EqualityComparer<TKey6>.Default : comparer6);
+			}
+			public bool Equals(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> a, Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> b)
+			{
+				return comparer1.Equals(a.Item1, b.Item1) && comparer2.Equals(a.Item2, b.Item2) && comparer3.Equals(a.Item3, b.Item3) && comparer4.Equals(a.Item4, b.Item4) && comparer5.Equals(a.Item5, b.Item5) && comparer6.Equals(a.Item6, b.Item6);
+			}
+			public int GetHashCode(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> obj)
+			{
+				uint result = 374761393u + 6u;
+				unchecked
+				{
+					result += (uint) comparer1.GetHashCode(obj.Item1) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result += (uint) comparer2.GetHashCode(obj.Item2) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result += (uint) comparer3.GetHashCode(obj.Item3) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result += (uint) comparer4.GetHashCode(obj.Item4) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result += (uint) comparer5.GetHashCode(obj.Item5) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result += (uint) comparer6.GetHashCode(obj.Item6) * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+					result ^= result >> 15;
+					result *= 2246822519u;
+					result ^= result >> 13;
+					result *= 3266489917u;
+					result ^= result >> 16;
+					return (int) result;
+				}
+			}
+		}
+		public DictionaryMapping() : base()
+		{
+		}
+		public DictionaryMapping(IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5, IEqualityComparer<TKey6> comparer6) : base (new EqualityComparer(comparer1, comparer2, comparer3, comparer4, comparer5, comparer6))
+		{
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6)
+		{
+			return base.ContainsKey(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6));
+		}
+		public override void Add(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> key, TValue value)
+		{
+			base.Add(key, value);
+			if(_prefixIndex != null)
+			{
+				IndexSet(_prefixIndex, key, value);
+			}
+		}
+		public override bool Remove(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> key)
+		{
+			if(!base.Remove(key))
+			{
+				return false;
+			}
+			if(_prefixIndex != null)
+			{
+				IndexRemove(key);
+			}
+			return true;
+		}
+		public override TValue this[Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> key]
+		{
+			get
+			{
+				return base[key];
+			}
+			set
+			{
+				base[key] = value;
+				if(_prefixIndex != null)
+				{
+					IndexSet(_prefixIndex, key, value);
+				}
+			}
+		}
+		public override void Clear()
+		{
+			base.Clear();
+			if(_prefixIndex != null)
+			{
+				_prefixIndex.Clear();
+			}
+		}
+		public new struct Enumerator : IEnumerator<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>, IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>
+		{
+			readonly Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue> _dictionary;
+			Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue>.Enumerator _inner;
+			internal Enumerator(Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue> dictionary)
+			{
+				_dictionary = dictionary;
+				_inner = dictionary.GetEnumerator();
+			}
+			public KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> Current
+			{
+				get
+				{
+					return new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>(_inner.Current);
+				}
+			}
+			IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			object IEnumerator.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			public bool MoveNext()
+			{
+				return _inner.MoveNext();
+			}
+			public void Reset()
+			{
+				_inner = _dictionary.GetEnumerator();
+			}
+			public void Dispose()
+			{
+				_inner.Dispose();
+			}
+		}
+		public new struct EntryCollection : IEnumerable<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>
+		{
+			readonly Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue> _dictionary;
+			internal EntryCollection(Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue> dictionary)
+			{
+				_dictionary = dictionary;
+			}
+			public int Count
+			{
+				get
+				{
+					return _dictionary.Count;
+				}
+			}
+			public Enumerator GetEnumerator()
+			{
+				return new Enumerator(_dictionary);
+			}
+			IEnumerator<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>> IEnumerable<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>.GetEnumerator()
+			{
+				return GetEnumerator();
+			}
+			IEnumerator IEnumerable.GetEnumerator()
+			{
+				return GetEnumerator();
+			}
+		}
+		public new EntryCollection Entries
+		{
+			get
+			{
+				return new EntryCollection(this);
+			}
+		}
+		public new Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>> IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>> IEnumerable<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		Dictionary<TKey1, DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>> _prefixIndex;
+		void IndexSet(Dictionary<TKey1, DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>> index, Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> key, TValue value)
+		{
+			DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue> slice;
+			if(!index.TryGetValue(key.Item1, out slice))
+			{
+				var comparer = Comparer as EqualityComparer;
+				slice = comparer == null ? new DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>() : new DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>(comparer.comparer2, comparer.comparer3, comparer.comparer4, comparer.comparer5, comparer.comparer6);
+				index.Add(key.Item1, slice);
+			}
+			slice[key.Item2, key.Item3, key.Item4, key.Item5, key.Item6] = value;
+		}
+		void IndexRemove(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6> key)
+		{
+			DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue> slice;
+			if(_prefixIndex.TryGetValue(key.Item1, out slice) && slice.Remove(key.Item2, key.Item3, key.Item4, key.Item5, key.Item6) && slice.Count == 0)
+			{
+				_prefixIndex.Remove(key.Item1);
+			}
+		}
+		public IMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue> Slice(TKey1 key1)
+		{
+			if(_prefixIndex == null)
+			{
+				var comparer = Comparer as EqualityComparer;
+				var index = new Dictionary<TKey1, DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>>(comparer == null ? null : comparer.comparer1);
+				foreach(var entry in (Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>, TValue>) this)
+				{
+					IndexSet(index, entry.Key, entry.Value);
+				}
+				Interlocked.CompareExchange(ref _prefixIndex, index, null);
+			}
+			return new SliceView(this, key1);
+		}
+		sealed class SliceView : IMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>
+		{
+			static readonly DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue> Empty = new DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>();
+			readonly DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> _mapping;
+			readonly TKey1 _key1;
+			public SliceView(DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> mapping, TKey1 key1)
+			{
+				_mapping = mapping;
+				_key1 = key1;
+			}
+			DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue> Slice()
+			{
+				DictionaryMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue> slice;
+				return _mapping._prefixIndex.TryGetValue(_key1, out slice) ? slice : Empty;
+			}
+			public bool Contains(TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6)
+			{
+				return Slice().Contains(key2, key3, key4, key5, key6);
+			}
+			public int Count
+			{
+				get
+				{
+					return Slice().Count;
+				}
+			}
+			public bool IsFinite
+			{
+				get
+				{
+					return true;
+				}
+			}
+			public bool IsNumerable
+			{
+				get
+				{
+					return true;
+				}
+			}
+			public TValue this[TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6]
+			{
+				get
+				{
+					return Slice()[key2, key3, key4, key5, key6];
+				}
+			}
+			public IEnumerator<IKeyValueTuple<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>> GetEnumerator()
+			{
+				return ((IMapping<TKey2, TKey3, TKey4, TKey5, TKey6, TValue>) Slice()).GetEnumerator();
+			}
+			IEnumerator<Tuple<TKey2, TKey3, TKey4, TKey5, TKey6>> IEnumerable<Tuple<TKey2, TKey3, TKey4, TKey5, TKey6>>.GetEnumerator()
+			{
+				return ((IEnumerable<Tuple<TKey2, TKey3, TKey4, TKey5, TKey6>>) Slice()).GetEnumerator();
+			}
+			IEnumerator IEnumerable.GetEnumerator()
+			{
+				return ((IEnumerable) Slice()).GetEnumerator();
+			}
+		}
+		public bool ContainsKey(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6)
+		{
+			return ContainsKey(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6));
+		}
+		public bool Remove(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6)
+		{
+			return Remove(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6));
+		}
+		public void Add(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, TValue value)
+		{
+			Add(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6), value);
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, out TValue value)
+		{
+			return TryGetValue(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6), out value);
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6]
+		{
+			get
+			{
+				return this[new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6)];
+			}
+			set
+			{
+				this[new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6>(key1, key2, key3, key4, key5, key6)] = value;
+			}
+		}
+		public new FrozenMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue> Freeze()
+		{
+			return new FrozenMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TValue>(this, Comparer);
+		}
+	}
+}
@@ -0,0 +1,295 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ExpiringLazyMapping<TKey, TValue> : WeakMapping, IMapping<TKey, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey key);
+		public delegate bool ContainsDelegate(TKey key);
+		protected class Entry
+		{
+			public TKey Key;
+			public TValue Value;
+			public long Expires;
+			public bool Refreshing;
+			public int Slot;
+			public Entry Previous;
+			public Entry Next;
+		}
+		protected const int WheelSlots = 64;
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected Dictionary<TKey, Entry> _inner;
+		protected Entry[] _wheel;
+		protected long _timeToLive;
+		protected long _refreshAhead;
+		protected long _slotSpan;
+		protected long _sweptSlot;
+		public ExpiringLazyMapping(InstantiateDelegate instantiator, TimeSpan timeToLive, ContainsDelegate contains = null, TimeSpan refreshAhead = default(TimeSpan))
+		{
+			_inner = new Dictionary<TKey, Entry>();
+			_instantiator = instantiator;
+			_contains = contains;
+			Initialize(timeToLive, refreshAhead);
+		}
+		public ExpiringLazyMapping(InstantiateDelegate instantiator, TimeSpan timeToLive, ContainsDelegate contains, TimeSpan refreshAhead, IEqualityComparer<TKey> comparer)
+		{
+			_inner = new Dictionary<TKey, Entry>(comparer);
+			_instantiator = instantiator;
+			_contains = contains;
+			Initialize(timeToLive, refreshAhead);
+		}
+		void Initialize(TimeSpan timeToLive, TimeSpan refreshAhead)
+		{
+			if(timeToLive <= TimeSpan.Zero)
+			{
+				throw new ArgumentOutOfRangeException("timeToLive");
+			}
+			_timeToLive = ToTimestamp(timeToLive);
+			_refreshAhead = ToTimestamp(refreshAhead);
+			_slotSpan = Math.Max(_timeToLive / WheelSlots, 1);
+			_wheel = new Entry[WheelSlots];
+			_sweptSlot = Stopwatch.GetTimestamp() / _slotSpan - 1;
+			AddToCleanupList(this, TimeSpan.FromSeconds(Math.Max((double) _slotSpan / Stopwatch.Frequency, 0.01)));
+		}
+		void Link(Entry entry)
+		{
+			entry.Slot = (int) (entry.Expires / _slotSpan % WheelSlots);
+			var head = _wheel[entry.Slot];
+			if(head == null)
+			{
+				entry.Next = entry.Previous = entry;
+			}
+			else
+			{
+				entry.Next = head;
+				entry.Previous = head.Previous;
+				head.Previous.Next = entry;
+				head.Previous = entry;
+			}
+			_wheel[entry.Slot] = entry;
+		}
+		void Unlink(Entry entry)
+		{
+			if(entry.Next == entry)
+			{
+				_wheel[entry.Slot] = null;
+			}
+			else
+			{
+				entry.Previous.Next = entry.Next;
+				entry.Next.Previous = entry.Previous;
+				if(_wheel[entry.Slot] == entry)
+				{
+					_wheel[entry.Slot] = entry.Next;
+				}
+			}
+			entry.Next = entry.Previous = null;
+		}
+		void Remove(Entry entry)
+		{
+			_inner.Remove(entry.Key);
+			Unlink(entry);
+		}
+		protected override bool CleanupBatch()
+		{
+			lock(_inner)
+			{
+				long now = Stopwatch.GetTimestamp();
+				long current = now / _slotSpan;
+				if(_sweptSlot + 1 >= current)
+				{
+					return true;
+				}
+				_sweptSlot = Math.Max(_sweptSlot + 1, current - WheelSlots);
+				var entry = _wheel[_sweptSlot % WheelSlots];
+				if(entry != null)
+				{
+					var last = entry.Previous;
+					int removed = 0;
+					while(true)
+					{
+						var next = entry.Next;
+						if(entry.Expires <= now)
+						{
+							Remove(entry);
+							removed++;
+						}
+						if(entry == last)
+						{
+							break;
+						}
+						entry = next;
+					}
+					var statistics = Statistics;
+					if(statistics != null && removed > 0)
+					{
+						statistics.RecordRemovals(removed);
+					}
+				}
+				return _sweptSlot + 1 >= current;
+			}
+		}
+		void Refresh(object state)
+		{
+			var entry = (Entry) state;
+			TValue value;
+			try
+			{
+				value = Instantiate(entry.Key);
+			}
+			catch
+			{
+				lock(_inner)
+				{
+					entry.Refreshing = false;
+				}
+				return;
+			}
+			lock(_inner)
+			{
+				entry.Refreshing = false;
+				Entry current;
+				if(_inner.TryGetValue(entry.Key, out current) && current == entry)
+				{
+					Unlink(entry);
+					entry.Value = value;
+					entry.Expires = Stopwatch.GetTimestamp() + _timeToLive;
+					Link(entry);
+				}
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected TValue Instantiate(TKey key)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				Entry entry;
+				TKey innerKey = key;
+				long now = Stopwatch.GetTimestamp();
+				var statistics = Statistics;
+				lock(_inner)
+				{
+					if(_inner.TryGetValue(innerKey, out entry))
+					{
+						if(now < entry.Expires)
+						{
+							if(_refreshAhead > 0 && !entry.Refreshing && now >= entry.Expires - _refreshAhead)
+							{
+								entry.Refreshing = true;
+								ThreadPool.QueueUserWorkItem(Refresh, entry);
+							}
+							if(statistics != null)
+							{
+								statistics.RecordHit();
+							}
+							return entry.Value;
+						}
+						Remove(entry);
+					}
+				}
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				TValue value = Instantiate(key);
+				lock(_inner)
+				{
+					now = Stopwatch.GetTimestamp();
+					if(_inner.TryGetValue(innerKey, out entry))
+					{
+						if(now < entry.Expires)
+						{
+							return entry.Value;
+						}
+						Remove(entry);
+					}
+					entry = new Entry();
+					entry.Key = innerKey;
+					entry.Value = value;
+					entry.Expires = now + _timeToLive;
+					_inner.Add(innerKey, entry);
+					Link(entry);
+				}
+				return value;
+			}
+		}
+		public bool TryGetExisting(TKey key, out TValue value)
+		{
+			Entry entry;
+			lock(_inner)
+			{
+				if(_inner.TryGetValue(key, out entry) && Stopwatch.GetTimestamp() < entry.Expires)
+				{
+					value = entry.Value;
+					return true;
+				}
+			}
+			value = default(TValue);
+			return false;
+		}
+	}
+}
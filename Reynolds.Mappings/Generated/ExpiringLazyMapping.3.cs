@@ -0,0 +1,295 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ExpiringLazyMapping<TKey1, TKey2, TKey3, TValue> : WeakMapping, IMapping<TKey1, TKey2, TKey3, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey1 key1, TKey2 key2, TKey3 key3);
+		public delegate bool ContainsDelegate(TKey1 key1, TKey2 key2, TKey3 key3);
+		protected class Entry
+		{
+			public Tuple<TKey1, TKey2, TKey3> Key;
+			public TValue Value;
+			public long Expires;
+			public bool Refreshing;
+			public int Slot;
+			public Entry Previous;
+			public Entry Next;
+		}
+		protected const int WheelSlots = 64;
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected Dictionary<Tuple<TKey1, TKey2, TKey3>, Entry> _inner;
+		protected Entry[] _wheel;
+		protected long _timeToLive;
+		protected long _refreshAhead;
+		protected long _slotSpan;
+		protected long _sweptSlot;
+		public ExpiringLazyMapping(InstantiateDelegate instantiator, TimeSpan timeToLive, ContainsDelegate contains = null, TimeSpan refreshAhead = default(TimeSpan))
+		{
+			_inner = new Dictionary<Tuple<TKey1, TKey2, TKey3>, Entry>();
+			_instantiator = instantiator;
+			_contains = contains;
+			Initialize(timeToLive, refreshAhead);
+		}
+		public ExpiringLazyMapping(InstantiateDelegate instantiator, TimeSpan timeToLive, ContainsDelegate contains, TimeSpan refreshAhead, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3)
+		{
+			_inner = new Dictionary<Tuple<TKey1, TKey2, TKey3>, Entry>(new DictionaryMapping<TKey1, TKey2, TKey3, TValue>.EqualityComparer(comparer1, comparer2, comparer3));
+			_instantiator = instantiator;
+			_contains = contains;
+			Initialize(timeToLive, refreshAhead);
+		}
+		void Initialize(TimeSpan timeToLive, TimeSpan refreshAhead)
+		{
+			if(timeToLive <= TimeSpan.Zero)
+			{
+				throw new ArgumentOutOfRangeException("timeToLive");
+			}
+			_timeToLive = ToTimestamp(timeToLive);
+			_refreshAhead = ToTimestamp(refreshAhead);
+			_slotSpan = Math.Max(_timeToLive / WheelSlots, 1);
+			_wheel = new Entry[WheelSlots];
+			_sweptSlot = Stopwatch.GetTimestamp() / _slotSpan - 1;
+			AddToCleanupList(this, TimeSpan.FromSeconds(Math.Max((double) _slotSpan / Stopwatch.Frequency, 0.01)));
+		}
+		void Link(Entry entry)
+		{
+			entry.Slot = (int) (entry.Expires / _slotSpan % WheelSlots);
+			var head = _wheel[entry.Slot];
+			if(head == null)
+			{
+				entry.Next = entry.Previous = entry;
+			}
+			else
+			{
+				entry.Next = head;
+				entry.Previous = head.Previous;
+				head.Previous.Next = entry;
+				head.Previous = entry;
+			}
+			_wheel[entry.Slot] = entry;
+		}
+		void Unlink(Entry entry)
+		{
+			if(entry.Next == entry)
+			{
+				_wheel[entry.Slot] = null;
+			}
+			else
+			{
+				entry.Previous.Next = entry.Next;
+				entry.Next.Previous = entry.Previous;
+				if(_wheel[entry.Slot] == entry)
+				{
+					_wheel[entry.Slot] = entry.Next;
+				}
+			}
+			entry.Next = entry.Previous = null;
+		}
+		void Remove(Entry entry)
+		{
+			_inner.Remove(entry.Key);
+			Unlink(entry);
+		}
+		protected override bool CleanupBatch()
+		{
+			lock(_inner)
+			{
+				long now = Stopwatch.GetTimestamp();
+				long current = now / _slotSpan;
+				if(_sweptSlot + 1 >= current)
+				{
+					return true;
+				}
+				_sweptSlot = Math.Max(_sweptSlot + 1, current - WheelSlots);
+				var entry = _wheel[_sweptSlot % WheelSlots];
+				if(entry != null)
+				{
+					var last = entry.Previous;
+					int removed = 0;
+					while(true)
+					{
+						var next = entry.Next;
+						if(entry.Expires <= now)
+						{
+							Remove(entry);
+							removed++;
+						}
+						if(entry == last)
+						{
+							break;
+						}
+						entry = next;
+					}
+					var statistics = Statistics;
+					if(statistics != null && removed > 0)
+					{
+						statistics.RecordRemovals(removed);
+					}
+				}
+				return _sweptSlot + 1 >= current;
+			}
+		}
+		void Refresh(object state)
+		{
+			var entry = (Entry) state;
+			TValue value;
+			try
+			{
+				value = Instantiate(entry.Key.Item1, entry.Key.Item2, entry.Key.Item3);
+			}
+			catch
+			{
+				lock(_inner)
+				{
+					entry.Refreshing = false;
+				}
+				return;
+			}
+			lock(_inner)
+			{
+				entry.Refreshing = false;
+				Entry current;
+				if(_inner.TryGetValue(entry.Key, out current) && current == entry)
+				{
+					Unlink(entry);
+					entry.Value = value;
+					entry.Expires = Stopwatch.GetTimestamp() + _timeToLive;
+					Link(entry);
+				}
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key1, key2, key3);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3>> IEnumerable<Tuple<TKey1, TKey2, TKey3>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected TValue Instantiate(TKey1 key1, TKey2 key2, TKey3 key3)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key1, key2, key3);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key1, key2, key3);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3]
+		{
+			get
+			{
+				Entry entry;
+				Tuple<TKey1, TKey2, TKey3> innerKey = new Tuple<TKey1, TKey2, TKey3>(key1, key2, key3);
+				long now = Stopwatch.GetTimestamp();
+				var statistics = Statistics;
+				lock(_inner)
+				{
+					if(_inner.TryGetValue(innerKey, out entry))
+					{
+						if(now < entry.Expires)
+						{
+							if(_refreshAhead > 0 && !entry.Refreshing && now >= entry.Expires - _refreshAhead)
+							{
+								entry.Refreshing = true;
+								ThreadPool.QueueUserWorkItem(Refresh, entry);
+							}
+							if(statistics != null)
+							{
+								statistics.RecordHit();
+							}
+							return entry.Value;
+						}
+						Remove(entry);
+					}
+				}
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				TValue value = Instantiate(key1, key2, key3);
+				lock(_inner)
+				{
+					now = Stopwatch.GetTimestamp();
+					if(_inner.TryGetValue(innerKey, out entry))
+					{
+						if(now < entry.Expires)
+						{
+							return entry.Value;
+						}
+						Remove(entry);
+					}
+					entry = new Entry();
+					entry.Key = innerKey;
+					entry.Value = value;
+					entry.Expires = now + _timeToLive;
+					_inner.Add(innerKey, entry);
+					Link(entry);
+				}
+				return value;
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, TKey3 key3, out TValue value)
+		{
+			Entry entry;
+			lock(_inner)
+			{
+				if(_inner.TryGetValue(new Tuple<TKey1, TKey2, TKey3>(key1, key2, key3), out entry) && Stopwatch.GetTimestamp() < entry.Expires)
+				{
+					value = entry.Value;
+					return true;
+				}
+			}
+			value = default(TValue);
+			return false;
+		}
+	}
+}
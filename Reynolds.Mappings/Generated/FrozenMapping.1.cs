@@ -0,0 +1,139 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class FrozenMapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		protected IEqualityComparer<TKey> _comparer;
+		protected TKey[] _keys;
+		protected TValue[] _values;
+		protected int[] _hashes;
+		protected int[] _buckets;
+		protected int _shift;
+		public FrozenMapping(ICollection<KeyValuePair<TKey, TValue>> entries, IEqualityComparer<TKey> comparer = null)
+		{
+			_comparer = comparer ?? EqualityComparer<TKey>.Default;
+			_keys = new TKey[entries.Count];
+			_values = new TValue[entries.Count];
+			_hashes = new int[entries.Count];
+			int bits = 1;
+			while((1 << bits) < 2 * entries.Count)
+			{
+				bits++;
+			}
+			_shift = 32 - bits;
+			_buckets = new int[1 << bits];
+			int count = 0;
+			foreach(var entry in entries)
+			{
+				int hash = _comparer.GetHashCode(entry.Key);
+				int bucket = Bucket(hash);
+				while(_buckets[bucket] != 0)
+				{
+					int other = _buckets[bucket] - 1;
+					if(_hashes[other] == hash && _comparer.Equals(_keys[other], entry.Key))
+					{
+						throw new ArgumentException("An entry with the same key was given more than once");
+					}
+					bucket = (bucket + 1) & (_buckets.Length - 1);
+				}
+				_keys[count] = entry.Key;
+				_values[count] = entry.Value;
+				_hashes[count] = hash;
+				_buckets[bucket] = ++count;
+			}
+		}
+		int Bucket(int hash)
+		{
+			return (int) (unchecked((uint) hash * 2654435769u) >> _shift);
+		}
+		protected int IndexOf(TKey innerKey)
+		{
+			int hash = _comparer.GetHashCode(innerKey);
+			int mask = _buckets.Length - 1;
+			for(int bucket = Bucket(hash); ; bucket = (bucket + 1) & mask)
+			{
+				int entry = _buckets[bucket] - 1;
+				if(entry < 0)
+				{
+					return -1;
+				}
+				if(_hashes[entry] == hash && _comparer.Equals(_keys[entry], innerKey))
+				{
+					return entry;
+				}
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			return IndexOf(key) >= 0;
+		}
+		public int Count
+		{
+			get
+			{
+				return _keys.Length;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool TryGetValue(TKey key, out TValue value)
+		{
+			int entry = IndexOf(key);
+			if(entry < 0)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = _values[entry];
+			return true;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				int entry = IndexOf(key);
+				if(entry < 0)
+				{
+					throw new KeyNotFoundException();
+				}
+				return _values[entry];
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			for(int i = 0; i < _keys.Length; i++)
+			{
+				yield return new KeyValueTuple<TKey, TValue>(new KeyValuePair<TKey, TValue>(_keys[i], _values[i]));
+			}
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			return ((IEnumerable<TKey>) _keys).GetEnumerator();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return _keys.GetEnumerator();
+		}
+	}
+}
@@ -0,0 +1,139 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class FrozenMapping<TKey1, TKey2, TKey3, TKey4, TValue> : IMapping<TKey1, TKey2, TKey3, TKey4, TValue>
+	{
+		protected IEqualityComparer<Tuple<TKey1, TKey2, TKey3, TKey4>> _comparer;
+		protected Tuple<TKey1, TKey2, TKey3, TKey4>[] _keys;
+		protected TValue[] _values;
+		protected int[] _hashes;
+		protected int[] _buckets;
+		protected int _shift;
+		public FrozenMapping(ICollection<KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4>, TValue>> entries, IEqualityComparer<Tuple<TKey1, TKey2, TKey3, TKey4>> comparer = null)
+		{
+			_comparer = comparer ?? EqualityComparer<Tuple<TKey1, TKey2, TKey3, TKey4>>.Default;
+			_keys = new Tuple<TKey1, TKey2, TKey3, TKey4>[entries.Count];
+			_values = new TValue[entries.Count];
+			_hashes = new int[entries.Count];
+			int bits = 1;
+			while((1 << bits) < 2 * entries.Count)
+			{
+				bits++;
+			}
+			_shift = 32 - bits;
+			_buckets = new int[1 << bits];
+			int count = 0;
+			foreach(var entry in entries)
+			{
+				int hash = _comparer.GetHashCode(entry.Key);
+				int bucket = Bucket(hash);
+				while(_buckets[bucket] != 0)
+				{
+					int other = _buckets[bucket] - 1;
+					if(_hashes[other] == hash && _comparer.Equals(_keys[other], entry.Key))
+					{
+						throw new ArgumentException("An entry with the same key was given more than once");
+					}
+					bucket = (bucket + 1) & (_buckets.Length - 1);
+				}
+				_keys[count] = entry.Key;
+				_values[count] = entry.Value;
+				_hashes[count] = hash;
+				_buckets[bucket] = ++count;
+			}
+		}
+		int Bucket(int hash)
+		{
+			return (int) (unchecked((uint) hash * 2654435769u) >> _shift);
+		}
+		protected int IndexOf(Tuple<TKey1, TKey2, TKey3, TKey4> innerKey)
+		{
+			int hash = _comparer.GetHashCode(innerKey);
+			int mask = _buckets.Length - 1;
+			for(int bucket = Bucket(hash); ; bucket = (bucket + 1) & mask)
+			{
+				int entry = _buckets[bucket] - 1;
+				if(entry < 0)
+				{
+					return -1;
+				}
+				if(_hashes[entry] == hash && _comparer.Equals(_keys[entry], innerKey))
+				{
+					return entry;
+				}
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4)
+		{
+			return IndexOf(new Tuple<TKey1, TKey2, TKey3, TKey4>(key1, key2, key3, key4)) >= 0;
+		}
+		public int Count
+		{
+			get
+			{
+				return _keys.Length;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, out TValue value)
+		{
+			int entry = IndexOf(new Tuple<TKey1, TKey2, TKey3, TKey4>(key1, key2, key3, key4));
+			if(entry < 0)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = _values[entry];
+			return true;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4]
+		{
+			get
+			{
+				int entry = IndexOf(new Tuple<TKey1, TKey2, TKey3, TKey4>(key1, key2, key3, key4));
+				if(entry < 0)
+				{
+					throw new KeyNotFoundException();
+				}
+				return _values[entry];
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>> GetEnumerator()
+		{
+			for(int i = 0; i < _keys.Length; i++)
+			{
+				yield return new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>(new KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4>, TValue>(_keys[i], _values[i]));
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4>>.GetEnumerator()
+		{
+			return ((IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4>>) _keys).GetEnumerator();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return _keys.GetEnumerator();
+		}
+	}
+}
@@ -0,0 +1,70 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public interface IDomain<TKey> : IEnumerable<TKey>
+	{
+		bool Contains(TKey key);
+		int Count
+		{
+			get;
+		}
+		bool IsFinite
+		{
+			get;
+		}
+		bool IsNumerable
+		{
+			get;
+		}
+	}
+	public interface IKeyValueTuple<TKey, out TValue>
+	{
+		TKey Key
+		{
+			get;
+		}
+		TValue Value
+		{
+			get;
+		}
+	}
+	public struct KeyValueTuple<TKey, TValue> : IKeyValueTuple<TKey, TValue>
+	{
+		KeyValuePair<TKey, TValue> inner;
+		public KeyValueTuple(KeyValuePair<TKey, TValue> inner)
+		{
+			this.inner = inner;
+		}
+		public TKey Key
+		{
+			get
+			{
+				return inner.Key;
+			}
+		}
+		public TValue Value
+		{
+			get
+			{
+				return inner.Value;
+			}
+		}
+	}
+	public interface IMapping<TKey, out TValue> : IEnumerable<IKeyValueTuple<TKey, TValue>>, IDomain<TKey>
+	{
+		TValue this[TKey key]
+		{
+			get;
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator();
+	}
+}
@@ -0,0 +1,103 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public interface IDomain<TKey1, TKey2, TKey3, TKey4> : IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4>>
+	{
+		bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4);
+		int Count
+		{
+			get;
+		}
+		bool IsFinite
+		{
+			get;
+		}
+		bool IsNumerable
+		{
+			get;
+		}
+	}
+	public interface IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, out TValue>
+	{
+		TKey1 Key1
+		{
+			get;
+		}
+		TKey2 Key2
+		{
+			get;
+		}
+		TKey3 Key3
+		{
+			get;
+		}
+		TKey4 Key4
+		{
+			get;
+		}
+		TValue Value
+		{
+			get;
+		}
+	}
+	public struct KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue> : IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>
+	{
+		KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4>, TValue> inner;
+		public KeyValueTuple(KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4>, TValue> inner)
+		{
+			this.inner = inner;
+		}
+		public TKey1 Key1
+		{
+			get
+			{
+				return inner.Key.Item1;
+			}
+		}
+		public TKey2 Key2
+		{
+			get
+			{
+				return inner.Key.Item2;
+			}
+		}
+		public TKey3 Key3
+		{
+			get
+			{
+				return inner.Key.Item3;
+			}
+		}
+		public TKey4 Key4
+		{
+			get
+			{
+				return inner.Key.Item4;
+			}
+		}
+		public TValue Value
+		{
+			get
+			{
+				return inner.Value;
+			}
+		}
+	}
+	public interface IMapping<TKey1, TKey2, TKey3, TKey4, out TValue> : IEnumerable<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>>, IDomain<TKey1, TKey2, TKey3, TKey4>
+	{
+		TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4]
+		{
+			get;
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TValue>> GetEnumerator();
+	}
+}
@@ -0,0 +1,136 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public interface IDomain<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7> : IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7>>
+	{
+		bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, TKey7 key7);
+		int Count
+		{
+			get;
+		}
+		bool IsFinite
+		{
+			get;
+		}
+		bool IsNumerable
+		{
+			get;
+		}
+	}
+	public interface IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7, out TValue>
+	{
+		TKey1 Key1
+		{
+			get;
+		}
+		TKey2 Key2
+		{
+			get;
+		}
+		TKey3 Key3
+		{
+			get;
+		}
+		TKey4 Key4
+		{
+			get;
+		}
+		TKey5 Key5
+		{
+			get;
+		}
+		TKey6 Key6
+		{
+			get;
+		}
+		TKey7 Key7
+		{
+			get;
+		}
+		TValue Value
+		{
+			get;
+		}
+	}
+	public struct KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7, TValue> : IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7, TValue>
+	{
+		KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7>, TValue> inner;
+		public KeyValueTuple(KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7>, TValue> inner)
+		{
+			this.inner = inner;
+		}
+		public TKey1 Key1
+		{
+			get
+			{
+				return inner.Key.Item1;
+			}
+		}
+		public TKey2 Key2
+		{
+			get
+			{
+				return inner.Key.Item2;
+			}
+		}
+		public TKey3 Key3
+		{
+			get
+			{
+				return inner.Key.Item3;
+			}
+		}
+		public TKey4 Key4
+		{
+			get
+			{
+				return inner.Key.Item4;
+			}
+		}
+		public TKey5 Key5
+		{
+			get
+			{
+				return inner.Key.Item5;
+			}
+		}
+		public TKey6 Key6
+		{
+			get
+			{
+				return inner.Key.Item6;
+			}
+		}
+		public TKey7 Key7
+		{
+			get
+			{
+				return inner.Key.Item7;
+			}
+		}
+		public TValue Value
+		{
+			get
+			{
+				return inner.Value;
+			}
+		}
+	}
+	public interface IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7, out TValue> : IEnumerable<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7, TValue>>, IDomain<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7>
+	{
+		TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TKey6 key6, TKey7 key7]
+		{
+			get;
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TKey6, TKey7, TValue>> GetEnumerator();
+	}
+}
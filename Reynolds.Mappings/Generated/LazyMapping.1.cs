@@ -0,0 +1,213 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class LazyMapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey key);
+		public delegate TValue[] InstantiateManyDelegate(IList<TKey> keys);
+		public delegate bool ContainsDelegate(TKey key);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected DictionaryMapping<TKey, TValue> _inner;
+		public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)
+		{
+			_inner = new DictionaryMapping<TKey, TValue>();
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey> comparer)
+		{
+			_inner = new DictionaryMapping<TKey, TValue>(comparer);
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public bool Contains(TKey key)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		protected TValue Instantiate(TKey key)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				TValue value;
+				var statistics = Statistics;
+				if(_inner.TryGetValue(key, out value))
+				{
+					if(statistics != null)
+					{
+						statistics.RecordHit();
+					}
+					return value;
+				}
+				else
+				{
+					if(statistics != null)
+					{
+						statistics.RecordMiss();
+					}
+					_inner[key] = value = Instantiate(key);
+					return value;
+				}
+			}
+		}
+		public bool TryGetExisting(TKey key, out TValue value)
+		{
+			return _inner.TryGetValue(key, out value);
+		}
+		public IMapping<TKey, TValue> Instantiated
+		{
+			get
+			{
+				return _inner;
+			}
+		}
+		public void Seed(IEnumerable<IKeyValueTuple<TKey, TValue>> entries)
+		{
+			foreach(var entry in entries)
+			{
+				if(!_inner.Contains(entry.Key))
+				{
+					_inner[entry.Key] = entry.Value;
+				}
+			}
+		}
+		public TValue[] GetMany(IList<TKey> keys)
+		{
+			return GetMany(keys, null);
+		}
+		public TValue[] GetMany(IList<TKey> keys, InstantiateManyDelegate instantiateMany)
+		{
+			var values = new TValue[keys.Count];
+			List<int> misses = null;
+			for(int i = 0; i < values.Length; i++)
+			{
+				if(!_inner.TryGetValue(keys[i], out values[i]))
+				{
+					(misses ?? (misses = new List<int>())).Add(i);
+				}
+			}
+			var statistics = Statistics;
+			if(statistics != null)
+			{
+				statistics.RecordHits(values.Length - (misses == null ? 0 : misses.Count));
+			}
+			if(misses != null)
+			{
+				if(statistics != null)
+				{
+					statistics.RecordMisses(misses.Count);
+				}
+				var created = new Dictionary<TKey, TValue>(_inner.Comparer);
+				if(instantiateMany == null)
+				{
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], Instantiate(keys[i]));
+						}
+					}
+				}
+				else
+				{
+					var missing = new List<TKey>();
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], default(TValue));
+							missing.Add(keys[i]);
+						}
+					}
+					var instantiated = instantiateMany(missing);
+					if(instantiated == null || instantiated.Length != missing.Count)
+					{
+						throw new InvalidOperationException("The batch instantiator must return one value per key");
+					}
+					for(int j = 0; j < missing.Count; j++)
+					{
+						created[missing[j]] = instantiated[j];
+					}
+				}
+				foreach(var i in misses)
+				{
+					_inner[keys[i]] = values[i] = created[keys[i]];
+				}
+			}
+			return values;
+		}
+	}
+}
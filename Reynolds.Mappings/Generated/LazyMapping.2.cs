@@ -0,0 +1,213 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class LazyMapping<TKey1, TKey2, TValue> : IMapping<TKey1, TKey2, TValue>
+	{
+		public delegate TValue InstantiateDelegate(TKey1 key1, TKey2 key2);
+		public delegate TValue[] InstantiateManyDelegate(IList<Tuple<TKey1, TKey2>> keys);
+		public delegate bool ContainsDelegate(TKey1 key1, TKey2 key2);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected DictionaryMapping<TKey1, TKey2, TValue> _inner;
+		public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)
+		{
+			_inner = new DictionaryMapping<TKey1, TKey2, TValue>();
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2)
+		{
+			_inner = new DictionaryMapping<TKey1, TKey2, TValue>(comparer1, comparer2);
+			_instantiator = instantiator;
+			_contains = contains;
+		}
+		public bool Contains(TKey1 key1, TKey2 key2)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key1, key2);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2>> IEnumerable<Tuple<TKey1, TKey2>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected MappingStatistics _statistics;
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return _statistics;
+			}
+			set
+			{
+				_statistics = value;
+			}
+		}
+		protected TValue Instantiate(TKey1 key1, TKey2 key2)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key1, key2);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key1, key2);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey1 key1, TKey2 key2]
+		{
+			get
+			{
+				TValue value;
+				var statistics = Statistics;
+				if(_inner.TryGetValue(key1, key2, out value))
+				{
+					if(statistics != null)
+					{
+						statistics.RecordHit();
+					}
+					return value;
+				}
+				else
+				{
+					if(statistics != null)
+					{
+						statistics.RecordMiss();
+					}
+					_inner[key1, key2] = value = Instantiate(key1, key2);
+					return value;
+				}
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, out TValue value)
+		{
+			return _inner.TryGetValue(key1, key2, out value);
+		}
+		public IMapping<TKey1, TKey2, TValue> Instantiated
+		{
+			get
+			{
+				return _inner;
+			}
+		}
+		public void Seed(IEnumerable<IKeyValueTuple<TKey1, TKey2, TValue>> entries)
+		{
+			foreach(var entry in entries)
+			{
+				if(!_inner.Contains(entry.Key1, entry.Key2))
+				{
+					_inner[entry.Key1, entry.Key2] = entry.Value;
+				}
+			}
+		}
+		public TValue[] GetMany(IList<Tuple<TKey1, TKey2>> keys)
+		{
+			return GetMany(keys, null);
+		}
+		public TValue[] GetMany(IList<Tuple<TKey1, TKey2>> keys, InstantiateManyDelegate instantiateMany)
+		{
+			var values = new TValue[keys.Count];
+			List<int> misses = null;
+			for(int i = 0; i < values.Length; i++)
+			{
+				if(!_inner.TryGetValue(keys[i], out values[i]))
+				{
+					(misses ?? (misses = new List<int>())).Add(i);
+				}
+			}
+			var statistics = Statistics;
+			if(statistics != null)
+			{
+				statistics.RecordHits(values.Length - (misses == null ? 0 : misses.Count));
+			}
+			if(misses != null)
+			{
+				if(statistics != null)
+				{
+					statistics.RecordMisses(misses.Count);
+				}
+				var created = new Dictionary<Tuple<TKey1, TKey2>, TValue>(_inner.Comparer);
+				if(instantiateMany == null)
+				{
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], Instantiate(keys[i].Item1, keys[i].Item2));
+						}
+					}
+				}
+				else
+				{
+					var missing = new List<Tuple<TKey1, TKey2>>();
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], default(TValue));
+							missing.Add(keys[i]);
+						}
+					}
+					var instantiated = instantiateMany(missing);
+					if(instantiated == null || instantiated.Length != missing.Count)
+					{
+						throw new InvalidOperationException("The batch instantiator must return one value per key");
+					}
+					for(int j = 0; j < missing.Count; j++)
+					{
+						created[missing[j]] = instantiated[j];
+					}
+				}
+				foreach(var i in misses)
+				{
+					_inner[keys[i]] = values[i] = created[keys[i]];
+				}
+			}
+			return values;
+		}
+	}
+}
@@ -0,0 +1,73 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class Mapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		public delegate TValue GetDelegate(TKey key);
+		GetDelegate _getter;
+		public Mapping(GetDelegate getter)
+		{
+			_getter = getter;
+		}
+		internal GetDelegate Getter
+		{
+			get
+			{
+				return _getter;
+			}
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				return _getter(key);
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			return true;
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+	}
+}
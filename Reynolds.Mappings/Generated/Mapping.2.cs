@@ -0,0 +1,73 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class Mapping<TKey1, TKey2, TValue> : IMapping<TKey1, TKey2, TValue>
+	{
+		public delegate TValue GetDelegate(TKey1 key1, TKey2 key2);
+		GetDelegate _getter;
+		public Mapping(GetDelegate getter)
+		{
+			_getter = getter;
+		}
+		internal GetDelegate Getter
+		{
+			get
+			{
+				return _getter;
+			}
+		}
+		public TValue this[TKey1 key1, TKey2 key2]
+		{
+			get
+			{
+				return _getter(key1, key2);
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2)
+		{
+			return true;
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2>> IEnumerable<Tuple<TKey1, TKey2>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+	}
+}
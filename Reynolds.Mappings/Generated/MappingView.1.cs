@@ -0,0 +1,181 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class MappingView<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		internal readonly ParameterExpression[] parameters;
+		internal readonly Expression lookup;
+		internal readonly Expression domain;
+		internal readonly IDomain<TKey> keys;
+		internal readonly bool filtered;
+		Func<TKey, TValue> _getter;
+		Func<TKey, bool> _contains;
+		internal MappingView(ParameterExpression[] parameters, Expression lookup, Expression domain, IDomain<TKey> keys, bool filtered)
+		{
+			this.parameters = parameters;
+			this.lookup = lookup;
+			this.domain = domain;
+			this.keys = keys;
+			this.filtered = filtered;
+		}
+		public static MappingView<TKey, TValue> Of(IMapping<TKey, TValue> mapping)
+		{
+			var view = mapping as MappingView<TKey, TValue>;
+			if(view != null)
+			{
+				return view;
+			}
+			var parameters = new[] { Expression.Parameter(typeof(TKey), "key") };
+			var function = mapping as Mapping<TKey, TValue>;
+			if(function != null)
+			{
+				return new MappingView<TKey, TValue>(parameters, Expression.Invoke(Expression.Constant(function.Getter), parameters), null, null, false);
+			}
+			var source = Expression.Constant(mapping, typeof(IMapping<TKey, TValue>));
+			var contains = Expression.Call(source, typeof(IDomain<TKey>).GetMethod("Contains"), parameters);
+			return new MappingView<TKey, TValue>(parameters, Expression.Property(source, "Item", parameters), contains, mapping, false);
+		}
+		public Func<TKey, TValue> Getter
+		{
+			get
+			{
+				if(_getter == null)
+				{
+					_getter = Expression.Lambda<Func<TKey, TValue>>(lookup, parameters).Compile();
+				}
+				return _getter;
+			}
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				return Getter(key);
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			if(domain == null)
+			{
+				return true;
+			}
+			if(_contains == null)
+			{
+				_contains = Expression.Lambda<Func<TKey, bool>>(domain, parameters).Compile();
+			}
+			return _contains(key);
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return keys != null && keys.IsFinite;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return keys != null && keys.IsNumerable;
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				if(keys == null)
+				{
+					throw new Exception("Domain is not finite");
+				}
+				if(!filtered)
+				{
+					return keys.Count;
+				}
+				int count = 0;
+				foreach(var key in keys)
+				{
+					if(Contains(key))
+					{
+						count++;
+					}
+				}
+				return count;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			if(keys == null)
+			{
+				throw new Exception("Domain is non-numerable");
+			}
+			return Entries().GetEnumerator();
+		}
+		IEnumerable<IKeyValueTuple<TKey, TValue>> Entries()
+		{
+			foreach(var key in keys)
+			{
+				if(!filtered || Contains(key))
+				{
+					yield return new KeyValueTuple<TKey, TValue>(new KeyValuePair<TKey, TValue>(key, Getter(key)));
+				}
+			}
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			if(keys == null)
+			{
+				throw new Exception("Domain is non-numerable");
+			}
+			return (filtered ? keys.Where(key => Contains(key)) : keys).GetEnumerator();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return ((IEnumerable<TKey>) this).GetEnumerator();
+		}
+		public LazyMapping<TKey, TValue> Memoize()
+		{
+			var contains = domain == null ? null : new LazyMapping<TKey, TValue>.ContainsDelegate(Contains);
+			return new LazyMapping<TKey, TValue>(new LazyMapping<TKey, TValue>.InstantiateDelegate(Getter), contains);
+		}
+	}
+	public static partial class MappingViews
+	{
+		public static MappingView<TKey, TValue> AsView<TKey, TValue>(this IMapping<TKey, TValue> mapping)
+		{
+			return MappingView<TKey, TValue>.Of(mapping);
+		}
+		public static MappingView<TKey, TResult> Select<TKey, TValue, TResult>(this IMapping<TKey, TValue> mapping, Expression<Func<TValue, TResult>> selector)
+		{
+			var view = MappingView<TKey, TValue>.Of(mapping);
+			return new MappingView<TKey, TResult>(view.parameters, ViewExpressions.Inline(selector, view.lookup), view.domain, view.keys, view.filtered);
+		}
+		public static MappingView<TKey, TValue> Where<TKey, TValue>(this IMapping<TKey, TValue> mapping, Expression<Func<TKey, bool>> predicate)
+		{
+			var view = MappingView<TKey, TValue>.Of(mapping);
+			var test = ViewExpressions.Inline(predicate, view.parameters);
+			var lookup = Expression.Condition(test, view.lookup, ViewExpressions.Missing(typeof(TValue)));
+			return new MappingView<TKey, TValue>(view.parameters, lookup, ViewExpressions.Both(view.domain, test), view.keys, true);
+		}
+		public static MappingView<TKey, TResult> Compose<TKey, TValue, TResult>(this IMapping<TKey, TValue> mapping, IMapping<TValue, TResult> next)
+		{
+			var view = MappingView<TKey, TValue>.Of(mapping);
+			var outer = MappingView<TValue, TResult>.Of(next);
+			var lookup = ViewExpressions.Inline(outer.parameters, outer.lookup, view.lookup);
+			if(outer.domain == null)
+			{
+				return new MappingView<TKey, TResult>(view.parameters, lookup, view.domain, view.keys, view.filtered);
+			}
+			var domain = ViewExpressions.Both(view.domain, ViewExpressions.Inline(outer.parameters, outer.domain, view.lookup));
+			return new MappingView<TKey, TResult>(view.parameters, lookup, domain, view.keys, true);
+		}
+	}
+}
@@ -0,0 +1,252 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class MappingView<TKey1, TKey2, TKey3, TValue> : IMapping<TKey1, TKey2, TKey3, TValue>
+	{
+		internal readonly ParameterExpression[] parameters;
+		internal readonly Expression lookup;
+		internal readonly Expression domain;
+		internal readonly IDomain<TKey1, TKey2, TKey3> keys;
+		internal readonly bool filtered;
+		Func<TKey1, TKey2, TKey3, TValue> _getter;
+		Func<TKey1, TKey2, TKey3, bool> _contains;
+		internal MappingView(ParameterExpression[] parameters, Expression lookup, Expression domain, IDomain<TKey1, TKey2, TKey3> keys, bool filtered)
+		{
+			this.parameters = parameters;
+			this.lookup = lookup;
+			this.domain = domain;
+			this.keys = keys;
+			this.filtered = filtered;
+		}
+		public static MappingView<TKey1, TKey2, TKey3, TValue> Of(IMapping<TKey1, TKey2, TKey3, TValue> mapping)
+		{
+			var view = mapping as MappingView<TKey1, TKey2, TKey3, TValue>;
+			if(view != null)
+			{
+				return view;
+			}
+			var parameters = new[] { Expression.Parameter(typeof(TKey1), "key1"), Expression.Parameter(typeof(TKey2), "key2"), Expression.Parameter(typeof(TKey3), "key3") };
+			var function = mapping as Mapping<TKey1, TKey2, TKey3, TValue>;
+			if(function != null)
+			{
+				return new MappingView<TKey1, TKey2, TKey3, TValue>(parameters, Expression.Invoke(Expression.Constant(function.Getter), parameters), null, null, false);
+			}
+			var source = Expression.Constant(mapping, typeof(IMapping<TKey1, TKey2, TKey3, TValue>));
+			var contains = Expression.Call(source, typeof(IDomain<TKey1, TKey2, TKey3>).GetMethod("Contains"), parameters);
+			return new MappingView<TKey1, TKey2, TKey3, TValue>(parameters, Expression.Property(source, "Item", parameters), contains, mapping, false);
+		}
+		public Func<TKey1, TKey2, TKey3, TValue> Getter
+		{
+			get
+			{
+				if(_getter == null)
+				{
+					_getter = Expression.Lambda<Func<TKey1, TKey2, TKey3, TValue>>(lookup, parameters).Compile();
+				}
+				return _getter;
+			}
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3]
+		{
+			get
+			{
+				return Getter(key1, key2, key3);
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3)
+		{
+			if(domain == null)
+			{
+				return true;
+			}
+			if(_contains == null)
+			{
+				_contains = Expression.Lambda<Func<TKey1, TKey2, TKey3, bool>>(domain, parameters).Compile();
+			}
+			return _contains(key1, key2, key3);
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return keys != null && keys.IsFinite;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return keys != null && keys.IsNumerable;
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				if(keys == null)
+				{
+					throw new Exception("Domain is not finite");
+				}
+				if(!filtered)
+				{
+					return keys.Count;
+				}
+				int count = 0;
+				foreach(var key in keys)
+				{
+					if(Contains(key.Item1, key.Item2, key.Item3))
+					{
+						count++;
+					}
+				}
+				return count;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TValue>> GetEnumerator()
+		{
+			if(keys == null)
+			{
+				throw new Exception("Domain is non-numerable");
+			}
+			return Entries().GetEnumerator();
+		}
+		IEnumerable<IKeyValueTuple<TKey1, TKey2, TKey3, TValue>> Entries()
+		{
+			foreach(var key in keys)
+			{
+				if(!filtered || Contains(key.Item1, key.Item2, key.Item3))
+				{
+					yield return new KeyValueTuple<TKey1, TKey2, TKey3, TValue>(new KeyValuePair<Tuple<TKey1, TKey2, TKey3>, TValue>(key, Getter(key.Item1, key.Item2, key.Item3)));
+				}
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3>> IEnumerable<Tuple<TKey1, TKey2, TKey3>>.GetEnumerator()
+		{
+			if(keys == null)
+			{
+				throw new Exception("Domain is non-numerable");
+			}
+			return (filtered ? keys.Where(key => Contains(key.Item1, key.Item2, key.Item3)) : keys).GetEnumerator();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return ((IEnumerable<Tuple<TKey1, TKey2, TKey3>>) this).GetEnumerator();
+		}
+		public LazyMapping<TKey1, TKey2, TKey3, TValue> Memoize()
+		{
+			var contains = domain == null ? null : new LazyMapping<TKey1, TKey2, TKey3, TValue>.ContainsDelegate(Contains);
+			return new LazyMapping<TKey1, TKey2, TKey3, TValue>(new LazyMapping<TKey1, TKey2, TKey3, TValue>.InstantiateDelegate(Getter), contains);
+		}
+	}
+	public static partial class MappingViews
+	{
+		public static MappingView<TKey1, TKey2, TKey3, TValue> AsView<TKey1, TKey2, TKey3, TValue>(this IMapping<TKey1, TKey2, TKey3, TValue> mapping)
+		{
+			return MappingView<TKey1, TKey2, TKey3, TValue>.Of(mapping);
+		}
+		public static MappingView<TKey1, TKey2, TKey3, TResult> Select<TKey1, TKey2, TKey3, TValue, TResult>(this IMapping<TKey1, TKey2, TKey3, TValue> mapping, Expression<Func<TValue, TResult>> selector)
+		{
+			var view = MappingView<TKey1, TKey2, TKey3, TValue>.Of(mapping);
+			return new MappingView<TKey1, TKey2, TKey3, TResult>(view.parameters, ViewExpressions.Inline(selector, view.lookup), view.domain, view.keys, view.filtered);
+		}
+		public static MappingView<TKey1, TKey2, TKey3, TValue> Where<TKey1, TKey2, TKey3, TValue>(this IMapping<TKey1, TKey2, TKey3, TValue> mapping, Expression<Func<TKey1, TKey2, TKey3, bool>> predicate)
+		{
+			var view = MappingView<TKey1, TKey2, TKey3, TValue>.Of(mapping);
+			var test = ViewExpressions.Inline(predicate, view.parameters);
+			var lookup = Expression.Condition(test, view.lookup, ViewExpressions.Missing(typeof(TValue)));
+			return new MappingView<TKey1, TKey2, TKey3, TValue>(view.parameters, lookup, ViewExpressions.Both(view.domain, test), view.keys, true);
+		}
+		public static MappingView<TKey1, TKey2, TKey3, TResult> Compose<TKey1, TKey2, TKey3, TValue, TResult>(this IMapping<TKey1, TKey2, TKey3, TValue> mapping, IMapping<TValue, TResult> next)
+		{
+			var view = MappingView<TKey1, TKey2, TKey3, TValue>.Of(mapping);
+			var outer = MappingView<TValue, TResult>.Of(next);
+			var lookup = ViewExpressions.Inline(outer.parameters, outer.lookup, view.lookup);
+			if(outer.domain == null)
+			{
+				return new MappingView<TKey1, TKey2, TKey3, TResult>(view.parameters, lookup, view.domain, view.keys, view.filtered);
+			}
+			var domain = ViewExpressions.Both(view.domain, ViewExpressions.Inline(outer.parameters, outer.domain, view.lookup));
+			return new MappingView<TKey1, TKey2, TKey3, TResult>(view.parameters, lookup, domain, view.keys, true);
+		}
+		public static MappingView<TKey2, TKey3, TValue> Curry<TKey1, TKey2, TKey3, TValue>(this IMapping<TKey1, TKey2, TKey3, TValue> mapping, TKey1 key1)
+		{
+			var view = MappingView<TKey1, TKey2, TKey3, TValue>.Of(mapping);
+			var parameters = view.parameters.Skip(1).ToArray();
+			var arguments = new Expression[] { Expression.Constant(key1, typeof(TKey1)) }.Concat(parameters).ToArray();
+			var domain = view.domain == null ? null : ViewExpressions.Inline(view.parameters, view.domain, arguments);
+			var keys = view.keys == null ? null : new CurriedDomain<TKey1, TKey2, TKey3>(view.keys, key1);
+			return new MappingView<TKey2, TKey3, TValue>(parameters, ViewExpressions.Inline(view.parameters, view.lookup, arguments), domain, keys, view.filtered);
+		}
+	}
+	sealed class CurriedDomain<TKey1, TKey2, TKey3> : IDomain<TKey2, TKey3>
+	{
+		static readonly EqualityComparer<TKey1> comparer = EqualityComparer<TKey1>.Default;
+		readonly IDomain<TKey1, TKey2, TKey3> _keys;
+		readonly TKey1 _key1;
+		public CurriedDomain(IDomain<TKey1, TKey2, TKey3> keys, TKey1 key1)
+		{
+			_keys = keys;
+			_key1 = key1;
+		}
+		public bool Contains(TKey2 key2, TKey3 key3)
+		{
+			return _keys.Contains(_key1, key2, key3);
+		}
+		public int Count
+		{
+			get
+			{
+				if(!_keys.IsFinite)
+				{
+					throw new Exception("Domain is not finite");
+				}
+				int count = 0;
+				foreach(var key in _keys)
+				{
+					if(comparer.Equals(key.Item1, _key1))
+					{
+						count++;
+					}
+				}
+				return count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return _keys.IsFinite;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return _keys.IsNumerable;
+			}
+		}
+		public IEnumerator<Tuple<TKey2, TKey3>> GetEnumerator()
+		{
+			foreach(var key in _keys)
+			{
+				if(comparer.Equals(key.Item1, _key1))
+				{
+					yield return new Tuple<TKey2, TKey3>(key.Item2, key.Item3);
+				}
+			}
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+	}
+}
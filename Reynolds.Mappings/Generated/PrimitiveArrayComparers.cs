@@ -0,0 +1,781 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class BooleanArrayEqualityComparer : IEqualityComparer<bool[]>, IComparer<bool[]>
+	{
+		protected BooleanArrayEqualityComparer()
+		{
+		}
+		public readonly static BooleanArrayEqualityComparer Instance = new BooleanArrayEqualityComparer();
+		public bool Equals(bool[] x, bool[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(bool[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(bool[] x, bool[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class ByteArrayEqualityComparer : IEqualityComparer<byte[]>, IComparer<byte[]>
+	{
+		protected ByteArrayEqualityComparer()
+		{
+		}
+		public readonly static ByteArrayEqualityComparer Instance = new ByteArrayEqualityComparer();
+		public bool Equals(byte[] x, byte[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(byte[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(byte[] x, byte[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class SByteArrayEqualityComparer : IEqualityComparer<sbyte[]>, IComparer<sbyte[]>
+	{
+		protected SByteArrayEqualityComparer()
+		{
+		}
+		public readonly static SByteArrayEqualityComparer Instance = new SByteArrayEqualityComparer();
+		public bool Equals(sbyte[] x, sbyte[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(sbyte[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(sbyte[] x, sbyte[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class Int16ArrayEqualityComparer : IEqualityComparer<short[]>, IComparer<short[]>
+	{
+		protected Int16ArrayEqualityComparer()
+		{
+		}
+		public readonly static Int16ArrayEqualityComparer Instance = new Int16ArrayEqualityComparer();
+		public bool Equals(short[] x, short[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(short[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(short[] x, short[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class UInt16ArrayEqualityComparer : IEqualityComparer<ushort[]>, IComparer<ushort[]>
+	{
+		protected UInt16ArrayEqualityComparer()
+		{
+		}
+		public readonly static UInt16ArrayEqualityComparer Instance = new UInt16ArrayEqualityComparer();
+		public bool Equals(ushort[] x, ushort[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(ushort[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(ushort[] x, ushort[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class CharArrayEqualityComparer : IEqualityComparer<char[]>, IComparer<char[]>
+	{
+		protected CharArrayEqualityComparer()
+		{
+		}
+		public readonly static CharArrayEqualityComparer Instance = new CharArrayEqualityComparer();
+		public bool Equals(char[] x, char[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(char[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(char[] x, char[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class Int32ArrayEqualityComparer : IEqualityComparer<int[]>, IComparer<int[]>
+	{
+		protected Int32ArrayEqualityComparer()
+		{
+		}
+		public readonly static Int32ArrayEqualityComparer Instance = new Int32ArrayEqualityComparer();
+		public bool Equals(int[] x, int[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(int[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i] * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(int[] x, int[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class UInt32ArrayEqualityComparer : IEqualityComparer<uint[]>, IComparer<uint[]>
+	{
+		protected UInt32ArrayEqualityComparer()
+		{
+		}
+		public readonly static UInt32ArrayEqualityComparer Instance = new UInt32ArrayEqualityComparer();
+		public bool Equals(uint[] x, uint[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(uint[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i] * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(uint[] x, uint[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class Int64ArrayEqualityComparer : IEqualityComparer<long[]>, IComparer<long[]>
+	{
+		protected Int64ArrayEqualityComparer()
+		{
+		}
+		public readonly static Int64ArrayEqualityComparer Instance = new Int64ArrayEqualityComparer();
+		public bool Equals(long[] x, long[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(long[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(long[] x, long[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class UInt64ArrayEqualityComparer : IEqualityComparer<ulong[]>, IComparer<ulong[]>
+	{
+		protected UInt64ArrayEqualityComparer()
+		{
+		}
+		public readonly static UInt64ArrayEqualityComparer Instance = new UInt64ArrayEqualityComparer();
+		public bool Equals(ulong[] x, ulong[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(x[k] != y[k])
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(ulong[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(ulong[] x, ulong[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class SingleArrayEqualityComparer : IEqualityComparer<float[]>, IComparer<float[]>
+	{
+		protected SingleArrayEqualityComparer()
+		{
+		}
+		public readonly static SingleArrayEqualityComparer Instance = new SingleArrayEqualityComparer();
+		public bool Equals(float[] x, float[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(!x[k].Equals(y[k]))
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(float[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(float[] x, float[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+	public class DoubleArrayEqualityComparer : IEqualityComparer<double[]>, IComparer<double[]>
+	{
+		protected DoubleArrayEqualityComparer()
+		{
+		}
+		public readonly static DoubleArrayEqualityComparer Instance = new DoubleArrayEqualityComparer();
+		public bool Equals(double[] x, double[] y)
+		{
+			if(x == y)
+			{
+				return true;
+			}
+			if(x == null || y == null || x.Length != y.Length)
+			{
+				return false;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(!x[k].Equals(y[k]))
+				{
+					return false;
+				}
+			}
+			return true;
+		}
+		public int GetHashCode(double[] array)
+		{
+			uint result = 374761393u + (uint) array.Length;
+			unchecked
+			{
+				for(int i = 0; i < array.Length; i++)
+				{
+					result += (uint) array[i].GetHashCode() * 3266489917u;
+					result = ((result << 17) | (result >> 15)) * 668265263u;
+				}
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		public int Compare(double[] x, double[] y)
+		{
+			if(x == y)
+			{
+				return 0;
+			}
+			int c;
+			if(0 != (c = x.Length.CompareTo(y.Length)))
+			{
+				return c;
+			}
+			for(int k = 0; k < x.Length; k++)
+			{
+				if(0 != (c = x[k].CompareTo(y[k])))
+				{
+					return c;
+				}
+			}
+			return 0;
+		}
+	}
+}
@@ -0,0 +1,265 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ShardedMapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		protected class Shard
+		{
+			internal readonly Dictionary<TKey, TValue> entries;
+			internal volatile KeyValuePair<TKey, TValue>[] snapshot;
+			internal Shard(IEqualityComparer<TKey> comparer)
+			{
+				entries = new Dictionary<TKey, TValue>(comparer);
+			}
+		}
+		protected readonly IEqualityComparer<TKey> _comparer;
+		protected readonly Shard[] _shards;
+		public ShardedMapping() : this(Environment.ProcessorCount)
+		{
+		}
+		public ShardedMapping(int shards) : this(shards, null)
+		{
+		}
+		public ShardedMapping(int shards, IEqualityComparer<TKey> comparer)
+		{
+			if(shards < 1)
+			{
+				throw new ArgumentOutOfRangeException("shards");
+			}
+			_comparer = comparer ?? EqualityComparer<TKey>.Default;
+			int count = 1;
+			while(count < shards)
+			{
+				count <<= 1;
+			}
+			_shards = new Shard[count];
+			for(int i = 0; i < count; i++)
+			{
+				_shards[i] = new Shard(_comparer);
+			}
+		}
+		public int ShardCount
+		{
+			get
+			{
+				return _shards.Length;
+			}
+		}
+		protected Shard GetShard(TKey innerKey)
+		{
+			int h = _comparer.GetHashCode(innerKey);
+			return _shards[(h ^ (h >> 16)) & (_shards.Length - 1)];
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				TKey innerKey = key;
+				var shard = GetShard(innerKey);
+				lock(shard)
+				{
+					return shard.entries[innerKey];
+				}
+			}
+			set
+			{
+				TKey innerKey = key;
+				var shard = GetShard(innerKey);
+				lock(shard)
+				{
+					shard.entries[innerKey] = value;
+					shard.snapshot = null;
+				}
+			}
+		}
+		public bool TryGetValue(TKey key, out TValue value)
+		{
+			TKey innerKey = key;
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				return shard.entries.TryGetValue(innerKey, out value);
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			TKey innerKey = key;
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				return shard.entries.ContainsKey(innerKey);
+			}
+		}
+		public void Add(TKey key, TValue value)
+		{
+			TKey innerKey = key;
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				shard.entries.Add(innerKey, value);
+				shard.snapshot = null;
+			}
+		}
+		public bool Remove(TKey key)
+		{
+			TKey innerKey = key;
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				if(!shard.entries.Remove(innerKey))
+				{
+					return false;
+				}
+				shard.snapshot = null;
+				return true;
+			}
+		}
+		public void Clear()
+		{
+			foreach(var shard in _shards)
+			{
+				lock(shard)
+				{
+					shard.entries.Clear();
+					shard.snapshot = null;
+				}
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				int count = 0;
+				foreach(var shard in _shards)
+				{
+					count += shard.entries.Count;
+				}
+				return count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		protected static KeyValuePair<TKey, TValue>[] Snapshot(Shard shard)
+		{
+			var snapshot = shard.snapshot;
+			if(snapshot == null)
+			{
+				lock(shard)
+				{
+					snapshot = shard.snapshot;
+					if(snapshot == null)
+					{
+						snapshot = new KeyValuePair<TKey, TValue>[shard.entries.Count];
+						((ICollection<KeyValuePair<TKey, TValue>>) shard.entries).CopyTo(snapshot, 0);
+						shard.snapshot = snapshot;
+					}
+				}
+			}
+			return snapshot;
+		}
+		public struct Enumerator : IEnumerator<KeyValueTuple<TKey, TValue>>, IEnumerator<IKeyValueTuple<TKey, TValue>>
+		{
+			readonly Shard[] _shards;
+			int _shard;
+			KeyValuePair<TKey, TValue>[] _snapshot;
+			int _index;
+			internal Enumerator(ShardedMapping<TKey, TValue> mapping)
+			{
+				_shards = mapping._shards;
+				_shard = -1;
+				_snapshot = null;
+				_index = -1;
+			}
+			public KeyValueTuple<TKey, TValue> Current
+			{
+				get
+				{
+					return new KeyValueTuple<TKey, TValue>(_snapshot[_index]);
+				}
+			}
+			IKeyValueTuple<TKey, TValue> IEnumerator<IKeyValueTuple<TKey, TValue>>.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			object IEnumerator.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			public bool MoveNext()
+			{
+				while(_snapshot == null || ++_index >= _snapshot.Length)
+				{
+					if(++_shard >= _shards.Length)
+					{
+						return false;
+					}
+					_snapshot = Snapshot(_shards[_shard]);
+					_index = -1;
+				}
+				return true;
+			}
+			public void Reset()
+			{
+				_shard = -1;
+				_snapshot = null;
+				_index = -1;
+			}
+			public void Dispose()
+			{
+			}
+		}
+		public Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> IMapping<TKey, TValue>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<IKeyValueTuple<TKey, TValue>> IEnumerable<IKeyValueTuple<TKey, TValue>>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			foreach(var shard in _shards)
+			{
+				foreach(var entry in Snapshot(shard))
+				{
+					yield return entry.Key;
+				}
+			}
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return ((IEnumerable<TKey>) this).GetEnumerator();
+		}
+	}
+}
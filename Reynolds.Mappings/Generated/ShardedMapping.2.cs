@@ -0,0 +1,265 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class ShardedMapping<TKey1, TKey2, TValue> : IMapping<TKey1, TKey2, TValue>
+	{
+		protected class Shard
+		{
+			internal readonly Dictionary<Tuple<TKey1, TKey2>, TValue> entries;
+			internal volatile KeyValuePair<Tuple<TKey1, TKey2>, TValue>[] snapshot;
+			internal Shard(IEqualityComparer<Tuple<TKey1, TKey2>> comparer)
+			{
+				entries = new Dictionary<Tuple<TKey1, TKey2>, TValue>(comparer);
+			}
+		}
+		protected readonly IEqualityComparer<Tuple<TKey1, TKey2>> _comparer;
+		protected readonly Shard[] _shards;
+		public ShardedMapping() : this(Environment.ProcessorCount)
+		{
+		}
+		public ShardedMapping(int shards) : this(shards, null, null)
+		{
+		}
+		public ShardedMapping(int shards, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2)
+		{
+			if(shards < 1)
+			{
+				throw new ArgumentOutOfRangeException("shards");
+			}
+			_comparer = new DictionaryMapping<TKey1, TKey2, TValue>.EqualityComparer(comparer1, comparer2);
+			int count = 1;
+			while(count < shards)
+			{
+				count <<= 1;
+			}
+			_shards = new Shard[count];
+			for(int i = 0; i < count; i++)
+			{
+				_shards[i] = new Shard(_comparer);
+			}
+		}
+		public int ShardCount
+		{
+			get
+			{
+				return _shards.Length;
+			}
+		}
+		protected Shard GetShard(Tuple<TKey1, TKey2> innerKey)
+		{
+			int h = _comparer.GetHashCode(innerKey);
+			return _shards[(h ^ (h >> 16)) & (_shards.Length - 1)];
+		}
+		public TValue this[TKey1 key1, TKey2 key2]
+		{
+			get
+			{
+				Tuple<TKey1, TKey2> innerKey = new Tuple<TKey1, TKey2>(key1, key2);
+				var shard = GetShard(innerKey);
+				lock(shard)
+				{
+					return shard.entries[innerKey];
+				}
+			}
+			set
+			{
+				Tuple<TKey1, TKey2> innerKey = new Tuple<TKey1, TKey2>(key1, key2);
+				var shard = GetShard(innerKey);
+				lock(shard)
+				{
+					shard.entries[innerKey] = value;
+					shard.snapshot = null;
+				}
+			}
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, out TValue value)
+		{
+			Tuple<TKey1, TKey2> innerKey = new Tuple<TKey1, TKey2>(key1, key2);
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				return shard.entries.TryGetValue(innerKey, out value);
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2)
+		{
+			Tuple<TKey1, TKey2> innerKey = new Tuple<TKey1, TKey2>(key1, key2);
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				return shard.entries.ContainsKey(innerKey);
+			}
+		}
+		public void Add(TKey1 key1, TKey2 key2, TValue value)
+		{
+			Tuple<TKey1, TKey2> innerKey = new Tuple<TKey1, TKey2>(key1, key2);
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				shard.entries.Add(innerKey, value);
+				shard.snapshot = null;
+			}
+		}
+		public bool Remove(TKey1 key1, TKey2 key2)
+		{
+			Tuple<TKey1, TKey2> innerKey = new Tuple<TKey1, TKey2>(key1, key2);
+			var shard = GetShard(innerKey);
+			lock(shard)
+			{
+				if(!shard.entries.Remove(innerKey))
+				{
+					return false;
+				}
+				shard.snapshot = null;
+				return true;
+			}
+		}
+		public void Clear()
+		{
+			foreach(var shard in _shards)
+			{
+				lock(shard)
+				{
+					shard.entries.Clear();
+					shard.snapshot = null;
+				}
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				int count = 0;
+				foreach(var shard in _shards)
+				{
+					count += shard.entries.Count;
+				}
+				return count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		protected static KeyValuePair<Tuple<TKey1, TKey2>, TValue>[] Snapshot(Shard shard)
+		{
+			var snapshot = shard.snapshot;
+			if(snapshot == null)
+			{
+				lock(shard)
+				{
+					snapshot = shard.snapshot;
+					if(snapshot == null)
+					{
+						snapshot = new KeyValuePair<Tuple<TKey1, TKey2>, TValue>[shard.entries.Count];
+						((ICollection<KeyValuePair<Tuple<TKey1, TKey2>, TValue>>) shard.entries).CopyTo(snapshot, 0);
+						shard.snapshot = snapshot;
+					}
+				}
+			}
+			return snapshot;
+		}
+		public struct Enumerator : IEnumerator<KeyValueTuple<TKey1, TKey2, TValue>>, IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>>
+		{
+			readonly Shard[] _shards;
+			int _shard;
+			KeyValuePair<Tuple<TKey1, TKey2>, TValue>[] _snapshot;
+			int _index;
+			internal Enumerator(ShardedMapping<TKey1, TKey2, TValue> mapping)
+			{
+				_shards = mapping._shards;
+				_shard = -1;
+				_snapshot = null;
+				_index = -1;
+			}
+			public KeyValueTuple<TKey1, TKey2, TValue> Current
+			{
+				get
+				{
+					return new KeyValueTuple<TKey1, TKey2, TValue>(_snapshot[_index]);
+				}
+			}
+			IKeyValueTuple<TKey1, TKey2, TValue> IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>>.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			object IEnumerator.Current
+			{
+				get
+				{
+					return Current;
+				}
+			}
+			public bool MoveNext()
+			{
+				while(_snapshot == null || ++_index >= _snapshot.Length)
+				{
+					if(++_shard >= _shards.Length)
+					{
+						return false;
+					}
+					_snapshot = Snapshot(_shards[_shard]);
+					_index = -1;
+				}
+				return true;
+			}
+			public void Reset()
+			{
+				_shard = -1;
+				_snapshot = null;
+				_index = -1;
+			}
+			public void Dispose()
+			{
+			}
+		}
+		public Enumerator GetEnumerator()
+		{
+			return new Enumerator(this);
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> IMapping<TKey1, TKey2, TValue>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> IEnumerable<IKeyValueTuple<TKey1, TKey2, TValue>>.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+		IEnumerator<Tuple<TKey1, TKey2>> IEnumerable<Tuple<TKey1, TKey2>>.GetEnumerator()
+		{
+			foreach(var shard in _shards)
+			{
+				foreach(var entry in Snapshot(shard))
+				{
+					yield return entry.Key;
+				}
+			}
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return ((IEnumerable<Tuple<TKey1, TKey2>>) this).GetEnumerator();
+		}
+	}
+}
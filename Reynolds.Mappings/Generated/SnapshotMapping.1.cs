@@ -0,0 +1,230 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class SnapshotMapping<TKey, TValue> : IMapping<TKey, TValue>, IDisposable where TKey : struct where TValue : struct
+	{
+		static readonly int KeyOffset = 0;
+		static readonly int ValueOffset = KeyOffset + SnapshotFile.SizeOf(typeof(TKey));
+		static readonly int RecordSize = ValueOffset + SnapshotFile.SizeOf(typeof(TValue));
+		static readonly long Stamp = SnapshotFile.Stamp(typeof(TKey), typeof(TValue));
+		readonly MemoryMappedFile _file;
+		readonly MemoryMappedViewAccessor _view;
+		volatile bool _disposed;
+		readonly int _count;
+		readonly int _mask;
+		readonly long _records;
+		public SnapshotMapping(string path)
+		{
+			_file = SnapshotFile.OpenRead(path);
+			try
+			{
+				_view = _file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+				int buckets;
+				SnapshotFile.ReadHeader(_view, 1, RecordSize, Stamp, out _count, out buckets);
+				_mask = buckets - 1;
+				_records = SnapshotFile.Slot(buckets);
+			}
+			catch
+			{
+				Dispose();
+				throw;
+			}
+		}
+		public static void Write(string path, IMapping<TKey, TValue> mapping)
+		{
+			int count = mapping.Count;
+			int buckets = SnapshotFile.Buckets(count);
+			long records = SnapshotFile.Slot(buckets);
+			var written = path + ".tmp";
+			try
+			{
+				using(var file = SnapshotFile.Create(written, SnapshotFile.Length(RecordSize, count, buckets)))
+				{
+					using(var view = file.CreateViewAccessor())
+					{
+						SnapshotFile.WriteHeader(view, 1, RecordSize, count, buckets, Stamp);
+						int index = 0;
+						foreach(var entry in mapping)
+						{
+							if(index == count)
+							{
+								throw new InvalidOperationException("The mapping changed while it was written");
+							}
+							long record = records + (long) index * RecordSize;
+							TKey key = entry.Key;
+							view.Write(record + KeyOffset, ref key);
+							TValue value = entry.Value;
+							view.Write(record + ValueOffset, ref value);
+							int hash = Hash(key);
+							int slot = hash & (buckets - 1);
+							while(view.ReadInt32(SnapshotFile.Slot(slot) + 4) != 0)
+							{
+								slot = (slot + 1) & (buckets - 1);
+							}
+							view.Write(SnapshotFile.Slot(slot), hash);
+							view.Write(SnapshotFile.Slot(slot) + 4, ++index);
+						}
+						if(index != count)
+						{
+							throw new InvalidOperationException("The mapping changed while it was written");
+						}
+					}
+				}
+				SnapshotFile.Replace(written, path);
+			}
+			catch
+			{
+				SnapshotFile.Discard(written);
+				throw;
+			}
+		}
+		static int Hash(TKey key)
+		{
+			uint result = 374761393u + 1u;
+			unchecked
+			{
+				result += (uint) EqualityComparer<TKey>.Default.GetHashCode(key) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		T Read<T>(long position) where T : struct
+		{
+			T value;
+			_view.Read(position, out value);
+			return value;
+		}
+		long Find(TKey key)
+		{
+			CheckDisposed();
+			int hash = Hash(key);
+			bool acquired = false;
+			try
+			{
+				IntPtr view = SnapshotFile.Acquire(_view, ref acquired);
+				for(int slot = hash & _mask; ; slot = (slot + 1) & _mask)
+				{
+					int index = SnapshotFile.SlotRecord(view, slot);
+					if(index == 0)
+					{
+						return -1;
+					}
+					if(SnapshotFile.SlotHash(view, slot) != hash)
+					{
+						continue;
+					}
+					long record = _records + (long) (index - 1) * RecordSize;
+					if(EqualityComparer<TKey>.Default.Equals(Read<TKey>(record + KeyOffset), key))
+					{
+						return record;
+					}
+				}
+			}
+			finally
+			{
+				if(acquired)
+				{
+					SnapshotFile.Release(_view);
+				}
+			}
+		}
+		void CheckDisposed()
+		{
+			if(_disposed)
+			{
+				throw new ObjectDisposedException(GetType().Name);
+			}
+		}
+		public bool TryGetValue(TKey key, out TValue value)
+		{
+			long record = Find(key);
+			if(record < 0)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = Read<TValue>(record + ValueOffset);
+			return true;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				long record = Find(key);
+				if(record < 0)
+				{
+					throw new KeyNotFoundException();
+				}
+				return Read<TValue>(record + ValueOffset);
+			}
+		}
+		public bool Contains(TKey key)
+		{
+			return Find(key) >= 0;
+		}
+		public int Count
+		{
+			get
+			{
+				return _count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			for(long record = _records; record < _records + (long) _count * RecordSize; record += RecordSize)
+			{
+				CheckDisposed();
+				yield return new KeyValueTuple<TKey, TValue>(new KeyValuePair<TKey, TValue>(Read<TKey>(record + KeyOffset), Read<TValue>(record + ValueOffset)));
+			}
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			for(long record = _records; record < _records + (long) _count * RecordSize; record += RecordSize)
+			{
+				CheckDisposed();
+				yield return Read<TKey>(record + KeyOffset);
+			}
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return ((IEnumerable<TKey>) this).GetEnumerator();
+		}
+		public void Dispose()
+		{
+			_disposed = true;
+			if(_view != null)
+			{
+				_view.Dispose();
+			}
+			_file.Dispose();
+		}
+	}
+}
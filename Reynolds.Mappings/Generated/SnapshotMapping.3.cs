@@ -0,0 +1,240 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class SnapshotMapping<TKey1, TKey2, TKey3, TValue> : IMapping<TKey1, TKey2, TKey3, TValue>, IDisposable where TKey1 : struct where TKey2 : struct where TKey3 : struct where TValue : struct
+	{
+		static readonly int Key1Offset = 0;
+		static readonly int Key2Offset = Key1Offset + SnapshotFile.SizeOf(typeof(TKey1));
+		static readonly int Key3Offset = Key2Offset + SnapshotFile.SizeOf(typeof(TKey2));
+		static readonly int ValueOffset = Key3Offset + SnapshotFile.SizeOf(typeof(TKey3));
+		static readonly int RecordSize = ValueOffset + SnapshotFile.SizeOf(typeof(TValue));
+		static readonly long Stamp = SnapshotFile.Stamp(typeof(TKey1), typeof(TKey2), typeof(TKey3), typeof(TValue));
+		readonly MemoryMappedFile _file;
+		readonly MemoryMappedViewAccessor _view;
+		volatile bool _disposed;
+		readonly int _count;
+		readonly int _mask;
+		readonly long _records;
+		public SnapshotMapping(string path)
+		{
+			_file = SnapshotFile.OpenRead(path);
+			try
+			{
+				_view = _file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+				int buckets;
+				SnapshotFile.ReadHeader(_view, 3, RecordSize, Stamp, out _count, out buckets);
+				_mask = buckets - 1;
+				_records = SnapshotFile.Slot(buckets);
+			}
+			catch
+			{
+				Dispose();
+				throw;
+			}
+		}
+		public static void Write(string path, IMapping<TKey1, TKey2, TKey3, TValue> mapping)
+		{
+			int count = mapping.Count;
+			int buckets = SnapshotFile.Buckets(count);
+			long records = SnapshotFile.Slot(buckets);
+			var written = path + ".tmp";
+			try
+			{
+				using(var file = SnapshotFile.Create(written, SnapshotFile.Length(RecordSize, count, buckets)))
+				{
+					using(var view = file.CreateViewAccessor())
+					{
+						SnapshotFile.WriteHeader(view, 3, RecordSize, count, buckets, Stamp);
+						int index = 0;
+						foreach(var entry in mapping)
+						{
+							if(index == count)
+							{
+								throw new InvalidOperationException("The mapping changed while it was written");
+							}
+							long record = records + (long) index * RecordSize;
+							TKey1 key1 = entry.Key1;
+							view.Write(record + Key1Offset, ref key1);
+							TKey2 key2 = entry.Key2;
+							view.Write(record + Key2Offset, ref key2);
+							TKey3 key3 = entry.Key3;
+							view.Write(record + Key3Offset, ref key3);
+							TValue value = entry.Value;
+							view.Write(record + ValueOffset, ref value);
+							int hash = Hash(key1, key2, key3);
+							int slot = hash & (buckets - 1);
+							while(view.ReadInt32(SnapshotFile.Slot(slot) + 4) != 0)
+							{
+								slot = (slot + 1) & (buckets - 1);
+							}
+							view.Write(SnapshotFile.Slot(slot), hash);
+							view.Write(SnapshotFile.Slot(slot) + 4, ++index);
+						}
+						if(index != count)
+						{
+							throw new InvalidOperationException("The mapping changed while it was written");
+						}
+					}
+				}
+				SnapshotFile.Replace(written, path);
+			}
+			catch
+			{
+				SnapshotFile.Discard(written);
+				throw;
+			}
+		}
+		static int Hash(TKey1 key1, TKey2 key2, TKey3 key3)
+		{
+			uint result = 374761393u + 3u;
+			unchecked
+			{
+				result += (uint) EqualityComparer<TKey1>.Default.GetHashCode(key1) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result += (uint) EqualityComparer<TKey2>.Default.GetHashCode(key2) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result += (uint) EqualityComparer<TKey3>.Default.GetHashCode(key3) * 3266489917u;
+				result = ((result << 17) | (result >> 15)) * 668265263u;
+				result ^= result >> 15;
+				result *= 2246822519u;
+				result ^= result >> 13;
+				result *= 3266489917u;
+				result ^= result >> 16;
+				return (int) result;
+			}
+		}
+		T Read<T>(long position) where T : struct
+		{
+			T value;
+			_view.Read(position, out value);
+			return value;
+		}
+		long Find(TKey1 key1, TKey2 key2, TKey3 key3)
+		{
+			CheckDisposed();
+			int hash = Hash(key1, key2, key3);
+			bool acquired = false;
+			try
+			{
+				IntPtr view = SnapshotFile.Acquire(_view, ref acquired);
+				for(int slot = hash & _mask; ; slot = (slot + 1) & _mask)
+				{
+					int index = SnapshotFile.SlotRecord(view, slot);
+					if(index == 0)
+					{
+						return -1;
+					}
+					if(SnapshotFile.SlotHash(view, slot) != hash)
+					{
+						continue;
+					}
+					long record = _records + (long) (index - 1) * RecordSize;
+					if(EqualityComparer<TKey1>.Default.Equals(Read<TKey1>(record + Key1Offset), key1) && EqualityComparer<TKey2>.Default.Equals(Read<TKey2>(record + Key2Offset), key2) && EqualityComparer<TKey3>.Default.Equals(Read<TKey3>(record + Key3Offset), key3))
+					{
+						return record;
+					}
+				}
+			}
+			finally
+			{
+				if(acquired)
+				{
+					SnapshotFile.Release(_view);
+				}
+			}
+		}
+		void CheckDisposed()
+		{
+			if(_disposed)
+			{
+				throw new ObjectDisposedException(GetType().Name);
+			}
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, TKey3 key3, out TValue value)
+		{
+			long record = Find(key1, key2, key3);
+			if(record < 0)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = Read<TValue>(record + ValueOffset);
+			return true;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3]
+		{
+			get
+			{
+				long record = Find(key1, key2, key3);
+				if(record < 0)
+				{
+					throw new KeyNotFoundException();
+				}
+				return Read<TValue>(record + ValueOffset);
+			}
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3)
+		{
+			return Find(key1, key2, key3) >= 0;
+		}
+		public int Count
+		{
+			get
+			{
+				return _count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TValue>> GetEnumerator()
+		{
+			for(long record = _records; record < _records + (long) _count * RecordSize; record += RecordSize)
+			{
+				CheckDisposed();
+				yield return new KeyValueTuple<TKey1, TKey2, TKey3, TValue>(new KeyValuePair<Tuple<TKey1, TKey2, TKey3>, TValue>(new Tuple<TKey1, TKey2, TKey3>(Read<TKey1>(record + Key1Offset), Read<TKey2>(record + Key2Offset), Read<TKey3>(record + Key3Offset)), Read<TValue>(record + ValueOffset)));
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3>> IEnumerable<Tuple<TKey1, TKey2, TKey3>>.GetEnumerator()
+		{
+			for(long record = _records; record < _records + (long) _count * RecordSize; record += RecordSize)
+			{
+				CheckDisposed();
+				yield return new Tuple<TKey1, TKey2, TKey3>(Read<TKey1>(record + Key1Offset), Read<TKey2>(record + Key2Offset), Read<TKey3>(record + Key3Offset));
+			}
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return ((IEnumerable<Tuple<TKey1, TKey2, TKey3>>) this).GetEnumerator();
+		}
+		public void Dispose()
+		{
+			_disposed = true;
+			if(_view != null)
+			{
+				_view.Dispose();
+			}
+			_file.Dispose();
+		}
+	}
+}
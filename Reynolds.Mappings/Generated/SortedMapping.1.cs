@@ -0,0 +1,133 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class SortedMapping<TKey, TValue> : IMapping<TKey, TValue>
+	{
+		protected SkipList<TKey, TValue> _inner;
+		public SortedMapping() : this((IComparer<TKey>) null)
+		{
+		}
+		public SortedMapping(IComparer<TKey> comparer)
+		{
+			_inner = new SkipList<TKey, TValue>(comparer);
+		}
+		public bool ContainsKey(TKey key)
+		{
+			return _inner.ContainsKey(key);
+		}
+		public bool Contains(TKey key)
+		{
+			return _inner.ContainsKey(key);
+		}
+		public bool TryGetValue(TKey key, out TValue value)
+		{
+			return _inner.TryGetValue(key, out value);
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				TValue value;
+				if(!_inner.TryGetValue(key, out value))
+				{
+					throw new KeyNotFoundException();
+				}
+				return value;
+			}
+			set
+			{
+				_inner.Set(key, value, false);
+			}
+		}
+		public void Add(TKey key, TValue value)
+		{
+			_inner.Set(key, value, true);
+		}
+		public bool Remove(TKey key)
+		{
+			return _inner.Remove(key);
+		}
+		public void Clear()
+		{
+			_inner.Clear();
+		}
+		public int Count
+		{
+			get
+			{
+				return _inner.Count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool TryGetFloor(TKey key, out KeyValueTuple<TKey, TValue> entry)
+		{
+			KeyValuePair<TKey, TValue> found;
+			bool result = _inner.TryGetFloor(key, out found);
+			entry = new KeyValueTuple<TKey, TValue>(found);
+			return result;
+		}
+		public bool TryGetCeiling(TKey key, out KeyValueTuple<TKey, TValue> entry)
+		{
+			KeyValuePair<TKey, TValue> found;
+			bool result = _inner.TryGetCeiling(key, out found);
+			entry = new KeyValueTuple<TKey, TValue>(found);
+			return result;
+		}
+		public IEnumerable<KeyValueTuple<TKey, TValue>> Range(TKey from, TKey to)
+		{
+			var comparer = _inner.Comparer;
+			return Tuples(_inner.Range(key => comparer.Compare(key, from) < 0 ? -1 : comparer.Compare(key, to) < 0 ? 0 : 1));
+		}
+		static IEnumerable<KeyValueTuple<TKey, TValue>> Tuples(IEnumerable<KeyValuePair<TKey, TValue>> entries)
+		{
+			foreach(var entry in entries)
+			{
+				yield return new KeyValueTuple<TKey, TValue>(entry);
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			foreach(var entry in _inner)
+			{
+				yield return new KeyValueTuple<TKey, TValue>(entry);
+			}
+		}
+		IEnumerator<TKey> EnumerateKeys()
+		{
+			foreach(var entry in _inner)
+			{
+				yield return entry.Key;
+			}
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			return EnumerateKeys();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return EnumerateKeys();
+		}
+	}
+}
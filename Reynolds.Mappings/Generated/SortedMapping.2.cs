@@ -0,0 +1,157 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class SortedMapping<TKey1, TKey2, TValue> : IMapping<TKey1, TKey2, TValue>
+	{
+		protected internal class KeyComparer : IComparer<Tuple<TKey1, TKey2>>
+		{
+			internal readonly IComparer<TKey1> comparer1;
+			internal readonly IComparer<TKey2> comparer2;
+			public KeyComparer(IComparer<TKey1> comparer1, IComparer<TKey2> comparer2)
+			{
+				this.comparer1 = comparer1 ?? Comparer<TKey1>.Default;
+				this.comparer2 = comparer2 ?? Comparer<TKey2>.Default;
+			}
+			public int Compare(Tuple<TKey1, TKey2> a, Tuple<TKey1, TKey2> b)
+			{
+				int result;
+				if((result = comparer1.Compare(a.Item1, b.Item1)) != 0)
+				{
+					return result;
+				}
+				return comparer2.Compare(a.Item2, b.Item2);
+			}
+		}
+		protected SkipList<Tuple<TKey1, TKey2>, TValue> _inner;
+		public SortedMapping() : this(null, null)
+		{
+		}
+		public SortedMapping(IComparer<TKey1> comparer1, IComparer<TKey2> comparer2)
+		{
+			_inner = new SkipList<Tuple<TKey1, TKey2>, TValue>(new KeyComparer(comparer1, comparer2));
+		}
+		public bool ContainsKey(TKey1 key1, TKey2 key2)
+		{
+			return _inner.ContainsKey(new Tuple<TKey1, TKey2>(key1, key2));
+		}
+		public bool Contains(TKey1 key1, TKey2 key2)
+		{
+			return _inner.ContainsKey(new Tuple<TKey1, TKey2>(key1, key2));
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, out TValue value)
+		{
+			return _inner.TryGetValue(new Tuple<TKey1, TKey2>(key1, key2), out value);
+		}
+		public TValue this[TKey1 key1, TKey2 key2]
+		{
+			get
+			{
+				TValue value;
+				if(!_inner.TryGetValue(new Tuple<TKey1, TKey2>(key1, key2), out value))
+				{
+					throw new KeyNotFoundException();
+				}
+				return value;
+			}
+			set
+			{
+				_inner.Set(new Tuple<TKey1, TKey2>(key1, key2), value, false);
+			}
+		}
+		public void Add(TKey1 key1, TKey2 key2, TValue value)
+		{
+			_inner.Set(new Tuple<TKey1, TKey2>(key1, key2), value, true);
+		}
+		public bool Remove(TKey1 key1, TKey2 key2)
+		{
+			return _inner.Remove(new Tuple<TKey1, TKey2>(key1, key2));
+		}
+		public void Clear()
+		{
+			_inner.Clear();
+		}
+		public int Count
+		{
+			get
+			{
+				return _inner.Count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool TryGetFloor(TKey1 key1, TKey2 key2, out KeyValueTuple<TKey1, TKey2, TValue> entry)
+		{
+			KeyValuePair<Tuple<TKey1, TKey2>, TValue> found;
+			bool result = _inner.TryGetFloor(new Tuple<TKey1, TKey2>(key1, key2), out found);
+			entry = new KeyValueTuple<TKey1, TKey2, TValue>(found);
+			return result;
+		}
+		public bool TryGetCeiling(TKey1 key1, TKey2 key2, out KeyValueTuple<TKey1, TKey2, TValue> entry)
+		{
+			KeyValuePair<Tuple<TKey1, TKey2>, TValue> found;
+			bool result = _inner.TryGetCeiling(new Tuple<TKey1, TKey2>(key1, key2), out found);
+			entry = new KeyValueTuple<TKey1, TKey2, TValue>(found);
+			return result;
+		}
+		public IEnumerable<KeyValueTuple<TKey1, TKey2, TValue>> Range(Tuple<TKey1, TKey2> from, Tuple<TKey1, TKey2> to)
+		{
+			var comparer = _inner.Comparer;
+			return Tuples(_inner.Range(key => comparer.Compare(key, from) < 0 ? -1 : comparer.Compare(key, to) < 0 ? 0 : 1));
+		}
+		public IEnumerable<KeyValueTuple<TKey1, TKey2, TValue>> RangeByKey1(TKey1 from, TKey1 to)
+		{
+			var comparer = ((KeyComparer) _inner.Comparer).comparer1;
+			return Tuples(_inner.Range(key => comparer.Compare(key.Item1, from) < 0 ? -1 : comparer.Compare(key.Item1, to) < 0 ? 0 : 1));
+		}
+		static IEnumerable<KeyValueTuple<TKey1, TKey2, TValue>> Tuples(IEnumerable<KeyValuePair<Tuple<TKey1, TKey2>, TValue>> entries)
+		{
+			foreach(var entry in entries)
+			{
+				yield return new KeyValueTuple<TKey1, TKey2, TValue>(entry);
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TValue>> GetEnumerator()
+		{
+			foreach(var entry in _inner)
+			{
+				yield return new KeyValueTuple<TKey1, TKey2, TValue>(entry);
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2>> EnumerateKeys()
+		{
+			foreach(var entry in _inner)
+			{
+				yield return entry.Key;
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2>> IEnumerable<Tuple<TKey1, TKey2>>.GetEnumerator()
+		{
+			return EnumerateKeys();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return EnumerateKeys();
+		}
+	}
+}
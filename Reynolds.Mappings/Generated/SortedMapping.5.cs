@@ -0,0 +1,175 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class SortedMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> : IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>
+	{
+		protected internal class KeyComparer : IComparer<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>
+		{
+			internal readonly IComparer<TKey1> comparer1;
+			internal readonly IComparer<TKey2> comparer2;
+			internal readonly IComparer<TKey3> comparer3;
+			internal readonly IComparer<TKey4> comparer4;
+			internal readonly IComparer<TKey5> comparer5;
+			public KeyComparer(IComparer<TKey1> comparer1, IComparer<TKey2> comparer2, IComparer<TKey3> comparer3, IComparer<TKey4> comparer4, IComparer<TKey5> comparer5)
+			{
+				this.comparer1 = comparer1 ?? Comparer<TKey1>.Default;
+				this.comparer2 = comparer2 ?? Comparer<TKey2>.Default;
+				this.comparer3 = comparer3 ?? Comparer<TKey3>.Default;
+				this.comparer4 = comparer4 ?? Comparer<TKey4>.Default;
+				this.comparer5 = comparer5 ?? Comparer<TKey5>.Default;
+			}
+			public int Compare(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> a, Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> b)
+			{
+				int result;
+				if((result = comparer1.Compare(a.Item1, b.Item1)) != 0)
+				{
+					return result;
+				}
+				if((result = comparer2.Compare(a.Item2, b.Item2)) != 0)
+				{
+					return result;
+				}
+				if((result = comparer3.Compare(a.Item3, b.Item3)) != 0)
+				{
+					return result;
+				}
+				if((result = comparer4.Compare(a.Item4, b.Item4)) != 0)
+				{
+					return result;
+				}
+				return comparer5.Compare(a.Item5, b.Item5);
+			}
+		}
+		protected SkipList<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> _inner;
+		public SortedMapping() : this(null, null, null, null, null)
+		{
+		}
+		public SortedMapping(IComparer<TKey1> comparer1, IComparer<TKey2> comparer2, IComparer<TKey3> comparer3, IComparer<TKey4> comparer4, IComparer<TKey5> comparer5)
+		{
+			_inner = new SkipList<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>(new KeyComparer(comparer1, comparer2, comparer3, comparer4, comparer5));
+		}
+		public bool ContainsKey(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			return _inner.ContainsKey(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5));
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			return _inner.ContainsKey(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5));
+		}
+		public bool TryGetValue(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out TValue value)
+		{
+			return _inner.TryGetValue(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out value);
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5]
+		{
+			get
+			{
+				TValue value;
+				if(!_inner.TryGetValue(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out value))
+				{
+					throw new KeyNotFoundException();
+				}
+				return value;
+			}
+			set
+			{
+				_inner.Set(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), value, false);
+			}
+		}
+		public void Add(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, TValue value)
+		{
+			_inner.Set(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), value, true);
+		}
+		public bool Remove(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			return _inner.Remove(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5));
+		}
+		public void Clear()
+		{
+			_inner.Clear();
+		}
+		public int Count
+		{
+			get
+			{
+				return _inner.Count;
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return true;
+			}
+		}
+		public bool TryGetFloor(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> entry)
+		{
+			KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> found;
+			bool result = _inner.TryGetFloor(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out found);
+			entry = new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>(found);
+			return result;
+		}
+		public bool TryGetCeiling(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> entry)
+		{
+			KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> found;
+			bool result = _inner.TryGetCeiling(new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5), out found);
+			entry = new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>(found);
+			return result;
+		}
+		public IEnumerable<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> Range(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> from, Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> to)
+		{
+			var comparer = _inner.Comparer;
+			return Tuples(_inner.Range(key => comparer.Compare(key, from) < 0 ? -1 : comparer.Compare(key, to) < 0 ? 0 : 1));
+		}
+		public IEnumerable<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> RangeByKey1(TKey1 from, TKey1 to)
+		{
+			var comparer = ((KeyComparer) _inner.Comparer).comparer1;
+			return Tuples(_inner.Range(key => comparer.Compare(key.Item1, from) < 0 ? -1 : comparer.Compare(key.Item1, to) < 0 ? 0 : 1));
+		}
+		static IEnumerable<KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> Tuples(IEnumerable<KeyValuePair<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>> entries)
+		{
+			foreach(var entry in entries)
+			{
+				yield return new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>(entry);
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> GetEnumerator()
+		{
+			foreach(var entry in _inner)
+			{
+				yield return new KeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>(entry);
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> EnumerateKeys()
+		{
+			foreach(var entry in _inner)
+			{
+				yield return entry.Key;
+			}
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>.GetEnumerator()
+		{
+			return EnumerateKeys();
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			return EnumerateKeys();
+		}
+	}
+}
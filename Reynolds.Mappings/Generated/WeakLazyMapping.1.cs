@@ -0,0 +1,420 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class WeakLazyMapping<TKey, TValue> : WeakMapping, IMapping<TKey, TValue> where TValue : class
+	{
+		public delegate TValue InstantiateDelegate(TKey key);
+		public delegate TValue[] InstantiateManyDelegate(IList<TKey> keys);
+		public delegate bool ContainsDelegate(TKey key);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected IEqualityComparer<TKey> _comparer;
+		protected Dictionary<TKey, WeakReference>[] _stripes;
+		protected Dictionary<TKey, EvictionNode<TKey, TValue>>[] _strong;
+		protected LruEvictionPolicy<TKey, TValue>[] _recency;
+		protected int _strongCapacity;
+		List<TKey> _dead = new List<TKey>();
+		int _cleanupStripe;
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null) : this(instantiator, contains, 0)
+		{
+		}
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey> comparer) : this(instantiator, contains, 0, comparer)
+		{
+		}
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, int strongCapacity)
+		{
+			_comparer = EqualityComparer<TKey>.Default;
+			_instantiator = instantiator;
+			_contains = contains;
+			CreateStripes(strongCapacity);
+			AddToCleanupList(this);
+		}
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, int strongCapacity, IEqualityComparer<TKey> comparer)
+		{
+			_comparer = comparer ?? EqualityComparer<TKey>.Default;
+			_instantiator = instantiator;
+			_contains = contains;
+			CreateStripes(strongCapacity);
+			AddToCleanupList(this);
+		}
+		void CreateStripes(int strongCapacity)
+		{
+			if(strongCapacity < 0)
+			{
+				throw new ArgumentOutOfRangeException("strongCapacity");
+			}
+			_stripes = new Dictionary<TKey, WeakReference>[16];
+			for(int i = 0; i < _stripes.Length; i++)
+			{
+				_stripes[i] = new Dictionary<TKey, WeakReference>(_comparer);
+			}
+			if(strongCapacity > 0)
+			{
+				_strongCapacity = (strongCapacity + _stripes.Length - 1) / _stripes.Length;
+				_strong = new Dictionary<TKey, EvictionNode<TKey, TValue>>[_stripes.Length];
+				_recency = new LruEvictionPolicy<TKey, TValue>[_stripes.Length];
+				for(int i = 0; i < _stripes.Length; i++)
+				{
+					_strong[i] = new Dictionary<TKey, EvictionNode<TKey, TValue>>(_strongCapacity, _comparer);
+					_recency[i] = new LruEvictionPolicy<TKey, TValue>();
+				}
+			}
+		}
+		public int StrongCapacity
+		{
+			get
+			{
+				return _strong == null ? 0 : _strongCapacity * _stripes.Length;
+			}
+		}
+		protected bool TryGetStrong(int s, TKey innerKey, out TValue value)
+		{
+			if(_strong != null)
+			{
+				EvictionNode<TKey, TValue> node;
+				if(_strong[s].TryGetValue(innerKey, out node))
+				{
+					_recency[s].Accessed(node);
+					value = node.Value;
+					return true;
+				}
+			}
+			value = null;
+			return false;
+		}
+		protected void Retain(int s, TKey innerKey, TValue value, bool promoted)
+		{
+			if(_strong == null)
+			{
+				return;
+			}
+			var strong = _strong[s];
+			EvictionNode<TKey, TValue> node;
+			if(strong.TryGetValue(innerKey, out node))
+			{
+				node.Value = value;
+				_recency[s].Accessed(node);
+				return;
+			}
+			var statistics = Statistics;
+			if(strong.Count >= _strongCapacity)
+			{
+				node = _recency[s].Evict();
+				strong.Remove(node.Key);
+				if(statistics != null)
+				{
+					statistics.RecordDemotion();
+				}
+			}
+			else
+			{
+				node = new EvictionNode<TKey, TValue>();
+			}
+			node.Key = innerKey;
+			node.Value = value;
+			strong.Add(innerKey, node);
+			_recency[s].Added(node);
+			if(promoted && statistics != null)
+			{
+				statistics.RecordPromotion();
+			}
+		}
+		protected int GetStripeIndex(TKey innerKey)
+		{
+			int h = _comparer.GetHashCode(innerKey);
+			return (h ^ (h >> 16)) & 15;
+		}
+		protected Dictionary<TKey, WeakReference> GetStripe(TKey innerKey)
+		{
+			return _stripes[GetStripeIndex(innerKey)];
+		}
+		protected override bool CleanupBatch()
+		{
+			var stripe = _stripes[_cleanupStripe];
+			lock(stripe)
+			{
+				foreach(var kv in stripe)
+				{
+					if(!kv.Value.IsAlive)
+					{
+						_dead.Add(kv.Key);
+					}
+				}
+				foreach(var key in _dead)
+				{
+					stripe.Remove(key);
+				}
+			}
+			var statistics = Statistics;
+			if(statistics != null && _dead.Count > 0)
+			{
+				statistics.RecordRemovals(_dead.Count);
+			}
+			_dead.Clear();
+			_cleanupStripe = (_cleanupStripe + 1) % _stripes.Length;
+			return _cleanupStripe == 0;
+		}
+		public bool Contains(TKey key)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<TKey> IEnumerable<TKey>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected TValue Instantiate(TKey key)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey key]
+		{
+			get
+			{
+				WeakReference r;
+				TValue v;
+				TKey innerKey = key;
+				int s = GetStripeIndex(innerKey);
+				var stripe = _stripes[s];
+				var statistics = Statistics;
+				lock(stripe)
+				{
+					if(TryGetStrong(s, innerKey, out v))
+					{
+						if(statistics != null)
+						{
+							statistics.RecordHit();
+						}
+						return v;
+					}
+					if(stripe.TryGetValue(innerKey, out r))
+					{
+						if((v = r.Target as TValue) != null)
+						{
+							if(statistics != null)
+							{
+								statistics.RecordHit();
+							}
+							Retain(s, innerKey, v, true);
+							return v;
+						}
+						NoteDeadReference();
+						if(statistics != null)
+						{
+							statistics.RecordResurrection();
+						}
+					}
+				}
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				v = Instantiate(key);
+				lock(stripe)
+				{
+					TValue existing;
+					if(stripe.TryGetValue(innerKey, out r) && (existing = r.Target as TValue) != null)
+					{
+						Retain(s, innerKey, existing, true);
+						return existing;
+					}
+					stripe[innerKey] = new WeakReference(v);
+					Retain(s, innerKey, v, false);
+				}
+				return v;
+			}
+		}
+		public bool TryGetExisting(TKey key, out TValue value)
+		{
+			WeakReference r;
+			TKey innerKey = key;
+			var stripe = GetStripe(innerKey);
+			lock(stripe)
+			{
+				if(stripe.TryGetValue(innerKey, out r))
+				{
+					value = r.Target as TValue;
+					return value != null;
+				}
+				value = null;
+				return false;
+			}
+		}
+		public TValue[] GetMany(IList<TKey> keys)
+		{
+			return GetMany(keys, null);
+		}
+		public TValue[] GetMany(IList<TKey> keys, InstantiateManyDelegate instantiateMany)
+		{
+			var values = new TValue[keys.Count];
+			var stripeOf = new int[keys.Count];
+			var perStripe = new int[_stripes.Length];
+			for(int i = 0; i < stripeOf.Length; i++)
+			{
+				perStripe[stripeOf[i] = GetStripeIndex(keys[i])]++;
+			}
+			List<int> misses = null;
+			WeakReference r;
+			var statistics = Statistics;
+			for(int s = 0; s < _stripes.Length; s++)
+			{
+				if(perStripe[s] == 0)
+				{
+					continue;
+				}
+				perStripe[s] = 0;
+				var stripe = _stripes[s];
+				lock(stripe)
+				{
+					for(int i = 0; i < stripeOf.Length; i++)
+					{
+						if(stripeOf[i] != s)
+						{
+							continue;
+						}
+						if(TryGetStrong(s, keys[i], out values[i]))
+						{
+							continue;
+						}
+						if(stripe.TryGetValue(keys[i], out r))
+						{
+							if((values[i] = r.Target as TValue) != null)
+							{
+								Retain(s, keys[i], values[i], true);
+								continue;
+							}
+							NoteDeadReference();
+							if(statistics != null)
+							{
+								statistics.RecordResurrection();
+							}
+						}
+						(misses ?? (misses = new List<int>())).Add(i);
+						perStripe[s]++;
+					}
+				}
+			}
+			if(statistics != null)
+			{
+				statistics.RecordHits(values.Length - (misses == null ? 0 : misses.Count));
+			}
+			if(misses != null)
+			{
+				if(statistics != null)
+				{
+					statistics.RecordMisses(misses.Count);
+				}
+				var created = new Dictionary<TKey, TValue>(_comparer);
+				if(instantiateMany == null)
+				{
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], Instantiate(keys[i]));
+						}
+					}
+				}
+				else
+				{
+					var missing = new List<TKey>();
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], default(TValue));
+							missing.Add(keys[i]);
+						}
+					}
+					var instantiated = instantiateMany(missing);
+					if(instantiated == null || instantiated.Length != missing.Count)
+					{
+						throw new InvalidOperationException("The batch instantiator must return one value per key");
+					}
+					for(int j = 0; j < missing.Count; j++)
+					{
+						created[missing[j]] = instantiated[j];
+					}
+				}
+				for(int s = 0; s < _stripes.Length; s++)
+				{
+					if(perStripe[s] == 0)
+					{
+						continue;
+					}
+					var stripe = _stripes[s];
+					lock(stripe)
+					{
+						foreach(var i in misses)
+						{
+							if(stripeOf[i] != s)
+							{
+								continue;
+							}
+							if(stripe.TryGetValue(keys[i], out r) && (values[i] = r.Target as TValue) != null)
+							{
+								Retain(s, keys[i], values[i], true);
+								continue;
+							}
+							stripe[keys[i]] = new WeakReference(values[i] = created[keys[i]]);
+							Retain(s, keys[i], values[i], false);
+						}
+					}
+				}
+			}
+			return values;
+		}
+	}
+}
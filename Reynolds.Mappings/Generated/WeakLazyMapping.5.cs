@@ -0,0 +1,420 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Diagnostics;
+using System.Linq;
+using System.Linq.Expressions;
+using System.IO.MemoryMappedFiles;
+namespace Reynolds.Mappings
+{
+	public class WeakLazyMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> : WeakMapping, IMapping<TKey1, TKey2, TKey3, TKey4, TKey5, TValue> where TValue : class
+	{
+		public delegate TValue InstantiateDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		public delegate TValue[] InstantiateManyDelegate(IList<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> keys);
+		public delegate bool ContainsDelegate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5);
+		protected InstantiateDelegate _instantiator;
+		protected ContainsDelegate _contains;
+		protected IEqualityComparer<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> _comparer;
+		protected Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, WeakReference>[] _stripes;
+		protected Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>>[] _strong;
+		protected LruEvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>[] _recency;
+		protected int _strongCapacity;
+		List<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> _dead = new List<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>();
+		int _cleanupStripe;
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null) : this(instantiator, contains, 0)
+		{
+		}
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5) : this(instantiator, contains, 0, comparer1, comparer2, comparer3, comparer4, comparer5)
+		{
+		}
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, int strongCapacity)
+		{
+			_comparer = EqualityComparer<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>.Default;
+			_instantiator = instantiator;
+			_contains = contains;
+			CreateStripes(strongCapacity);
+			AddToCleanupList(this);
+		}
+		public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, int strongCapacity, IEqualityComparer<TKey1> comparer1, IEqualityComparer<TKey2> comparer2, IEqualityComparer<TKey3> comparer3, IEqualityComparer<TKey4> comparer4, IEqualityComparer<TKey5> comparer5)
+		{
+			_comparer = new DictionaryMapping<TKey1, TKey2, TKey3, TKey4, TKey5, WeakReference>.EqualityComparer(comparer1, comparer2, comparer3, comparer4, comparer5);
+			_instantiator = instantiator;
+			_contains = contains;
+			CreateStripes(strongCapacity);
+			AddToCleanupList(this);
+		}
+		void CreateStripes(int strongCapacity)
+		{
+			if(strongCapacity < 0)
+			{
+				throw new ArgumentOutOfRangeException("strongCapacity");
+			}
+			_stripes = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, WeakReference>[16];
+			for(int i = 0; i < _stripes.Length; i++)
+			{
+				_stripes[i] = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, WeakReference>(_comparer);
+			}
+			if(strongCapacity > 0)
+			{
+				_strongCapacity = (strongCapacity + _stripes.Length - 1) / _stripes.Length;
+				_strong = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>>[_stripes.Length];
+				_recency = new LruEvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>[_stripes.Length];
+				for(int i = 0; i < _stripes.Length; i++)
+				{
+					_strong[i] = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>>(_strongCapacity, _comparer);
+					_recency[i] = new LruEvictionPolicy<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>();
+				}
+			}
+		}
+		public int StrongCapacity
+		{
+			get
+			{
+				return _strong == null ? 0 : _strongCapacity * _stripes.Length;
+			}
+		}
+		protected bool TryGetStrong(int s, Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey, out TValue value)
+		{
+			if(_strong != null)
+			{
+				EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> node;
+				if(_strong[s].TryGetValue(innerKey, out node))
+				{
+					_recency[s].Accessed(node);
+					value = node.Value;
+					return true;
+				}
+			}
+			value = null;
+			return false;
+		}
+		protected void Retain(int s, Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey, TValue value, bool promoted)
+		{
+			if(_strong == null)
+			{
+				return;
+			}
+			var strong = _strong[s];
+			EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue> node;
+			if(strong.TryGetValue(innerKey, out node))
+			{
+				node.Value = value;
+				_recency[s].Accessed(node);
+				return;
+			}
+			var statistics = Statistics;
+			if(strong.Count >= _strongCapacity)
+			{
+				node = _recency[s].Evict();
+				strong.Remove(node.Key);
+				if(statistics != null)
+				{
+					statistics.RecordDemotion();
+				}
+			}
+			else
+			{
+				node = new EvictionNode<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>();
+			}
+			node.Key = innerKey;
+			node.Value = value;
+			strong.Add(innerKey, node);
+			_recency[s].Added(node);
+			if(promoted && statistics != null)
+			{
+				statistics.RecordPromotion();
+			}
+		}
+		protected int GetStripeIndex(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey)
+		{
+			int h = _comparer.GetHashCode(innerKey);
+			return (h ^ (h >> 16)) & 15;
+		}
+		protected Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, WeakReference> GetStripe(Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey)
+		{
+			return _stripes[GetStripeIndex(innerKey)];
+		}
+		protected override bool CleanupBatch()
+		{
+			var stripe = _stripes[_cleanupStripe];
+			lock(stripe)
+			{
+				foreach(var kv in stripe)
+				{
+					if(!kv.Value.IsAlive)
+					{
+						_dead.Add(kv.Key);
+					}
+				}
+				foreach(var key in _dead)
+				{
+					stripe.Remove(key);
+				}
+			}
+			var statistics = Statistics;
+			if(statistics != null && _dead.Count > 0)
+			{
+				statistics.RecordRemovals(_dead.Count);
+			}
+			_dead.Clear();
+			_cleanupStripe = (_cleanupStripe + 1) % _stripes.Length;
+			return _cleanupStripe == 0;
+		}
+		public bool Contains(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			if(_contains == null)
+			{
+				return true;
+			}
+			else
+			{
+				return _contains(key1, key2, key3, key4, key5);
+			}
+		}
+		public int Count
+		{
+			get
+			{
+				throw new Exception("Domain is not finite");
+			}
+		}
+		public bool IsFinite
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public bool IsNumerable
+		{
+			get
+			{
+				return false;
+			}
+		}
+		public IEnumerator<IKeyValueTuple<TKey1, TKey2, TKey3, TKey4, TKey5, TValue>> GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> IEnumerable<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		IEnumerator IEnumerable.GetEnumerator()
+		{
+			throw new Exception("Domain is non-numerable");
+		}
+		protected TValue Instantiate(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5)
+		{
+			var statistics = Statistics;
+			if(statistics == null)
+			{
+				return _instantiator(key1, key2, key3, key4, key5);
+			}
+			long started = Stopwatch.GetTimestamp();
+			TValue value = _instantiator(key1, key2, key3, key4, key5);
+			statistics.RecordInstantiation(started);
+			return value;
+		}
+		public TValue this[TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5]
+		{
+			get
+			{
+				WeakReference r;
+				TValue v;
+				Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey = new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5);
+				int s = GetStripeIndex(innerKey);
+				var stripe = _stripes[s];
+				var statistics = Statistics;
+				lock(stripe)
+				{
+					if(TryGetStrong(s, innerKey, out v))
+					{
+						if(statistics != null)
+						{
+							statistics.RecordHit();
+						}
+						return v;
+					}
+					if(stripe.TryGetValue(innerKey, out r))
+					{
+						if((v = r.Target as TValue) != null)
+						{
+							if(statistics != null)
+							{
+								statistics.RecordHit();
+							}
+							Retain(s, innerKey, v, true);
+							return v;
+						}
+						NoteDeadReference();
+						if(statistics != null)
+						{
+							statistics.RecordResurrection();
+						}
+					}
+				}
+				if(statistics != null)
+				{
+					statistics.RecordMiss();
+				}
+				v = Instantiate(key1, key2, key3, key4, key5);
+				lock(stripe)
+				{
+					TValue existing;
+					if(stripe.TryGetValue(innerKey, out r) && (existing = r.Target as TValue) != null)
+					{
+						Retain(s, innerKey, existing, true);
+						return existing;
+					}
+					stripe[innerKey] = new WeakReference(v);
+					Retain(s, innerKey, v, false);
+				}
+				return v;
+			}
+		}
+		public bool TryGetExisting(TKey1 key1, TKey2 key2, TKey3 key3, TKey4 key4, TKey5 key5, out TValue value)
+		{
+			WeakReference r;
+			Tuple<TKey1, TKey2, TKey3, TKey4, TKey5> innerKey = new Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>(key1, key2, key3, key4, key5);
+			var stripe = GetStripe(innerKey);
+			lock(stripe)
+			{
+				if(stripe.TryGetValue(innerKey, out r))
+				{
+					value = r.Target as TValue;
+					return value != null;
+				}
+				value = null;
+				return false;
+			}
+		}
+		public TValue[] GetMany(IList<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> keys)
+		{
+			return GetMany(keys, null);
+		}
+		public TValue[] GetMany(IList<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>> keys, InstantiateManyDelegate instantiateMany)
+		{
+			var values = new TValue[keys.Count];
+			var stripeOf = new int[keys.Count];
+			var perStripe = new int[_stripes.Length];
+			for(int i = 0; i < stripeOf.Length; i++)
+			{
+				perStripe[stripeOf[i] = GetStripeIndex(keys[i])]++;
+			}
+			List<int> misses = null;
+			WeakReference r;
+			var statistics = Statistics;
+			for(int s = 0; s < _stripes.Length; s++)
+			{
+				if(perStripe[s] == 0)
+				{
+					continue;
+				}
+				perStripe[s] = 0;
+				var stripe = _stripes[s];
+				lock(stripe)
+				{
+					for(int i = 0; i < stripeOf.Length; i++)
+					{
+						if(stripeOf[i] != s)
+						{
+							continue;
+						}
+						if(TryGetStrong(s, keys[i], out values[i]))
+						{
+							continue;
+						}
+						if(stripe.TryGetValue(keys[i], out r))
+						{
+							if((values[i] = r.Target as TValue) != null)
+							{
+								Retain(s, keys[i], values[i], true);
+								continue;
+							}
+							NoteDeadReference();
+							if(statistics != null)
+							{
+								statistics.RecordResurrection();
+							}
+						}
+						(misses ?? (misses = new List<int>())).Add(i);
+						perStripe[s]++;
+					}
+				}
+			}
+			if(statistics != null)
+			{
+				statistics.RecordHits(values.Length - (misses == null ? 0 : misses.Count));
+			}
+			if(misses != null)
+			{
+				if(statistics != null)
+				{
+					statistics.RecordMisses(misses.Count);
+				}
+				var created = new Dictionary<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>, TValue>(_comparer);
+				if(instantiateMany == null)
+				{
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], Instantiate(keys[i].Item1, keys[i].Item2, keys[i].Item3, keys[i].Item4, keys[i].Item5));
+						}
+					}
+				}
+				else
+				{
+					var missing = new List<Tuple<TKey1, TKey2, TKey3, TKey4, TKey5>>();
+					foreach(var i in misses)
+					{
+						if(!created.ContainsKey(keys[i]))
+						{
+							created.Add(keys[i], default(TValue));
+							missing.Add(keys[i]);
+						}
+					}
+					var instantiated = instantiateMany(missing);
+					if(instantiated == null || instantiated.Length != missing.Count)
+					{
+						throw new InvalidOperationException("The batch instantiator must return one value per key");
+					}
+					for(int j = 0; j < missing.Count; j++)
+					{
+						created[missing[j]] = instantiated[j];
+					}
+				}
+				for(int s = 0; s < _stripes.Length; s++)
+				{
+					if(perStripe[s] == 0)
+					{
+						continue;
+					}
+					var stripe = _stripes[s];
+					lock(stripe)
+					{
+						foreach(var i in misses)
+						{
+							if(stripeOf[i] != s)
+							{
+								continue;
+							}
+							if(stripe.TryGetValue(keys[i], out r) && (values[i] = r.Target as TValue) != null)
+							{
+								Retain(s, keys[i], values[i], true);
+								continue;
+							}
+							stripe[keys[i]] = new WeakReference(values[i] = created[keys[i]]);
+							Retain(s, keys[i], values[i], false);
+						}
+					}
+				}
+			}
+			return values;
+		}
+	}
+}
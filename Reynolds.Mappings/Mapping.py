@@ -1,280 +1,2307 @@
 ﻿#----
-MAX_N = 6
+MIN_ARITY = 1
+MAX_ARITY = 8
+GENERIC_ABOVE = 5 # arities above this share the single-key implementation, keyed by Tuple<...> (CompositeKey<...> with --struct-keys)
+STRUCT_KEYS = False # emit CompositeKey<...> structs instead of Tuple<...> for multi-key lookups
+LOCK_STRIPES = 16 # number of locks (a power of two) WeakLazyMapping spreads its keys over
+PREFIX_INDEX = True # give multi-key DictionaryMappings a Slice(key1) backed by an index on the first key
+STATISTICS = True # let lazy and weak mappings count hits, misses and instantiation times into a MappingStatistics
 #----
 
 import sys
+import os
+import argparse
+import multiprocessing
 
 from CodeGen import *
+from Benchmarks import emit_benchmarks
+from Python import emit_python, emit_python_benchmarks
 
-codegen_begin("Mapping.cs")
-
-stmt("using System")
-stmt("using System.Collections")
-stmt("using System.Collections.Generic")
-stmt("using System.Threading")
-stmt("using System.Linq")
-
-with block("namespace Reynolds.Mappings"):
-	for n in range(1, MAX_N):
-		if n == 1:
-			subs = {
-				'Tuple<TKeys>': "TKey",
-				'TKeys': "TKey",
-				'TKeys keys': "TKey key",
-				'keytuple': "key",
-				'keys': 'key',
-				'IEqualityComparer<TKeys>' : "IEqualityComparer<TKey>",
-				'IEqualityComparer<TKeys> comparers' : "IEqualityComparer<TKey> comparer"
-			}
-		else:
-			subs = {
-				'TKeys': ", ".join(["TKey%i" % (i+1) for i in range(n)]), 
-				'TKeys keys': ", ".join(["TKey%i key%i" % (i+1, i+1) for i in range(n)]),
-				'Tuple<TKeys>': "Tuple<" + ", ".join(["TKey%i" % (i+1) for i in range(n)]) + ">",
-				'keytuple': "new Tuple<" + ", ".join(["TKey%i" % (i+1) for i in range(n)]) + ">(" + ", ".join(["key%i" % (i+1) for i in range(n)]) + ")",
-				'keys': ", ".join(['key' + str(i+1) for i in range(n)]),
-				'IEqualityComparer<TKeys>' : ", ".join(["IEqualityComparer<TKey%i>" % (i+1) for i in range(n)]),
-				'IEqualityComparer<TKeys> comparers' : ", ".join(["IEqualityComparer<TKey%i> comparer%i" % (i+1, i+1) for i in range(n)])
-			}
-		
-		with placeholders(**subs):
-			# --------------- IDomain -------------
-			with block("public interface IDomain<$TKeys$> : IEnumerable<$Tuple<TKeys>$>"):
-				stmt("bool Contains($TKeys keys$)")
-				with block("int Count"):
-					stmt("get")
-				with block("bool IsFinite"):
-					stmt("get")
-				with block("bool IsNumerable"):
-					stmt("get")
-					
-			# --------------- KeyValueTuple -------------
-			with block("public interface IKeyValueTuple<$TKeys$, out TValue>"):
-				if n>1:
-					for i in range(1, n+1):
-						with block("TKey%i Key%i" % (i, i)):
-							stmt("get")
-				else:
-					with block("TKey Key"):
-						stmt("get")
-				with block("TValue Value"):
-					stmt("get")
-			with block("public struct KeyValueTuple<$TKeys$, TValue> : IKeyValueTuple<$TKeys$, TValue>"):
-				stmt("KeyValuePair<$Tuple<TKeys>$, TValue> inner")
-				with block("public KeyValueTuple(KeyValuePair<$Tuple<TKeys>$, TValue> inner)"):
-					stmt("this.inner = inner")
-				if n>1:
-					for i in range(1, n+1):
-						with block("public TKey%i Key%i" % (i, i)):
-							with block("get"):
-								stmt("return inner.Key.Item%i" % i)
-				else:
-					with block("public TKey Key"):
-						with block("get"):
-							stmt("return inner.Key")
-				with block("public TValue Value"):
-					with block("get"):
-						stmt("return inner.Value")
-			
-			# --------------- IMapping ----------------
-			with block("public interface IMapping<$TKeys$, out TValue> : IEnumerable<IKeyValueTuple<$TKeys$, TValue>>, IDomain<$TKeys$>"):
-				with block("TValue this[$TKeys keys$]"):
+CLASSES = [ "Mapping", "MappingView", "DictionaryMapping", "FrozenMapping", "ColumnarMapping", "SortedMapping", "ShardedMapping", "SnapshotMapping", "LazyMapping", "BoundedLazyMapping", "ExpiringLazyMapping", "ConcurrentLazyMapping", "AsyncLazyMapping", "WeakLazyMapping" ]
+
+parser = argparse.ArgumentParser(description = "Generates the mapping classes, one file per class and arity")
+parser.add_argument("--min-arity", type = int, default = MIN_ARITY)
+parser.add_argument("--max-arity", type = int, default = MAX_ARITY)
+parser.add_argument("--generic-above", type = int, default = GENERIC_ABOVE, help = "arities above this derive from the single-key classes instead of being emitted in full")
+parser.add_argument("--classes", default = ",".join(CLASSES), help = "comma separated list of classes to emit (dependencies are added)")
+parser.add_argument("--struct-keys", action = "store_true", default = STRUCT_KEYS, help = "key multi-key dictionaries by CompositeKey<...> structs, which need no allocation per lookup, rather than Tuple<...>; this changes the key type of IDomain and DictionaryMapping")
+parser.add_argument("--lock-stripes", type = int, default = LOCK_STRIPES)
+parser.add_argument("--no-prefix-index", action = "store_true", help = "leave out DictionaryMapping.Slice and its first-key index")
+parser.add_argument("--no-statistics", action = "store_true", help = "leave out the Statistics of the lazy and weak mappings")
+parser.add_argument("--output-dir", default = "Generated", help = "directory for the generated files; files in it that are no longer generated are deleted")
+parser.add_argument("--output", help = "write everything into this one file instead, or to standard output if it is -")
+parser.add_argument("--jobs", type = int, default = multiprocessing.cpu_count(), help = "number of processes rendering the files")
+parser.add_argument("--no-cache", action = "store_true", help = "render every file, even if the generator and its options are unchanged since the last run")
+parser.add_argument("--benchmarks", default = "../Reynolds.Mappings.Benchmarks/Benchmarks.cs", help = "where to write the matching benchmarks, or an empty string for none")
+parser.add_argument("--python", default = "../Reynolds.Mappings.Python/reynolds_mappings.py", help = "where to write the Python mapping classes, or an empty string for none")
+parser.add_argument("--python-benchmarks", default = "../Reynolds.Mappings.Python/bench_mappings.py", help = "where to write the pytest-benchmark module for the Python classes, or an empty string for none")
+args = parser.parse_args()
+
+STRUCT_KEYS = args.struct_keys
+LOCK_STRIPES = args.lock_stripes
+PREFIX_INDEX = not args.no_prefix_index
+STATISTICS = not args.no_statistics
+
+assert LOCK_STRIPES > 0 and LOCK_STRIPES & (LOCK_STRIPES - 1) == 0, "LOCK_STRIPES must be a power of two"
+assert 1 <= args.min_arity <= args.max_arity, "invalid arity range"
+
+# the member of a multi-key key holding key i (from 1): a Tuple keeps the keys after the seventh in its Rest
+def item(i):
+	return "Item%i" % i if STRUCT_KEYS or i <= 7 else "Rest." + item(i - 7)
+
+def tuple_type(types):
+	if len(types) > 7:
+		return "Tuple<%s, %s>" % (", ".join(types[:7]), tuple_type(types[7:]))
+	return "Tuple<%s>" % ", ".join(types)
+
+def new_tuple(types, values):
+	if len(types) > 7:
+		return "new Tuple<%s, %s>(%s, %s)" % (", ".join(types[:7]), tuple_type(types[7:]), ", ".join(values[:7]), new_tuple(types[7:], values[7:]))
+	return "new %s(%s)" % (tuple_type(types), ", ".join(values))
+
+# the key type of a mapping keyed by types, and a new key of it holding the given key expressions
+def key_type(types):
+	if len(types) == 1:
+		return types[0]
+	return "CompositeKey<%s>" % ", ".join(types) if STRUCT_KEYS else tuple_type(types)
+
+def new_key(values, types = None):
+	types = types or ["TKey%i" % (i+1) for i in range(len(values))]
+	if len(types) == 1:
+		return values[0]
+	return "new CompositeKey<%s>(%s)" % (", ".join(types), ", ".join(values)) if STRUCT_KEYS else new_tuple(types, values)
+
+def key_items(n, key):
+	return key if n == 1 else ", ".join("%s.%s" % (key, item(i+1)) for i in range(n))
+
+def hash_round(value):
+	stmt("result += (uint) %s * 3266489917u" % value)
+	stmt("result = ((result << 17) | (result >> 15)) * 668265263u")
+
+def hash_combine(n, values):
+	# xxHash32 rounds, written out inline: each hash is multiplied and rotated into the state and the
+	# result avalanched, so clustered integer keys still spread; HashCodes in EqualityComparers.cs matches
+	stmt("uint result = 374761393u + %iu" % n)
+	with block("unchecked"):
+		for value in values:
+			hash_round(value)
+		hash_finish()
+
+def hash_finish():
+	stmt("result ^= result >> 15")
+	stmt("result *= 2246822519u")
+	stmt("result ^= result >> 13")
+	stmt("result *= 3266489917u")
+	stmt("result ^= result >> 16")
+	stmt("return (int) result")
+
+def instantiate(keys):
+	return ("Instantiate(%s)" if STATISTICS else "_instantiator(%s)") % keys
+
+def statistics_members(weak = False, timed = True):
+	# weak mappings inherit Statistics from WeakMapping, whose cleanup thread also reports to it
+	if not STATISTICS:
+		return
+	if not weak:
+		stmt("protected MappingStatistics _statistics")
+		with block("public MappingStatistics Statistics"):
+			with block("get"):
+				stmt("return _statistics")
+			with block("set"):
+				stmt("_statistics = value")
+	if timed:
+		with block("protected TValue Instantiate($TKeys keys$)"):
+			stmt("var statistics = Statistics")
+			with block("if(statistics == null)"):
+				stmt("return _instantiator($keys$)")
+			stmt("long started = Stopwatch.GetTimestamp()")
+			stmt("TValue value = _instantiator($keys$)")
+			stmt("statistics.RecordInstantiation(started)")
+			stmt("return value")
+
+def statistics_local():
+	if STATISTICS:
+		stmt("var statistics = Statistics")
+
+def record(event, argument = ""):
+	if STATISTICS:
+		with block("if(statistics != null)"):
+			stmt("statistics.Record%s(%s)" % (event, argument))
+
+def instantiate_misses(n, comparer):
+	# fills 'created' with one value per distinct key in 'misses', through instantiateMany when given
+	stmt("var created = new Dictionary<$Tuple<TKeys>$, TValue>(%s)" % comparer)
+	with block("if(instantiateMany == null)"):
+		with block("foreach(var i in misses)"):
+			with block("if(!created.ContainsKey(keys[i]))"):
+				stmt("created.Add(keys[i], %s)" % instantiate(key_items(n, "keys[i]")))
+	with block("else"):
+		stmt("var missing = new List<$Tuple<TKeys>$>()")
+		with block("foreach(var i in misses)"):
+			with block("if(!created.ContainsKey(keys[i]))"):
+				stmt("created.Add(keys[i], default(TValue))")
+				stmt("missing.Add(keys[i])")
+		stmt("var instantiated = instantiateMany(missing)")
+		with block("if(instantiated == null || instantiated.Length != missing.Count)"):
+			stmt('throw new InvalidOperationException("The batch instantiator must return one value per key")')
+		with block("for(int j = 0; j < missing.Count; j++)"):
+			stmt("created[missing[j]] = instantiated[j]")
+
+# --------------- primitive array comparers ----------------
+PRIMITIVES = [("bool", "Boolean"), ("byte", "Byte"), ("sbyte", "SByte"), ("short", "Int16"), ("ushort", "UInt16"), ("char", "Char"), ("int", "Int32"), ("uint", "UInt32"), ("long", "Int64"), ("ulong", "UInt64"), ("float", "Single"), ("double", "Double")]
+
+def primitive_array_comparer(t, name):
+	# ValueTypeArrayEqualityComparer<T> for one primitive T, with the element operations bound at compile time
+	cls = name + "ArrayEqualityComparer"
+	with block("public class %s : IEqualityComparer<%s[]>, IComparer<%s[]>" % (cls, t, t)):
+		with block("protected %s()" % cls):
+			pass
+		stmt("public readonly static %s Instance = new %s()" % (cls, cls))
+		with block("public bool Equals(%s[] x, %s[] y)" % (t, t)):
+			with block("if(x == y)"):
+				stmt("return true")
+			with block("if(x == null || y == null || x.Length != y.Length)"):
+				stmt("return false")
+			with block("for(int k = 0; k < x.Length; k++)"):
+				# Equals rather than == for floating point, so NaN equals itself as it hashes
+				with block("if(%s)" % ("!x[k].Equals(y[k])" if t in ("float", "double") else "x[k] != y[k]")):
+					stmt("return false")
+			stmt("return true")
+		with block("public int GetHashCode(%s[] array)" % t):
+			stmt("uint result = 374761393u + (uint) array.Length")
+			with block("unchecked"):
+				with block("for(int i = 0; i < array.Length; i++)"):
+					hash_round("array[i]" if t in ("int", "uint") else "array[i].GetHashCode()")
+				hash_finish()
+		with block("public int Compare(%s[] x, %s[] y)" % (t, t)):
+			with block("if(x == y)"):
+				stmt("return 0")
+			stmt("int c")
+			with block("if(0 != (c = x.Length.CompareTo(y.Length)))"):
+				stmt("return c")
+			with block("for(int k = 0; k < x.Length; k++)"):
+				with block("if(0 != (c = x[k].CompareTo(y[k])))"):
+					stmt("return c")
+			stmt("return 0")
+
+# --------------- CompositeKey ----------------
+def composite_key(n):
+	if n > 1 and STRUCT_KEYS:
+		with block("public struct CompositeKey<$TKeys$> : IEquatable<$Tuple<TKeys>$>"):
+			for i in range(n):
+				stmt("public readonly TKey%i Item%i" % (i+1, i+1))
+			with block("public CompositeKey($TKeys keys$)"):
+				for i in range(n):
+					stmt("Item%i = key%i" % (i+1, i+1))
+			with block("public bool Equals($Tuple<TKeys>$ other)"):
+				stmt("return " + " && ".join(("EqualityComparer<TKey%i>.Default.Equals(Item%i, other.Item%i)" % (i+1, i+1, i+1)) for i in range(n)))
+			with block("public override bool Equals(object obj)"):
+				stmt("return obj is $Tuple<TKeys>$ && Equals(($Tuple<TKeys>$) obj)")
+			with block("public override int GetHashCode()"):
+				hash_combine(n, ("EqualityComparer<TKey%i>.Default.GetHashCode(Item%i)" % (i+1, i+1) for i in range(n)))
+
+# --------------- IDomain ----------------
+def domain_interface(n):
+	with block("public interface IDomain<$TKeys$> : IEnumerable<$Tuple<TKeys>$>"):
+		stmt("bool Contains($TKeys keys$)")
+		with block("int Count"):
+			stmt("get")
+		with block("bool IsFinite"):
+			stmt("get")
+		with block("bool IsNumerable"):
+			stmt("get")
+
+# --------------- KeyValueTuple ----------------
+def key_value_tuple(n):
+	with block("public interface IKeyValueTuple<$TKeys$, out TValue>"):
+		if n>1:
+			for i in range(1, n+1):
+				with block("TKey%i Key%i" % (i, i)):
 					stmt("get")
-				stmt("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()")
-
-			# --------------- Mapping ----------
-			with block("public class Mapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
-				stmt("public delegate TValue GetDelegate($TKeys keys$)")
-				stmt("GetDelegate _getter")
-				with block("public Mapping(GetDelegate getter)"):
-					stmt("_getter = getter")
-				with block("public TValue this[$TKeys keys$]"):
-					with block("get"):
-						stmt("return _getter($keys$)")
-				with block("public bool IsFinite"):
-					with block("get"):
-						stmt("return false")
-				with block("public bool IsNumerable"):
+		else:
+			with block("TKey Key"):
+				stmt("get")
+		with block("TValue Value"):
+			stmt("get")
+	with block("public struct KeyValueTuple<$TKeys$, TValue> : IKeyValueTuple<$TKeys$, TValue>"):
+		stmt("KeyValuePair<$Tuple<TKeys>$, TValue> inner")
+		with block("public KeyValueTuple(KeyValuePair<$Tuple<TKeys>$, TValue> inner)"):
+			stmt("this.inner = inner")
+		if n>1:
+			for i in range(1, n+1):
+				with block("public TKey%i Key%i" % (i, i)):
 					with block("get"):
-						stmt("return false")
-				with block("public bool Contains($TKeys keys$)"):
+						stmt("return inner.Key.%s" % item(i))
+		else:
+			with block("public TKey Key"):
+				with block("get"):
+					stmt("return inner.Key")
+		with block("public TValue Value"):
+			with block("get"):
+				stmt("return inner.Value")
+
+# --------------- IMapping ----------------
+def mapping_interface(n):
+	with block("public interface IMapping<$TKeys$, out TValue> : IEnumerable<IKeyValueTuple<$TKeys$, TValue>>, IDomain<$TKeys$>"):
+		with block("TValue this[$TKeys keys$]"):
+			stmt("get")
+		stmt("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()")
+
+# --------------- Mapping ----------------
+def mapping(n):
+	with block("public class Mapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		stmt("public delegate TValue GetDelegate($TKeys keys$)")
+		stmt("GetDelegate _getter")
+		with block("public Mapping(GetDelegate getter)"):
+			stmt("_getter = getter")
+		with block("internal GetDelegate Getter"):
+			with block("get"):
+				stmt("return _getter")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("return _getter($keys$)")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return true")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')						
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+
+# --------------- MappingView ----------------
+def key_parameters(n):
+	if n == 1:
+		return [("TKey", "key")]
+	return [("TKey%i" % (i+1), "key%i" % (i+1)) for i in range(n)]
+
+def mapping_view(n):
+	view = "MappingView<$TKeys$, TValue>"
+	with block("public class %s : IMapping<$TKeys$, TValue>" % view):
+		# the lookup, and the test for the domain or null where the view is defined for every key, as
+		# expressions over parameters; views built on a view splice these into their own
+		stmt("internal readonly ParameterExpression[] parameters")
+		stmt("internal readonly Expression lookup")
+		stmt("internal readonly Expression domain")
+		# the keys to enumerate, or null if the view is non-numerable; filtered if some of them are outside the domain
+		stmt("internal readonly IDomain<$TKeys$> keys")
+		stmt("internal readonly bool filtered")
+		stmt("Func<$TKeys$, TValue> _getter")
+		stmt("Func<$TKeys$, bool> _contains")
+		with block("internal MappingView(ParameterExpression[] parameters, Expression lookup, Expression domain, IDomain<$TKeys$> keys, bool filtered)"):
+			for field in ["parameters", "lookup", "domain", "keys", "filtered"]:
+				stmt("this.%s = %s" % (field, field))
+		with block("public static %s Of(IMapping<$TKeys$, TValue> mapping)" % view):
+			stmt("var view = mapping as %s" % view)
+			with block("if(view != null)"):
+				stmt("return view")
+			stmt("var parameters = new[] { %s }" % ", ".join('Expression.Parameter(typeof(%s), "%s")' % p for p in key_parameters(n)))
+			stmt("var function = mapping as Mapping<$TKeys$, TValue>")
+			with block("if(function != null)"):
+				stmt("return new %s(parameters, Expression.Invoke(Expression.Constant(function.Getter), parameters), null, null, false)" % view)
+			stmt("var source = Expression.Constant(mapping, typeof(IMapping<$TKeys$, TValue>))")
+			stmt('var contains = Expression.Call(source, typeof(IDomain<$TKeys$>).GetMethod("Contains"), parameters)')
+			stmt('return new %s(parameters, Expression.Property(source, "Item", parameters), contains, mapping, false)' % view)
+		# the whole chain of views as one delegate, compiled on first use
+		with block("public Func<$TKeys$, TValue> Getter"):
+			with block("get"):
+				with block("if(_getter == null)"):
+					stmt("_getter = Expression.Lambda<Func<$TKeys$, TValue>>(lookup, parameters).Compile()")
+				stmt("return _getter")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("return Getter($keys$)")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(domain == null)"):
+				stmt("return true")
+			with block("if(_contains == null)"):
+				stmt("_contains = Expression.Lambda<Func<$TKeys$, bool>>(domain, parameters).Compile()")
+			stmt("return _contains($keys$)")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return keys != null && keys.IsFinite")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return keys != null && keys.IsNumerable")
+		with block("public int Count"):
+			with block("get"):
+				with block("if(keys == null)"):
+					stmt('throw new Exception("Domain is not finite")')
+				with block("if(!filtered)"):
+					stmt("return keys.Count")
+				stmt("int count = 0")
+				with block("foreach(var key in keys)"):
+					with block("if(Contains(%s))" % key_items(n, "key")):
+						stmt("count++")
+				stmt("return count")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			with block("if(keys == null)"):
+				stmt('throw new Exception("Domain is non-numerable")')
+			stmt("return Entries().GetEnumerator()")
+		with block("IEnumerable<IKeyValueTuple<$TKeys$, TValue>> Entries()"):
+			with block("foreach(var key in keys)"):
+				with block("if(!filtered || Contains(%s))" % key_items(n, "key")):
+					stmt("yield return new KeyValueTuple<$TKeys$, TValue>(new KeyValuePair<$Tuple<TKeys>$, TValue>(key, Getter(%s)))" % key_items(n, "key"))
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			with block("if(keys == null)"):
+				stmt('throw new Exception("Domain is non-numerable")')
+			stmt("return (filtered ? keys.Where(key => Contains(%s)) : keys).GetEnumerator()" % key_items(n, "key"))
+		# keys, as from DictionaryMapping
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return ((IEnumerable<$Tuple<TKeys>$>) this).GetEnumerator()")
+		if "LazyMapping" in selected:
+			# caches what the fused lookup returns, for views whose lookups are worth keeping
+			with block("public LazyMapping<$TKeys$, TValue> Memoize()"):
+				stmt("var contains = domain == null ? null : new LazyMapping<$TKeys$, TValue>.ContainsDelegate(Contains)")
+				stmt("return new LazyMapping<$TKeys$, TValue>(new LazyMapping<$TKeys$, TValue>.InstantiateDelegate(Getter), contains)")
+	# Chained views are fused: each one splices the expressions of the view below it into its own, so a
+	# lookup through any number of them is a single compiled delegate and never builds a key tuple.
+	with block("public static partial class MappingViews"):
+		with block("public static %s AsView<$TKeys$, TValue>(this IMapping<$TKeys$, TValue> mapping)" % view):
+			stmt("return %s.Of(mapping)" % view)
+		with block("public static MappingView<$TKeys$, TResult> Select<$TKeys$, TValue, TResult>(this IMapping<$TKeys$, TValue> mapping, Expression<Func<TValue, TResult>> selector)"):
+			stmt("var view = %s.Of(mapping)" % view)
+			stmt("return new MappingView<$TKeys$, TResult>(view.parameters, ViewExpressions.Inline(selector, view.lookup), view.domain, view.keys, view.filtered)")
+		# restricts the domain to the keys that pass predicate; looking up any other key throws KeyNotFoundException
+		with block("public static %s Where<$TKeys$, TValue>(this IMapping<$TKeys$, TValue> mapping, Expression<Func<$TKeys$, bool>> predicate)" % view):
+			stmt("var view = %s.Of(mapping)" % view)
+			stmt("var test = ViewExpressions.Inline(predicate, view.parameters)")
+			stmt("var lookup = Expression.Condition(test, view.lookup, ViewExpressions.Missing(typeof(TValue)))")
+			stmt("return new %s(view.parameters, lookup, ViewExpressions.Both(view.domain, test), view.keys, true)" % view)
+		if 1 in arities:
+			# next applied to the values of mapping; the domain shrinks to the keys whose value next contains
+			with block("public static MappingView<$TKeys$, TResult> Compose<$TKeys$, TValue, TResult>(this IMapping<$TKeys$, TValue> mapping, IMapping<TValue, TResult> next)"):
+				stmt("var view = %s.Of(mapping)" % view)
+				stmt("var outer = MappingView<TValue, TResult>.Of(next)")
+				stmt("var lookup = ViewExpressions.Inline(outer.parameters, outer.lookup, view.lookup)")
+				with block("if(outer.domain == null)"):
+					stmt("return new MappingView<$TKeys$, TResult>(view.parameters, lookup, view.domain, view.keys, view.filtered)")
+				stmt("var domain = ViewExpressions.Both(view.domain, ViewExpressions.Inline(outer.parameters, outer.domain, view.lookup))")
+				stmt("return new MappingView<$TKeys$, TResult>(view.parameters, lookup, domain, view.keys, true)")
+		if n > 1 and n - 1 in arities:
+			rest = ", ".join("TKey%i" % (i+1) for i in range(1, n))
+			# the mapping of the remaining keys with the first one fixed; it enumerates the keys of mapping that start with key1
+			with block("public static MappingView<%s, TValue> Curry<$TKeys$, TValue>(this IMapping<$TKeys$, TValue> mapping, TKey1 key1)" % rest):
+				stmt("var view = %s.Of(mapping)" % view)
+				stmt("var parameters = view.parameters.Skip(1).ToArray()")
+				stmt("var arguments = new Expression[] { Expression.Constant(key1, typeof(TKey1)) }.Concat(parameters).ToArray()")
+				stmt("var domain = view.domain == null ? null : ViewExpressions.Inline(view.parameters, view.domain, arguments)")
+				stmt("var keys = view.keys == null ? null : new CurriedDomain<$TKeys$>(view.keys, key1)")
+				stmt("return new MappingView<%s, TValue>(parameters, ViewExpressions.Inline(view.parameters, view.lookup, arguments), domain, keys, view.filtered)" % rest)
+	if n > 1 and n - 1 in arities:
+		curried_domain(n)
+
+def curried_domain(n):
+	# the keys of a domain whose first key equals key1, without it; key1 is compared by default equality
+	rest_types = ["TKey%i" % (i+1) for i in range(1, n)]
+	rest = ", ".join(rest_types)
+	rest_parameters = ", ".join("TKey%i key%i" % (i+1, i+1) for i in range(1, n))
+	rest_keys = ", ".join("key%i" % (i+1) for i in range(1, n))
+	with block("sealed class CurriedDomain<$TKeys$> : IDomain<%s>" % rest):
+		stmt("static readonly EqualityComparer<TKey1> comparer = EqualityComparer<TKey1>.Default")
+		stmt("readonly IDomain<$TKeys$> _keys")
+		stmt("readonly TKey1 _key1")
+		with block("public CurriedDomain(IDomain<$TKeys$> keys, TKey1 key1)"):
+			stmt("_keys = keys")
+			stmt("_key1 = key1")
+		with block("public bool Contains(%s)" % rest_parameters):
+			stmt("return _keys.Contains(_key1, %s)" % rest_keys)
+		with block("public int Count"):
+			with block("get"):
+				with block("if(!_keys.IsFinite)"):
+					stmt('throw new Exception("Domain is not finite")')
+				stmt("int count = 0")
+				with block("foreach(var key in _keys)"):
+					with block("if(comparer.Equals(key.Item1, _key1))"):
+						stmt("count++")
+				stmt("return count")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return _keys.IsFinite")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return _keys.IsNumerable")
+		with block("public IEnumerator<%s> GetEnumerator()" % key_type(rest_types)):
+			with block("foreach(var key in _keys)"):
+				with block("if(comparer.Equals(key.Item1, _key1))"):
+					stmt("yield return %s" % new_key(["key." + item(i+1) for i in range(1, n)], rest_types))
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return GetEnumerator()")
+
+# --------------- EqualityComparer ----------------
+def equality_comparer(n):
+	with block("protected internal class EqualityComparer : IEqualityComparer<$Tuple<TKeys>$>"):
+		for i in range(n):
+			stmt("internal readonly IEqualityComparer<TKey%i> comparer%i" % (i+1, i+1))
+		with block("public EqualityComparer($IEqualityComparer<TKeys> comparers$)"):
+			for i in range(n):
+				stmt("this.comparer%i = (comparer%i == null ? EqualityComparer<TKey%i>.Default : comparer%i)" % (i+1, i+1, i+1, i+1))
+		with block("public bool Equals($Tuple<TKeys>$ a, $Tuple<TKeys>$ b)"):
+			stmt ("return " + " && ".join(("comparer%i.Equals(a.%s, b.%s)" % (i+1, item(i+1), item(i+1))) for i in range(n)))
+		with block("public int GetHashCode($Tuple<TKeys>$ obj)"):
+			hash_combine(n, ("comparer%i.GetHashCode(obj.%s)" % (i+1, item(i+1)) for i in range(n)))
+
+# --------------- DictionaryMapping ----------------
+def prefix_indexed(n):
+	return n > 1 and PREFIX_INDEX and (n - 1) in arities
+
+def indexed_writes(n):
+	# the single-key class hooks its writes for the generic arities that derive from it and keep a prefix index
+	return prefix_indexed(n) or (n == 1 and any(m > args.generic_above and prefix_indexed(m) for m in arities))
+
+def dictionary_mapping(n):
+	interfaces = ""
+	if indexed_writes(n):
+		interfaces = ", IDictionary<$Tuple<TKeys>$, TValue>, ICollection<KeyValuePair<$Tuple<TKeys>$, TValue>>"
+	with block("public class DictionaryMapping<$TKeys$, TValue> : Dictionary<$Tuple<TKeys>$, TValue>, IMapping<$TKeys$, TValue>%s" % interfaces):
+		if n > 1:
+			equality_comparer(n)
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return this.ContainsKey($keytuple$)")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return true")
+				
+		with block("public DictionaryMapping() : base()"):
+			pass
+		with block("public DictionaryMapping($IEqualityComparer<TKeys> comparers$) : base (" + ("comparer" if n == 1 else "new EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")") + ")"):
+			pass
+		if indexed_writes(n):
+			dictionary_writes(n)
+		dictionary_enumeration(n, False)
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt("return this.Keys.GetEnumerator()")
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return this.Keys.GetEnumerator()")				
+		if "FrozenMapping" in selected:
+			with block("public FrozenMapping<$TKeys$, TValue> Freeze()"):
+				stmt("return new FrozenMapping<$TKeys$, TValue>(this, Comparer)")
+		if n > 1:
+			dictionary_multi_key_members(n)
+
+def dictionary_writes(n):
+	# Hide the Dictionary's writes so that they keep the prefix index current, virtual in the single-key class
+	# for the generic arities deriving from it. IDictionary<,> and ICollection<> are implemented again, so
+	# writes through them come here too; only writes through a reference typed as Dictionary<,>, or through
+	# the non-generic IDictionary, get past the index.
+	virtual = "virtual " if n == 1 else ""
+	indexed = prefix_indexed(n)
+	entry = "KeyValuePair<$Tuple<TKeys>$, TValue>"
+	with block("public new %svoid Add($Tuple<TKeys>$ key, TValue value)" % virtual):
+		stmt("base.Add(key, value)")
+		if indexed:
+			with block("if(_prefixIndex != null)"):
+				stmt("IndexSet(_prefixIndex, key, value)")
+	with block("public new %sbool Remove($Tuple<TKeys>$ key)" % virtual):
+		if indexed:
+			with block("if(!base.Remove(key))"):
+				stmt("return false")
+			with block("if(_prefixIndex != null)"):
+				stmt("IndexRemove(key)")
+			stmt("return true")
+		else:
+			stmt("return base.Remove(key)")
+	with block("public new %sTValue this[$Tuple<TKeys>$ key]" % virtual):
+		with block("get"):
+			stmt("return base[key]")
+		with block("set"):
+			stmt("base[key] = value")
+			if indexed:
+				with block("if(_prefixIndex != null)"):
+					stmt("IndexSet(_prefixIndex, key, value)")
+	with block("public new %svoid Clear()" % virtual):
+		stmt("base.Clear()")
+		if indexed:
+			with block("if(_prefixIndex != null)"):
+				stmt("_prefixIndex.Clear()")
+	with block("ICollection<$Tuple<TKeys>$> IDictionary<$Tuple<TKeys>$, TValue>.Keys"):
+		with block("get"):
+			stmt("return Keys")
+	with block("ICollection<TValue> IDictionary<$Tuple<TKeys>$, TValue>.Values"):
+		with block("get"):
+			stmt("return Values")
+	with block("bool ICollection<%s>.IsReadOnly" % entry):
+		with block("get"):
+			stmt("return false")
+	with block("void ICollection<%s>.Add(%s item)" % (entry, entry)):
+		stmt("Add(item.Key, item.Value)")
+	with block("bool ICollection<%s>.Contains(%s item)" % (entry, entry)):
+		stmt("TValue value")
+		stmt("return TryGetValue(item.Key, out value) && EqualityComparer<TValue>.Default.Equals(value, item.Value)")
+	with block("void ICollection<%s>.CopyTo(%s[] array, int arrayIndex)" % (entry, entry)):
+		with block("if(array.Length - arrayIndex < Count)"):
+			stmt('throw new ArgumentException("The array is too small", "array")')
+		with block("foreach(var item in (Dictionary<$Tuple<TKeys>$, TValue>) this)"):
+			stmt("array[arrayIndex++] = item")
+	with block("bool ICollection<%s>.Remove(%s item)" % (entry, entry)):
+		stmt("return ((ICollection<%s>) this).Contains(item) && Remove(item.Key)" % entry)
+	with block("IEnumerator<%s> IEnumerable<%s>.GetEnumerator()" % (entry, entry)):
+		stmt("return base.GetEnumerator()")
+
+def dictionary_enumeration(n, derived):
+	# a struct enumerator over the Dictionary's own, so foreach and Entries neither allocate nor box;
+	# derived is set for the generic arities, which hide the members of their single-key base
+	hide = "new " if derived else ""
+	with block("public new struct Enumerator : IEnumerator<KeyValueTuple<$TKeys$, TValue>>, IEnumerator<IKeyValueTuple<$TKeys$, TValue>>"):
+		stmt("readonly Dictionary<$Tuple<TKeys>$, TValue> _dictionary")
+		stmt("Dictionary<$Tuple<TKeys>$, TValue>.Enumerator _inner")
+		with block("internal Enumerator(Dictionary<$Tuple<TKeys>$, TValue> dictionary)"):
+			stmt("_dictionary = dictionary")
+			stmt("_inner = dictionary.GetEnumerator()")
+		with block("public KeyValueTuple<$TKeys$, TValue> Current"):
+			with block("get"):
+				stmt("return new KeyValueTuple<$TKeys$, TValue>(_inner.Current)")
+		with block("IKeyValueTuple<$TKeys$, TValue> IEnumerator<IKeyValueTuple<$TKeys$, TValue>>.Current"):
+			with block("get"):
+				stmt("return Current")
+		with block("object IEnumerator.Current"):
+			with block("get"):
+				stmt("return Current")
+		with block("public bool MoveNext()"):
+			stmt("return _inner.MoveNext()")
+		with block("public void Reset()"):
+			stmt("_inner = _dictionary.GetEnumerator()")
+		with block("public void Dispose()"):
+			stmt("_inner.Dispose()")
+	with block("public %sstruct EntryCollection : IEnumerable<KeyValueTuple<$TKeys$, TValue>>" % hide):
+		stmt("readonly Dictionary<$Tuple<TKeys>$, TValue> _dictionary")
+		with block("internal EntryCollection(Dictionary<$Tuple<TKeys>$, TValue> dictionary)"):
+			stmt("_dictionary = dictionary")
+		with block("public int Count"):
+			with block("get"):
+				stmt("return _dictionary.Count")
+		with block("public Enumerator GetEnumerator()"):
+			stmt("return new Enumerator(_dictionary)")
+		with block("IEnumerator<KeyValueTuple<$TKeys$, TValue>> IEnumerable<KeyValueTuple<$TKeys$, TValue>>.GetEnumerator()"):
+			stmt("return GetEnumerator()")
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return GetEnumerator()")
+	with block("public %sEntryCollection Entries" % hide):
+		with block("get"):
+			stmt("return new EntryCollection(this)")
+	with block("public new Enumerator GetEnumerator()"):
+		stmt("return new Enumerator(this)")
+	with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> IMapping<$TKeys$, TValue>.GetEnumerator()"):
+		stmt("return GetEnumerator()")
+	with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> IEnumerable<IKeyValueTuple<$TKeys$, TValue>>.GetEnumerator()"):
+		stmt("return GetEnumerator()")
+
+def dictionary_multi_key_members(n):
+	# shared by the full and the generic multi-key DictionaryMapping, whose base is a Dictionary keyed by $Tuple<TKeys>$
+	rest_types = ["TKey%i" % (i+1) for i in range(1, n)]
+	rest = ", ".join(rest_types)
+	slices = "DictionaryMapping<%s, TValue>" % rest
+	if prefix_indexed(n):
+		rest_key = key_type(rest_types)
+		rest_parameters = ", ".join("TKey%i key%i" % (i+1, i+1) for i in range(1, n))
+		rest_keys = ", ".join("key%i" % (i+1) for i in range(1, n))
+		key_rest = ", ".join("key." + item(i+1) for i in range(1, n))
+		# key1 -> the entries sharing it, as a lower-arity mapping; built on the first Slice call, and holding only
+		# the key1s that have entries. Like Dictionary, the mapping allows any number of concurrent readers, which
+		# may all call Slice, but writes must not overlap with anything else.
+		stmt("Dictionary<TKey1, %s> _prefixIndex" % slices)
+		with block("void IndexSet(Dictionary<TKey1, %s> index, $Tuple<TKeys>$ key, TValue value)" % slices):
+			stmt("%s slice" % slices)
+			with block("if(!index.TryGetValue(key.Item1, out slice))"):
+				stmt("var comparer = Comparer as EqualityComparer")
+				stmt("slice = comparer == null ? new %s() : new %s(%s)" % (slices, slices, ", ".join("comparer.comparer%i" % (i+1) for i in range(1, n))))
+				stmt("index.Add(key.Item1, slice)")
+			stmt("slice[%s] = value" % key_rest)
+		with block("void IndexRemove($Tuple<TKeys>$ key)"):
+			stmt("%s slice" % slices)
+			with block("if(_prefixIndex.TryGetValue(key.Item1, out slice) && slice.Remove(%s) && slice.Count == 0)" % key_rest):
+				stmt("_prefixIndex.Remove(key.Item1)")
+		# the entries whose first key is key1, as a read-only mapping of the other keys that follows later writes;
+		# it registers nothing, so slicing an absent key1 leaves the index as it was
+		with block("public IMapping<%s, TValue> Slice(TKey1 key1)" % rest):
+			with block("if(_prefixIndex == null)"):
+				stmt("var comparer = Comparer as EqualityComparer")
+				stmt("var index = new Dictionary<TKey1, %s>(comparer == null ? null : comparer.comparer1)" % slices)
+				with block("foreach(var entry in (Dictionary<$Tuple<TKeys>$, TValue>) this)"):
+					stmt("IndexSet(index, entry.Key, entry.Value)")
+				stmt("Interlocked.CompareExchange(ref _prefixIndex, index, null)")
+			stmt("return new SliceView(this, key1)")
+		# looks the slice up on every call, so it sees entries for key1 added after it was made, or after the
+		# index dropped an emptied slice
+		with block("sealed class SliceView : IMapping<%s, TValue>" % rest):
+			stmt("static readonly %s Empty = new %s()" % (slices, slices))
+			stmt("readonly DictionaryMapping<$TKeys$, TValue> _mapping")
+			stmt("readonly TKey1 _key1")
+			with block("public SliceView(DictionaryMapping<$TKeys$, TValue> mapping, TKey1 key1)"):
+				stmt("_mapping = mapping")
+				stmt("_key1 = key1")
+			with block("%s Slice()" % slices):
+				stmt("%s slice" % slices)
+				stmt("return _mapping._prefixIndex.TryGetValue(_key1, out slice) ? slice : Empty")
+			with block("public bool Contains(%s)" % rest_parameters):
+				stmt("return Slice().Contains(%s)" % rest_keys)
+			with block("public int Count"):
+				with block("get"):
+					stmt("return Slice().Count")
+			with block("public bool IsFinite"):
+				with block("get"):
+					stmt("return true")
+			with block("public bool IsNumerable"):
+				with block("get"):
 					stmt("return true")
-				with block("public int Count"):
+			with block("public TValue this[%s]" % rest_parameters):
+				with block("get"):
+					stmt("return Slice()[%s]" % rest_keys)
+			with block("public IEnumerator<IKeyValueTuple<%s, TValue>> GetEnumerator()" % rest):
+				stmt("return ((IMapping<%s, TValue>) Slice()).GetEnumerator()" % rest)
+			with block("IEnumerator<%s> IEnumerable<%s>.GetEnumerator()" % (rest_key, rest_key)):
+				stmt("return ((IEnumerable<%s>) Slice()).GetEnumerator()" % rest_key)
+			with block("IEnumerator IEnumerable.GetEnumerator()"):
+				stmt("return ((IEnumerable) Slice()).GetEnumerator()")
+	with block("public bool ContainsKey($TKeys keys$)"):
+		stmt("return ContainsKey($keytuple$)")
+	with block("public bool Remove($TKeys keys$)"):
+		stmt("return Remove($keytuple$)")
+	with block("public void Add($TKeys keys$, TValue value)"):
+		stmt("Add($keytuple$, value)")
+	with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+		stmt("return TryGetValue($keytuple$, out value)")
+	with block("public TValue this[$TKeys keys$]"):
+		with block("get"):
+			stmt("return this[$keytuple$]")
+		with block("set"):
+			stmt("this[$keytuple$] = value")
+
+# --------------- FrozenMapping ----------------
+def frozen_mapping(n):
+	# read-only snapshot: keys and values in two arrays, indexed by an open-addressing table of entry numbers
+	with block("public class FrozenMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		stmt("protected IEqualityComparer<$Tuple<TKeys>$> _comparer")
+		stmt("protected $Tuple<TKeys>$[] _keys")
+		stmt("protected TValue[] _values")
+		stmt("protected int[] _hashes")
+		stmt("protected int[] _buckets")
+		stmt("protected int _shift")
+		with block("public FrozenMapping(ICollection<KeyValuePair<$Tuple<TKeys>$, TValue>> entries, IEqualityComparer<$Tuple<TKeys>$> comparer = null)"):
+			stmt("_comparer = comparer ?? EqualityComparer<$Tuple<TKeys>$>.Default")
+			stmt("_keys = new $Tuple<TKeys>$[entries.Count]")
+			stmt("_values = new TValue[entries.Count]")
+			stmt("_hashes = new int[entries.Count]")
+			# at most half full, so probe sequences stay short
+			stmt("int bits = 1")
+			with block("while((1 << bits) < 2 * entries.Count)"):
+				stmt("bits++")
+			stmt("_shift = 32 - bits")
+			stmt("_buckets = new int[1 << bits]")
+			stmt("int count = 0")
+			with block("foreach(var entry in entries)"):
+				stmt("int hash = _comparer.GetHashCode(entry.Key)")
+				stmt("int bucket = Bucket(hash)")
+				with block("while(_buckets[bucket] != 0)"):
+					stmt("int other = _buckets[bucket] - 1")
+					with block("if(_hashes[other] == hash && _comparer.Equals(_keys[other], entry.Key))"):
+						stmt('throw new ArgumentException("An entry with the same key was given more than once")')
+					stmt("bucket = (bucket + 1) & (_buckets.Length - 1)")
+				stmt("_keys[count] = entry.Key")
+				stmt("_values[count] = entry.Value")
+				stmt("_hashes[count] = hash")
+				stmt("_buckets[bucket] = ++count")
+		with block("int Bucket(int hash)"):
+			stmt("return (int) (unchecked((uint) hash * 2654435769u) >> _shift)")
+		with block("protected int IndexOf($Tuple<TKeys>$ innerKey)"):
+			stmt("int hash = _comparer.GetHashCode(innerKey)")
+			stmt("int mask = _buckets.Length - 1")
+			with block("for(int bucket = Bucket(hash); ; bucket = (bucket + 1) & mask)"):
+				stmt("int entry = _buckets[bucket] - 1")
+				with block("if(entry < 0)"):
+					stmt("return -1")
+				with block("if(_hashes[entry] == hash && _comparer.Equals(_keys[entry], innerKey))"):
+					stmt("return entry")
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return IndexOf($keytuple$) >= 0")
+		with block("public int Count"):
+			with block("get"):
+				stmt("return _keys.Length")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+			stmt("int entry = IndexOf($keytuple$)")
+			with block("if(entry < 0)"):
+				stmt("value = default(TValue)")
+				stmt("return false")
+			stmt("value = _values[entry]")
+			stmt("return true")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("int entry = IndexOf($keytuple$)")
+				with block("if(entry < 0)"):
+					stmt("throw new KeyNotFoundException()")
+				stmt("return _values[entry]")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			with block("for(int i = 0; i < _keys.Length; i++)"):
+				stmt("yield return new KeyValueTuple<$TKeys$, TValue>(new KeyValuePair<$Tuple<TKeys>$, TValue>(_keys[i], _values[i]))")
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt("return ((IEnumerable<$Tuple<TKeys>$>) _keys).GetEnumerator()")
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return _keys.GetEnumerator()")
+
+# --------------- ColumnarMapping ----------------
+def columnar_mapping(n):
+	# struct keys stored column by column next to a values array, indexed by an open-addressing table of entry numbers
+	if n == 1:
+		types, names, columns, properties, comparers = ["TKey"], ["key"], ["_keys"], ["Key"], ["comparer"]
+	else:
+		types = ["TKey%i" % (i+1) for i in range(n)]
+		names = ["key%i" % (i+1) for i in range(n)]
+		columns = ["_keys%i" % (i+1) for i in range(n)]
+		properties = ["Key%i" % (i+1) for i in range(n)]
+		comparers = ["comparer%i" % (i+1) for i in range(n)]
+	# not IEquatable<T> as well: enums do not implement it, and the default comparers compare them without boxing anyway
+	constraints = " ".join("where %s : struct" % t for t in types)
+	with block("public class ColumnarMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue> " + constraints):
+		for t, cmp in zip(types, comparers):
+			stmt("static readonly EqualityComparer<%s> %s = EqualityComparer<%s>.Default" % (t, cmp, t))
+		for t, c in zip(types, columns):
+			stmt("protected %s[] %s" % (t, c))
+		stmt("protected TValue[] _values")
+		stmt("protected int[] _hashes")
+		stmt("protected int[] _buckets")
+		stmt("protected int _count")
+		stmt("protected int _shift")
+		stmt("protected int _version")
+		with block("public ColumnarMapping() : this(4)"):
+			pass
+		with block("public ColumnarMapping(int capacity)"):
+			stmt("Resize(Math.Max(capacity, 4))")
+		with block("void Resize(int capacity)"):
+			for c in columns:
+				stmt("Array.Resize(ref %s, capacity)" % c)
+			stmt("Array.Resize(ref _values, capacity)")
+			stmt("Array.Resize(ref _hashes, capacity)")
+			stmt("int bits = 1")
+			with block("while((1 << bits) < 2 * capacity)"):
+				stmt("bits++")
+			stmt("_shift = 32 - bits")
+			stmt("_buckets = new int[1 << bits]")
+			with block("for(int entry = 0; entry < _count; entry++)"):
+				stmt("int bucket = Bucket(_hashes[entry])")
+				with block("while(_buckets[bucket] != 0)"):
+					stmt("bucket = (bucket + 1) & (_buckets.Length - 1)")
+				stmt("_buckets[bucket] = entry + 1")
+		with block("int Bucket(int hash)"):
+			stmt("return (int) (unchecked((uint) hash * 2654435769u) >> _shift)")
+		with block("static int Hash($TKeys keys$)"):
+			if n == 1:
+				stmt("return comparer.GetHashCode(key)")
+			else:
+				hash_combine(n, ("%s.GetHashCode(%s)" % (cmp, k) for cmp, k in zip(comparers, names)))
+		# the bucket holding the entry for keys, or the empty bucket where it would go
+		with block("protected int FindBucket(int hash, $TKeys keys$)"):
+			stmt("int mask = _buckets.Length - 1")
+			with block("for(int bucket = Bucket(hash); ; bucket = (bucket + 1) & mask)"):
+				stmt("int entry = _buckets[bucket] - 1")
+				with block("if(entry < 0 || (_hashes[entry] == hash && " + " && ".join("%s.Equals(%s[entry], %s)" % (cmp, c, k) for cmp, c, k in zip(comparers, columns, names)) + "))"):
+					stmt("return bucket")
+		with block("void RemoveBucket(int hole)"):
+			# backward-shift deletion keeps every probe sequence unbroken without tombstones
+			stmt("int mask = _buckets.Length - 1")
+			with block("for(int bucket = (hole + 1) & mask; _buckets[bucket] != 0; bucket = (bucket + 1) & mask)"):
+				stmt("int home = Bucket(_hashes[_buckets[bucket] - 1])")
+				with block("if(hole <= bucket ? (hole < home && home <= bucket) : (hole < home || home <= bucket))"):
+					stmt("continue")
+				stmt("_buckets[hole] = _buckets[bucket]")
+				stmt("hole = bucket")
+			stmt("_buckets[hole] = 0")
+		with block("void Insert($TKeys keys$, TValue value, bool add)"):
+			stmt("int hash = Hash($keys$)")
+			stmt("int bucket = FindBucket(hash, $keys$)")
+			stmt("int entry = _buckets[bucket] - 1")
+			with block("if(entry >= 0)"):
+				with block("if(add)"):
+					stmt('throw new ArgumentException("An entry with the same key already exists")')
+				stmt("_values[entry] = value")
+				stmt("_version++")
+				stmt("return")
+			with block("if(_count == _values.Length)"):
+				stmt("Resize(2 * _count)")
+				stmt("bucket = FindBucket(hash, $keys$)")
+			for c, k in zip(columns, names):
+				stmt("%s[_count] = %s" % (c, k))
+			stmt("_values[_count] = value")
+			stmt("_hashes[_count] = hash")
+			stmt("_buckets[bucket] = ++_count")
+			# only once the slot is written, so a failed Add leaves enumerators valid
+			stmt("_version++")
+		with block("public bool ContainsKey($TKeys keys$)"):
+			stmt("return _buckets[FindBucket(Hash($keys$), $keys$)] != 0")
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return _buckets[FindBucket(Hash($keys$), $keys$)] != 0")
+		with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+			stmt("int entry = _buckets[FindBucket(Hash($keys$), $keys$)] - 1")
+			with block("if(entry < 0)"):
+				stmt("value = default(TValue)")
+				stmt("return false")
+			stmt("value = _values[entry]")
+			stmt("return true")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("int entry = _buckets[FindBucket(Hash($keys$), $keys$)] - 1")
+				with block("if(entry < 0)"):
+					stmt("throw new KeyNotFoundException()")
+				stmt("return _values[entry]")
+			with block("set"):
+				stmt("Insert($keys$, value, false)")
+		with block("public void Add($TKeys keys$, TValue value)"):
+			stmt("Insert($keys$, value, true)")
+		with block("public bool Remove($TKeys keys$)"):
+			stmt("int bucket = FindBucket(Hash($keys$), $keys$)")
+			stmt("int entry = _buckets[bucket] - 1")
+			with block("if(entry < 0)"):
+				stmt("return false")
+			stmt("RemoveBucket(bucket)")
+			stmt("_version++")
+			stmt("int last = --_count")
+			with block("if(entry != last)"):
+				# move the last entry into the gap so the columns stay dense
+				stmt("int moved = Bucket(_hashes[last])")
+				with block("while(_buckets[moved] != last + 1)"):
+					stmt("moved = (moved + 1) & (_buckets.Length - 1)")
+				stmt("_buckets[moved] = entry + 1")
+				for c in columns:
+					stmt("%s[entry] = %s[last]" % (c, c))
+				stmt("_values[entry] = _values[last]")
+				stmt("_hashes[entry] = _hashes[last]")
+			stmt("_values[last] = default(TValue)")
+			stmt("return true")
+		with block("public void Clear()"):
+			stmt("Array.Clear(_buckets, 0, _buckets.Length)")
+			stmt("Array.Clear(_values, 0, _count)")
+			stmt("_count = 0")
+			stmt("_version++")
+		with block("public int Count"):
+			with block("get"):
+				stmt("return _count")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return true")
+		with block("public struct Entry"):
+			stmt("readonly ColumnarMapping<$TKeys$, TValue> _mapping")
+			stmt("readonly int _index")
+			with block("internal Entry(ColumnarMapping<$TKeys$, TValue> mapping, int index)"):
+				stmt("_mapping = mapping")
+				stmt("_index = index")
+			for t, c, prop in zip(types, columns, properties):
+				with block("public %s %s" % (t, prop)):
 					with block("get"):
-						stmt('throw new Exception("Domain is not finite")')						
-				with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("IEnumerator IEnumerable.GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-					
-		
-			# --------------- DictionaryMapping ----------------
-			with block("public class DictionaryMapping<$TKeys$, TValue> : Dictionary<$Tuple<TKeys>$, TValue>, IMapping<$TKeys$, TValue>"):
-				if n > 1:
-					with block("protected class EqualityComparer : IEqualityComparer<$Tuple<TKeys>$>"):
-						for i in range(n):
-							stmt("IEqualityComparer<TKey%i> comparer%i" % (i+1, i+1))
-						with block("public EqualityComparer($IEqualityComparer<TKeys> comparers$)"):
-							for i in range(n):
-								stmt("this.comparer%i = (comparer%i == null ? EqualityComparer<TKey%i>.Default : comparer%i)" % (i+1, i+1, i+1, i+1))
-						with block("public bool Equals($Tuple<TKeys>$ a, $Tuple<TKeys>$ b)"):
-							stmt ("return " + " && ".join(("comparer%i.Equals(a.Item%i, b.Item%i)" % (i+1, i+1, i+1)) for i in range(n)))
-						with block("public int GetHashCode($Tuple<TKeys>$ obj)"):
-							stmt("int result = %i" % n)
-							with block("unchecked"):
-								for i in range(n):
-									stmt("result = result * 23 + comparer%i.GetHashCode(obj.Item%i)" % (i+1, i+1))
+						stmt("return _mapping.%s[_index]" % c)
+			with block("public TValue Value"):
+				with block("get"):
+					stmt("return _mapping._values[_index]")
+		with block("void CheckVersion(int version)"):
+			with block("if(version != _version)"):
+				stmt('throw new InvalidOperationException("Collection was modified; enumeration operation may not execute.")')
+		with block("public struct Enumerator"):
+			stmt("readonly ColumnarMapping<$TKeys$, TValue> _mapping")
+			stmt("readonly int _version")
+			stmt("int _index")
+			with block("internal Enumerator(ColumnarMapping<$TKeys$, TValue> mapping)"):
+				stmt("_mapping = mapping")
+				stmt("_version = mapping._version")
+				stmt("_index = -1")
+			with block("public Entry Current"):
+				with block("get"):
+					stmt("return new Entry(_mapping, _index)")
+			with block("public bool MoveNext()"):
+				stmt("_mapping.CheckVersion(_version)")
+				stmt("return ++_index < _mapping._count")
+		with block("public Enumerator GetEnumerator()"):
+			stmt("return new Enumerator(this)")
+		with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> EnumerateTuples(int version)"):
+			# checked before the end test too, so that a Clear is noticed
+			with block("for(int i = 0; ; i++)"):
+				stmt("CheckVersion(version)")
+				with block("if(i == _count)"):
+					stmt("yield break")
+				stmt("yield return new KeyValueTuple<$TKeys$, TValue>(new KeyValuePair<$Tuple<TKeys>$, TValue>(%s, _values[i]))" % ("_keys[i]" if n == 1 else new_key(["%s[i]" % c for c in columns])))
+		with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> IMapping<$TKeys$, TValue>.GetEnumerator()"):
+			stmt("return EnumerateTuples(_version)")
+		with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> IEnumerable<IKeyValueTuple<$TKeys$, TValue>>.GetEnumerator()"):
+			stmt("return EnumerateTuples(_version)")
+		with block("IEnumerator<$Tuple<TKeys>$> EnumerateKeys(int version)"):
+			with block("for(int i = 0; ; i++)"):
+				stmt("CheckVersion(version)")
+				with block("if(i == _count)"):
+					stmt("yield break")
+				stmt("yield return %s" % ("_keys[i]" if n == 1 else new_key(["%s[i]" % c for c in columns])))
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt("return EnumerateKeys(_version)")
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return EnumerateKeys(_version)")
+
+# --------------- SortedMapping ----------------
+def sorted_mapping(n):
+	# entries kept in key order in a SkipList, compared key by key from the first, for range and nearest-key queries
+	comparers = "IComparer<TKey> comparer" if n == 1 else ", ".join("IComparer<TKey%i> comparer%i" % (i+1, i+1) for i in range(n))
+	with block("public class SortedMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		if n > 1:
+			with block("protected internal class KeyComparer : IComparer<$Tuple<TKeys>$>"):
+				for i in range(n):
+					stmt("internal readonly IComparer<TKey%i> comparer%i" % (i+1, i+1))
+				with block("public KeyComparer(%s)" % comparers):
+					for i in range(n):
+						stmt("this.comparer%i = comparer%i ?? Comparer<TKey%i>.Default" % (i+1, i+1, i+1))
+				with block("public int Compare($Tuple<TKeys>$ a, $Tuple<TKeys>$ b)"):
+					stmt("int result")
+					for i in range(n-1):
+						with block("if((result = comparer%i.Compare(a.%s, b.%s)) != 0)" % (i+1, item(i+1), item(i+1))):
 							stmt("return result")
-				with block("public bool Contains($TKeys keys$)"):
-					stmt("return this.ContainsKey($keytuple$)")
-				with block("public bool IsFinite"):
-					with block("get"):
-						stmt("return true")
-				with block("public bool IsNumerable"):
-					with block("get"):
-						stmt("return true")
-						
-				with block("public DictionaryMapping() : base()"):
-					pass
-				with block("public DictionaryMapping($IEqualityComparer<TKeys> comparers$) : base (" + ("comparer" if n == 1 else "new EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")") + ")"):
-					pass
-				with block("public new IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
-					with block("for(var e = base.GetEnumerator(); e.MoveNext(); )"):
-						stmt("yield return new KeyValueTuple<$TKeys$, TValue>(e.Current)")
-				with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
-					stmt("return this.Keys.GetEnumerator()")
-				with block("IEnumerator IEnumerable.GetEnumerator()"):
-					stmt("return this.Keys.GetEnumerator()")				
-				if n > 1:
-					with block("public bool ContainsKey($TKeys keys$)"):
-						stmt("return base.ContainsKey($keytuple$)")
-					with block("public bool Remove($TKeys keys$)"):
-						stmt("return base.Remove($keytuple$)")
-					with block("public void Add($TKeys keys$, TValue value)"):
-						stmt("base.Add($keytuple$, value)")
-					with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
-						stmt("return base.TryGetValue($keytuple$, out value)")
-					with block("public TValue this[$TKeys keys$]"):
-						with block("get"):
-							stmt("return base[$keytuple$]")
-						with block("set"):
-							stmt("base[$keytuple$] = value")
-
-			# --------------- LazyMapping ----------------
-			with block("public class LazyMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
-				stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
-				stmt("public delegate bool ContainsDelegate($TKeys keys$)")
-				stmt("protected InstantiateDelegate _instantiator")
-				stmt("protected ContainsDelegate _contains")
-				stmt("protected DictionaryMapping<$TKeys$, TValue> _inner")
-				with block("public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)"):
-					stmt("_inner = new DictionaryMapping<$TKeys$, TValue>()")
-					stmt("_instantiator = instantiator")
-					stmt("_contains = contains")
-				with block("public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, $IEqualityComparer<TKeys> comparers$)"):
-					stmt("_inner = new DictionaryMapping<$TKeys$, TValue>(" + ("comparer" if n == 1 else ", ".join(("comparer%i" % (i+1) for i in range(n)))) + ")")
-					stmt("_instantiator = instantiator")
-					stmt("_contains = contains")
-				with block("public bool Contains($TKeys keys$)"):
-					with block("if(_contains == null)"):
-						stmt("return true")
-					with block("else"):
-						stmt("return _contains($keys$)")
-				with block("public int Count"):
-					with block("get"):
-						stmt('throw new Exception("Domain is not finite")')
-				with block("public bool IsFinite"):
-					with block("get"):
-						stmt("return false")
-				with block("public bool IsNumerable"):
-					with block("get"):
-						stmt("return false")
-				with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("IEnumerator IEnumerable.GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("public TValue this[$TKeys keys$]"):
-					with block("get"):
-						stmt("TValue value")
-						with block("if(_inner.TryGetValue($keys$, out value))"):
-							stmt("return value")
-						with block("else"):
-							stmt("_inner[$keys$] = value = _instantiator($keys$)")
-							stmt("return value")
-				with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
-					stmt("return _inner.TryGetValue($keys$, out value)")
-					
-			# --------------- WeakLazyMapping ----------------
-			with block("public class WeakLazyMapping<$TKeys$, TValue> : WeakMapping, IMapping<$TKeys$, TValue> where TValue : class"):
-				stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
-				stmt("public delegate bool ContainsDelegate($TKeys keys$)")
-				stmt("protected InstantiateDelegate _instantiator")
-				stmt("protected ContainsDelegate _contains")
-				stmt("protected DictionaryMapping<$TKeys$, WeakReference> _inner")
-				with block("public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)"):
-					stmt("_inner = new DictionaryMapping<$TKeys$, WeakReference>()")
-					stmt("_instantiator = instantiator")
-					stmt("_contains = contains")
-					stmt("AddToCleanupList(this)")
-				with block("public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, $IEqualityComparer<TKeys> comparers$)"):
-					stmt("_inner = new DictionaryMapping<$TKeys$, WeakReference>(" + ("comparer" if n == 1 else ", ".join(("comparer%i" % (i+1) for i in range(n)))) + ")")
-					stmt("_instantiator = instantiator")
-					stmt("_contains = contains")
-				with block("protected override void Cleanup()"):
-					stmt("$Tuple<TKeys>$[] keys")
-					with block("lock(_inner)"):
-						stmt("keys = ((IEnumerable<$Tuple<TKeys>$>) _inner).ToArray()")
-					with block("foreach(var key in keys)"):
-						with block("lock(_inner)"):
-							stmt("WeakReference r");
-							stmt("object v");
-							with block("if(_inner.TryGetValue(key, out r) && !r.IsAlive)"):
-								stmt("_inner.Remove(key)")
-				with block("public bool Contains($TKeys keys$)"):
-					with block("if(_contains == null)"):
-						stmt("return true")
-					with block("else"):
-						stmt("return _contains($keys$)")
-				with block("public int Count"):
-					with block("get"):
-						stmt('throw new Exception("Domain is not finite")')
-				with block("public bool IsFinite"):
-					with block("get"):
-						stmt("return false")
-				with block("public bool IsNumerable"):
-					with block("get"):
+					stmt("return comparer%i.Compare(a.%s, b.%s)" % (n, item(n), item(n)))
+		stmt("protected SkipList<$Tuple<TKeys>$, TValue> _inner")
+		with block("public SortedMapping() : this(%s)" % ("(IComparer<TKey>) null" if n == 1 else ", ".join(["null"] * n))):
+			pass
+		with block("public SortedMapping(%s)" % comparers):
+			stmt("_inner = new SkipList<$Tuple<TKeys>$, TValue>(%s)" % ("comparer" if n == 1 else "new KeyComparer(" + ", ".join("comparer%i" % (i+1) for i in range(n)) + ")"))
+		with block("public bool ContainsKey($TKeys keys$)"):
+			stmt("return _inner.ContainsKey($keytuple$)")
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return _inner.ContainsKey($keytuple$)")
+		with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+			stmt("return _inner.TryGetValue($keytuple$, out value)")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("TValue value")
+				with block("if(!_inner.TryGetValue($keytuple$, out value))"):
+					stmt("throw new KeyNotFoundException()")
+				stmt("return value")
+			with block("set"):
+				stmt("_inner.Set($keytuple$, value, false)")
+		with block("public void Add($TKeys keys$, TValue value)"):
+			stmt("_inner.Set($keytuple$, value, true)")
+		with block("public bool Remove($TKeys keys$)"):
+			stmt("return _inner.Remove($keytuple$)")
+		with block("public void Clear()"):
+			stmt("_inner.Clear()")
+		with block("public int Count"):
+			with block("get"):
+				stmt("return _inner.Count")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return true")
+		# the entry with the greatest key not after, or the least key not before, the given keys
+		for name in ("Floor", "Ceiling"):
+			with block("public bool TryGet%s($TKeys keys$, out KeyValueTuple<$TKeys$, TValue> entry)" % name):
+				stmt("KeyValuePair<$Tuple<TKeys>$, TValue> found")
+				stmt("bool result = _inner.TryGet%s($keytuple$, out found)" % name)
+				stmt("entry = new KeyValueTuple<$TKeys$, TValue>(found)")
+				stmt("return result")
+		# entries from 'from' (inclusive) up to 'to' (exclusive), in key order
+		with block("public IEnumerable<KeyValueTuple<$TKeys$, TValue>> Range($Tuple<TKeys>$ from, $Tuple<TKeys>$ to)"):
+			stmt("var comparer = _inner.Comparer")
+			stmt("return Tuples(_inner.Range(key => comparer.Compare(key, from) < 0 ? -1 : comparer.Compare(key, to) < 0 ? 0 : 1))")
+		if n > 1:
+			# entries whose first key lies in [from, to), whatever the other keys
+			with block("public IEnumerable<KeyValueTuple<$TKeys$, TValue>> RangeByKey1(TKey1 from, TKey1 to)"):
+				stmt("var comparer = ((KeyComparer) _inner.Comparer).comparer1")
+				stmt("return Tuples(_inner.Range(key => comparer.Compare(key.Item1, from) < 0 ? -1 : comparer.Compare(key.Item1, to) < 0 ? 0 : 1))")
+		with block("static IEnumerable<KeyValueTuple<$TKeys$, TValue>> Tuples(IEnumerable<KeyValuePair<$Tuple<TKeys>$, TValue>> entries)"):
+			with block("foreach(var entry in entries)"):
+				stmt("yield return new KeyValueTuple<$TKeys$, TValue>(entry)")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			with block("foreach(var entry in _inner)"):
+				stmt("yield return new KeyValueTuple<$TKeys$, TValue>(entry)")
+		with block("IEnumerator<$Tuple<TKeys>$> EnumerateKeys()"):
+			with block("foreach(var entry in _inner)"):
+				stmt("yield return entry.Key")
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt("return EnumerateKeys()")
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return EnumerateKeys()")
+
+# --------------- ShardedMapping ----------------
+def sharded_mapping(n):
+	entry = "KeyValuePair<$Tuple<TKeys>$, TValue>"
+	with block("public class ShardedMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		# A shard is locked for its own reads and writes only. snapshot holds its entries as they were when
+		# last enumerated, or null once a write has changed them, so enumerations of an unchanged shard
+		# take no lock and never block writers.
+		with block("protected class Shard"):
+			stmt("internal readonly Dictionary<$Tuple<TKeys>$, TValue> entries")
+			stmt("internal volatile %s[] snapshot" % entry)
+			with block("internal Shard(IEqualityComparer<$Tuple<TKeys>$> comparer)"):
+				stmt("entries = new Dictionary<$Tuple<TKeys>$, TValue>(comparer)")
+		stmt("protected readonly IEqualityComparer<$Tuple<TKeys>$> _comparer")
+		stmt("protected readonly Shard[] _shards")
+		with block("public ShardedMapping() : this(Environment.ProcessorCount)"):
+			pass
+		# shards is rounded up to a power of two
+		with block("public ShardedMapping(int shards) : this(shards, %s)" % ", ".join(["null"] * n)):
+			pass
+		with block("public ShardedMapping(int shards, $IEqualityComparer<TKeys> comparers$)"):
+			with block("if(shards < 1)"):
+				stmt('throw new ArgumentOutOfRangeException("shards")')
+			stmt("_comparer = " + ("comparer ?? EqualityComparer<TKey>.Default" if n == 1 else "new DictionaryMapping<$TKeys$, TValue>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")"))
+			stmt("int count = 1")
+			with block("while(count < shards)"):
+				stmt("count <<= 1")
+			stmt("_shards = new Shard[count]")
+			with block("for(int i = 0; i < count; i++)"):
+				stmt("_shards[i] = new Shard(_comparer)")
+		with block("public int ShardCount"):
+			with block("get"):
+				stmt("return _shards.Length")
+		with block("protected Shard GetShard($Tuple<TKeys>$ innerKey)"):
+			stmt("int h = _comparer.GetHashCode(innerKey)")
+			stmt("return _shards[(h ^ (h >> 16)) & (_shards.Length - 1)]")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+				stmt("var shard = GetShard(innerKey)")
+				with block("lock(shard)"):
+					stmt("return shard.entries[innerKey]")
+			with block("set"):
+				stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+				stmt("var shard = GetShard(innerKey)")
+				with block("lock(shard)"):
+					stmt("shard.entries[innerKey] = value")
+					stmt("shard.snapshot = null")
+		with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+			stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+			stmt("var shard = GetShard(innerKey)")
+			with block("lock(shard)"):
+				stmt("return shard.entries.TryGetValue(innerKey, out value)")
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+			stmt("var shard = GetShard(innerKey)")
+			with block("lock(shard)"):
+				stmt("return shard.entries.ContainsKey(innerKey)")
+		with block("public void Add($TKeys keys$, TValue value)"):
+			stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+			stmt("var shard = GetShard(innerKey)")
+			with block("lock(shard)"):
+				stmt("shard.entries.Add(innerKey, value)")
+				stmt("shard.snapshot = null")
+		with block("public bool Remove($TKeys keys$)"):
+			stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+			stmt("var shard = GetShard(innerKey)")
+			with block("lock(shard)"):
+				with block("if(!shard.entries.Remove(innerKey))"):
+					stmt("return false")
+				stmt("shard.snapshot = null")
+				stmt("return true")
+		with block("public void Clear()"):
+			with block("foreach(var shard in _shards)"):
+				with block("lock(shard)"):
+					stmt("shard.entries.Clear()")
+					stmt("shard.snapshot = null")
+		# the sum of the shards' counts, read without locking; exact once concurrent writes have finished
+		with block("public int Count"):
+			with block("get"):
+				stmt("int count = 0")
+				with block("foreach(var shard in _shards)"):
+					stmt("count += shard.entries.Count")
+				stmt("return count")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return true")
+		with block("protected static %s[] Snapshot(Shard shard)" % entry):
+			stmt("var snapshot = shard.snapshot")
+			with block("if(snapshot == null)"):
+				with block("lock(shard)"):
+					stmt("snapshot = shard.snapshot")
+					with block("if(snapshot == null)"):
+						stmt("snapshot = new %s[shard.entries.Count]" % entry)
+						stmt("((ICollection<%s>) shard.entries).CopyTo(snapshot, 0)" % entry)
+						stmt("shard.snapshot = snapshot")
+			stmt("return snapshot")
+		# walks the snapshot of each shard in turn, so each shard is enumerated as it was when the
+		# enumeration reached it; a struct, so that foreach does not allocate
+		with block("public struct Enumerator : IEnumerator<KeyValueTuple<$TKeys$, TValue>>, IEnumerator<IKeyValueTuple<$TKeys$, TValue>>"):
+			stmt("readonly Shard[] _shards")
+			stmt("int _shard")
+			stmt("%s[] _snapshot" % entry)
+			stmt("int _index")
+			with block("internal Enumerator(ShardedMapping<$TKeys$, TValue> mapping)"):
+				stmt("_shards = mapping._shards")
+				stmt("_shard = -1")
+				stmt("_snapshot = null")
+				stmt("_index = -1")
+			with block("public KeyValueTuple<$TKeys$, TValue> Current"):
+				with block("get"):
+					stmt("return new KeyValueTuple<$TKeys$, TValue>(_snapshot[_index])")
+			with block("IKeyValueTuple<$TKeys$, TValue> IEnumerator<IKeyValueTuple<$TKeys$, TValue>>.Current"):
+				with block("get"):
+					stmt("return Current")
+			with block("object IEnumerator.Current"):
+				with block("get"):
+					stmt("return Current")
+			with block("public bool MoveNext()"):
+				with block("while(_snapshot == null || ++_index >= _snapshot.Length)"):
+					with block("if(++_shard >= _shards.Length)"):
 						stmt("return false")
-				with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("IEnumerator IEnumerable.GetEnumerator()"):
-					stmt('throw new Exception("Domain is non-numerable")')
-				with block("public TValue this[$TKeys keys$]"):
-					with block("get"):
-						stmt("WeakReference r")
-						stmt("TValue v")
-						with block("lock(_inner)"):
-							with block("if(_inner.TryGetValue($keys$, out r))"):
-								stmt("v = r.Target as TValue")
-								with block("if(v != null)"):
-									stmt("return v")
-							stmt("_inner[$keys$] = new WeakReference(v = _instantiator($keys$))")
+					stmt("_snapshot = Snapshot(_shards[_shard])")
+					stmt("_index = -1")
+				stmt("return true")
+			with block("public void Reset()"):
+				stmt("_shard = -1")
+				stmt("_snapshot = null")
+				stmt("_index = -1")
+			with block("public void Dispose()"):
+				pass
+		with block("public Enumerator GetEnumerator()"):
+			stmt("return new Enumerator(this)")
+		with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> IMapping<$TKeys$, TValue>.GetEnumerator()"):
+			stmt("return GetEnumerator()")
+		with block("IEnumerator<IKeyValueTuple<$TKeys$, TValue>> IEnumerable<IKeyValueTuple<$TKeys$, TValue>>.GetEnumerator()"):
+			stmt("return GetEnumerator()")
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			with block("foreach(var shard in _shards)"):
+				with block("foreach(var entry in Snapshot(shard))"):
+					stmt("yield return entry.Key")
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return ((IEnumerable<$Tuple<TKeys>$>) this).GetEnumerator()")
+
+# --------------- SnapshotMapping ----------------
+def snapshot_mapping(n):
+	params = key_parameters(n)
+	fields = ["Key" if n == 1 else "Key%i" % (i+1) for i in range(n)]
+	constraints = " ".join("where %s : struct" % t for t, name in params + [("TValue", "value")])
+	types = ", ".join("typeof(%s)" % t for t, name in params + [("TValue", "value")])
+	def read_keys(record):
+		keys = ["Read<%s>(%s + %sOffset)" % (t, record, field) for (t, name), field in zip(params, fields)]
+		return keys[0] if n == 1 else new_key(keys)
+	# A mapping of unmanaged keys and values read straight from a memory-mapped snapshot file (see
+	# SnapshotFile.cs); lookups probe the index in the file and copy out only the records they compare.
+	with block("public class SnapshotMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>, IDisposable %s" % constraints):
+		# where the keys and the value lie in a record, packed one after the other
+		offset = "0"
+		for (t, name), field in zip(params, fields):
+			stmt("static readonly int %sOffset = %s" % (field, offset))
+			offset = "%sOffset + SnapshotFile.SizeOf(typeof(%s))" % (field, t)
+		stmt("static readonly int ValueOffset = %s" % offset)
+		stmt("static readonly int RecordSize = ValueOffset + SnapshotFile.SizeOf(typeof(TValue))")
+		stmt("static readonly long Stamp = SnapshotFile.Stamp(%s)" % types)
+		stmt("readonly MemoryMappedFile _file")
+		stmt("readonly MemoryMappedViewAccessor _view")
+		stmt("volatile bool _disposed")
+		stmt("readonly int _count")
+		stmt("readonly int _mask")
+		stmt("readonly long _records")
+		with block("public SnapshotMapping(string path)"):
+			stmt("_file = SnapshotFile.OpenRead(path)")
+			with block("try"):
+				stmt("_view = _file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read)")
+				stmt("int buckets")
+				stmt("SnapshotFile.ReadHeader(_view, %i, RecordSize, Stamp, out _count, out buckets)" % n)
+				stmt("_mask = buckets - 1")
+				stmt("_records = SnapshotFile.Slot(buckets)")
+			with block("catch"):
+				stmt("Dispose()")
+				stmt("throw")
+		# writes the entries of a numerable mapping, such as a DictionaryMapping or the Instantiated of a LazyMapping
+		with block("public static void Write(string path, IMapping<$TKeys$, TValue> mapping)"):
+			stmt("int count = mapping.Count")
+			stmt("int buckets = SnapshotFile.Buckets(count)")
+			stmt("long records = SnapshotFile.Slot(buckets)")
+			stmt('var written = path + ".tmp"')
+			with block("try"):
+				with block("using(var file = SnapshotFile.Create(written, SnapshotFile.Length(RecordSize, count, buckets)))"):
+					with block("using(var view = file.CreateViewAccessor())"):
+						stmt("SnapshotFile.WriteHeader(view, %i, RecordSize, count, buckets, Stamp)" % n)
+						stmt("int index = 0")
+						with block("foreach(var entry in mapping)"):
+							with block("if(index == count)"):
+								stmt('throw new InvalidOperationException("The mapping changed while it was written")')
+							stmt("long record = records + (long) index * RecordSize")
+							for (t, name), field in zip(params, fields):
+								stmt("%s %s = entry.%s" % (t, name, field))
+								stmt("view.Write(record + %sOffset, ref %s)" % (field, name))
+							stmt("TValue value = entry.Value")
+							stmt("view.Write(record + ValueOffset, ref value)")
+							stmt("int hash = Hash($keys$)")
+							stmt("int slot = hash & (buckets - 1)")
+							with block("while(view.ReadInt32(SnapshotFile.Slot(slot) + 4) != 0)"):
+								stmt("slot = (slot + 1) & (buckets - 1)")
+							stmt("view.Write(SnapshotFile.Slot(slot), hash)")
+							stmt("view.Write(SnapshotFile.Slot(slot) + 4, ++index)")
+						with block("if(index != count)"):
+							stmt('throw new InvalidOperationException("The mapping changed while it was written")')
+				stmt("SnapshotFile.Replace(written, path)")
+			with block("catch"):
+				stmt("SnapshotFile.Discard(written)")
+				stmt("throw")
+		with block("static int Hash($TKeys keys$)"):
+			hash_combine(n, ("EqualityComparer<%s>.Default.GetHashCode(%s)" % p for p in params))
+		with block("T Read<T>(long position) where T : struct"):
+			stmt("T value")
+			stmt("_view.Read(position, out value)")
+			stmt("return value")
+		# the position of the record holding the keys, or -1; only records whose hash matches are read, key by key
+		with block("long Find($TKeys keys$)"):
+			stmt("CheckDisposed()")
+			stmt("int hash = Hash($keys$)")
+			stmt("bool acquired = false")
+			with block("try"):
+				stmt("IntPtr view = SnapshotFile.Acquire(_view, ref acquired)")
+				with block("for(int slot = hash & _mask; ; slot = (slot + 1) & _mask)"):
+					stmt("int index = SnapshotFile.SlotRecord(view, slot)")
+					with block("if(index == 0)"):
+						stmt("return -1")
+					with block("if(SnapshotFile.SlotHash(view, slot) != hash)"):
+						stmt("continue")
+					stmt("long record = _records + (long) (index - 1) * RecordSize")
+					with block("if(%s)" % " && ".join("EqualityComparer<%s>.Default.Equals(Read<%s>(record + %sOffset), %s)" % (t, t, field, name) for (t, name), field in zip(params, fields))):
+						stmt("return record")
+			with block("finally"):
+				with block("if(acquired)"):
+					stmt("SnapshotFile.Release(_view)")
+		with block("void CheckDisposed()"):
+			with block("if(_disposed)"):
+				stmt("throw new ObjectDisposedException(GetType().Name)")
+		with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+			stmt("long record = Find($keys$)")
+			with block("if(record < 0)"):
+				stmt("value = default(TValue)")
+				stmt("return false")
+			stmt("value = Read<TValue>(record + ValueOffset)")
+			stmt("return true")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("long record = Find($keys$)")
+				with block("if(record < 0)"):
+					stmt("throw new KeyNotFoundException()")
+				stmt("return Read<TValue>(record + ValueOffset)")
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return Find($keys$) >= 0")
+		with block("public int Count"):
+			with block("get"):
+				stmt("return _count")
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return true")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return true")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			with block("for(long record = _records; record < _records + (long) _count * RecordSize; record += RecordSize)"):
+				stmt("CheckDisposed()")
+				stmt("yield return new KeyValueTuple<$TKeys$, TValue>(new KeyValuePair<$Tuple<TKeys>$, TValue>(%s, Read<TValue>(record + ValueOffset)))" % read_keys("record"))
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			with block("for(long record = _records; record < _records + (long) _count * RecordSize; record += RecordSize)"):
+				stmt("CheckDisposed()")
+				stmt("yield return %s" % read_keys("record"))
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt("return ((IEnumerable<$Tuple<TKeys>$>) this).GetEnumerator()")
+		# may be called more than once; a lookup that is probing the view when it is disposed holds its handle,
+		# so the view is only unmapped once that lookup is done
+		with block("public void Dispose()"):
+			stmt("_disposed = true")
+			with block("if(_view != null)"):
+				stmt("_view.Dispose()")
+			stmt("_file.Dispose()")
+
+# --------------- LazyMapping ----------------
+def lazy_mapping(n):
+	with block("public class LazyMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
+		stmt("public delegate TValue[] InstantiateManyDelegate(IList<$Tuple<TKeys>$> keys)")
+		stmt("public delegate bool ContainsDelegate($TKeys keys$)")
+		stmt("protected InstantiateDelegate _instantiator")
+		stmt("protected ContainsDelegate _contains")
+		stmt("protected DictionaryMapping<$TKeys$, TValue> _inner")
+		with block("public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)"):
+			stmt("_inner = new DictionaryMapping<$TKeys$, TValue>()")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public LazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, $IEqualityComparer<TKeys> comparers$)"):
+			stmt("_inner = new DictionaryMapping<$TKeys$, TValue>(" + ("comparer" if n == 1 else ", ".join(("comparer%i" % (i+1) for i in range(n)))) + ")")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(_contains == null)"):
+				stmt("return true")
+			with block("else"):
+				stmt("return _contains($keys$)")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		statistics_members()
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("TValue value")
+				statistics_local()
+				with block("if(_inner.TryGetValue($keys$, out value))"):
+					record("Hit")
+					stmt("return value")
+				with block("else"):
+					record("Miss")
+					stmt("_inner[$keys$] = value = %s" % instantiate("$keys$"))
+					stmt("return value")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("return _inner.TryGetValue($keys$, out value)")
+		# the values instantiated so far, e.g. to write them to a SnapshotMapping
+		with block("public IMapping<$TKeys$, TValue> Instantiated"):
+			with block("get"):
+				stmt("return _inner")
+		# adds entries, e.g. those of a SnapshotMapping written by an earlier run, without calling the
+		# instantiator; keys already instantiated keep their values
+		with block("public void Seed(IEnumerable<IKeyValueTuple<$TKeys$, TValue>> entries)"):
+			with block("foreach(var entry in entries)"):
+				entry_keys = "entry.Key" if n == 1 else ", ".join("entry.Key%i" % (i+1) for i in range(n))
+				with block("if(!_inner.Contains(%s))" % entry_keys):
+					stmt("_inner[%s] = entry.Value" % entry_keys)
+		with block("public TValue[] GetMany(IList<$Tuple<TKeys>$> keys)"):
+			stmt("return GetMany(keys, null)")
+		with block("public TValue[] GetMany(IList<$Tuple<TKeys>$> keys, InstantiateManyDelegate instantiateMany)"):
+			stmt("var values = new TValue[keys.Count]")
+			stmt("List<int> misses = null")
+			with block("for(int i = 0; i < values.Length; i++)"):
+				with block("if(!_inner.TryGetValue(keys[i], out values[i]))"):
+					stmt("(misses ?? (misses = new List<int>())).Add(i)")
+			statistics_local()
+			record("Hits", "values.Length - (misses == null ? 0 : misses.Count)")
+			with block("if(misses != null)"):
+				record("Misses", "misses.Count")
+				instantiate_misses(n, "_inner.Comparer")
+				with block("foreach(var i in misses)"):
+					stmt("_inner[keys[i]] = values[i] = created[keys[i]]")
+			stmt("return values")
+
+# --------------- BoundedLazyMapping ----------------
+def bounded_lazy_mapping(n):
+	with block("public class BoundedLazyMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
+		stmt("public delegate bool ContainsDelegate($TKeys keys$)")
+		stmt("protected InstantiateDelegate _instantiator")
+		stmt("protected ContainsDelegate _contains")
+		stmt("protected Dictionary<$Tuple<TKeys>$, EvictionNode<$Tuple<TKeys>$, TValue>> _inner")
+		stmt("protected EvictionPolicy<$Tuple<TKeys>$, TValue> _policy")
+		stmt("protected int _capacity")
+		with block("public BoundedLazyMapping(InstantiateDelegate instantiator, int capacity, ContainsDelegate contains = null, EvictionPolicy<$Tuple<TKeys>$, TValue> policy = null)"):
+			with block("if(capacity < 1)"):
+				stmt('throw new ArgumentOutOfRangeException("capacity")')
+			stmt("_inner = new Dictionary<$Tuple<TKeys>$, EvictionNode<$Tuple<TKeys>$, TValue>>(capacity)")
+			stmt("_policy = policy ?? new LruEvictionPolicy<$Tuple<TKeys>$, TValue>()")
+			stmt("_capacity = capacity")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public BoundedLazyMapping(InstantiateDelegate instantiator, int capacity, ContainsDelegate contains, EvictionPolicy<$Tuple<TKeys>$, TValue> policy, $IEqualityComparer<TKeys> comparers$)"):
+			with block("if(capacity < 1)"):
+				stmt('throw new ArgumentOutOfRangeException("capacity")')
+			stmt("_inner = new Dictionary<$Tuple<TKeys>$, EvictionNode<$Tuple<TKeys>$, TValue>>(capacity, " + ("comparer" if n == 1 else "new DictionaryMapping<$TKeys$, TValue>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")") + ")")
+			stmt("_policy = policy ?? new LruEvictionPolicy<$Tuple<TKeys>$, TValue>()")
+			stmt("_capacity = capacity")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public int Capacity"):
+			with block("get"):
+				stmt("return _capacity")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(_contains == null)"):
+				stmt("return true")
+			with block("else"):
+				stmt("return _contains($keys$)")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		statistics_members()
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("EvictionNode<$Tuple<TKeys>$, TValue> node")
+				stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+				statistics_local()
+				with block("if(_inner.TryGetValue(innerKey, out node))"):
+					record("Hit")
+					stmt("_policy.Accessed(node)")
+					stmt("return node.Value")
+				record("Miss")
+				stmt("TValue value = %s" % instantiate("$keys$"))
+				# an instantiator that looked the key up itself has added it already; like LazyMapping, the
+				# outer value replaces the one it added
+				with block("if(_inner.TryGetValue(innerKey, out node))"):
+					stmt("node.Value = value")
+					stmt("_policy.Accessed(node)")
+					stmt("return value")
+				with block("if(_inner.Count >= _capacity)"):
+					# recycle the evicted node so a full mapping does not allocate per miss
+					stmt("node = _policy.Evict()")
+					stmt("_inner.Remove(node.Key)")
+				with block("else"):
+					stmt("node = new EvictionNode<$Tuple<TKeys>$, TValue>()")
+				stmt("node.Key = innerKey")
+				stmt("node.Value = value")
+				stmt("_inner.Add(innerKey, node)")
+				stmt("_policy.Added(node)")
+				stmt("return value")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("EvictionNode<$Tuple<TKeys>$, TValue> node")
+			with block("if(_inner.TryGetValue($keytuple$, out node))"):
+				stmt("value = node.Value")
+				stmt("return true")
+			stmt("value = default(TValue)")
+			stmt("return false")
+
+# --------------- ExpiringLazyMapping ----------------
+def expiring_lazy_mapping(n):
+	with block("public class ExpiringLazyMapping<$TKeys$, TValue> : WeakMapping, IMapping<$TKeys$, TValue>"):
+		stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
+		stmt("public delegate bool ContainsDelegate($TKeys keys$)")
+		with block("protected class Entry"):
+			stmt("public $Tuple<TKeys>$ Key")
+			stmt("public TValue Value")
+			stmt("public long Expires")
+			stmt("public bool Refreshing")
+			stmt("public int Slot")
+			stmt("public Entry Previous")
+			stmt("public Entry Next")
+		stmt("protected const int WheelSlots = 64")
+		stmt("protected InstantiateDelegate _instantiator")
+		stmt("protected ContainsDelegate _contains")
+		stmt("protected Dictionary<$Tuple<TKeys>$, Entry> _inner")
+		stmt("protected Entry[] _wheel")
+		stmt("protected long _timeToLive")
+		stmt("protected long _refreshAhead")
+		stmt("protected long _slotSpan")
+		stmt("protected long _sweptSlot")
+		with block("public ExpiringLazyMapping(InstantiateDelegate instantiator, TimeSpan timeToLive, ContainsDelegate contains = null, TimeSpan refreshAhead = default(TimeSpan))"):
+			stmt("_inner = new Dictionary<$Tuple<TKeys>$, Entry>()")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+			stmt("Initialize(timeToLive, refreshAhead)")
+		with block("public ExpiringLazyMapping(InstantiateDelegate instantiator, TimeSpan timeToLive, ContainsDelegate contains, TimeSpan refreshAhead, $IEqualityComparer<TKeys> comparers$)"):
+			stmt("_inner = new Dictionary<$Tuple<TKeys>$, Entry>(" + ("comparer" if n == 1 else "new DictionaryMapping<$TKeys$, TValue>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")") + ")")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+			stmt("Initialize(timeToLive, refreshAhead)")
+		with block("void Initialize(TimeSpan timeToLive, TimeSpan refreshAhead)"):
+			with block("if(timeToLive <= TimeSpan.Zero)"):
+				stmt('throw new ArgumentOutOfRangeException("timeToLive")')
+			stmt("_timeToLive = ToTimestamp(timeToLive)")
+			stmt("_refreshAhead = ToTimestamp(refreshAhead)")
+			# one turn of the wheel spans the time-to-live, so a sweep only visits entries that are due
+			stmt("_slotSpan = Math.Max(_timeToLive / WheelSlots, 1)")
+			stmt("_wheel = new Entry[WheelSlots]")
+			stmt("_sweptSlot = Stopwatch.GetTimestamp() / _slotSpan - 1")
+			stmt("AddToCleanupList(this, TimeSpan.FromSeconds(Math.Max((double) _slotSpan / Stopwatch.Frequency, 0.01)))")
+		with block("void Link(Entry entry)"):
+			stmt("entry.Slot = (int) (entry.Expires / _slotSpan % WheelSlots)")
+			stmt("var head = _wheel[entry.Slot]")
+			with block("if(head == null)"):
+				stmt("entry.Next = entry.Previous = entry")
+			with block("else"):
+				stmt("entry.Next = head")
+				stmt("entry.Previous = head.Previous")
+				stmt("head.Previous.Next = entry")
+				stmt("head.Previous = entry")
+			stmt("_wheel[entry.Slot] = entry")
+		with block("void Unlink(Entry entry)"):
+			with block("if(entry.Next == entry)"):
+				stmt("_wheel[entry.Slot] = null")
+			with block("else"):
+				stmt("entry.Previous.Next = entry.Next")
+				stmt("entry.Next.Previous = entry.Previous")
+				with block("if(_wheel[entry.Slot] == entry)"):
+					stmt("_wheel[entry.Slot] = entry.Next")
+			stmt("entry.Next = entry.Previous = null")
+		with block("void Remove(Entry entry)"):
+			stmt("_inner.Remove(entry.Key)")
+			stmt("Unlink(entry)")
+		with block("protected override bool CleanupBatch()"):
+			with block("lock(_inner)"):
+				stmt("long now = Stopwatch.GetTimestamp()")
+				stmt("long current = now / _slotSpan")
+				with block("if(_sweptSlot + 1 >= current)"):
+					stmt("return true")
+				stmt("_sweptSlot = Math.Max(_sweptSlot + 1, current - WheelSlots)")
+				stmt("var entry = _wheel[_sweptSlot % WheelSlots]")
+				with block("if(entry != null)"):
+					stmt("var last = entry.Previous")
+					stmt("int removed = 0")
+					with block("while(true)"):
+						stmt("var next = entry.Next")
+						with block("if(entry.Expires <= now)"):
+							stmt("Remove(entry)")
+							stmt("removed++")
+						with block("if(entry == last)"):
+							stmt("break")
+						stmt("entry = next")
+					stmt("var statistics = Statistics")
+					with block("if(statistics != null && removed > 0)"):
+						stmt("statistics.RecordRemovals(removed)")
+				stmt("return _sweptSlot + 1 >= current")
+		with block("void Refresh(object state)"):
+			stmt("var entry = (Entry) state")
+			stmt("TValue value")
+			with block("try"):
+				stmt("value = %s" % instantiate(key_items(n, "entry.Key")))
+			with block("catch"):
+				# a failed refresh keeps the current value until it expires
+				with block("lock(_inner)"):
+					stmt("entry.Refreshing = false")
+				stmt("return")
+			with block("lock(_inner)"):
+				stmt("entry.Refreshing = false")
+				stmt("Entry current")
+				with block("if(_inner.TryGetValue(entry.Key, out current) && current == entry)"):
+					stmt("Unlink(entry)")
+					stmt("entry.Value = value")
+					stmt("entry.Expires = Stopwatch.GetTimestamp() + _timeToLive")
+					stmt("Link(entry)")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(_contains == null)"):
+				stmt("return true")
+			with block("else"):
+				stmt("return _contains($keys$)")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		statistics_members(weak = True)
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("Entry entry")
+				stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+				stmt("long now = Stopwatch.GetTimestamp()")
+				statistics_local()
+				with block("lock(_inner)"):
+					with block("if(_inner.TryGetValue(innerKey, out entry))"):
+						with block("if(now < entry.Expires)"):
+							with block("if(_refreshAhead > 0 && !entry.Refreshing && now >= entry.Expires - _refreshAhead)"):
+								stmt("entry.Refreshing = true")
+								stmt("ThreadPool.QueueUserWorkItem(Refresh, entry)")
+							record("Hit")
+							stmt("return entry.Value")
+						stmt("Remove(entry)")
+				record("Miss")
+				stmt("TValue value = %s" % instantiate("$keys$"))
+				with block("lock(_inner)"):
+					stmt("now = Stopwatch.GetTimestamp()")
+					with block("if(_inner.TryGetValue(innerKey, out entry))"):
+						with block("if(now < entry.Expires)"):
+							stmt("return entry.Value")
+						stmt("Remove(entry)")
+					stmt("entry = new Entry()")
+					stmt("entry.Key = innerKey")
+					stmt("entry.Value = value")
+					stmt("entry.Expires = now + _timeToLive")
+					stmt("_inner.Add(innerKey, entry)")
+					stmt("Link(entry)")
+				stmt("return value")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("Entry entry")
+			with block("lock(_inner)"):
+				with block("if(_inner.TryGetValue($keytuple$, out entry) && Stopwatch.GetTimestamp() < entry.Expires)"):
+					stmt("value = entry.Value")
+					stmt("return true")
+			stmt("value = default(TValue)")
+			stmt("return false")
+
+# --------------- ConcurrentLazyMapping ----------------
+def concurrent_lazy_mapping(n):
+	with block("public class ConcurrentLazyMapping<$TKeys$, TValue> : IMapping<$TKeys$, TValue>"):
+		stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
+		stmt("public delegate bool ContainsDelegate($TKeys keys$)")
+		stmt("protected InstantiateDelegate _instantiator")
+		stmt("protected ContainsDelegate _contains")
+		stmt("protected ConcurrentDictionary<$Tuple<TKeys>$, Lazy<TValue>> _inner")
+		with block("public ConcurrentLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)"):
+			stmt("_inner = new ConcurrentDictionary<$Tuple<TKeys>$, Lazy<TValue>>()")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public ConcurrentLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, $IEqualityComparer<TKeys> comparers$)"):
+			stmt("_inner = new ConcurrentDictionary<$Tuple<TKeys>$, Lazy<TValue>>(" + ("comparer ?? EqualityComparer<TKey>.Default" if n == 1 else "new DictionaryMapping<$TKeys$, TValue>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")") + ")")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(_contains == null)"):
+				stmt("return true")
+			with block("else"):
+				stmt("return _contains($keys$)")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		# the miss path lives in its own method so that the closure is only allocated on a miss
+		with block("protected Lazy<TValue> AddLazy($Tuple<TKeys>$ innerKey, $TKeys keys$)"):
+			stmt("return _inner.GetOrAdd(innerKey, new Lazy<TValue>(() => %s, LazyThreadSafetyMode.ExecutionAndPublication))" % instantiate("$keys$"))
+		statistics_members()
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("Lazy<TValue> lazy")
+				stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+				statistics_local()
+				with block("if(!_inner.TryGetValue(innerKey, out lazy))"):
+					record("Miss")
+					stmt("lazy = AddLazy(innerKey, $keys$)")
+				if STATISTICS:
+					with block("else if(statistics != null)"):
+						stmt("statistics.RecordHit()")
+				with block("try"):
+					stmt("return lazy.Value")
+				with block("catch"):
+					# forget the faulted instantiation (unless it has been replaced already) so the next caller retries
+					stmt("((ICollection<KeyValuePair<$Tuple<TKeys>$, Lazy<TValue>>>) _inner).Remove(new KeyValuePair<$Tuple<TKeys>$, Lazy<TValue>>(innerKey, lazy))")
+					stmt("throw")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("Lazy<TValue> lazy")
+			with block("if(_inner.TryGetValue($keytuple$, out lazy) && lazy.IsValueCreated)"):
+				stmt("value = lazy.Value")
+				stmt("return true")
+			stmt("value = default(TValue)")
+			stmt("return false")
+
+# --------------- AsyncLazyMapping ----------------
+def async_lazy_mapping(n):
+	with block("public class AsyncLazyMapping<$TKeys$, TValue> : IMapping<$TKeys$, Task<TValue>>"):
+		stmt("public delegate Task<TValue> InstantiateDelegate($TKeys keys$, CancellationToken cancellationToken)")
+		stmt("public delegate bool ContainsDelegate($TKeys keys$)")
+		stmt("protected InstantiateDelegate _instantiator")
+		stmt("protected ContainsDelegate _contains")
+		stmt("protected ConcurrentDictionary<$Tuple<TKeys>$, Task<TValue>> _inner")
+		stmt("protected CancellationTokenSource _cancellation = new CancellationTokenSource()")
+		with block("public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null)"):
+			stmt("_inner = new ConcurrentDictionary<$Tuple<TKeys>$, Task<TValue>>()")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public AsyncLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, $IEqualityComparer<TKeys> comparers$)"):
+			stmt("_inner = new ConcurrentDictionary<$Tuple<TKeys>$, Task<TValue>>(" + ("comparer ?? EqualityComparer<TKey>.Default" if n == 1 else "new DictionaryMapping<$TKeys$, TValue>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")") + ")")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(_contains == null)"):
+				stmt("return true")
+			with block("else"):
+				stmt("return _contains($keys$)")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, Task<TValue>>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("void Forget($Tuple<TKeys>$ innerKey, Task<TValue> task)"):
+			stmt("((ICollection<KeyValuePair<$Tuple<TKeys>$, Task<TValue>>>) _inner).Remove(new KeyValuePair<$Tuple<TKeys>$, Task<TValue>>(innerKey, task))")
+		# the miss path lives in its own method so that the closures are only allocated on a miss
+		with block("protected Task<TValue> AddTask($Tuple<TKeys>$ innerKey, $TKeys keys$)"):
+			stmt("var source = new TaskCompletionSource<TValue>()")
+			stmt("var task = _inner.GetOrAdd(innerKey, source.Task)")
+			with block("if(task != source.Task)"):
+				stmt("return task")
+			stmt("Task<TValue> instantiated")
+			statistics_local()
+			if STATISTICS:
+				# timed until the task completes
+				stmt("long started = statistics == null ? 0 : Stopwatch.GetTimestamp()")
+			with block("try"):
+				stmt("instantiated = _instantiator($keys$, PendingToken())")
+				with block("if(instantiated == null)"):
+					stmt('throw new InvalidOperationException("The instantiator returned no task")')
+			with block("catch(Exception e)"):
+				stmt("Forget(innerKey, source.Task)")
+				stmt("source.SetException(e)")
+				stmt("return source.Task")
+			# faulted and cancelled tasks are evicted before anyone sees them complete, so the next caller retries
+			with block("instantiated.ContinueWith(t =>", postfix=", TaskContinuationOptions.ExecuteSynchronously);"):
+				record("Instantiation", "started")
+				with block("if(t.IsFaulted || t.IsCanceled)"):
+					stmt("Forget(innerKey, source.Task)")
+				stmt("Tasks.Forward(t, source)")
+			stmt("return source.Task")
+		statistics_members(timed = False)
+		with block("public Task<TValue> GetAsync($TKeys keys$, CancellationToken cancellationToken)"):
+			stmt("Task<TValue> task")
+			stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+			statistics_local()
+			with block("if(!_inner.TryGetValue(innerKey, out task))"):
+				record("Miss")
+				stmt("task = AddTask(innerKey, $keys$)")
+			if STATISTICS:
+				with block("else if(statistics != null)"):
+					stmt("statistics.RecordHit()")
+			stmt("return Tasks.WithCancellation(task, cancellationToken)")
+		with block("public Task<TValue> this[$TKeys keys$]"):
+			with block("get"):
+				stmt("return GetAsync($keys$, CancellationToken.None)")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("Task<TValue> task")
+			with block("if(_inner.TryGetValue($keytuple$, out task) && task.Status == TaskStatus.RanToCompletion)"):
+				stmt("value = task.Result")
+				stmt("return true")
+			stmt("value = default(TValue)")
+			stmt("return false")
+		with block("CancellationToken PendingToken()"):
+			with block("try"):
+				stmt("return _cancellation.Token")
+			# a concurrent CancelPending cancelled and disposed the source in between
+			with block("catch(ObjectDisposedException)"):
+				stmt("return new CancellationToken(true)")
+		with block("public void CancelPending()"):
+			stmt("var cancelled = Interlocked.Exchange(ref _cancellation, new CancellationTokenSource())")
+			with block("try"):
+				stmt("cancelled.Cancel()")
+			with block("finally"):
+				stmt("cancelled.Dispose()")
+
+# --------------- WeakLazyMapping ----------------
+def weak_lazy_mapping(n):
+	with block("public class WeakLazyMapping<$TKeys$, TValue> : WeakMapping, IMapping<$TKeys$, TValue> where TValue : class"):
+		stmt("public delegate TValue InstantiateDelegate($TKeys keys$)")
+		stmt("public delegate TValue[] InstantiateManyDelegate(IList<$Tuple<TKeys>$> keys)")
+		stmt("public delegate bool ContainsDelegate($TKeys keys$)")
+		stmt("protected InstantiateDelegate _instantiator")
+		stmt("protected ContainsDelegate _contains")
+		stmt("protected IEqualityComparer<$Tuple<TKeys>$> _comparer")
+		stmt("protected Dictionary<$Tuple<TKeys>$, WeakReference>[] _stripes")
+		# The optional strong tier: per stripe, and under the stripe's lock, the most recently used values,
+		# held strongly so that they survive collections; values it drops are still weakly held.
+		stmt("protected Dictionary<$Tuple<TKeys>$, EvictionNode<$Tuple<TKeys>$, TValue>>[] _strong")
+		stmt("protected LruEvictionPolicy<$Tuple<TKeys>$, TValue>[] _recency")
+		stmt("protected int _strongCapacity")
+		stmt("List<$Tuple<TKeys>$> _dead = new List<$Tuple<TKeys>$>()")
+		stmt("int _cleanupStripe")
+		with block("public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains = null) : this(instantiator, contains, 0)"):
+			pass
+		with block("public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, $IEqualityComparer<TKeys> comparers$) : this(instantiator, contains, 0, %s)" % ("comparer" if n == 1 else ", ".join(("comparer%i" % (i+1) for i in range(n))))):
+			pass
+		with block("public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, int strongCapacity)"):
+			stmt("_comparer = EqualityComparer<$Tuple<TKeys>$>.Default")
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+			stmt("CreateStripes(strongCapacity)")
+			stmt("AddToCleanupList(this)")
+		with block("public WeakLazyMapping(InstantiateDelegate instantiator, ContainsDelegate contains, int strongCapacity, $IEqualityComparer<TKeys> comparers$)"):
+			stmt("_comparer = " + ("comparer ?? EqualityComparer<TKey>.Default" if n == 1 else "new DictionaryMapping<$TKeys$, WeakReference>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")"))
+			stmt("_instantiator = instantiator")
+			stmt("_contains = contains")
+			stmt("CreateStripes(strongCapacity)")
+			stmt("AddToCleanupList(this)")
+		with block("void CreateStripes(int strongCapacity)"):
+			with block("if(strongCapacity < 0)"):
+				stmt('throw new ArgumentOutOfRangeException("strongCapacity")')
+			stmt("_stripes = new Dictionary<$Tuple<TKeys>$, WeakReference>[%i]" % LOCK_STRIPES)
+			with block("for(int i = 0; i < _stripes.Length; i++)"):
+				stmt("_stripes[i] = new Dictionary<$Tuple<TKeys>$, WeakReference>(_comparer)")
+			with block("if(strongCapacity > 0)"):
+				stmt("_strongCapacity = (strongCapacity + _stripes.Length - 1) / _stripes.Length")
+				stmt("_strong = new Dictionary<$Tuple<TKeys>$, EvictionNode<$Tuple<TKeys>$, TValue>>[_stripes.Length]")
+				stmt("_recency = new LruEvictionPolicy<$Tuple<TKeys>$, TValue>[_stripes.Length]")
+				with block("for(int i = 0; i < _stripes.Length; i++)"):
+					stmt("_strong[i] = new Dictionary<$Tuple<TKeys>$, EvictionNode<$Tuple<TKeys>$, TValue>>(_strongCapacity, _comparer)")
+					stmt("_recency[i] = new LruEvictionPolicy<$Tuple<TKeys>$, TValue>()")
+		# the number of values the strong tier holds at most, the requested capacity rounded up to a multiple of the stripe count
+		with block("public int StrongCapacity"):
+			with block("get"):
+				stmt("return _strong == null ? 0 : _strongCapacity * _stripes.Length")
+		# both are called with stripe s locked
+		with block("protected bool TryGetStrong(int s, $Tuple<TKeys>$ innerKey, out TValue value)"):
+			with block("if(_strong != null)"):
+				stmt("EvictionNode<$Tuple<TKeys>$, TValue> node")
+				with block("if(_strong[s].TryGetValue(innerKey, out node))"):
+					stmt("_recency[s].Accessed(node)")
+					stmt("value = node.Value")
+					stmt("return true")
+			stmt("value = null")
+			stmt("return false")
+		# puts a value into the strong tier, demoting the least recently used one of the stripe if it is full;
+		# promoted tells a value found among the weak references from a new one
+		with block("protected void Retain(int s, $Tuple<TKeys>$ innerKey, TValue value, bool promoted)"):
+			with block("if(_strong == null)"):
+				stmt("return")
+			stmt("var strong = _strong[s]")
+			stmt("EvictionNode<$Tuple<TKeys>$, TValue> node")
+			with block("if(strong.TryGetValue(innerKey, out node))"):
+				stmt("node.Value = value")
+				stmt("_recency[s].Accessed(node)")
+				stmt("return")
+			statistics_local()
+			with block("if(strong.Count >= _strongCapacity)"):
+				stmt("node = _recency[s].Evict()")
+				stmt("strong.Remove(node.Key)")
+				record("Demotion")
+			with block("else"):
+				stmt("node = new EvictionNode<$Tuple<TKeys>$, TValue>()")
+			stmt("node.Key = innerKey")
+			stmt("node.Value = value")
+			stmt("strong.Add(innerKey, node)")
+			stmt("_recency[s].Added(node)")
+			if STATISTICS:
+				with block("if(promoted && statistics != null)"):
+					stmt("statistics.RecordPromotion()")
+		with block("protected int GetStripeIndex($Tuple<TKeys>$ innerKey)"):
+			if LOCK_STRIPES == 1:
+				stmt("return 0")
+			else:
+				stmt("int h = _comparer.GetHashCode(innerKey)")
+				stmt("return (h ^ (h >> 16)) & %i" % (LOCK_STRIPES - 1))
+		with block("protected Dictionary<$Tuple<TKeys>$, WeakReference> GetStripe($Tuple<TKeys>$ innerKey)"):
+			stmt("return _stripes[GetStripeIndex(innerKey)]")
+		with block("protected override bool CleanupBatch()"):
+			stmt("var stripe = _stripes[_cleanupStripe]")
+			with block("lock(stripe)"):
+				with block("foreach(var kv in stripe)"):
+					with block("if(!kv.Value.IsAlive)"):
+						stmt("_dead.Add(kv.Key)")
+				with block("foreach(var key in _dead)"):
+					stmt("stripe.Remove(key)")
+			stmt("var statistics = Statistics")
+			with block("if(statistics != null && _dead.Count > 0)"):
+				stmt("statistics.RecordRemovals(_dead.Count)")
+			stmt("_dead.Clear()")
+			stmt("_cleanupStripe = (_cleanupStripe + 1) % _stripes.Length")
+			stmt("return _cleanupStripe == 0")
+		with block("public bool Contains($TKeys keys$)"):
+			with block("if(_contains == null)"):
+				stmt("return true")
+			with block("else"):
+				stmt("return _contains($keys$)")
+		with block("public int Count"):
+			with block("get"):
+				stmt('throw new Exception("Domain is not finite")')
+		with block("public bool IsFinite"):
+			with block("get"):
+				stmt("return false")
+		with block("public bool IsNumerable"):
+			with block("get"):
+				stmt("return false")
+		with block("public IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator<$Tuple<TKeys>$> IEnumerable<$Tuple<TKeys>$>.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("IEnumerator IEnumerable.GetEnumerator()"):
+			stmt('throw new Exception("Domain is non-numerable")')
+		statistics_members(weak = True)
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("WeakReference r")
+				stmt("TValue v")
+				stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+				stmt("int s = GetStripeIndex(innerKey)")
+				stmt("var stripe = _stripes[s]")
+				statistics_local()
+				with block("lock(stripe)"):
+					with block("if(TryGetStrong(s, innerKey, out v))"):
+						record("Hit")
+						stmt("return v")
+					with block("if(stripe.TryGetValue(innerKey, out r))"):
+						with block("if((v = r.Target as TValue) != null)"):
+							record("Hit")
+							stmt("Retain(s, innerKey, v, true)")
 							stmt("return v")
-				with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
-					stmt("WeakReference r")
-					with block("lock(_inner)"):
-						with block("if(_inner.TryGetValue($keys$, out r))"):
-							stmt("value = r.Target as TValue")
-							stmt("return value != null")
-						stmt("value = null")
-						stmt("return false")
+						stmt("NoteDeadReference()")
+						record("Resurrection")
+				record("Miss")
+				# instantiate outside the lock, then publish unless another thread got there first
+				stmt("v = %s" % instantiate("$keys$"))
+				with block("lock(stripe)"):
+					stmt("TValue existing")
+					with block("if(stripe.TryGetValue(innerKey, out r) && (existing = r.Target as TValue) != null)"):
+						stmt("Retain(s, innerKey, existing, true)")
+						stmt("return existing")
+					stmt("stripe[innerKey] = new WeakReference(v)")
+					stmt("Retain(s, innerKey, v, false)")
+				stmt("return v")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("WeakReference r")
+			stmt("$Tuple<TKeys>$ innerKey = $keytuple$")
+			stmt("var stripe = GetStripe(innerKey)")
+			with block("lock(stripe)"):
+				with block("if(stripe.TryGetValue(innerKey, out r))"):
+					stmt("value = r.Target as TValue")
+					stmt("return value != null")
+				stmt("value = null")
+				stmt("return false")
+		with block("public TValue[] GetMany(IList<$Tuple<TKeys>$> keys)"):
+			stmt("return GetMany(keys, null)")
+		with block("public TValue[] GetMany(IList<$Tuple<TKeys>$> keys, InstantiateManyDelegate instantiateMany)"):
+			stmt("var values = new TValue[keys.Count]")
+			stmt("var stripeOf = new int[keys.Count]")
+			stmt("var perStripe = new int[_stripes.Length]")
+			with block("for(int i = 0; i < stripeOf.Length; i++)"):
+				stmt("perStripe[stripeOf[i] = GetStripeIndex(keys[i])]++")
+			stmt("List<int> misses = null")
+			stmt("WeakReference r")
+			statistics_local()
+			# each stripe is locked once for the lookups and once more to publish the misses
+			with block("for(int s = 0; s < _stripes.Length; s++)"):
+				with block("if(perStripe[s] == 0)"):
+					stmt("continue")
+				stmt("perStripe[s] = 0")
+				stmt("var stripe = _stripes[s]")
+				with block("lock(stripe)"):
+					with block("for(int i = 0; i < stripeOf.Length; i++)"):
+						with block("if(stripeOf[i] != s)"):
+							stmt("continue")
+						with block("if(TryGetStrong(s, keys[i], out values[i]))"):
+							stmt("continue")
+						with block("if(stripe.TryGetValue(keys[i], out r))"):
+							with block("if((values[i] = r.Target as TValue) != null)"):
+								stmt("Retain(s, keys[i], values[i], true)")
+								stmt("continue")
+							stmt("NoteDeadReference()")
+							record("Resurrection")
+						stmt("(misses ?? (misses = new List<int>())).Add(i)")
+						stmt("perStripe[s]++")
+			record("Hits", "values.Length - (misses == null ? 0 : misses.Count)")
+			with block("if(misses != null)"):
+				record("Misses", "misses.Count")
+				instantiate_misses(n, "_comparer")
+				with block("for(int s = 0; s < _stripes.Length; s++)"):
+					with block("if(perStripe[s] == 0)"):
+						stmt("continue")
+					stmt("var stripe = _stripes[s]")
+					with block("lock(stripe)"):
+						with block("foreach(var i in misses)"):
+							with block("if(stripeOf[i] != s)"):
+								stmt("continue")
+							with block("if(stripe.TryGetValue(keys[i], out r) && (values[i] = r.Target as TValue) != null)"):
+								stmt("Retain(s, keys[i], values[i], true)")
+								stmt("continue")
+							stmt("stripe[keys[i]] = new WeakReference(values[i] = created[keys[i]])")
+							stmt("Retain(s, keys[i], values[i], false)")
+			stmt("return values")
+
+# --------------- generic arities ----------------
+# Above GENERIC_ABOVE the mappings derive from their single-key counterparts keyed by $Tuple<TKeys>$,
+# and only add the multi-key members, so higher arities cost a few dozen lines each.
+CONSTRUCTOR_ARGS = {
+	"LazyMapping": ([], []),
+	"BoundedLazyMapping": ([("int", "capacity")], [("EvictionPolicy<$Tuple<TKeys>$, TValue>", "policy", "null")]),
+	"ExpiringLazyMapping": ([("TimeSpan", "timeToLive")], [("TimeSpan", "refreshAhead", "default(TimeSpan)")]),
+	"ConcurrentLazyMapping": ([], []),
+	"AsyncLazyMapping": ([], []),
+	"WeakLazyMapping": ([], []),
+}
+# arguments that, like the strong tier of WeakLazyMapping, came after the comparers had shipped, so they
+# get constructors of their own rather than changing the existing ones
+OPTIONAL_CONSTRUCTOR_ARGS = {
+	"WeakLazyMapping": [("int", "strongCapacity")],
+}
+
+def generic_dictionary_mapping(n):
+	with block("public class DictionaryMapping<$TKeys$, TValue> : DictionaryMapping<$Tuple<TKeys>$, TValue>, IMapping<$TKeys$, TValue>"):
+		equality_comparer(n)
+		with block("public DictionaryMapping() : base()"):
+			pass
+		with block("public DictionaryMapping($IEqualityComparer<TKeys> comparers$) : base (new EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + "))"):
+			pass
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return base.ContainsKey($keytuple$)")
+		if prefix_indexed(n):
+			# the base class's writes are virtual, so writes through it or its interfaces reach the index too
+			with block("public override void Add($Tuple<TKeys>$ key, TValue value)"):
+				stmt("base.Add(key, value)")
+				with block("if(_prefixIndex != null)"):
+					stmt("IndexSet(_prefixIndex, key, value)")
+			with block("public override bool Remove($Tuple<TKeys>$ key)"):
+				with block("if(!base.Remove(key))"):
+					stmt("return false")
+				with block("if(_prefixIndex != null)"):
+					stmt("IndexRemove(key)")
+				stmt("return true")
+			with block("public override TValue this[$Tuple<TKeys>$ key]"):
+				with block("get"):
+					stmt("return base[key]")
+				with block("set"):
+					stmt("base[key] = value")
+					with block("if(_prefixIndex != null)"):
+						stmt("IndexSet(_prefixIndex, key, value)")
+			with block("public override void Clear()"):
+				stmt("base.Clear()")
+				with block("if(_prefixIndex != null)"):
+					stmt("_prefixIndex.Clear()")
+		dictionary_enumeration(n, True)
+		dictionary_multi_key_members(n)
+		if "FrozenMapping" in selected:
+			with block("public new FrozenMapping<$TKeys$, TValue> Freeze()"):
+				stmt("return new FrozenMapping<$TKeys$, TValue>(this, Comparer)")
+
+def generic_frozen_mapping(n):
+	with block("public class FrozenMapping<$TKeys$, TValue> : FrozenMapping<$Tuple<TKeys>$, TValue>, IMapping<$TKeys$, TValue>"):
+		with block("public FrozenMapping(ICollection<KeyValuePair<$Tuple<TKeys>$, TValue>> entries, IEqualityComparer<$Tuple<TKeys>$> comparer = null) : base(entries, comparer)"):
+			pass
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return IndexOf($keytuple$) >= 0")
+		with block("public bool TryGetValue($TKeys keys$, out TValue value)"):
+			stmt("return TryGetValue($keytuple$, out value)")
+		with block("public TValue this[$TKeys keys$]"):
+			with block("get"):
+				stmt("return this[$keytuple$]")
+		with block("public new IEnumerator<IKeyValueTuple<$TKeys$, TValue>> GetEnumerator()"):
+			with block("for(int i = 0; i < _keys.Length; i++)"):
+				stmt("yield return new KeyValueTuple<$TKeys$, TValue>(new KeyValuePair<$Tuple<TKeys>$, TValue>(_keys[i], _values[i]))")
+
+def generic_lazy_mapping(n, name):
+	base = name + "<$Tuple<TKeys>$, TValue>"
+	value = "Task<TValue>" if name == "AsyncLazyMapping" else "TValue"
+	constraint = " where TValue : class" if name == "WeakLazyMapping" else ""
+	with block("public class %s<$TKeys$, TValue> : %s, IMapping<$TKeys$, %s>%s" % (name, base, value, constraint)):
+		if name == "AsyncLazyMapping":
+			stmt("public new delegate Task<TValue> InstantiateDelegate($TKeys keys$, CancellationToken cancellationToken)")
+			instantiator = "(key, cancellationToken) => instantiator(%s, cancellationToken)" % key_items(n, "key")
+		else:
+			stmt("public new delegate TValue InstantiateDelegate($TKeys keys$)")
+			instantiator = "key => instantiator(%s)" % key_items(n, "key")
+		stmt("public new delegate bool ContainsDelegate($TKeys keys$)")
+		contains = "contains == null ? null : new %s.ContainsDelegate(key => contains(%s))" % (base, key_items(n, "key"))
+		before, after = CONSTRUCTOR_ARGS[name]
+		comparer = "new DictionaryMapping<$TKeys$, TValue>.EqualityComparer(" + ", ".join(("comparer%i" % (i+1) for i in range(n))) + ")"
+		parameters = ["InstantiateDelegate instantiator"] + ["%s %s" % a[:2] for a in before] + ["ContainsDelegate contains = null"] + ["%s %s = %s" % a for a in after]
+		arguments = [instantiator] + [a[1] for a in before] + [contains] + [a[1] for a in after]
+		with block("public %s(%s) : base(%s)" % (name, ", ".join(parameters), ", ".join(arguments))):
+			pass
+		parameters = ["InstantiateDelegate instantiator"] + ["%s %s" % a[:2] for a in before] + ["ContainsDelegate contains"] + ["%s %s" % a[:2] for a in after] + ["$IEqualityComparer<TKeys> comparers$"]
+		with block("public %s(%s) : base(%s)" % (name, ", ".join(parameters), ", ".join(arguments + [comparer]))):
+			pass
+		optional = OPTIONAL_CONSTRUCTOR_ARGS.get(name)
+		if optional:
+			parameters = ["InstantiateDelegate instantiator"] + ["%s %s" % a[:2] for a in before] + ["ContainsDelegate contains"] + ["%s %s" % a[:2] for a in after] + ["%s %s" % a for a in optional]
+			arguments = arguments + [a[1] for a in optional]
+			with block("public %s(%s) : base(%s)" % (name, ", ".join(parameters), ", ".join(arguments))):
+				pass
+			with block("public %s(%s) : base(%s)" % (name, ", ".join(parameters + ["$IEqualityComparer<TKeys> comparers$"]), ", ".join(arguments + [comparer]))):
+				pass
+		with block("public bool Contains($TKeys keys$)"):
+			stmt("return Contains($keytuple$)")
+		with block("public new IEnumerator<IKeyValueTuple<$TKeys$, %s>> GetEnumerator()" % value):
+			stmt('throw new Exception("Domain is non-numerable")')
+		with block("public %s this[$TKeys keys$]" % value):
+			with block("get"):
+				stmt("return this[$keytuple$]")
+		with block("public bool TryGetExisting($TKeys keys$, out TValue value)"):
+			stmt("return TryGetExisting($keytuple$, out value)")
+		if name == "AsyncLazyMapping":
+			with block("public Task<TValue> GetAsync($TKeys keys$, CancellationToken cancellationToken)"):
+				stmt("return GetAsync($keytuple$, cancellationToken)")
+
+EMITTERS = [
+	("Mapping", mapping),
+	("MappingView", mapping_view),
+	("DictionaryMapping", dictionary_mapping),
+	("FrozenMapping", frozen_mapping),
+	("ColumnarMapping", columnar_mapping),
+	("SortedMapping", sorted_mapping),
+	("ShardedMapping", sharded_mapping),
+	("SnapshotMapping", snapshot_mapping),
+	("LazyMapping", lazy_mapping),
+	("BoundedLazyMapping", bounded_lazy_mapping),
+	("ExpiringLazyMapping", expiring_lazy_mapping),
+	("ConcurrentLazyMapping", concurrent_lazy_mapping),
+	("AsyncLazyMapping", async_lazy_mapping),
+	("WeakLazyMapping", weak_lazy_mapping),
+]
+assert [name for name, emitter in EMITTERS] == CLASSES
+
+# every class other than Mapping, MappingView, ColumnarMapping and SortedMapping keeps its entries in, or borrows the comparer of,
+# DictionaryMapping, or, like SnapshotMapping, is benchmarked against one; MappingView calls the delegates of Mappings directly
+selected = set(c.strip() for c in args.classes.split(",") if c.strip())
+unknown = selected - set(CLASSES)
+if unknown:
+	parser.error("unknown classes: " + ", ".join(sorted(unknown)))
+if selected - set(["Mapping", "MappingView", "ColumnarMapping", "SortedMapping"]):
+	selected.add("DictionaryMapping")
+if "MappingView" in selected:
+	selected.add("Mapping")
+
+arities = list(range(args.min_arity, args.max_arity + 1))
+if arities[-1] > args.generic_above and 1 not in arities:
+	arities.insert(0, 1)
+
+def subs_for(n):
+	if n == 1:
+		return {
+			'Tuple<TKeys>': "TKey",
+			'TKeys': "TKey",
+			'TKeys keys': "TKey key",
+			'keytuple': "key",
+			'keys': 'key',
+			'IEqualityComparer<TKeys>' : "IEqualityComparer<TKey>",
+			'IEqualityComparer<TKeys> comparers' : "IEqualityComparer<TKey> comparer"
+		}
+	types = ["TKey%i" % (i+1) for i in range(n)]
+	values = ["key%i" % (i+1) for i in range(n)]
+	return {
+		'TKeys': ", ".join(types), 
+		'TKeys keys': ", ".join(["TKey%i key%i" % (i+1, i+1) for i in range(n)]),
+		'Tuple<TKeys>': "CompositeKey<%s>" % ", ".join(types) if STRUCT_KEYS else tuple_type(types),
+		'keytuple': new_key(values),
+		'keys': ", ".join(['key' + str(i+1) for i in range(n)]),
+		'IEqualityComparer<TKeys>' : ", ".join(["IEqualityComparer<TKey%i>" % (i+1) for i in range(n)]),
+		'IEqualityComparer<TKeys> comparers' : ", ".join(["IEqualityComparer<TKey%i> comparer%i" % (i+1, i+1) for i in range(n)])
+	}
+
+USINGS = ["System", "System.Collections", "System.Collections.Generic", "System.Collections.Concurrent", "System.Threading", "System.Threading.Tasks", "System.Diagnostics", "System.Linq", "System.Linq.Expressions", "System.IO.MemoryMappedFiles"]
+
+def render_class(name, emitter, n):
+	# Mapping, SortedMapping and ShardedMapping are too small, and MappingView, ColumnarMapping and SnapshotMapping too
+	# arity-specific, to share the single-key code
+	if n <= args.generic_above or name in ("Mapping", "MappingView", "ColumnarMapping", "SortedMapping", "ShardedMapping", "SnapshotMapping"):
+		emitter(n)
+	elif name == "DictionaryMapping":
+		generic_dictionary_mapping(n)
+	elif name == "FrozenMapping":
+		generic_frozen_mapping(n)
+	else:
+		generic_lazy_mapping(n, name)
+
+def units():
+	# (file name, unit), in the order the single-file output follows; a unit is picklable, so it can be sent to a worker process
+	yield "PrimitiveArrayComparers.cs", ("PrimitiveArrayComparers", 0)
+	for n in arities:
+		yield "IMapping.%i.cs" % n, ("IMapping", n)
+		for name in CLASSES:
+			if name in selected:
+				yield "%s.%i.cs" % (name, n), (name, n)
+
+def emit_unit(unit):
+	name, n = unit
+	if name == "PrimitiveArrayComparers":
+		for t, type_name in PRIMITIVES:
+			primitive_array_comparer(t, type_name)
+		return
+	with placeholders(**subs_for(n)):
+		if name == "IMapping":
+			composite_key(n)
+			domain_interface(n)
+			key_value_tuple(n)
+			mapping_interface(n)
+		else:
+			render_class(name, dict(EMITTERS)[name], n)
+
+def header():
+	for using in USINGS:
+		stmt("using " + using)
+
+def render_file(unit):
+	def emit():
+		header()
+		with block("namespace Reynolds.Mappings"):
+			emit_unit(unit)
+	return render(emit)
+
+def render_single_file():
+	header()
+	with block("namespace Reynolds.Mappings"):
+		for fn, unit in units():
+			emit_unit(unit)
+
+# Rendered files are cached until this script, the modules it imports or the options that shape the code change.
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__", "Mapping.cache")
+
+def cache_key():
+	here = os.path.dirname(os.path.abspath(__file__))
+	options = sorted((name, value) for name, value in vars(args).items() if name not in ("output", "output_dir", "benchmarks", "python", "python_benchmarks", "jobs", "no_cache"))
+	return fingerprint([os.path.join(here, fn) for fn in ("Mapping.py", "CodeGen.py", "Benchmarks.py")], options)
+
+# worker processes import this module too, so only the main process writes
+if __name__ == "__main__":
+	if args.output == "-":
+		render(render_single_file, sys.stdout)
+	elif args.output:
+		write_if_changed(args.output, render(render_single_file))
+	else:
+		if not os.path.isdir(args.output_dir):
+			os.makedirs(args.output_dir)
+		files = list(units())
+		key = cache_key()
+		texts = {} if args.no_cache else load_cache(CACHE, key)
+		missing = [unit for fn, unit in files if unit not in texts]
+		if len(missing) > 1 and args.jobs > 1:
+			pool = multiprocessing.Pool(args.jobs)
+			texts.update(zip(missing, pool.map(render_file, missing)))
+			pool.close()
+		else:
+			texts.update((unit, render_file(unit)) for unit in missing)
+		if missing:
+			save_cache(CACHE, key, texts)
+		written = 0
+		for fn, unit in files:
+			written += write_if_changed(os.path.join(args.output_dir, fn), texts[unit])
+		generated = set(fn for fn, unit in files)
+		for fn in os.listdir(args.output_dir):
+			if fn.endswith(".cs") and fn not in generated:
+				os.remove(os.path.join(args.output_dir, fn))
+		print("%i of %i files rendered, %i rewritten in %s" % (len(missing), len(files), written, args.output_dir))
 
-codegen_end()
+	if args.benchmarks:
+		write_if_changed(args.benchmarks, render(lambda: emit_benchmarks(arities, selected, CLASSES, STATISTICS)))
+	if args.python:
+		write_if_changed(args.python, render(lambda: emit_python(arities, selected, LOCK_STRIPES), writer_class = PythonWriter))
+	if args.python_benchmarks:
+		module = os.path.splitext(os.path.basename(args.python or "reynolds_mappings.py"))[0]
+		write_if_changed(args.python_benchmarks, render(lambda: emit_python_benchmarks(module, arities, selected), writer_class = PythonWriter))
 
 # from System import *
 # from System.CodeDom import *
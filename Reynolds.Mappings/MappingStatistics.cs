@@ -0,0 +1,243 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text;
+using System.Threading;
+
+namespace Reynolds.Mappings
+{
+	// Counters a lazy or weak mapping updates once its Statistics is set. Every thread adds to the
+	// stripe picked by its id, and the properties sum over the stripes, so recording hardly contends.
+	// A metrics publisher (EventCounters, Meter, performance counters) polls the properties.
+	public class MappingStatistics
+	{
+		public const int HistogramBuckets = 32;
+
+		const int HitCell = 0;
+		const int MissCell = 1;
+		const int InstantiationCell = 2;
+		const int InstantiationTicksCell = 3;
+		const int ResurrectionCell = 4;
+		const int CleanupCell = 5;
+		const int CleanupTicksCell = 6;
+		const int RemovalCell = 7;
+		const int HistogramCell = 8;
+		const int PromotionCell = HistogramCell + HistogramBuckets;
+		const int DemotionCell = PromotionCell + 1;
+		// a multiple of eight longs, so every stripe covers whole cache lines
+		const int Stride = 48;
+
+		readonly long[] cells;
+		readonly int stripeMask;
+
+		public MappingStatistics() : this(Environment.ProcessorCount)
+		{
+		}
+
+		public MappingStatistics(int stripes)
+		{
+			int count = 1;
+			while(count < stripes)
+				count <<= 1;
+			stripeMask = count - 1;
+			cells = new long[count * Stride];
+		}
+
+		int Stripe()
+		{
+			return (Thread.CurrentThread.ManagedThreadId & stripeMask) * Stride;
+		}
+
+		long Sum(int cell)
+		{
+			long result = 0;
+			for(int i = cell; i < cells.Length; i += Stride)
+				result += Interlocked.Read(ref cells[i]);
+			return result;
+		}
+
+		// bucket 0 holds durations under a microsecond, bucket i those from 2^(i-1) up to 2^i microseconds
+		static int Bucket(long ticks)
+		{
+			long microseconds = ticks * 1000000 / Stopwatch.Frequency;
+			int bucket = 0;
+			while(microseconds > 0 && bucket < HistogramBuckets - 1)
+			{
+				microseconds >>= 1;
+				bucket++;
+			}
+			return bucket;
+		}
+
+		public void RecordHit()
+		{
+			Interlocked.Increment(ref cells[Stripe() + HitCell]);
+		}
+
+		public void RecordHits(int count)
+		{
+			Interlocked.Add(ref cells[Stripe() + HitCell], count);
+		}
+
+		public void RecordMiss()
+		{
+			Interlocked.Increment(ref cells[Stripe() + MissCell]);
+		}
+
+		public void RecordMisses(int count)
+		{
+			Interlocked.Add(ref cells[Stripe() + MissCell], count);
+		}
+
+		public void RecordResurrection()
+		{
+			Interlocked.Increment(ref cells[Stripe() + ResurrectionCell]);
+		}
+
+		public void RecordPromotion()
+		{
+			Interlocked.Increment(ref cells[Stripe() + PromotionCell]);
+		}
+
+		public void RecordDemotion()
+		{
+			Interlocked.Increment(ref cells[Stripe() + DemotionCell]);
+		}
+
+		// started is the Stopwatch.GetTimestamp() taken before the instantiator was called
+		public void RecordInstantiation(long started)
+		{
+			long ticks = Stopwatch.GetTimestamp() - started;
+			int stripe = Stripe();
+			Interlocked.Increment(ref cells[stripe + InstantiationCell]);
+			Interlocked.Add(ref cells[stripe + InstantiationTicksCell], ticks);
+			Interlocked.Increment(ref cells[stripe + HistogramCell + Bucket(ticks)]);
+		}
+
+		public void RecordCleanup(long started)
+		{
+			long ticks = Stopwatch.GetTimestamp() - started;
+			int stripe = Stripe();
+			Interlocked.Increment(ref cells[stripe + CleanupCell]);
+			Interlocked.Add(ref cells[stripe + CleanupTicksCell], ticks);
+		}
+
+		// entries a cleanup removed because their values had been collected or had expired
+		public void RecordRemovals(int count)
+		{
+			Interlocked.Add(ref cells[Stripe() + RemovalCell], count);
+		}
+
+		public long Hits
+		{
+			get
+			{
+				return Sum(HitCell);
+			}
+		}
+
+		public long Misses
+		{
+			get
+			{
+				return Sum(MissCell);
+			}
+		}
+
+		public double HitRatio
+		{
+			get
+			{
+				long hits = Hits, lookups = hits + Misses;
+				return lookups == 0 ? 0 : (double) hits / lookups;
+			}
+		}
+
+		public long Instantiations
+		{
+			get
+			{
+				return Sum(InstantiationCell);
+			}
+		}
+
+		public TimeSpan InstantiationTime
+		{
+			get
+			{
+				return TimeSpan.FromSeconds((double) Sum(InstantiationTicksCell) / Stopwatch.Frequency);
+			}
+		}
+
+		public long[] InstantiationHistogram
+		{
+			get
+			{
+				var result = new long[HistogramBuckets];
+				for(int i = 0; i < HistogramBuckets; i++)
+					result[i] = Sum(HistogramCell + i);
+				return result;
+			}
+		}
+
+		// entries that were found but whose value had already been collected
+		public long Resurrections
+		{
+			get
+			{
+				return Sum(ResurrectionCell);
+			}
+		}
+
+		// values a tiered weak mapping moved from its weak references into its strong tier, and values it
+		// dropped from the strong tier to make room; many demotions followed by resurrections suggest a
+		// bigger tier, promotions that stay rare a smaller one
+		public long Promotions
+		{
+			get
+			{
+				return Sum(PromotionCell);
+			}
+		}
+
+		public long Demotions
+		{
+			get
+			{
+				return Sum(DemotionCell);
+			}
+		}
+
+		// the number of times the cleanup thread worked on the mapping, and the time it spent
+		public long Cleanups
+		{
+			get
+			{
+				return Sum(CleanupCell);
+			}
+		}
+
+		public TimeSpan CleanupTime
+		{
+			get
+			{
+				return TimeSpan.FromSeconds((double) Sum(CleanupTicksCell) / Stopwatch.Frequency);
+			}
+		}
+
+		public long Removals
+		{
+			get
+			{
+				return Sum(RemovalCell);
+			}
+		}
+
+		public void Reset()
+		{
+			for(int i = 0; i < cells.Length; i++)
+				Interlocked.Exchange(ref cells[i], 0);
+		}
+	}
+}
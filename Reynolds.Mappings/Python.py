@@ -0,0 +1,415 @@
+﻿# Emits the Python counterparts of the mapping classes, one class per class and arity (Mapping2,
+# LazyMapping3, ...), and a pytest-benchmark module comparing them with functools.lru_cache. Called from
+# Mapping.py.
+#
+# A single-key mapping keys its dict by the key itself; a multi-key mapping by the tuple that m[key1, key2]
+# already passes to __getitem__, so neither builds a key on a lookup. Calling m(key1, key2) looks up the
+# same entry. The domain of IDomain is __contains__, len() and iteration, with is_finite and is_numerable.
+
+import re
+
+from CodeGen import *
+from Benchmarks import SIZE
+
+PYTHON_CLASSES = ["Mapping", "DictionaryMapping", "LazyMapping", "ConcurrentLazyMapping", "WeakLazyMapping"]
+LAZY = ["LazyMapping", "ConcurrentLazyMapping", "WeakLazyMapping"]
+
+def line(text):
+	stmt(text, "")
+
+def snake_case(s):
+	return re.sub("(?<!^)(?=[A-Z])", "_", s).lower()
+
+def key_names(n):
+	return ["key"] if n == 1 else ["key%i" % (i+1) for i in range(n)]
+
+# the parameter of __getitem__, which is also the dict key
+def subscript(n):
+	return "key" if n == 1 else "keys"
+
+def unpack(n):
+	if n > 1:
+		line("%s = keys" % ", ".join(key_names(n)))
+
+def docstring(text):
+	line('"""%s"""' % text)
+
+def domain_attributes(finite):
+	line("is_finite = %s" % finite)
+	line("is_numerable = %s" % finite)
+
+# contains is how __contains__ decides: "all" keys, the "entries" present, or the "delegate" given
+def domain_members(n, finite, contains):
+	blank()
+	with block("def __contains__(self, %s)" % subscript(n)):
+		if contains == "delegate":
+			with block("if self._contains is None"):
+				line("return True")
+			unpack(n)
+			line("return self._contains(%s)" % ", ".join(key_names(n)))
+		elif contains == "entries":
+			line("return %s in self._entries" % subscript(n))
+		else:
+			line("return True")
+	if not finite:
+		blank()
+		with block("def __len__(self)"):
+			line('raise TypeError("Domain is not finite")')
+		blank()
+		with block("def __iter__(self)"):
+			line('raise TypeError("Domain is non-numerable")')
+
+# the method that is both m[keys] and m(key1, key2): a single key needs one method only. __call__ packs
+# its keys into the tuple only for a body that reads it.
+def lookup(n, body, packed = True):
+	with block("def __getitem__(self, %s)" % subscript(n)):
+		body(True)
+	blank()
+	if n == 1:
+		line("__call__ = __getitem__")
+	else:
+		with block("def __call__(self, %s)" % ", ".join(key_names(n))):
+			if packed:
+				line("keys = %s" % ", ".join(key_names(n)))
+			body(False)
+
+# --------------- Mapping ----------------
+def py_mapping(n):
+	with block("class Mapping%i" % n):
+		docstring("getter(%s) as a mapping over every key." % ", ".join(key_names(n)))
+		line('__slots__ = ("_getter",)')
+		domain_attributes(False)
+		blank()
+		with block("def __init__(self, getter)"):
+			line("self._getter = getter")
+		blank()
+		def body(subscripted):
+			if subscripted:
+				unpack(n)
+			line("return self._getter(%s)" % ", ".join(key_names(n)))
+		lookup(n, body, False)
+		domain_members(n, False, "all")
+
+# --------------- DictionaryMapping ----------------
+def py_dictionary_mapping(n):
+	with block("class DictionaryMapping%i" % n):
+		docstring("A finite mapping over the keys it was given.")
+		line('__slots__ = ("_entries",)')
+		domain_attributes(True)
+		blank()
+		with block("def __init__(self, entries = ())"):
+			line("self._entries = dict(entries)")
+		blank()
+		lookup(n, lambda subscripted: line("return self._entries[keys]" if n > 1 else "return self._entries[key]"))
+		blank()
+		with block("def __setitem__(self, %s, value)" % subscript(n)):
+			line("self._entries[%s] = value" % subscript(n))
+		blank()
+		with block("def __delitem__(self, %s)" % subscript(n)):
+			line("del self._entries[%s]" % subscript(n))
+		domain_members(n, True, "entries")
+		blank()
+		with block("def __len__(self)"):
+			line("return len(self._entries)")
+		blank()
+		with block("def __iter__(self)"):
+			line("return iter(self._entries)")
+		blank()
+		with block("def items(self)"):
+			line("return self._entries.items()")
+		blank()
+		with block("def get(self, %s, default = None)" % subscript(n)):
+			line("return self._entries.get(%s, default)" % subscript(n))
+
+# a copy of the entries instantiated so far, and seed() for those of an earlier run; seeded keys that are already
+# instantiated keep their values
+def instantiated_members(n):
+	blank()
+	line("@property")
+	with block("def instantiated(self)"):
+		line("return dict(self._values)")
+	blank()
+	with block("def seed(self, entries)"):
+		with block("for %s, value in entries" % subscript(n)):
+			line("self._values.setdefault(%s, value)" % subscript(n))
+	blank()
+	with block("def get_existing(self, %s, default = None)" % subscript(n)):
+		line("return self._values.get(%s, default)" % subscript(n))
+
+# --------------- LazyMapping ----------------
+def py_lazy_mapping(n):
+	# the dict instantiates missing values itself, so a hit is one subscript and a miss raises no KeyError
+	with block("class _Instances%i(dict)" % n):
+		docstring("The values of a LazyMapping%i, instantiated on the first lookup of their key." % n)
+		line('__slots__ = ("instantiator",)')
+		blank()
+		with block("def __missing__(self, %s)" % subscript(n)):
+			unpack(n)
+			line("value = self[%s] = self.instantiator(%s)" % (subscript(n), ", ".join(key_names(n))))
+			line("return value")
+	blank()
+	blank()
+	with block("class LazyMapping%i" % n):
+		docstring("Instantiates the value of each key once, on its first lookup. Not thread-safe.")
+		line('__slots__ = ("_contains", "_values")')
+		domain_attributes(False)
+		blank()
+		with block("def __init__(self, instantiator, contains = None)"):
+			line("self._contains = contains")
+			line("self._values = _Instances%i()" % n)
+			line("self._values.instantiator = instantiator")
+		blank()
+		lookup(n, lambda subscripted: line("return self._values[%s]" % subscript(n)))
+		domain_members(n, False, "delegate")
+		instantiated_members(n)
+
+# --------------- ConcurrentLazyMapping ----------------
+def py_concurrent_lazy_mapping(n):
+	with block("class ConcurrentLazyMapping%i" % n):
+		docstring("A thread-safe LazyMapping: concurrent misses on one key wait for a single instantiation. An instantiation that raises is not kept, so the next lookup retries.")
+		line('__slots__ = ("_instantiator", "_contains", "_values", "_flights", "_lock")')
+		domain_attributes(False)
+		blank()
+		with block("def __init__(self, instantiator, contains = None)"):
+			line("self._instantiator = instantiator")
+			line("self._contains = contains")
+			line("self._values = {}")
+			line("self._flights = {}")
+			line("self._lock = threading.Lock()")
+		blank()
+		def body(subscripted):
+			# hits take no lock: a dict lookup is atomic
+			with block("try"):
+				line("return self._values[%s]" % subscript(n))
+			with block("except KeyError"):
+				pass
+			if subscripted:
+				unpack(n)
+			line("return self._miss(%s)" % ", ".join(([] if n == 1 else ["keys"]) + key_names(n)))
+		lookup(n, body)
+		domain_members(n, False, "delegate")
+		blank()
+		# the first thread to miss a key instantiates it; the others find its flight and wait. The value is
+		# stored before the flight is removed, so a thread that misses both has not missed the value.
+		with block("def _miss(self, %s)" % ", ".join(([] if n == 1 else ["keys"]) + key_names(n))):
+			with block("with self._lock"):
+				with block("try"):
+					line("return self._values[%s]" % subscript(n))
+				with block("except KeyError"):
+					pass
+				line("flight = self._flights.get(%s)" % subscript(n))
+				line("leader = flight is None")
+				with block("if leader"):
+					line("flight = self._flights[%s] = _Flight()" % subscript(n))
+			with block("if not leader"):
+				line("return flight.wait()")
+			with block("try"):
+				line("value = flight.value = self._instantiator(%s)" % ", ".join(key_names(n)))
+				line("self._values[%s] = value" % subscript(n))
+			with block("except BaseException as error"):
+				line("flight.error = error")
+				line("raise")
+			with block("finally"):
+				with block("with self._lock"):
+					line("del self._flights[%s]" % subscript(n))
+				line("flight.done.release()")
+			line("return value")
+		instantiated_members(n)
+
+# --------------- WeakLazyMapping ----------------
+def py_weak_lazy_mapping(n, lock_stripes):
+	with block("class WeakLazyMapping%i" % n):
+		docstring("A thread-safe LazyMapping that keeps its values only while they are referenced elsewhere, and, given a strong_capacity, the most recently used values regardless. Values must be weakly referenceable.")
+		line('__slots__ = ("_instantiator", "_contains", "_values", "_locks", "_strong", "_strong_capacity", "_strong_lock")')
+		domain_attributes(False)
+		blank()
+		with block("def __init__(self, instantiator, contains = None, strong_capacity = 0)"):
+			with block("if strong_capacity < 0"):
+				line('raise ValueError("strong_capacity must not be negative")')
+			line("self._instantiator = instantiator")
+			line("self._contains = contains")
+			line("self._values = weakref.WeakValueDictionary()")
+			# a key is instantiated under the lock of its stripe, so only once while its value lives
+			line("self._locks = tuple(threading.RLock() for stripe in range(%i))" % lock_stripes)
+			line("self._strong = OrderedDict()")
+			line("self._strong_capacity = strong_capacity")
+			line("self._strong_lock = threading.Lock()")
+		blank()
+		line("@property")
+		with block("def strong_capacity(self)"):
+			line("return self._strong_capacity")
+		blank()
+		def body(subscripted):
+			line("value = self._values.get(%s)" % subscript(n))
+			with block("if value is None"):
+				if subscripted:
+					unpack(n)
+				line("return self._miss(%s)" % ", ".join(([] if n == 1 else ["keys"]) + key_names(n)))
+			with block("if self._strong_capacity"):
+				line("self._retain(%s, value)" % subscript(n))
+			line("return value")
+		lookup(n, body)
+		domain_members(n, False, "delegate")
+		blank()
+		with block("def _miss(self, %s)" % ", ".join(([] if n == 1 else ["keys"]) + key_names(n))):
+			with block("with self._locks[hash(%s) & %i]" % (subscript(n), lock_stripes - 1)):
+				line("value = self._values.get(%s)" % subscript(n))
+				with block("if value is None"):
+					line("value = self._instantiator(%s)" % ", ".join(key_names(n)))
+					line("self._values[%s] = value" % subscript(n))
+			with block("if self._strong_capacity"):
+				line("self._retain(%s, value)" % subscript(n))
+			line("return value")
+		blank()
+		# the strong tier: the strong_capacity most recently used values, least recently used first
+		with block("def _retain(self, %s, value)" % subscript(n)):
+			# a value that is strong already only moves to the end, which is atomic and needs no lock
+			with block("try"):
+				line("self._strong.move_to_end(%s)" % subscript(n))
+				line("return")
+			with block("except KeyError"):
+				pass
+			with block("with self._strong_lock"):
+				line("strong = self._strong")
+				line("strong[%s] = value" % subscript(n))
+				line("strong.move_to_end(%s)" % subscript(n))
+				with block("if len(strong) > self._strong_capacity"):
+					line("strong.popitem(last = False)")
+		blank()
+		with block("def get_existing(self, %s, default = None)" % subscript(n)):
+			line("return self._values.get(%s, default)" % subscript(n))
+
+def flight():
+	with block("class _Flight"):
+		docstring("An instantiation in progress, which the threads missing the same key wait for.")
+		line('__slots__ = ("done", "value", "error", "owner")')
+		blank()
+		with block("def __init__(self)"):
+			# held until the instantiation is done; a plain lock is cheaper to create than an Event
+			line("self.done = threading.Lock()")
+			line("self.done.acquire()")
+			line("self.value = None")
+			line("self.error = None")
+			line("self.owner = threading.get_ident()")
+		blank()
+		with block("def wait(self)"):
+			# the thread instantiating the key would wait for itself
+			with block("if self.owner == threading.get_ident()"):
+				line('raise RuntimeError("The instantiator looked up the key it is instantiating")')
+			line("self.done.acquire()")
+			line("self.done.release()")
+			with block("if self.error is not None"):
+				line("raise self.error")
+			line("return self.value")
+
+def python_names(arities, selected):
+	return ["%s%i" % (name, n) for n in arities for name in PYTHON_CLASSES if name in selected]
+
+def emit_python(arities, selected, lock_stripes):
+	line("# Generated by Mapping.py from the same templates as the C# classes.")
+	blank()
+	line("import threading")
+	line("import weakref")
+	line("from collections import OrderedDict")
+	blank()
+	line("__all__ = [%s]" % ", ".join('"%s"' % name for name in python_names(arities, selected)))
+	if "ConcurrentLazyMapping" in selected:
+		blank()
+		blank()
+		flight()
+	emitters = {
+		"Mapping": py_mapping,
+		"DictionaryMapping": py_dictionary_mapping,
+		"LazyMapping": py_lazy_mapping,
+		"ConcurrentLazyMapping": py_concurrent_lazy_mapping,
+		"WeakLazyMapping": lambda n: py_weak_lazy_mapping(n, lock_stripes),
+	}
+	for n in arities:
+		for name in PYTHON_CLASSES:
+			if name in selected:
+				blank()
+				blank()
+				emitters[name](n)
+
+# --------------- benchmarks ----------------
+def bench(name, n, case, group, *body):
+	blank()
+	blank()
+	with block("def test_%s_%i_%s(benchmark)" % (snake_case(name), n, snake_case(case))):
+		line('benchmark.group = "%i/%s"' % (n, group))
+		for text in body:
+			line(text)
+
+def emit_python_benchmarks(module, arities, selected):
+	line("# Generated by Mapping.py. Needs pytest-benchmark:")
+	line("#   pytest --benchmark-only %s" % "bench_mappings.py")
+	line("# Each group times the generated mappings and functools.lru_cache on the same keys.")
+	blank()
+	line("import functools")
+	blank()
+	line("from %s import *" % module)
+	blank()
+	line("SIZE = %i" % SIZE)
+	line("ROUNDS = 20")
+	blank()
+	# the keys of the C# benchmarks: component k of key i is i * (2k + 1)
+	for k in range(max(arities)):
+		line("K%i = [i * %i for i in range(SIZE)]" % (k+1, 2 * (k+1) + 1))
+	for n in arities:
+		line("KEYS%i = %s" % (n, "K1" if n == 1 else "list(zip(%s))" % ", ".join("K%i" % (k+1) for k in range(n))))
+	blank()
+	blank()
+	with block("class Value"):
+		docstring("A weakly referenceable value for WeakLazyMapping.")
+		line('__slots__ = ("value", "__weakref__")')
+		blank()
+		with block("def __init__(self, value)"):
+			line("self.value = value")
+	for n in arities:
+		names = ", ".join(key_names(n))
+		blank()
+		blank()
+		with block("def call%i(function, keys)" % n):
+			with block("for %s in keys" % names):
+				line("function(%s)" % names)
+		blank()
+		blank()
+		# each key of a multi-key mapping is the tuple that mapping[key1, key2] passes
+		with block("def subscript%i(mapping, keys)" % n):
+			with block("for key in keys"):
+				line("mapping[key]")
+	for n in arities:
+		names = ", ".join(key_names(n))
+		first = "lambda %s: %s" % (names, key_names(n)[0])
+		warm = "call%i(mapping, KEYS%i)" % (n, n)
+		bench("LruCache", n, "GetHit", "GetHit",
+			"mapping = functools.lru_cache(maxsize = None)(%s)" % first,
+			warm,
+			"benchmark(call%i, mapping, KEYS%i)" % (n, n))
+		bench("LruCache", n, "Instantiate", "Instantiate",
+			"setup = lambda: ((functools.lru_cache(maxsize = None)(%s), KEYS%i), {})" % (first, n),
+			"benchmark.pedantic(call%i, setup = setup, rounds = ROUNDS)" % n)
+		for name in PYTHON_CLASSES:
+			if name not in selected:
+				continue
+			instantiator = "lambda %s: Value(%s)" % (names, key_names(n)[0]) if name == "WeakLazyMapping" else first
+			constructor = "%s%i(%s)" % (name, n, instantiator)
+			if name == "DictionaryMapping":
+				fill = ["mapping = %s%i((%s, %s) for %s in KEYS%i)" % (name, n, subscript(n), key_names(n)[0] if n == 1 else "keys[0]", subscript(n), n)]
+			else:
+				fill = ["mapping = %s" % constructor]
+				if name in LAZY:
+					# the values are kept alive so that weak entries stay hits
+					fill.append("alive = [mapping(%s) for %s in KEYS%i]" % (names, names, n))
+			for case, runner in (("GetHit", "call"), ("SubscriptGetHit", "subscript")):
+				bench(name, n, case, "GetHit", *(fill + ["benchmark(%s%i, mapping, KEYS%i)" % (runner, n, n)]))
+			if name in LAZY:
+				bench(name, n, "Instantiate", "Instantiate",
+					"setup = lambda: ((%s, KEYS%i), {})" % (constructor, n),
+					"benchmark.pedantic(call%i, setup = setup, rounds = ROUNDS)" % n)
+			if name == "WeakLazyMapping":
+				# nothing else holds the values; a strong tier with room for every key keeps them
+				bench(name, n, "TieredGetHit", "GetHit",
+					"mapping = %s%i(%s, None, SIZE)" % (name, n, instantiator),
+					warm,
+					"benchmark(call%i, mapping, KEYS%i)" % (n, n))
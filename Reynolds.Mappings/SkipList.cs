@@ -0,0 +1,189 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+
+namespace Reynolds.Mappings
+{
+	// Ordered storage behind SortedMapping. Not thread-safe.
+	public class SkipList<TKey, TValue> : IEnumerable<KeyValuePair<TKey, TValue>>
+	{
+		class Node
+		{
+			public TKey Key;
+			public TValue Value;
+			public Node[] Next;
+		}
+
+		const int MaxLevel = 32;
+
+		readonly IComparer<TKey> comparer;
+		readonly Node head = new Node { Next = new Node[MaxLevel] };
+		readonly Node[] update = new Node[MaxLevel];
+		int level = 1;
+		int count;
+		uint seed = 2463534242;
+
+		public SkipList(IComparer<TKey> comparer = null)
+		{
+			this.comparer = comparer ?? Comparer<TKey>.Default;
+		}
+
+		public IComparer<TKey> Comparer
+		{
+			get
+			{
+				return comparer;
+			}
+		}
+
+		public int Count
+		{
+			get
+			{
+				return count;
+			}
+		}
+
+		// each level holds about a quarter of the nodes of the level below
+		int RandomLevel()
+		{
+			seed ^= seed << 13;
+			seed ^= seed >> 17;
+			seed ^= seed << 5;
+			int l = 1;
+			for(uint bits = seed; l < MaxLevel && (bits & 3) == 0; bits >>= 2)
+				l++;
+			return l;
+		}
+
+		// last node before key on every level, left in update; returns the first node not before key
+		Node FindPredecessors(TKey key)
+		{
+			Node x = head;
+			for(int i = level - 1; i >= 0; i--)
+			{
+				while(x.Next[i] != null && comparer.Compare(x.Next[i].Key, key) < 0)
+					x = x.Next[i];
+				update[i] = x;
+			}
+			return x.Next[0];
+		}
+
+		Node Find(TKey key)
+		{
+			Node x = head;
+			for(int i = level - 1; i >= 0; i--)
+				while(x.Next[i] != null && comparer.Compare(x.Next[i].Key, key) < 0)
+					x = x.Next[i];
+			x = x.Next[0];
+			return x != null && comparer.Compare(x.Key, key) == 0 ? x : null;
+		}
+
+		public bool ContainsKey(TKey key)
+		{
+			return Find(key) != null;
+		}
+
+		public bool TryGetValue(TKey key, out TValue value)
+		{
+			var x = Find(key);
+			if(x == null)
+			{
+				value = default(TValue);
+				return false;
+			}
+			value = x.Value;
+			return true;
+		}
+
+		public void Set(TKey key, TValue value, bool add)
+		{
+			var x = FindPredecessors(key);
+			if(x != null && comparer.Compare(x.Key, key) == 0)
+			{
+				if(add)
+					throw new ArgumentException("An entry with the same key already exists");
+				x.Value = value;
+				return;
+			}
+			int l = RandomLevel();
+			for(; level < l; level++)
+				update[level] = head;
+			x = new Node { Key = key, Value = value, Next = new Node[l] };
+			for(int i = 0; i < l; i++)
+			{
+				x.Next[i] = update[i].Next[i];
+				update[i].Next[i] = x;
+			}
+			count++;
+		}
+
+		public bool Remove(TKey key)
+		{
+			var x = FindPredecessors(key);
+			if(x == null || comparer.Compare(x.Key, key) != 0)
+				return false;
+			for(int i = 0; i < x.Next.Length; i++)
+				update[i].Next[i] = x.Next[i];
+			while(level > 1 && head.Next[level - 1] == null)
+				level--;
+			Array.Clear(update, 0, update.Length);
+			count--;
+			return true;
+		}
+
+		public void Clear()
+		{
+			Array.Clear(head.Next, 0, head.Next.Length);
+			level = 1;
+			count = 0;
+		}
+
+		// greatest entry whose key is not after key
+		public bool TryGetFloor(TKey key, out KeyValuePair<TKey, TValue> entry)
+		{
+			Node x = head;
+			for(int i = level - 1; i >= 0; i--)
+				while(x.Next[i] != null && comparer.Compare(x.Next[i].Key, key) <= 0)
+					x = x.Next[i];
+			entry = x == head ? default(KeyValuePair<TKey, TValue>) : new KeyValuePair<TKey, TValue>(x.Key, x.Value);
+			return x != head;
+		}
+
+		// least entry whose key is not before key
+		public bool TryGetCeiling(TKey key, out KeyValuePair<TKey, TValue> entry)
+		{
+			Node x = head;
+			for(int i = level - 1; i >= 0; i--)
+				while(x.Next[i] != null && comparer.Compare(x.Next[i].Key, key) < 0)
+					x = x.Next[i];
+			x = x.Next[0];
+			entry = x == null ? default(KeyValuePair<TKey, TValue>) : new KeyValuePair<TKey, TValue>(x.Key, x.Value);
+			return x != null;
+		}
+
+		// The entries for which position returns 0. position must be negative for keys before the
+		// range and positive after it, so the scan starts with a descent and stops at the first key past it.
+		public IEnumerable<KeyValuePair<TKey, TValue>> Range(Func<TKey, int> position)
+		{
+			Node x = head;
+			for(int i = level - 1; i >= 0; i--)
+				while(x.Next[i] != null && position(x.Next[i].Key) < 0)
+					x = x.Next[i];
+			for(x = x.Next[0]; x != null && position(x.Key) == 0; x = x.Next[0])
+				yield return new KeyValuePair<TKey, TValue>(x.Key, x.Value);
+		}
+
+		public IEnumerator<KeyValuePair<TKey, TValue>> GetEnumerator()
+		{
+			for(var x = head.Next[0]; x != null; x = x.Next[0])
+				yield return new KeyValuePair<TKey, TValue>(x.Key, x.Value);
+		}
+
+		System.Collections.IEnumerator System.Collections.IEnumerable.GetEnumerator()
+		{
+			return GetEnumerator();
+		}
+	}
+}
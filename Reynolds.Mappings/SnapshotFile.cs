@@ -0,0 +1,188 @@
+﻿using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Linq;
+using System.Reflection;
+using System.Runtime.InteropServices;
+using System.Text;
+
+namespace Reynolds.Mappings
+{
+	// The layout shared by the generated SnapshotMappings:
+	//   header   magic, version, arity, record size, count, bucket count (ints), type stamp (long)
+	//   index    bucket count slots of (hash, record + 1), linear probing, 0 marking an empty slot
+	//   records  count records, each the keys followed by the value, packed without padding
+	// Keys and values are copied byte for byte, so they must be blittable and the file is only read
+	// back on a machine of the same endianness. Hashes come from EqualityComparer<T>.Default, which is
+	// the same in every process for primitives, enums and structs of them.
+	static class SnapshotFile
+	{
+		public const int Magic = 0x4E534D52; // "RMSN"
+		public const int Version = 2;
+		public const int HeaderSize = 32;
+		public const int SlotSize = 8;
+
+		// the number of bytes a view accessor copies for a key or value of type
+		public static int SizeOf(Type type)
+		{
+			if(!IsBlittable(type))
+				throw new NotSupportedException(type + " is not a blittable type and cannot be written to a snapshot");
+			try
+			{
+				return Marshal.SizeOf(type.IsEnum ? Enum.GetUnderlyingType(type) : type);
+			}
+			catch(ArgumentException)
+			{
+				throw new NotSupportedException(type + " has no fixed layout and cannot be written to a snapshot");
+			}
+		}
+
+		// no references, and no bool or char, whose marshalled size differs from their size in memory
+		static bool IsBlittable(Type type)
+		{
+			if(type.IsPrimitive)
+				return type != typeof(bool) && type != typeof(char);
+			if(type.IsEnum || type.IsPointer)
+				return true;
+			if(!type.IsValueType)
+				return false;
+			foreach(var field in type.GetFields(BindingFlags.Instance | BindingFlags.Public | BindingFlags.NonPublic))
+				if(!IsBlittable(field.FieldType))
+					return false;
+			return true;
+		}
+
+		// FNV-1a over the type names, so that a snapshot is not read back as different types of the same size
+		public static long Stamp(params Type[] types)
+		{
+			unchecked
+			{
+				ulong stamp = 14695981039346656037ul;
+				foreach(var type in types)
+				{
+					foreach(char c in type.FullName)
+						stamp = (stamp ^ c) * 1099511628211ul;
+					stamp = (stamp ^ '|') * 1099511628211ul;
+				}
+				return (long) stamp;
+			}
+		}
+
+		// at least twice as many slots as records, so probes stay short and always reach an empty slot
+		public static int Buckets(int count)
+		{
+			int buckets = 1;
+			while(buckets <= count * 2L)
+				buckets <<= 1;
+			return buckets;
+		}
+
+		public static long Slot(int slot)
+		{
+			return HeaderSize + (long) slot * SlotSize;
+		}
+
+		// the hash and the record number (plus one) in a slot of the index, read from the pinned view
+		public static int SlotHash(IntPtr view, int slot)
+		{
+			return Marshal.ReadInt32(new IntPtr(view.ToInt64() + Slot(slot)));
+		}
+
+		public static int SlotRecord(IntPtr view, int slot)
+		{
+			return Marshal.ReadInt32(new IntPtr(view.ToInt64() + Slot(slot) + 4));
+		}
+
+		public static long Length(int recordSize, int count, int buckets)
+		{
+			return Slot(buckets) + (long) recordSize * count;
+		}
+
+		public static void WriteHeader(UnmanagedMemoryAccessor view, int arity, int recordSize, int count, int buckets, long stamp)
+		{
+			view.Write(0, Magic);
+			view.Write(4, Version);
+			view.Write(8, arity);
+			view.Write(12, recordSize);
+			view.Write(16, count);
+			view.Write(20, buckets);
+			view.Write(24, stamp);
+		}
+
+		// checks that the snapshot holds the types the reader expects and returns its count and bucket count
+		public static void ReadHeader(UnmanagedMemoryAccessor view, int arity, int recordSize, long stamp, out int count, out int buckets)
+		{
+			if(view.Capacity < HeaderSize || view.ReadInt32(0) != Magic)
+				throw new InvalidDataException("Not a mapping snapshot");
+			if(view.ReadInt32(4) != Version)
+				throw new InvalidDataException("Unsupported snapshot version " + view.ReadInt32(4));
+			if(view.ReadInt32(8) != arity || view.ReadInt32(12) != recordSize || view.ReadInt64(24) != stamp)
+				throw new InvalidDataException("The snapshot was written for different key or value types");
+			count = view.ReadInt32(16);
+			buckets = view.ReadInt32(20);
+			if(count < 0 || buckets <= count || (buckets & (buckets - 1)) != 0 || view.Capacity < Length(recordSize, count, buckets))
+				throw new InvalidDataException("The snapshot is truncated or corrupt");
+		}
+
+		// Holds the view open for one lookup and returns its address, so that probing the index does not pay
+		// for the accessor's bounds check and reference counting on every slot, and disposing the reader
+		// meanwhile does not unmap it. Throws ObjectDisposedException once the view is closed.
+		public static IntPtr Acquire(MemoryMappedViewAccessor view, ref bool acquired)
+		{
+			view.SafeMemoryMappedViewHandle.DangerousAddRef(ref acquired);
+			return view.SafeMemoryMappedViewHandle.DangerousGetHandle();
+		}
+
+		public static void Release(MemoryMappedViewAccessor view)
+		{
+			view.SafeMemoryMappedViewHandle.DangerousRelease();
+		}
+
+		// read-only and shared, so that any number of readers, in this process or others, can map the same
+		// snapshot while a writer replaces it
+		public static MemoryMappedFile OpenRead(string path)
+		{
+			var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read | FileShare.Delete);
+			try
+			{
+				return MemoryMappedFile.CreateFromFile(stream, null, 0, MemoryMappedFileAccess.Read, null, HandleInheritability.None, false);
+			}
+			catch
+			{
+				stream.Dispose();
+				throw;
+			}
+		}
+
+		public static MemoryMappedFile Create(string path, long length)
+		{
+			return MemoryMappedFile.CreateFromFile(path, FileMode.Create, null, length, MemoryMappedFileAccess.ReadWrite);
+		}
+
+		// deletes a snapshot that could not be written, without hiding the exception that stopped it
+		public static void Discard(string written)
+		{
+			try
+			{
+				File.Delete(written);
+			}
+			catch(IOException)
+			{
+			}
+			catch(UnauthorizedAccessException)
+			{
+			}
+		}
+
+		// renames a fully written snapshot over the old one, so readers never open half a file or find none;
+		// readers that have the old one open keep reading it
+		public static void Replace(string written, string path)
+		{
+			if(File.Exists(path))
+				File.Replace(written, path, null);
+			else
+				File.Move(written, path);
+		}
+	}
+}
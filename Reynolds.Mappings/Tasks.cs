@@ -0,0 +1,37 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Reynolds.Mappings
+{
+	static class Tasks
+	{
+		public static void Forward<T>(Task<T> task, TaskCompletionSource<T> source)
+		{
+			if(task.IsFaulted)
+				source.TrySetException(task.Exception.InnerExceptions);
+			else if(task.IsCanceled)
+				source.TrySetCanceled();
+			else
+				source.TrySetResult(task.Result);
+		}
+
+		// Lets one caller stop waiting for a shared task without cancelling it for everyone else.
+		public static Task<T> WithCancellation<T>(Task<T> task, CancellationToken cancellationToken)
+		{
+			if(task.IsCompleted || !cancellationToken.CanBeCanceled)
+				return task;
+			var source = new TaskCompletionSource<T>();
+			var registration = cancellationToken.Register(() => source.TrySetCanceled());
+			task.ContinueWith(t =>
+			{
+				registration.Dispose();
+				Forward(t, source);
+			}, TaskContinuationOptions.ExecuteSynchronously);
+			return source.Task;
+		}
+	}
+}
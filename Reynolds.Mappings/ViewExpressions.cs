@@ -0,0 +1,71 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Linq.Expressions;
+using System.Text;
+
+namespace Reynolds.Mappings
+{
+	// Splices the bodies of the lambdas a MappingView is built from into one another, so that a chain of
+	// views compiles to a single delegate instead of one call per layer.
+	static class ViewExpressions
+	{
+		class Substitution : ExpressionVisitor
+		{
+			readonly Dictionary<ParameterExpression, Expression> arguments;
+
+			public Substitution(Dictionary<ParameterExpression, Expression> arguments)
+			{
+				this.arguments = arguments;
+			}
+
+			protected override Expression VisitParameter(ParameterExpression node)
+			{
+				Expression argument;
+				return arguments.TryGetValue(node, out argument) ? argument : node;
+			}
+		}
+
+		// body with each of parameters replaced by the matching argument; an argument that is neither a
+		// parameter nor a constant is evaluated once, into a variable, however often the body uses it
+		public static Expression Inline(IList<ParameterExpression> parameters, Expression body, params Expression[] arguments)
+		{
+			var substitutions = new Dictionary<ParameterExpression, Expression>();
+			var variables = new List<ParameterExpression>();
+			var assignments = new List<Expression>();
+			for(int i = 0; i < parameters.Count; i++)
+			{
+				var argument = arguments[i];
+				if(!(argument is ParameterExpression || argument is ConstantExpression))
+				{
+					var variable = Expression.Variable(argument.Type, parameters[i].Name);
+					variables.Add(variable);
+					assignments.Add(Expression.Assign(variable, argument));
+					argument = variable;
+				}
+				substitutions.Add(parameters[i], argument);
+			}
+			body = new Substitution(substitutions).Visit(body);
+			if(variables.Count == 0)
+				return body;
+			assignments.Add(body);
+			return Expression.Block(body.Type, variables, assignments);
+		}
+
+		public static Expression Inline(LambdaExpression lambda, params Expression[] arguments)
+		{
+			return Inline(lambda.Parameters, lambda.Body, arguments);
+		}
+
+		// what a view's lookup does for a key outside its domain
+		public static Expression Missing(Type type)
+		{
+			return Expression.Throw(Expression.New(typeof(KeyNotFoundException)), type);
+		}
+
+		public static Expression Both(Expression first, Expression second)
+		{
+			return first == null ? second : second == null ? first : Expression.AndAlso(first, second);
+		}
+	}
+}
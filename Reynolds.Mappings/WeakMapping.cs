@@ -1,5 +1,6 @@
 ﻿using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
 using System.Text;
 using System.Threading;
@@ -8,9 +9,57 @@ namespace Reynolds.Mappings
 {
 	public abstract class WeakMapping
 	{
-		protected abstract void Cleanup();
+		// Removes dead entries from the next batch of the mapping and returns true once a full pass is complete.
+		protected abstract bool CleanupBatch();
 
 		static Thread cleanupThread;
+		static readonly AutoResetEvent cleanupSignal = new AutoResetEvent(false);
+		static int collectionPending;
+
+		int deadReferences;
+		int cleanupPending;
+		long sweepInterval;
+		long nextSweep;
+
+		MappingStatistics statistics;
+		// set to have hits, misses, instantiations and cleanup passes counted
+		public MappingStatistics Statistics
+		{
+			get
+			{
+				return statistics;
+			}
+			set
+			{
+				statistics = value;
+			}
+		}
+
+		static TimeSpan cleanupBudget = TimeSpan.FromMilliseconds(2);
+		public static TimeSpan CleanupBudget
+		{
+			get
+			{
+				return cleanupBudget;
+			}
+			set
+			{
+				cleanupBudget = value;
+			}
+		}
+
+		static int deadReferenceThreshold = 64;
+		public static int DeadReferenceThreshold
+		{
+			get
+			{
+				return deadReferenceThreshold;
+			}
+			set
+			{
+				deadReferenceThreshold = value;
+			}
+		}
 
 		static List<WeakReference> containers = null;
 		protected static List<WeakReference> Containers
@@ -32,32 +81,121 @@ namespace Reynolds.Mappings
 				{
 					cleanupThread = new Thread(CleanupLoop);
 					cleanupThread.Priority = ThreadPriority.BelowNormal;
+					cleanupThread.IsBackground = true;
 					cleanupThread.Start();
+					new CollectionSentinel();
 				}
 			}
 		}
 
+		// Registers a container that also needs a cleanup pass every sweepInterval, e.g. to drop expired entries.
+		protected static void AddToCleanupList(WeakMapping container, TimeSpan sweepInterval)
+		{
+			container.sweepInterval = ToTimestamp(sweepInterval);
+			container.nextSweep = Stopwatch.GetTimestamp() + container.sweepInterval;
+			AddToCleanupList(container);
+			cleanupSignal.Set();
+		}
+
+		protected static long ToTimestamp(TimeSpan time)
+		{
+			return (long) (time.TotalSeconds * Stopwatch.Frequency);
+		}
+
+		protected void NoteDeadReference()
+		{
+			if(Interlocked.Increment(ref deadReferences) == deadReferenceThreshold)
+				RequestCleanup();
+		}
+
+		protected void RequestCleanup()
+		{
+			Interlocked.Exchange(ref cleanupPending, 1);
+			cleanupSignal.Set();
+		}
+
+		class CollectionSentinel
+		{
+			~CollectionSentinel()
+			{
+				if(Environment.HasShutdownStarted)
+					return;
+				Interlocked.Exchange(ref collectionPending, 1);
+				cleanupSignal.Set();
+				GC.ReRegisterForFinalize(this);
+			}
+		}
+
 		static void CleanupLoop()
 		{
-			WeakMapping container;
+			var pending = new List<WeakMapping>();
+			var stopwatch = new Stopwatch();
+			bool unfinished = false;
+			int timeout = Timeout.Infinite;
 			while(true)
 			{
-				Thread.Sleep(30);
-				int k = 0;
-				while(k < containers.Count)
+				cleanupSignal.WaitOne(unfinished ? 1 : timeout);
+				bool collected = Interlocked.Exchange(ref collectionPending, 0) == 1;
+				long now = Stopwatch.GetTimestamp();
+				long nextDue = long.MaxValue;
+				lock(containers)
 				{
-					lock(containers)
+					int k = 0;
+					while(k < containers.Count)
 					{
-						container = containers[k].Target as WeakMapping;
+						var container = containers[k].Target as WeakMapping;
 						if(container == null)
 							containers.RemoveAt(k);
 						else
 						{
-							container.Cleanup();
+							if(collected)
+								container.cleanupPending = 1;
+							if(container.sweepInterval > 0)
+							{
+								if(now >= container.nextSweep)
+								{
+									container.cleanupPending = 1;
+									container.nextSweep = now + container.sweepInterval;
+								}
+								nextDue = Math.Min(nextDue, container.nextSweep);
+							}
+							if(container.cleanupPending == 1)
+								pending.Add(container);
 							k++;
 						}
 					}
 				}
+				if(nextDue == long.MaxValue)
+					timeout = Timeout.Infinite;
+				else
+					timeout = (int) Math.Max(1, (nextDue - now) * 1000 / Stopwatch.Frequency);
+				unfinished = false;
+				stopwatch.Restart();
+				foreach(var container in pending)
+				{
+					if(stopwatch.Elapsed >= cleanupBudget)
+					{
+						unfinished = true;
+						break;
+					}
+					long started = Stopwatch.GetTimestamp();
+					while(!container.CleanupBatch())
+					{
+						if(stopwatch.Elapsed >= cleanupBudget)
+						{
+							unfinished = true;
+							break;
+						}
+					}
+					if(container.statistics != null)
+						container.statistics.RecordCleanup(started);
+					if(!unfinished)
+					{
+						Interlocked.Exchange(ref container.deadReferences, 0);
+						Interlocked.Exchange(ref container.cleanupPending, 0);
+					}
+				}
+				pending.Clear();
 			}
 		}
 	}